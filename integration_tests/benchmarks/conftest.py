@@ -0,0 +1,267 @@
+"""
+Fixtures of the performance benchmarks: timing of the benchmarked functions, comparison to the
+JSON baselines and stubs of the external codes so that benchmarks run offline.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import os.path as pth
+import time
+import types
+from typing import Callable
+
+import fastoad.api
+import numpy as np
+import pandas as pd
+import pytest
+from openmdao.components.external_code_comp import ExternalCodeDelegate
+
+import fastga.models.aerodynamics.components.compute_propeller_aero as propeller_aero
+from fastga.models.aerodynamics.external.xfoil.xfoil_polar import (
+    XfoilPolar,
+    OPTION_ALPHA_START,
+    OPTION_ALPHA_END,
+    OPTION_COMP_NEG_AIR_SYM,
+)
+from fastga.models.aerodynamics.constants import POLAR_POINT_COUNT
+
+BASELINES_FILE_PATH = pth.join(pth.dirname(__file__), "baselines.json")
+# Timings are written in the (git-ignored) results folder, unless another folder is given in
+# this environment variable
+RESULTS_FOLDER_ENV_VAR = "FASTGA_BENCHMARK_RESULTS_FOLDER"
+RESULTS_FOLDER_PATH = pth.join(pth.dirname(__file__), "results")
+RESULTS_FILE_NAME = "benchmark_results.json"
+
+# If this environment variable is set to 1, the baselines are replaced by the measured times
+# instead of being checked
+SAVE_BASELINES_ENV_VAR = "FASTGA_SAVE_BENCHMARK_BASELINES"
+
+# Tolerated relative slow-down with regard to the baseline, if not specified in baselines.json
+DEFAULT_THRESHOLD = 0.5
+
+# Timings of the session: {benchmark name: statistics}
+_SESSION_RESULTS = {}
+
+
+def _reference_workload():
+    """Mix of numpy and pure python operations representative of the models."""
+    matrix = np.random.RandomState(0).rand(200, 200) + 200.0 * np.eye(200)
+    np.linalg.solve(matrix, np.ones(200))
+    total = 0.0
+    for idx in range(100000):
+        total += idx ** 0.5
+
+    return total
+
+
+def _load_baselines() -> dict:
+    if pth.exists(BASELINES_FILE_PATH):
+        with open(BASELINES_FILE_PATH) as file:
+            return json.load(file)
+    return {"benchmarks": {}}
+
+
+@pytest.fixture(scope="session")
+def calibration_time() -> float:
+    """
+    Median time of a reference workload on the current machine. Benchmark times are divided by it
+    so that baselines can be compared between machines.
+    """
+    durations = []
+    for _ in range(7):
+        start = time.perf_counter()
+        _reference_workload()
+        durations.append(time.perf_counter() - start)
+
+    return float(np.median(durations))
+
+
+class BenchmarkFixture:
+    """
+    Times a function in the way the pytest-benchmark fixture does and checks the median time
+    against the baseline of the benchmark.
+    """
+
+    def __init__(self, name: str, calibration_time: float, baseline: dict = None):
+        self.name = name
+        self.calibration_time = calibration_time
+        self.baseline = baseline
+        self.stats = None
+
+    def __call__(self, function: Callable, *args, **kwargs):
+        """
+        Runs the function (once for warm-up and then for 5 timed rounds).
+
+        :return: the result of the last call.
+        """
+        return self.pedantic(function, args=args, kwargs=kwargs)
+
+    def pedantic(
+        self,
+        function: Callable,
+        args: tuple = (),
+        kwargs: dict = None,
+        setup: Callable = None,
+        rounds: int = 5,
+        warmup_rounds: int = 1,
+    ):
+        """
+        Runs the function with explicit control of the rounds.
+
+        :param function: the benchmarked function.
+        :param args: positional arguments of the function.
+        :param kwargs: keyword arguments of the function.
+        :param setup: function called before each round and not timed. If it returns a tuple
+        (args, kwargs), they are used for the call of the round.
+        :param rounds: number of timed calls.
+        :param warmup_rounds: number of calls done before the timed ones.
+        :return: the result of the last call.
+        """
+        if kwargs is None:
+            kwargs = {}
+
+        result = None
+        durations = []
+        for idx in range(warmup_rounds + rounds):
+            round_args, round_kwargs = args, kwargs
+            if setup is not None:
+                setup_result = setup()
+                if setup_result is not None:
+                    round_args, round_kwargs = setup_result
+            start = time.perf_counter()
+            result = function(*round_args, **round_kwargs)
+            duration = time.perf_counter() - start
+            if idx >= warmup_rounds:
+                durations.append(duration)
+
+        self._record(durations)
+
+        return result
+
+    def _record(self, durations: list):
+        median = float(np.median(durations))
+        self.stats = {
+            "rounds": len(durations),
+            "min": float(np.min(durations)),
+            "median": median,
+            "mean": float(np.mean(durations)),
+            "max": float(np.max(durations)),
+            "normalized_time": median / self.calibration_time,
+        }
+        _SESSION_RESULTS[self.name] = self.stats
+
+        if self.baseline is None or os.environ.get(SAVE_BASELINES_ENV_VAR) == "1":
+            return
+        ratio = self.stats["normalized_time"] / self.baseline["normalized_time"]
+        self.stats["baseline_ratio"] = ratio
+        threshold = self.baseline.get("threshold", DEFAULT_THRESHOLD)
+        if ratio > 1.0 + threshold:
+            pytest.fail(
+                "%s is %.0f%% slower than its baseline (median of %.3f s, threshold %.0f%%)"
+                % (self.name, 100.0 * (ratio - 1.0), median, 100.0 * threshold)
+            )
+
+
+@pytest.fixture
+def benchmark(request, calibration_time) -> BenchmarkFixture:
+    """Times a function, see :class:`BenchmarkFixture`."""
+    name = request.node.name
+    baseline = _load_baselines()["benchmarks"].get(name)
+
+    return BenchmarkFixture(name, calibration_time, baseline)
+
+
+def pytest_sessionfinish(session):
+    """Writes the timings of the session and updates the baselines if asked."""
+    if not _SESSION_RESULTS:
+        return
+
+    results_folder_path = os.environ.get(RESULTS_FOLDER_ENV_VAR, RESULTS_FOLDER_PATH)
+    os.makedirs(results_folder_path, exist_ok=True)
+    with open(pth.join(results_folder_path, RESULTS_FILE_NAME), "w") as file:
+        json.dump(_SESSION_RESULTS, file, indent=2, sort_keys=True)
+
+    if os.environ.get(SAVE_BASELINES_ENV_VAR) == "1":
+        baselines = _load_baselines()
+        for name, stats in _SESSION_RESULTS.items():
+            baseline = baselines["benchmarks"].setdefault(name, {"threshold": DEFAULT_THRESHOLD})
+            baseline["normalized_time"] = stats["normalized_time"]
+            baseline["median"] = stats["median"]
+        with open(BASELINES_FILE_PATH, "w") as file:
+            json.dump(baselines, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+
+def synthetic_polar(alpha: np.ndarray):
+    """
+    Smooth airfoil polar used in place of the XFOIL results, so that benchmarks do not depend on
+    the presence of XFOIL nor on previously saved polars.
+
+    :param alpha: angles of attack in degree.
+    :return: lift, drag, pressure drag and moment coefficients arrays.
+    """
+    cl = 1.4 * np.tanh(0.1 * (alpha + 2.5))
+    cd = 0.008 + 1.5e-4 * alpha ** 2
+    cdp = 0.5 * cd
+    cm = -0.05 * np.ones_like(alpha)
+
+    return cl, cd, cdp, cm
+
+
+def _stubbed_xfoil_compute(self, inputs, outputs):
+    alpha_start = self.options[OPTION_ALPHA_START]
+    if self.options[OPTION_COMP_NEG_AIR_SYM]:
+        alpha_start = -self.options[OPTION_ALPHA_END]
+    alpha = np.linspace(alpha_start, self.options[OPTION_ALPHA_END], POLAR_POINT_COUNT)
+    cl, cd, cdp, cm = synthetic_polar(alpha)
+
+    outputs["xfoil:alpha"] = alpha
+    outputs["xfoil:CL"] = cl
+    outputs["xfoil:CD"] = cd
+    outputs["xfoil:CDp"] = cdp
+    outputs["xfoil:CM"] = cm
+    outputs["xfoil:CL_max_2D"] = np.max(cl)
+    outputs["xfoil:CL_min_2D"] = np.min(cl)
+
+
+def _execute_disabled(self, command, **kwargs):
+    raise RuntimeError("External codes are disabled during benchmarks: %s" % command)
+
+
+@pytest.fixture(autouse=True)
+def offline_external_codes(monkeypatch, tmpdir):
+    """
+    Runs the benchmarks offline: XFOIL polars are replaced by :func:`synthetic_polar` (including
+    the polars read by the propeller computation from the XFOIL resources) and any other external
+    code raises an error.
+    """
+    monkeypatch.setattr(XfoilPolar, "compute", _stubbed_xfoil_compute)
+    monkeypatch.setattr(ExternalCodeDelegate, "_execute_local", _execute_disabled)
+
+    resources_folder_path = pth.join(str(tmpdir), "resources")
+    os.makedirs(resources_folder_path)
+    alpha = np.linspace(-30.0, 30.0, POLAR_POINT_COUNT)
+    cl, cd, cdp, cm = synthetic_polar(alpha)
+    data = pd.DataFrame(
+        [0.0, 1e6, np.max(cl), np.min(cl)]
+        + [str(value.tolist()) for value in [alpha, cl, cd, cdp, cm]],
+        index=["mach", "reynolds", "cl_max_2d", "cl_min_2d", "alpha", "cl", "cd", "cdp", "cm"],
+    )
+    propeller_profiles = propeller_aero.ComputePropellerPerformance().options[
+        "sections_profile_name_list"
+    ]
+    for profile_name in propeller_profiles:
+        data.to_csv(pth.join(resources_folder_path, profile_name + "_30S.csv"))
+    monkeypatch.setattr(propeller_aero, "xfoil", types.SimpleNamespace(__path__=[str(tmpdir)]))
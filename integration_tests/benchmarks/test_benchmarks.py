@@ -0,0 +1,195 @@
+"""
+Performance benchmarks of the most time consuming models, applied to the beechcraft 76.
+
+Median times are compared to baselines.json, run with FASTGA_SAVE_BENCHMARK_BASELINES=1 to update
+it (e.g. after an intended change of the models).
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os.path as pth
+
+import numpy as np
+import openmdao.api as om
+import pytest
+from fastoad.io import VariableIO
+from fastoad.io.configuration.configuration import FASTOADProblemConfigurator
+from fastoad.openmdao.variables import VariableList
+from openmdao.core.system import System
+
+import fastga.models.aerodynamics.unitary_tests as aerodynamics_tests
+import fastga.models.load_analysis.unitary_tests as load_analysis_tests
+import fastga.models.performances.unitary_tests as performances_tests
+import fastga.models.weight.mass_breakdown.unitary_tests as mass_breakdown_tests
+from fastga.models.aerodynamics.components.compute_propeller_aero import (
+    _ComputePropellerPerformance,
+)
+from fastga.models.aerodynamics.external.vlm import ComputeAEROvlm
+from fastga.models.aerodynamics.external.vlm.compute_aero import INPUT_AOA
+from fastga.models.load_analysis.wing.aerostructural_loads import AerostructuralLoad
+from fastga.models.performances.mission.mission import (
+    _compute_climb,
+    _compute_cruise,
+    _compute_descent,
+)
+from fastga.models.performances.payload_range.payload_range import ComputePayloadRange
+from fastga.models.performances.unitary_tests.dummy_engines import (
+    ENGINE_WRAPPER_BE76 as ENGINE_WRAPPER,
+)
+from fastga.models.weight.cg.cg_variation import InFlightCGVariation
+
+from tests.testing_utilities import list_inputs
+
+XML_FILE = "beechcraft_76.xml"
+OAD_DATA_FOLDER_PATH = pth.join(pth.dirname(__file__), "..", "oad_process", "data")
+
+
+def _data_file(tests_package) -> str:
+    return pth.join(tests_package.__path__[0], "data", XML_FILE)
+
+
+def get_indep_var_comp(component: System, *data_file_paths: str) -> om.IndepVarComp:
+    """
+    Reads the inputs of the component in the data files, a variable being read in the first file
+    that contains it.
+    """
+    var_names = list_inputs(component)
+    variables = VariableList()
+    for data_file_path in data_file_paths:
+        reader = VariableIO(data_file_path)
+        reader.path_separator = ":"
+        variables.update(
+            reader.read(only=[name for name in var_names if name not in variables.names()])
+        )
+
+    return variables.to_ivc()
+
+
+def setup_system(component: System, ivc: om.IndepVarComp) -> om.Problem:
+    """Same as tests.testing_utilities.run_system, without running the problem."""
+    problem = om.Problem()
+    problem.model.add_subsystem("inputs", ivc, promotes=["*"])
+    problem.model.add_subsystem("component", component, promotes=["*"])
+    problem.setup()
+    variables = VariableList.from_unconnected_inputs(problem)
+    assert not variables, "These inputs are not provided: %s" % variables.names()
+    problem.final_setup()
+
+    return problem
+
+
+@pytest.mark.parametrize("low_speed_aero", [False, True], ids=["cruise", "low_speed"])
+def test_vlm_compute_aero_coef(benchmark, low_speed_aero):
+    component = ComputeAEROvlm(low_speed_aero=low_speed_aero)
+    ivc = get_indep_var_comp(component, _data_file(aerodynamics_tests))
+    problem = setup_system(ComputeAEROvlm(low_speed_aero=low_speed_aero), ivc)
+    problem.run_model()
+
+    if low_speed_aero:
+        altitude = 0.0
+        mach = problem["data:aerodynamics:low_speed:mach"]
+    else:
+        altitude = problem.get_val("data:mission:sizing:main_route:cruise:altitude", units="m")
+        mach = problem["data:aerodynamics:cruise:mach"]
+    aero_vlm = problem.model.component.aero_vlm
+    results = benchmark(aero_vlm.compute_aero_coef, aero_vlm._inputs, altitude, mach, INPUT_AOA)
+
+    cl_alpha_wing = results[1]
+    assert 4.0 < cl_alpha_wing < 6.0
+
+
+def test_propeller_performance(benchmark):
+    def component():
+        return _ComputePropellerPerformance(
+            sections_profile_name_list=["naca4430"],
+            sections_profile_position_list=[0],
+            elements_number=3,
+            vectors_length=7,
+        )
+
+    ivc = get_indep_var_comp(component(), _data_file(aerodynamics_tests))
+    problem = setup_system(component(), ivc)
+    benchmark.pedantic(problem.run_model, rounds=1, warmup_rounds=0)
+
+    assert np.all(problem["data:aerodynamics:propeller:sea_level:thrust_limit"] > 0.0)
+
+
+@pytest.mark.parametrize(
+    "phase_name, phase_class",
+    [("climb", _compute_climb), ("cruise", _compute_cruise), ("descent", _compute_descent)],
+    ids=["climb", "cruise", "descent"],
+)
+def test_mission_phase(benchmark, phase_name, phase_class):
+    def group():
+        phase = om.Group()
+        phase.add_subsystem("in_flight_cg_variation", InFlightCGVariation(), promotes=["*"])
+        phase.add_subsystem(phase_name, phase_class(propulsion_id=ENGINE_WRAPPER), promotes=["*"])
+        return phase
+
+    ivc = get_indep_var_comp(group(), _data_file(performances_tests))
+    problem = setup_system(group(), ivc)
+    benchmark(problem.run_model)
+
+    assert problem.get_val("data:mission:sizing:main_route:%s:fuel" % phase_name) > 0.0
+
+
+def test_payload_range(benchmark):
+    ivc = get_indep_var_comp(
+        ComputePayloadRange(propulsion_id=ENGINE_WRAPPER), _data_file(performances_tests)
+    )
+    problem = setup_system(ComputePayloadRange(propulsion_id=ENGINE_WRAPPER), ivc)
+    benchmark.pedantic(problem.run_model, rounds=1, warmup_rounds=0)
+
+    assert np.all(np.isfinite(problem["data:payload_range:range_array"]))
+
+
+def test_aerostructural_load(benchmark):
+    # Slipstream results are taken from the mass breakdown data
+    ivc = get_indep_var_comp(
+        AerostructuralLoad(),
+        _data_file(load_analysis_tests),
+        _data_file(mass_breakdown_tests),
+    )
+    problem = setup_system(AerostructuralLoad(), ivc)
+    benchmark.pedantic(problem.run_model, rounds=10, warmup_rounds=1)
+
+    assert problem.get_val("data:loads:max_shear:mass", units="kg") == pytest.approx(
+        1747.3, abs=1e-1
+    )
+
+
+def test_sizing_mda(benchmark, tmpdir):
+    """Complete sizing loop of the overall aircraft design process of the beechcraft 76."""
+    with open(pth.join(OAD_DATA_FOLDER_PATH, "oad_process_be76.yml")) as file:
+        configuration = file.read()
+    configuration = configuration.replace("D:/tmp", pth.join(str(tmpdir), "aerodynamics"))
+    configuration = configuration.replace("../results", str(tmpdir))
+    configuration_file_path = pth.join(str(tmpdir), "oad_process_be76.yml")
+    with open(configuration_file_path, "w") as file:
+        file.write(configuration)
+
+    configurator = FASTOADProblemConfigurator(configuration_file_path)
+    configurator.write_needed_inputs(pth.join(OAD_DATA_FOLDER_PATH, "input_be76.xml"))
+    # Wing position inputs of the wing CG are not in the reference inputs
+    inputs_io = VariableIO(configurator.input_file_path)
+    inputs = inputs_io.read()
+    inputs["data:geometry:wing:dihedral"].value = [6.5]
+    inputs["data:geometry:wing:dihedral"].units = "deg"
+    inputs["data:geometry:wing:vertical_position"].value = [0.0]
+    inputs["data:geometry:wing:vertical_position"].units = "m"
+    inputs_io.write(inputs)
+    problem = configurator.get_problem(read_inputs=True)
+    problem.setup()
+    benchmark.pedantic(problem.run_model, rounds=1, warmup_rounds=0)
+
+    assert np.isfinite(problem.get_val("data:weight:aircraft:MTOW", units="kg"))
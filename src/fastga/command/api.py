@@ -24,8 +24,9 @@ from tempfile import TemporaryDirectory
 from copy import deepcopy
 from itertools import product
 from pathlib import Path
-from typing import Union, List
+from typing import Dict, Union, List, Tuple
 from platform import system
+import pandas as pd
 import openmdao.api as om
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.implicitcomponent import ImplicitComponent
@@ -40,13 +41,26 @@ from fastoad.openmdao.problem import FASTOADProblem
 from fastoad.io import DataFile, IVariableIOFormatter
 from fastoad.io.xml import VariableXmlStandardFormatter
 from fastoad.io import VariableIO
-from fastoad.io.configuration.configuration import AutoUnitsDefaultGroup
+from fastoad.io.configuration.configuration import (
+    AutoUnitsDefaultGroup,
+    FASTOADProblemConfigurator,
+)
 from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
 
 # noinspection PyProtectedMember
 from fastoad.cmd.api import _get_simple_system_list
 
 from fastga.utils.warnings import VariableDescriptionWarning
+from fastga.utils.mda_warm_start import WarmStartNonlinearBlockGS
+from fastga.utils.concurrent_execution import ConcurrentRunOnce
+from fastga.utils.profiling import ComponentProfiler, ProfilingReport
+from fastga.utils.batch_execution import run_batch
+from fastga.utils.checkpoint import MDACheckpointer
+from fastga.models.aerodynamics.external.vlm.vlm import VLMSimpleGeometry
+from fastga.models.aerodynamics.external.openvsp.openvsp import OPENVSPSimpleGeometry
+from fastga.models.handling_qualities.utils.reference_flight_condition import (
+    write_flight_condition_reports,
+)
 
 from . import resources
 
@@ -462,6 +476,289 @@ def write_needed_inputs(
     variables.save()
 
 
+def enable_mda_warm_start(
+    problem: om.Problem,
+    group_name: str = "aircraft_sizing",
+    use_aitken: bool = False,
+    cache_size: int = 50,
+    warm_start_variables: List[str] = None,
+) -> WarmStartNonlinearBlockGS:
+    """
+    Replaces the NonlinearBlockGS solver of the MDA group by a WarmStartNonlinearBlockGS keeping
+    its options, so that each new MDA (e.g. at each driver iteration) starts from the closest
+    previously converged point. Should be called before problem setup.
+
+    :param problem: the configured problem
+    :param group_name: path of the group solved with NonlinearBlockGS in the problem model
+    :param use_aitken: if True, activates Aitken acceleration of the Gauss-Seidel sweeps
+    :param cache_size: maximum number of converged points stored
+    :param warm_start_variables: promoted names of the loop variables to seed, default to MTOW,
+    wing area, wing position and sizing fuel
+    :return: the new solver of the group
+    """
+    group = problem.model._get_subsystem(group_name)
+    if group is None:
+        raise ValueError("Group %s not found in problem model!" % group_name)
+    if not isinstance(group.nonlinear_solver, om.NonlinearBlockGS):
+        raise TypeError(
+            "Warm start is only available for groups solved with NonlinearBlockGS, %s uses %s!"
+            % (group_name, type(group.nonlinear_solver).__name__)
+        )
+
+    solver = WarmStartNonlinearBlockGS()
+    for option_name, option_value in group.nonlinear_solver.options.items():
+        solver.options[option_name] = option_value
+    solver.options["use_aitken"] = use_aitken
+    solver.options["warm_start_cache_size"] = cache_size
+    if warm_start_variables is not None:
+        solver.options["warm_start_variables"] = warm_start_variables
+    group.nonlinear_solver = solver
+
+    return solver
+
+
+def enable_concurrent_execution(
+    problem: om.Problem, group_name: str, max_workers: int = None
+) -> ConcurrentRunOnce:
+    """
+    Makes the subsystems of a group run concurrently in a pool of processes on the local machine,
+    e.g. to overlap high speed and low speed aerodynamics gathered in a sub-group of the
+    configuration file. The subsystems of the group should not be connected to each other. Should
+    be called before problem setup.
+
+    :param problem: the configured problem
+    :param group_name: path of the group in the problem model
+    :param max_workers: maximum number of processes, default to the number of subsystems
+    :return: the new solver of the group
+    """
+    group = problem.model._get_subsystem(group_name)
+    if group is None:
+        raise ValueError("Group %s not found in problem model!" % group_name)
+    if type(group.nonlinear_solver) is not om.NonlinearRunOnce:
+        raise TypeError(
+            "Concurrent execution is only available for groups run once, %s uses %s!"
+            % (group_name, type(group.nonlinear_solver).__name__)
+        )
+
+    solver = ConcurrentRunOnce(max_workers=max_workers)
+    group.nonlinear_solver = solver
+
+    return solver
+
+
+def enable_aero_surrogate(problem: om.Problem, max_error: float = 0.01) -> List[str]:
+    """
+    Makes the VLM and OpenVSP computations of the problem predict the aerodynamic coefficients of
+    new geometries with a kriging surrogate of the results saved in their result folder, the
+    external code being run only if the estimated relative error exceeds max_error. Should be
+    called after problem setup, on components with a result folder.
+
+    :param problem: the problem after setup
+    :param max_error: maximum estimated relative error of the predicted coefficients
+    :return: paths of the components using the surrogate
+    """
+    component_paths = []
+    for component in problem.model.system_iter(recurse=True):
+        if (
+            isinstance(component, (VLMSimpleGeometry, OPENVSPSimpleGeometry))
+            and component.options["result_folder_path"] != ""
+        ):
+            component.options["surrogate_max_error"] = float(max_error)
+            component_paths.append(component.pathname)
+
+    return component_paths
+
+
+def enable_profiling(problem: om.Problem, report_folder_path: str = None) -> ComponentProfiler:
+    """
+    Records the time spent in each component compute, external code subprocess and nonlinear
+    solver iteration of the problem, along with the cache hits and misses of the external codes
+    results, at each run_model/run_driver. The report is logged at the end of each run.
+
+    :param problem: the problem to profile
+    :param report_folder_path: if provided, folder where the report is written after each run as
+    profiling.json and profiling.txt
+    :return: the profiler, whose report attribute gives the timings recorded so far
+    """
+    profiler = ComponentProfiler(report_folder_path)
+    profiler.attach(problem)
+
+    return profiler
+
+
+def run_profiled_problem(
+    configuration_file_path: str,
+    overwrite: bool = False,
+    mode: str = "run_model",
+    report_folder_path: str = None,
+) -> Tuple[FASTOADProblem, ProfilingReport]:
+    """
+    Same as fastoad.api.evaluate_problem (or optimize_problem if mode is "run_driver") with the
+    run profiled, see :func:`enable_profiling`. The reports of the reference flight conditions are
+    written at the end of the run, see :func:`enable_flight_condition_reports`.
+
+    :param configuration_file_path: problem definition
+    :param overwrite: if True, output file will be overwritten
+    :param mode: 'run_model' or 'run_driver'
+    :param report_folder_path: if provided, folder where the report is written
+    :return: the OpenMDAO problem after run and the profiling report
+    """
+    conf = FASTOADProblemConfigurator(configuration_file_path)
+    problem = conf.get_problem(read_inputs=True)
+
+    outputs_path = pth.normpath(problem.output_file_path)
+    if not overwrite and pth.exists(outputs_path):
+        raise FastFileExistsError(
+            "Problem not run because output file %s already exists. "
+            "Use overwrite=True to bypass." % outputs_path,
+            outputs_path,
+        )
+
+    problem.setup()
+    enable_flight_condition_reports(problem)
+    profiler = enable_profiling(problem, report_folder_path)
+    getattr(problem, mode)()
+    problem.write_outputs()
+
+    return problem, profiler.report
+
+
+def enable_flight_condition_reports(problem: om.Problem):
+    """
+    Makes run_model and run_driver of the problem write the reports of its reference flight
+    conditions (readme_test_data.txt) in their result folder once the run is done.
+
+    :param problem: the problem whose runs write the reports
+    """
+    for method_name in ["run_model", "run_driver"]:
+        setattr(problem, method_name, _with_flight_condition_reports(problem, method_name))
+
+
+def _with_flight_condition_reports(problem: om.Problem, method_name: str):
+    run = getattr(problem, method_name)
+
+    def wrapped_run(*args, **kwargs):
+        result = run(*args, **kwargs)
+        write_flight_condition_reports(problem)
+        return result
+
+    return wrapped_run
+
+
+def enable_checkpoints(
+    problem: om.Problem,
+    checkpoint_file_path: str,
+    group_name: str = "aircraft_sizing",
+    period: int = 1,
+    restart: bool = True,
+) -> MDACheckpointer:
+    """
+    Writes the state of the problem (outputs, solver iteration count, warm start cache) every
+    period iterations of the nonlinear solver of the MDA group, and if restart is True and the
+    checkpoint file exists, resumes the problem from it. Should be called after problem setup.
+    The driver state is not checkpointed, so that a checkpoint written during an optimization is
+    not restored.
+
+    :param problem: the problem after setup
+    :param checkpoint_file_path: path of the checkpoint file
+    :param group_name: path of the group solved iteratively in the problem model
+    :param period: number of solver iterations between two checkpoints
+    :param restart: if True, the problem is set back to the state of the existing checkpoint
+    :return: the checkpointer, whose remove method deletes the checkpoint once no more needed
+    """
+    checkpointer = MDACheckpointer(checkpoint_file_path, group_name, period)
+    checkpointer.attach(problem)
+    if restart:
+        problem.final_setup()
+        checkpointer.restore()
+
+    return checkpointer
+
+
+def run_problem_with_checkpoints(
+    configuration_file_path: str,
+    overwrite: bool = False,
+    checkpoint_file_path: str = None,
+    group_name: str = "aircraft_sizing",
+    period: int = 1,
+) -> FASTOADProblem:
+    """
+    Same as fastoad.api.evaluate_problem with the MDA checkpointed, see
+    :func:`enable_checkpoints`. If a previous run has been interrupted, it is resumed from its
+    last checkpoint. The checkpoint is deleted once the run is complete. Optimizations are not
+    supported, as the state of the driver is not checkpointed. The reports of the reference flight
+    conditions are written at the end of the run.
+
+    :param configuration_file_path: problem definition
+    :param overwrite: if True, output file will be overwritten
+    :param checkpoint_file_path: path of the checkpoint file, default to the output file path
+    with a _checkpoint.pkl suffix
+    :param group_name: path of the group solved iteratively in the problem model
+    :param period: number of solver iterations between two checkpoints
+    :return: the OpenMDAO problem after run
+    """
+    conf = FASTOADProblemConfigurator(configuration_file_path)
+    problem = conf.get_problem(read_inputs=True)
+
+    outputs_path = pth.normpath(problem.output_file_path)
+    if not overwrite and pth.exists(outputs_path):
+        raise FastFileExistsError(
+            "Problem not run because output file %s already exists. "
+            "Use overwrite=True to bypass." % outputs_path,
+            outputs_path,
+        )
+    if checkpoint_file_path is None:
+        checkpoint_file_path = pth.splitext(outputs_path)[0] + "_checkpoint.pkl"
+
+    problem.setup()
+    checkpointer = enable_checkpoints(problem, checkpoint_file_path, group_name, period)
+    problem.run_model()
+    write_flight_condition_reports(problem)
+    problem.write_outputs()
+    checkpointer.remove()
+
+    return problem
+
+
+def run_design_points(
+    configuration_file_path: str,
+    design_points: Union[str, pd.DataFrame],
+    result_file_path: str,
+    output_names: List[str] = None,
+    units: Dict[str, str] = None,
+    max_workers: int = None,
+) -> pd.DataFrame:
+    """
+    Runs the problem of a configuration file at each design point of a table (e.g. a DOE over
+    GA configurations), in a pool of worker processes. Each worker sets the problem up once and
+    keeps its caches (digitized figures, airfoil profiles, polar results, engine maps) from one
+    case to the next, and the results of all cases are written in a single .csv file.
+
+    :param configuration_file_path: problem definition, with an existing input file
+    :param design_points: table, or path to a .csv file, with one row per case and one column per
+    problem input to modify (scalar values), the other inputs keeping the values of the input file
+    :param result_file_path: path of the .csv file where results are written
+    :param output_names: variables to store for each case, default to all the problem outputs
+    :param units: units of the design point and output values, by variable name, default to the
+    units of the problem
+    :param max_workers: maximum number of worker processes, default to the number of CPUs. With
+    1, cases are run in the current process
+    :return: the result table, with the design points, the output values and the status of each
+    case (success, error message, run time in s and process id)
+    """
+    if isinstance(design_points, str):
+        design_points = pd.read_csv(design_points)
+
+    return run_batch(
+        configuration_file_path,
+        design_points,
+        result_file_path=result_file_path,
+        output_names=output_names,
+        units=units,
+        max_workers=max_workers,
+    )
+
+
 def list_ivc_outputs_name(local_system: Union[ExplicitComponent, ImplicitComponent, Group]):
     """
     List all "root" components in the systems, meaning the components that don't have any
@@ -609,6 +906,7 @@ def generate_block_analysis(
                 problem_local = FASTOADProblem(group_local)
                 problem_local.setup()
                 problem_local.run_model()
+                write_flight_condition_reports(problem_local)
                 if overwrite:
                     problem_local.output_file_path = xml_file_path
                     problem_local.write_outputs()
@@ -1,9 +1,21 @@
+import os
+import sys
+import time
+
 import numpy as np
 import openmdao.api as om
+from openmdao.components.external_code_comp import ExternalCodeComp
+from openmdao.test_suite.components.sellar import SellarDis1, SellarDis2
 
 from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
 from fastoad.module_management.constants import ModelDomain
 
+from fastga.models.handling_qualities.check_modes.mode_check import ModeCheck
+from fastga.models.handling_qualities.utils.reference_flight_condition import (
+    ReferenceFlightCondition,
+)
+from fastga.utils.profiling import record_cache_access
+
 
 class Disc1(om.ExplicitComponent):
     """An OpenMDAO component to encapsulate Disc1 discipline and test"""
@@ -54,3 +66,78 @@ class Disc3(om.Group):
         ivc.add_output("data:geometry:variable_1", val=self.options["ivc_value"])
         self.add_subsystem("ivc1", ivc, promotes=["*"])
         self.add_subsystem("disc1", Disc1(), promotes=["*"])
+
+
+class SellarCycle(om.Group):
+    """An OpenMDAO group with the coupled Sellar disciplines to test MDA solvers"""
+
+    def setup(self):
+        self.add_subsystem("disc1", SellarDis1(), promotes=["*"])
+        self.add_subsystem("disc2", SellarDis2(), promotes=["*"])
+
+
+class SlowDisc(om.ExplicitComponent):
+    """An OpenMDAO component with a long computation that reports the process it ran in"""
+
+    def initialize(self):
+        self.options.declare("index", types=int, default=1)
+        self.options.declare("duration", types=float, default=0.5)
+
+    def setup(self):
+        index = str(self.options["index"])
+        self.add_input("data:geometry:variable_" + index, val=np.nan)
+        self.add_output("data:geometry:result_" + index)
+        self.add_output("data:geometry:process_id_" + index)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        index = str(self.options["index"])
+        time.sleep(self.options["duration"])
+        outputs["data:geometry:result_" + index] = 2.0 * inputs["data:geometry:variable_" + index]
+        outputs["data:geometry:process_id_" + index] = os.getpid()
+
+
+class ExternalDisc(ExternalCodeComp):
+    """An OpenMDAO component running a subprocess, whose result is never found in cache"""
+
+    def setup(self):
+        self.add_input("data:geometry:variable_1", val=np.nan)
+        self.add_output("data:geometry:result_external")
+        self.options["command"] = [sys.executable, "-c", "pass"]
+        self.stderr = os.devnull
+
+    def compute(self, inputs, outputs):
+        record_cache_access(False)
+        super().compute(inputs, outputs)
+        outputs["data:geometry:result_external"] = inputs["data:geometry:variable_1"]
+
+
+class DiscreteDisc(om.ExplicitComponent):
+    """An OpenMDAO component with a discrete output"""
+
+    def setup(self):
+        self.add_input("data:geometry:variable_1", val=np.nan)
+        self.add_discrete_output("data:geometry:sign", val=1)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        discrete_outputs["data:geometry:sign"] = int(np.sign(inputs["data:geometry:variable_1"]))
+
+
+@RegisterOpenMDAOSystem("test.dummy_module.counting_check", domain=ModelDomain.OTHER)
+class CountingCheck(ModeCheck):
+    """A mode check counting its evaluations in a discrete output"""
+
+    def setup(self):
+        self.add_input("data:geometry:variable_3", val=np.nan)
+        self.add_discrete_output("data:geometry:evaluation_count", val=0)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        discrete_outputs["data:geometry:evaluation_count"] += 1
+        self.record_check(variable_3=inputs["data:geometry:variable_3"])
+
+    def plot_check(self, record, results_folder_path, plot_name_suffix=""):
+        return []
+
+
+@RegisterOpenMDAOSystem("test.dummy_module.flight_condition", domain=ModelDomain.OTHER)
+class FlightCondition(ReferenceFlightCondition):
+    """The reference flight condition of the handling qualities, used in a configuration file"""
@@ -13,14 +13,30 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os.path as pth
+import json
+import shutil
 import os
+import subprocess
+import sys
 import pytest
+import numpy as np
+import pandas as pd
+import openmdao.api as om
 import warnings
+from platform import system
 
 from fastoad.io.configuration.configuration import FASTOADProblemConfigurator
 
 from fastga.command import api
-from fastga.command.unitary_tests.dummy_classes import Disc1, Disc2, Disc3
+from fastga.command.unitary_tests.dummy_classes import (
+    Disc1,
+    Disc2,
+    Disc3,
+    DiscreteDisc,
+    ExternalDisc,
+    SellarCycle,
+    SlowDisc,
+)
 from fastga import models
 from fastga.models import (
     aerodynamics,
@@ -31,6 +47,7 @@ from fastga.models import (
     performances,
 )
 from fastga.models.weight import cg, mass_breakdown
+from fastga.utils import batch_execution
 from fastga.utils.warnings import VariableDescriptionWarning
 
 RESULTS_FOLDER = pth.join(pth.dirname(__file__), "results")
@@ -263,3 +280,367 @@ def test_variable_descriptions_auto_gen():
                     counter += 1
 
         assert counter == 0
+
+
+def test_mda_warm_start():
+    def _create_problem():
+        # Problem with a coupled group solved as in configuration files
+        problem = om.Problem()
+        ivc = om.IndepVarComp()
+        ivc.add_output("x", val=1.0)
+        ivc.add_output("z", val=np.array([5.0, 2.0]))
+        problem.model.add_subsystem("ivc", ivc, promotes=["*"])
+        cycle = problem.model.add_subsystem("cycle", SellarCycle(), promotes=["*"])
+        cycle.nonlinear_solver = om.NonlinearBlockGS(maxiter=50, rtol=1e-3, iprint=-1)
+        return problem
+
+    problem = _create_problem()
+    with pytest.raises(ValueError):
+        api.enable_mda_warm_start(problem, "unknown_group")
+    with pytest.raises(TypeError):
+        api.enable_mda_warm_start(problem, "")
+
+    solver = api.enable_mda_warm_start(problem, "cycle", warm_start_variables=["y1", "y2"])
+    assert solver.options["rtol"] == pytest.approx(1e-3, abs=1e-9)
+    problem.setup()
+
+    # Cold start, loop variables starting from their default values
+    problem.run_model()
+    cold_iterations = solver._iter_count
+    assert len(solver.cache) == 1
+
+    # Loop variables are reset as if read from default values, warm start should restore the
+    # closest converged point and need fewer iterations
+    problem["y1"] = 1.0
+    problem["y2"] = 1.0
+    problem["z"] = np.array([5.05, 2.0])
+    problem.run_model()
+    assert solver._iter_count < cold_iterations
+    assert len(solver.cache) == 2
+    _, _, distance = solver.cache.nearest(np.array([1.0, 5.05, 2.0]))
+    assert distance == pytest.approx(0.0, abs=1e-12)
+
+    # Check that the converged point is the same as without warm start
+    reference_problem = _create_problem()
+    reference_problem.setup()
+    reference_problem["z"] = np.array([5.05, 2.0])
+    reference_problem.run_model()
+    assert problem["y1"] == pytest.approx(reference_problem["y1"], rel=1e-3)
+    assert problem["y2"] == pytest.approx(reference_problem["y2"], rel=1e-3)
+
+    # Far from the converged points, the relative tolerance applies to the actual initial
+    # residual, so the converged point keeps the same accuracy
+    problem["x"] = 3.0
+    problem["z"] = np.array([8.0, 1.0])
+    problem.run_model()
+    assert len(solver.cache) == 3
+    reference_problem["x"] = 3.0
+    reference_problem["z"] = np.array([8.0, 1.0])
+    reference_problem["y1"] = 1.0
+    reference_problem["y2"] = 1.0
+    reference_problem.run_model()
+    assert problem["y1"] == pytest.approx(reference_problem["y1"], rel=1e-3)
+    assert problem["y2"] == pytest.approx(reference_problem["y2"], rel=1e-3)
+
+
+@pytest.mark.skipif(system() == "Windows", reason="processes can not be forked on Windows")
+def test_concurrent_execution():
+    def _create_problem(connected_stage: bool = False):
+        problem = om.Problem()
+        ivc = om.IndepVarComp()
+        ivc.add_output("data:geometry:variable_1", val=1.0)
+        ivc.add_output("data:geometry:variable_2", val=2.0)
+        problem.model.add_subsystem("ivc", ivc, promotes=["*"])
+        stage = problem.model.add_subsystem("stage", om.Group(), promotes=["*"])
+        stage.add_subsystem("disc1", SlowDisc(index=1), promotes=["*"])
+        stage.add_subsystem("disc2", SlowDisc(index=2), promotes=["*"])
+        if connected_stage:
+            stage.add_subsystem("disc3", SlowDisc(index=3, duration=0.0), promotes=["*"])
+            stage.connect("data:geometry:result_1", "data:geometry:variable_3")
+        return problem
+
+    problem = _create_problem()
+    with pytest.raises(ValueError):
+        api.enable_concurrent_execution(problem, "unknown_group")
+    api.enable_concurrent_execution(problem, "stage", max_workers=2)
+    problem.setup()
+    problem.final_setup()
+
+    serial_problem = _create_problem()
+    serial_problem.setup()
+    serial_problem.run_model()
+
+    # Both computations run in other processes, with the same results as the serial run
+    problem.run_model()
+    assert problem["data:geometry:result_1"] == pytest.approx(
+        serial_problem["data:geometry:result_1"], abs=1e-9
+    )
+    assert problem["data:geometry:result_2"] == pytest.approx(
+        serial_problem["data:geometry:result_2"], abs=1e-9
+    )
+    solver = problem.model.stage.nonlinear_solver
+    worker_process_ids = {process.pid for process in solver._pool._pool}
+    assert os.getpid() not in worker_process_ids
+    assert {
+        problem["data:geometry:process_id_1"][0],
+        problem["data:geometry:process_id_2"][0],
+    } <= worker_process_ids
+
+    # Processes are reused by the next run, which is done with the new inputs
+    problem["data:geometry:variable_1"] = 3.0
+    problem.run_model()
+    assert problem["data:geometry:result_1"] == pytest.approx(6.0, abs=1e-9)
+    assert problem["data:geometry:result_2"] == pytest.approx(4.0, abs=1e-9)
+    assert {
+        problem["data:geometry:process_id_1"][0],
+        problem["data:geometry:process_id_2"][0],
+    } <= worker_process_ids
+    solver.close()
+    assert solver._pool is None
+
+    # Subsystems connected to each other can not run concurrently
+    problem = _create_problem(connected_stage=True)
+    api.enable_concurrent_execution(problem, "stage")
+    with pytest.raises(RuntimeError):
+        problem.setup()
+        problem.final_setup()
+
+    # Nor subsystems with discrete variables, whose values would not come back
+    problem = _create_problem()
+    problem.model.stage.add_subsystem("disc4", DiscreteDisc(), promotes=["*"])
+    api.enable_concurrent_execution(problem, "stage")
+    with pytest.raises(RuntimeError):
+        problem.setup()
+        problem.final_setup()
+
+
+def test_models_import_time():
+    """
+    Checks with python -X importtime that loading the FAST-GA models as FAST-OAD plugins does not
+    import the plotting and command modules, which are only needed when used.
+    """
+
+    deferred_modules = ["matplotlib.pyplot", "fastga.command.api"]
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import fastoad.api"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+    )
+    assert result.returncode == 0
+
+    # Lines are formatted as "import time: self [us] | cumulative | imported package"
+    imported_modules = {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+    assert any(name.startswith("fastga.models.") for name in imported_modules)
+    for module_name in deferred_modules:
+        assert module_name not in imported_modules
+
+
+def test_profiling(tmpdir):
+    problem = om.Problem()
+    ivc = om.IndepVarComp()
+    ivc.add_output("x", val=1.0)
+    ivc.add_output("z", val=np.array([5.0, 2.0]))
+    ivc.add_output("data:geometry:variable_1", val=1.0)
+    problem.model.add_subsystem("ivc", ivc, promotes=["*"])
+    cycle = problem.model.add_subsystem("cycle", SellarCycle(), promotes=["*"])
+    cycle.nonlinear_solver = om.NonlinearBlockGS(maxiter=50, rtol=1e-6, iprint=-1)
+    problem.model.add_subsystem("slow", SlowDisc(duration=0.1), promotes=["*"])
+    problem.model.add_subsystem("external", ExternalDisc(), promotes=["*"])
+
+    report_folder_path = pth.join(tmpdir, "profiling")
+    profiler = api.enable_profiling(problem, report_folder_path)
+    problem.setup()
+    problem.run_model()
+    problem.run_model()
+
+    report = profiler.report
+    records = {(record["name"], record["kind"]): record for record in report.records}
+    slow_record = records[("slow", "compute")]
+    assert slow_record["calls"] == 2
+    assert slow_record["mean_time"] == pytest.approx(0.1, abs=0.05)
+    assert report.sorted()[0]["name"] in ["model", "slow", "external"]
+    assert records[("external", "compute")]["cache_misses"] == 2
+    assert records[("external", "external_code")]["calls"] == 2
+    iteration_count = records[("cycle", "solver_iteration")]["calls"]
+    assert iteration_count > 2
+    assert records[("cycle.disc1", "compute")]["calls"] >= iteration_count
+    assert report.total_time >= 0.2
+    assert pth.exists(pth.join(report_folder_path, "profiling.txt"))
+    with open(pth.join(report_folder_path, "profiling.json")) as json_file:
+        assert len(json.load(json_file)["records"]) == len(report.records)
+    assert "slow" in report.summary(sort_by="calls", kind="compute")
+    with pytest.raises(ValueError):
+        report.sorted("unknown")
+
+    # Once detached, runs are not recorded anymore
+    profiler.reset()
+    profiler.detach()
+    problem.run_model()
+    assert not profiler.report.records
+
+
+def test_flight_condition_reports(tmpdir):
+    configuration_file_path = pth.join(tmpdir, "flight_condition.yml")
+    with open(configuration_file_path, "w") as file:
+        file.write(
+            "title: Reference flight condition\n"
+            "module_folders: %s\n"
+            "input_file: ./inputs.xml\n"
+            "output_file: ./outputs.xml\n"
+            "model:\n"
+            "    flight_condition:\n"
+            "        id: test.dummy_module.flight_condition\n"
+            "        result_folder_path: %s\n"
+            % (pth.dirname(__file__), pth.join(tmpdir, "results"))
+        )
+    shutil.copy(pth.join(DATA_FOLDER_PATH, "flight_condition.xml"), pth.join(tmpdir, "inputs.xml"))
+    os.mkdir(pth.join(tmpdir, "results"))
+    report_file_path = pth.join(tmpdir, "results", "readme_test_data.txt")
+
+    problem, _ = api.run_profiled_problem(configuration_file_path)
+    assert pth.exists(report_file_path)
+
+    # Each run of the problem writes the report again
+    os.remove(report_file_path)
+    problem.run_model()
+    assert pth.exists(report_file_path)
+
+
+def test_run_design_points(tmpdir):
+    configuration_file_path = pth.join(tmpdir, "batch.yml")
+    with open(configuration_file_path, "w") as file:
+        file.write(
+            "title: Batch of design points\n"
+            "module_folders: %s\n"
+            "input_file: ./inputs.xml\n"
+            "output_file: ./outputs.xml\n"
+            "model:\n"
+            "    disc:\n"
+            "        id: test.dummy_module.disc3\n" % pth.dirname(__file__)
+        )
+    shutil.copy(pth.join(DATA_FOLDER_PATH, "complete.xml"), pth.join(tmpdir, "inputs.xml"))
+
+    # variable_4 = variable_1 (6.0 from the IVC of the model) + 3.0 * 5.0 - variable_3
+    design_points = pd.DataFrame({"data:geometry:variable_3": [0.0, 1.0, 2.0, 0.0]})
+    result_file_path = pth.join(tmpdir, "results", "design_points.csv")
+    results = api.run_design_points(
+        configuration_file_path,
+        design_points,
+        result_file_path,
+        output_names=["data:geometry:variable_4"],
+        max_workers=2,
+    )
+    assert results["success"].all()
+    assert results["data:geometry:variable_4"].to_numpy() == pytest.approx(
+        [21.0, 20.0, 19.0, 21.0], abs=1e-6
+    )
+    written_results = pd.read_csv(result_file_path, index_col=0)
+    assert list(written_results.columns) == list(results.columns)
+    assert written_results["data:geometry:variable_4"].to_numpy() == pytest.approx(
+        results["data:geometry:variable_4"].to_numpy()
+    )
+    assert (results["process_id"] != os.getpid()).all()
+
+    # Design points read from file and run in the current process, in other units
+    design_points_file_path = pth.join(tmpdir, "design_points.csv")
+    pd.DataFrame({"data:geometry:variable_2": [10.0, 20.0]}).to_csv(
+        design_points_file_path, index=False
+    )
+    results = api.run_design_points(
+        configuration_file_path,
+        design_points_file_path,
+        result_file_path,
+        units={"data:geometry:variable_2": "dm**2"},
+        max_workers=1,
+    )
+    assert results["data:geometry:variable_4"].to_numpy() == pytest.approx([4.01, 4.04], abs=1e-6)
+    assert (results["process_id"] == os.getpid()).all()
+
+    # State left by the previous cases (discrete variables, mode check records) is reset
+    with open(configuration_file_path, "a") as file:
+        file.write("    check:\n        id: test.dummy_module.counting_check\n")
+    results = api.run_design_points(
+        configuration_file_path,
+        design_points,
+        result_file_path,
+        output_names=["data:geometry:variable_4", "data:geometry:evaluation_count"],
+        max_workers=1,
+    )
+    assert results["data:geometry:evaluation_count"].to_list() == [1, 1, 1, 1]
+    check = batch_execution._BATCH_RUNNER.problem.model.check
+    assert len(check.check_records) == 1
+    assert check.check_records[0]["variable_3"] == pytest.approx(0.0)
+
+    with pytest.raises(ValueError):
+        api.run_design_points(
+            configuration_file_path,
+            pd.DataFrame({"data:geometry:variable_4": [1.0]}),
+            result_file_path,
+            max_workers=1,
+        )
+
+
+def test_checkpoints(tmpdir, monkeypatch):
+    def sellar_problem(x=1.0, maxiter=50):
+        problem = om.Problem()
+        ivc = om.IndepVarComp()
+        ivc.add_output("x", val=x)
+        ivc.add_output("z", val=np.array([5.0, 2.0]))
+        problem.model.add_subsystem("ivc", ivc, promotes=["*"])
+        cycle = problem.model.add_subsystem("cycle", SellarCycle(), promotes=["*"])
+        cycle.nonlinear_solver = om.NonlinearBlockGS(
+            maxiter=maxiter, rtol=1e-10, atol=1e-12, iprint=-1
+        )
+        problem.setup()
+        return problem
+
+    reference_problem = sellar_problem()
+    reference_problem.run_model()
+    reference_iteration_count = reference_problem.model.cycle.nonlinear_solver._iter_count
+
+    # Run interrupted after 3 iterations
+    checkpoint_file_path = pth.join(tmpdir, "checkpoint.pkl")
+    problem = sellar_problem(maxiter=3)
+    checkpointer = api.enable_checkpoints(problem, checkpoint_file_path, group_name="cycle")
+    problem.run_model()
+    assert pth.exists(checkpoint_file_path)
+    assert not [name for name in os.listdir(tmpdir) if name.endswith(".tmp")]
+
+    # Restarted run continues from the 3rd iteration
+    problem = sellar_problem()
+    checkpointer = api.enable_checkpoints(problem, checkpoint_file_path, group_name="cycle")
+    assert problem["y1"] == pytest.approx(
+        pd.read_pickle(checkpoint_file_path)["outputs"]["cycle.disc1.y1"], rel=1e-12
+    )
+    problem.run_model()
+    iteration_count = problem.model.cycle.nonlinear_solver._iter_count
+    assert iteration_count == pytest.approx(reference_iteration_count, abs=1)
+    assert problem["y1"] == pytest.approx(reference_problem["y1"], rel=1e-8)
+    assert problem["y2"] == pytest.approx(reference_problem["y2"], rel=1e-8)
+    checkpointer.remove()
+    assert not pth.exists(checkpoint_file_path)
+
+    # Checkpoint of other inputs is not used
+    problem = sellar_problem(maxiter=3)
+    api.enable_checkpoints(problem, checkpoint_file_path, group_name="cycle")
+    problem.run_model()
+    problem = sellar_problem(x=2.0)
+    checkpointer = api.enable_checkpoints(problem, checkpoint_file_path, group_name="cycle")
+    assert not checkpointer.restore()
+
+    with pytest.raises(TypeError):
+        api.enable_checkpoints(problem, checkpoint_file_path, group_name="ivc")
+    with pytest.raises(ValueError):
+        api.enable_checkpoints(problem, checkpoint_file_path, group_name="unknown")
+
+    # OpenMDAO internals are only used with checked versions
+    monkeypatch.setattr("openmdao.__version__", "4.0.0")
+    with pytest.raises(RuntimeError):
+        api.enable_checkpoints(problem, checkpoint_file_path, group_name="cycle")
@@ -12,14 +12,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import math
-
 import numpy as np
 
 from openmdao.core.explicitcomponent import ExplicitComponent
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
+from .parasite_drag import ParasiteDrag
 from ..constants import SUBMODEL_CD0_FUSELAGE
 
 
@@ -53,31 +52,14 @@ class Cd0Fuselage(ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        height = inputs["data:geometry:fuselage:maximum_height"]
-        width = inputs["data:geometry:fuselage:maximum_width"]
-        length = inputs["data:geometry:fuselage:length"]
-        wet_area_fus = inputs["data:geometry:fuselage:wet_area"]
-        wing_area = inputs["data:geometry:wing:area"]
         if self.options["low_speed_aero"]:
             unit_reynolds = inputs["data:aerodynamics:low_speed:unit_reynolds"]
         else:
             unit_reynolds = inputs["data:aerodynamics:cruise:unit_reynolds"]
 
-        # Local Reynolds:
-        reynolds = unit_reynolds * length
-        # 5% NLF
-        x_trans = 0.05
-        # Roots
-        x0_turbulent = 36.9 * x_trans ** 0.625 * (1.0 / reynolds) ** 0.375
-        cf_fus = 0.074 / reynolds ** 0.2 * (1.0 - (x_trans - x0_turbulent)) ** 0.8
-        f = length / math.sqrt(4 * height * width / math.pi)
-        ff_fus = 1.0 + 60.0 / (f ** 3.0) + f / 400.0
-        # Fuselage
-        cd0_fuselage = cf_fus * ff_fus * wet_area_fus / wing_area
-        # Cockpit window (Gudmundsson p727)
-        cd0_window = 0.002 * (height * width) / wing_area
+        cd0 = ParasiteDrag(inputs).fuselage(unit_reynolds)
 
         if self.options["low_speed_aero"]:
-            outputs["data:aerodynamics:fuselage:low_speed:CD0"] = cd0_fuselage + cd0_window
+            outputs["data:aerodynamics:fuselage:low_speed:CD0"] = cd0
         else:
-            outputs["data:aerodynamics:fuselage:cruise:CD0"] = cd0_fuselage + cd0_window
+            outputs["data:aerodynamics:fuselage:cruise:CD0"] = cd0
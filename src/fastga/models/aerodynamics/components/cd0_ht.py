@@ -12,16 +12,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import math
-
 import numpy as np
 
 from openmdao.core.explicitcomponent import ExplicitComponent
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
-from fastga.models.geometry.profiles.get_profile import get_profile
-
+from .parasite_drag import ParasiteDrag
 from ..constants import SUBMODEL_CD0_HT
 
 
@@ -59,12 +56,6 @@ class Cd0HorizontalTail(ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        tip_chord = inputs["data:geometry:horizontal_tail:tip:chord"]
-        root_chord = inputs["data:geometry:horizontal_tail:root:chord"]
-        sweep_25_ht = inputs["data:geometry:horizontal_tail:sweep_25"]
-        wet_area_ht = inputs["data:geometry:horizontal_tail:wet_area"]
-        wing_area = inputs["data:geometry:wing:area"]
-        thickness = inputs["data:geometry:horizontal_tail:thickness_ratio"]
         if self.options["low_speed_aero"]:
             mach = inputs["data:aerodynamics:low_speed:mach"]
             unit_reynolds = inputs["data:aerodynamics:low_speed:unit_reynolds"]
@@ -72,31 +63,8 @@ class Cd0HorizontalTail(ExplicitComponent):
             mach = inputs["data:aerodynamics:cruise:mach"]
             unit_reynolds = inputs["data:aerodynamics:cruise:unit_reynolds"]
 
-        # Sear max thickness position ratio
-        profile = get_profile(file_name=self.options["htp_airfoil_file"])
-        relative_thickness = profile.get_relative_thickness()
-        index = int(
-            np.where(relative_thickness["thickness"] == np.max(relative_thickness["thickness"]))[0]
-        )
-        x_t_max = relative_thickness["x"][index]
-        # Root: 50% NLF
-        x_trans = 0.5
-        x0_turbulent = 36.9 * x_trans ** 0.625 * (1 / (unit_reynolds * root_chord)) ** 0.375
-        cf_root = (
-            0.074 / (unit_reynolds * root_chord) ** 0.2 * (1 - (x_trans - x0_turbulent)) ** 0.8
-        )
-        # Tip: 50% NLF
-        x_trans = 0.5
-        x0_turbulent = 36.9 * x_trans ** 0.625 * (1 / (unit_reynolds * tip_chord)) ** 0.375
-        cf_tip = 0.074 / (unit_reynolds * tip_chord) ** 0.2 * (1 - (x_trans - x0_turbulent)) ** 0.8
-        # Global
-        cf_ht = (cf_root + cf_tip) * 0.5
-        ff = 1 + 0.6 / x_t_max * thickness + 100 * thickness ** 4
-        ff = ff * 1.05  # Due to hinged elevator (Raymer)
-        if mach > 0.2:
-            ff = ff * 1.34 * mach ** 0.18 * (math.cos(sweep_25_ht * math.pi / 180)) ** 0.28
-        interference_factor = 1.05
-        cd0 = ff * interference_factor * cf_ht * wet_area_ht / wing_area
+        parasite_drag = ParasiteDrag(inputs, htp_airfoil_file=self.options["htp_airfoil_file"])
+        cd0 = parasite_drag.horizontal_tail(mach, unit_reynolds)
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:horizontal_tail:low_speed:CD0"] = cd0
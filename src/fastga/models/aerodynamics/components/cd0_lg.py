@@ -18,6 +18,7 @@ from openmdao.core.explicitcomponent import ExplicitComponent
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
+from .parasite_drag import ParasiteDrag
 from ..constants import SUBMODEL_CD0_LANDING_GEAR
 
 
@@ -47,38 +48,9 @@ class Cd0LandingGear(ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        lg_type = inputs["data:geometry:landing_gear:type"]
-        lg_height = inputs["data:geometry:landing_gear:height"]
-        wing_area = inputs["data:geometry:wing:area"]
+        cd0 = ParasiteDrag(inputs).landing_gear(self.options["low_speed_aero"])
 
-        if lg_type == 0.0:  # non-retractable LG AC (ref: Cirrus SR22)
-            # Gudmundsson example 15.12 (page 721)
-            area_mlg = 15 * 6 * 0.0254 ** 2  # Frontal area of wheel (data in inches)
-            area_nlg = 14 * 5 * 0.0254 ** 2
-            # MLG
-            cd_wheel = 0.484
-            cd0_mlg = cd_wheel * area_mlg / wing_area
-            # NLG
-            cd_wheel = 0.484 / 2
-            cd0_nlg = cd_wheel * area_nlg / wing_area
-            cd0 = cd0_mlg + cd0_nlg
-
-            if self.options["low_speed_aero"]:
-                outputs["data:aerodynamics:landing_gear:low_speed:CD0"] = cd0
-            else:
-                outputs["data:aerodynamics:landing_gear:cruise:CD0"] = cd0
-
-        else:  # retractable LG AC
-            tyre_width = 5 * 0.0254
-            # MLG
-            cd_mlg = 1.2
-            area_mlg = tyre_width * 1.8 * lg_height
-            # NLG
-            cd_nlg = 0.65
-            area_nlg = 14 * 5 * 0.0254 ** 2
-            cd0 = (cd_mlg * area_mlg + cd_nlg * area_nlg) / wing_area
-
-            if self.options["low_speed_aero"]:
-                outputs["data:aerodynamics:landing_gear:low_speed:CD0"] = cd0
-            else:
-                outputs["data:aerodynamics:landing_gear:cruise:CD0"] = 0.0
+        if self.options["low_speed_aero"]:
+            outputs["data:aerodynamics:landing_gear:low_speed:CD0"] = cd0
+        else:
+            outputs["data:aerodynamics:landing_gear:cruise:CD0"] = cd0
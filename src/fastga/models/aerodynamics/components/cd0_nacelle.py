@@ -14,8 +14,6 @@
 
 import numpy as np
 
-import warnings
-
 from openmdao.core.explicitcomponent import ExplicitComponent
 
 # noinspection PyProtectedMember
@@ -24,6 +22,7 @@ from fastoad.module_management.service_registry import RegisterSubmodel
 
 from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
 
+from .parasite_drag import ParasiteDrag
 from ..constants import SUBMODEL_CD0_NACELLE
 
 
@@ -64,11 +63,6 @@ class Cd0Nacelle(ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        propulsion_model = FuelEngineSet(self._engine_wrapper.get_model(inputs), 1.0)
-        engine_number = inputs["data:geometry:propulsion:engine:count"]
-        prop_layout = inputs["data:geometry:propulsion:engine:layout"]
-        l0_wing = inputs["data:geometry:wing:MAC:length"]
-        wing_area = inputs["data:geometry:wing:area"]
         if self.options["low_speed_aero"]:
             mach = inputs["data:aerodynamics:low_speed:mach"]
             unit_reynolds = inputs["data:aerodynamics:low_speed:unit_reynolds"]
@@ -76,19 +70,8 @@ class Cd0Nacelle(ExplicitComponent):
             mach = inputs["data:aerodynamics:cruise:mach"]
             unit_reynolds = inputs["data:aerodynamics:cruise:unit_reynolds"]
 
-        drag_force = propulsion_model.compute_drag(mach, unit_reynolds, l0_wing)
-
-        if (prop_layout == 1.0) or (prop_layout == 2.0):
-            cd0 = drag_force / wing_area * engine_number
-        elif prop_layout == 3.0:
-            cd0 = 0.0
-        else:
-            cd0 = 0.0
-            warnings.warn(
-                "Propulsion layout {} not implemented in model, replaced by layout 1!".format(
-                    prop_layout
-                )
-            )
+        propulsion_model = FuelEngineSet(self._engine_wrapper.get_model(inputs), 1.0)
+        cd0 = ParasiteDrag(inputs, propulsion_model).nacelles(mach, unit_reynolds)
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:nacelles:low_speed:CD0"] = cd0
@@ -18,6 +18,7 @@ from openmdao.core.explicitcomponent import ExplicitComponent
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
+from .parasite_drag import ParasiteDrag
 from ..constants import SUBMODEL_CD0_OTHER
 
 
@@ -47,28 +48,9 @@ class Cd0Other(ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        prop_layout = inputs["data:geometry:propulsion:engine:layout"]
-        wing_area = inputs["data:geometry:wing:area"]
-
-        # COWLING (only if engine in fuselage): cx_cowl*wing_area assumed typical (Gudmundsson p739)
-        if prop_layout == 3.0:
-            cd0_cowling = 0.0267 / wing_area
-        else:
-            cd0_cowling = 0.0
-        # Cooling (piston engine only)
-        # Gudmundsson p715. Assuming cx_cooling*wing area/MTOW value of the book is typical
-        cd0_cooling = (
-            0.0005525  # (7.054E-6 / wing_area * mtow) FIXME: should come from propulsion model...
-        )
-        # Gudmundsson p739. Sum of other components (not calculated here), cx_other*wing_area
-        # assumed typical
-        cd0_components = 0.0253 / wing_area
+        cd0 = ParasiteDrag(inputs).other()
 
         if self.options["low_speed_aero"]:
-            outputs["data:aerodynamics:other:low_speed:CD0"] = (
-                cd0_cowling + cd0_cooling + cd0_components
-            )
+            outputs["data:aerodynamics:other:low_speed:CD0"] = cd0
         else:
-            outputs["data:aerodynamics:other:cruise:CD0"] = (
-                cd0_cowling + cd0_cooling + cd0_components
-            )
+            outputs["data:aerodynamics:other:cruise:CD0"] = cd0
@@ -18,6 +18,7 @@ from openmdao.core.explicitcomponent import ExplicitComponent
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
+from .parasite_drag import aircraft_cd0
 from ..constants import SUBMODEL_CD0_SUM
 
 
@@ -77,10 +78,7 @@ class Cd0Total(ExplicitComponent):
             cd0_lg = inputs["data:aerodynamics:landing_gear:cruise:CD0"]
             cd0_other = inputs["data:aerodynamics:other:cruise:CD0"]
 
-        # CRUD (other undesirable drag). Factor from Gudmundsson book
-        crud_factor = 1.25
-
-        cd0 = crud_factor * (cd0_wing + cd0_fus + cd0_ht + cd0_vt + cd0_lg + cd0_nac + cd0_other)
+        cd0 = aircraft_cd0(cd0_wing, cd0_fus, cd0_ht, cd0_vt, cd0_nac, cd0_lg, cd0_other)
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:aircraft:low_speed:CD0"] = cd0
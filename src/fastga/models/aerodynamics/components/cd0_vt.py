@@ -12,14 +12,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import math
-
 import numpy as np
 
 from openmdao.core.explicitcomponent import ExplicitComponent
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
+from .parasite_drag import ParasiteDrag
 from ..constants import SUBMODEL_CD0_VT
 
 
@@ -60,13 +59,6 @@ class Cd0VerticalTail(ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        tip_chord = inputs["data:geometry:vertical_tail:tip:chord"]
-        root_chord = inputs["data:geometry:vertical_tail:root:chord"]
-        sweep_25_vt = inputs["data:geometry:vertical_tail:sweep_25"]
-        wet_area_vt = inputs["data:geometry:vertical_tail:wet_area"]
-        wing_area = inputs["data:geometry:wing:area"]
-        thickness = inputs["data:geometry:vertical_tail:thickness_ratio"]
-        x_t_max = inputs["data:geometry:vertical_tail:max_thickness:x_ratio"]
         if self.options["low_speed_aero"]:
             mach = inputs["data:aerodynamics:low_speed:mach"]
             unit_reynolds = inputs["data:aerodynamics:low_speed:unit_reynolds"]
@@ -74,24 +66,7 @@ class Cd0VerticalTail(ExplicitComponent):
             mach = inputs["data:aerodynamics:cruise:mach"]
             unit_reynolds = inputs["data:aerodynamics:cruise:unit_reynolds"]
 
-        # Root: 50% NLF
-        x_trans = 0.5
-        x0_turbulent = 36.9 * x_trans ** 0.625 * (1 / (unit_reynolds * root_chord)) ** 0.375
-        cf_root = (
-            0.074 / (unit_reynolds * root_chord) ** 0.2 * (1 - (x_trans - x0_turbulent)) ** 0.8
-        )
-        # Tip: 50% NLF
-        x_trans = 0.5
-        x0_turbulent = 36.9 * x_trans ** 0.625 * (1 / (unit_reynolds * tip_chord)) ** 0.375
-        cf_tip = 0.074 / (unit_reynolds * tip_chord) ** 0.2 * (1 - (x_trans - x0_turbulent)) ** 0.8
-        # Global
-        cf_vt = (cf_root + cf_tip) * 0.5
-        ff = 1 + 0.6 / x_t_max * thickness + 100 * thickness ** 4
-        ff = ff * 1.05  # Due to hinged elevator (Raymer)
-        if mach > 0.2:
-            ff = ff * 1.34 * mach ** 0.18 * (math.cos(sweep_25_vt * math.pi / 180)) ** 0.28
-        interference_factor = 1.05
-        cd0 = ff * interference_factor * cf_vt * wet_area_vt / wing_area
+        cd0 = ParasiteDrag(inputs).vertical_tail(mach, unit_reynolds)
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:vertical_tail:low_speed:CD0"] = cd0
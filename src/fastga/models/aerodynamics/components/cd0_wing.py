@@ -12,16 +12,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import math
-
 import numpy as np
 
 from openmdao.core.explicitcomponent import ExplicitComponent
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
-from fastga.models.geometry.profiles.get_profile import get_profile
-
+from .parasite_drag import ParasiteDrag
 from ..constants import SUBMODEL_CD0_WING
 
 
@@ -64,15 +61,6 @@ class Cd0Wing(ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        l2_wing = inputs["data:geometry:wing:root:chord"]
-        l4_wing = inputs["data:geometry:wing:tip:chord"]
-        y1_wing = inputs["data:geometry:fuselage:maximum_width"] / 2.0
-        y2_wing = inputs["data:geometry:wing:root:y"]
-        span = inputs["data:geometry:wing:span"]
-        sweep_25 = inputs["data:geometry:wing:sweep_25"]
-        wet_area_wing = inputs["data:geometry:wing:wet_area"]
-        wing_area = inputs["data:geometry:wing:area"]
-        thickness = inputs["data:geometry:wing:thickness_ratio"]
         if self.options["low_speed_aero"]:
             mach = inputs["data:aerodynamics:low_speed:mach"]
             unit_reynolds = inputs["data:aerodynamics:low_speed:unit_reynolds"]
@@ -80,29 +68,8 @@ class Cd0Wing(ExplicitComponent):
             mach = inputs["data:aerodynamics:cruise:mach"]
             unit_reynolds = inputs["data:aerodynamics:cruise:unit_reynolds"]
 
-        # Sear max thickness position ratio
-        profile = get_profile(file_name=self.options["wing_airfoil_file"])
-        relative_thickness = profile.get_relative_thickness()
-        index = int(
-            np.where(relative_thickness["thickness"] == np.max(relative_thickness["thickness"]))[0]
-        )
-        x_t_max = relative_thickness["x"][index]
-        # Root: 45% NLF
-        x_trans = 0.45
-        x0_turbulent = 36.9 * x_trans ** 0.625 * (1 / (unit_reynolds * l2_wing)) ** 0.375
-        cf_root = 0.074 / (unit_reynolds * l2_wing) ** 0.2 * (1 - (x_trans - x0_turbulent)) ** 0.8
-        # Tip: 55% NLF
-        x_trans = 0.55
-        x0_turbulent = 36.9 * x_trans ** 0.625 * (1 / (unit_reynolds * l4_wing)) ** 0.375
-        cf_tip = 0.074 / (unit_reynolds * l4_wing) ** 0.2 * (1 - (x_trans - x0_turbulent)) ** 0.8
-        # Global
-        cf_wing = (
-            cf_root * (y2_wing - y1_wing) + 0.5 * (span / 2.0 - y2_wing) * (cf_root + cf_tip)
-        ) / (span / 2.0 - y1_wing)
-        ff = 1 + 0.6 / x_t_max * thickness + 100 * thickness ** 4
-        if mach > 0.2:
-            ff = ff * 1.34 * mach ** 0.18 * (math.cos(sweep_25 * math.pi / 180)) ** 0.28
-        cd0_wing = ff * cf_wing * wet_area_wing / wing_area
+        parasite_drag = ParasiteDrag(inputs, wing_airfoil_file=self.options["wing_airfoil_file"])
+        cd0_wing = parasite_drag.wing(mach, unit_reynolds)
 
         if self.options["low_speed_aero"]:
             outputs["data:aerodynamics:wing:low_speed:CD0"] = cd0_wing
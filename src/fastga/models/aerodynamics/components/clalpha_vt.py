@@ -62,8 +62,10 @@ class ComputeClAlphaVT(FigureDigitization):
         self.add_input("data:geometry:fuselage:maximum_width", val=np.nan, units="m")
         self.add_input("data:geometry:fuselage:maximum_height", val=np.nan, units="m")
 
-        self.add_output("data:geometry:fuselage:depth_quarter_vt", units="m")
         if self.options["low_speed_aero"]:
+            # Geometric outputs are only given by the low speed computation, so that both can be
+            # used in the same problem
+            self.add_output("data:geometry:fuselage:depth_quarter_vt", units="m")
             self.add_output("data:aerodynamics:vertical_tail:low_speed:CL_alpha", units="rad**-1")
             self.add_output("data:aerodynamics:vertical_tail:k_ar_effective")
         else:
@@ -131,12 +133,10 @@ class ComputeClAlphaVT(FigureDigitization):
             )
         )
 
-        outputs["data:geometry:fuselage:depth_quarter_vt"] = avg_fus_depth
-
         if self.options["low_speed_aero"]:
+            outputs["data:geometry:fuselage:depth_quarter_vt"] = avg_fus_depth
             outputs["data:aerodynamics:vertical_tail:low_speed:CL_alpha"] = cl_alpha_vt
             outputs["data:aerodynamics:vertical_tail:k_ar_effective"] = k_ar_effective
         else:
             outputs["data:aerodynamics:vertical_tail:cruise:CL_alpha"] = cl_alpha_vt
-            outputs["data:aerodynamics:vertical_tail:k_ar_effective"] = k_ar_effective
 
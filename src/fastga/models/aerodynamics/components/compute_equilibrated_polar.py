@@ -16,9 +16,10 @@
 
 from fastga.models.performances.mission.dynamic_equilibrium import DynamicEquilibrium
 
-from stdatm import Atmosphere
 from fastoad.models.aerodynamics.constants import POLAR_POINT_COUNT
 
+from fastga.utils.complex_step import ComplexStepAtmosphere
+
 import numpy as np
 
 FIRST_INVALID_COEFF = 100.0
@@ -120,7 +121,7 @@ class ComputeEquilibratedPolar(DynamicEquilibrium):
                 "data:aerodynamics:aircraft:cruise:equilibrated:CL", shape=POLAR_POINT_COUNT
             )
 
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="cs")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
@@ -140,7 +141,7 @@ class ComputeEquilibratedPolar(DynamicEquilibrium):
         cl_array = np.array([])
         cd_array = np.array([])
 
-        atm = Atmosphere(altitude, altitude_in_feet=False)
+        atm = ComplexStepAtmosphere(altitude, altitude_in_feet=False)
 
         # Computation of the maximum aircraft mass that can be used before exceeding
         # the CL0 clean of the wing in found_cl_repartition
@@ -167,9 +168,9 @@ class ComputeEquilibratedPolar(DynamicEquilibrium):
             if previous_step[-1]:
                 break
             else:
-                cl_wing = float(previous_step[2])
-                cl_tail = float(previous_step[3])
-                thrust = float(previous_step[1])
+                cl_wing = previous_step[2]
+                cl_tail = previous_step[3]
+                thrust = previous_step[1]
                 cl_array = np.append(cl_array, cl_wing + cl_tail)
                 cd = thrust / (0.5 * atm.density * v_tas ** 2 * wing_area)
                 cd_array = np.append(cd_array, cd)
@@ -23,6 +23,7 @@ from scipy.optimize import fsolve
 from stdatm import Atmosphere
 import fastga.models.aerodynamics.external.xfoil as xfoil
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
+from fastga.utils.atmosphere import TabulatedAtmosphere
 
 from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
 from fastoad.module_management.constants import ModelDomain
@@ -348,7 +349,7 @@ class _ComputePropellerPerformance(om.ExplicitComponent):
         length = radius_max - radius_min
         element_length = length / elements_number
         omega = omega * math.pi / 30.0
-        atm = Atmosphere(altitude, altitude_in_feet=False)
+        atm = TabulatedAtmosphere(altitude, altitude_in_feet=False)
 
         # Initialise vectors
         vi_vect = np.zeros(elements_number)
@@ -13,7 +13,6 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import math
-import warnings
 import logging
 
 import numpy as np
@@ -29,13 +28,15 @@ from fastoad.module_management._bundle_loader import BundleLoader
 from fastoad.model_base import FlightPoint
 from fastoad.constants import EngineSetting
 
-from stdatm import Atmosphere
-
 from fastga.models.aerodynamics.constants import MACH_NB_PTS
 
 from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
+from fastga.utils.atmosphere import TabulatedAtmosphere
 
 DOMAIN_PTS_NB = 19  # number of (V,n) calculated for the flight domain
+# Convergence of the fixed-point iterations on the intersection of the gust and stall lines
+GUST_INTERSECTION_MAX_ITERATIONS = 50
+GUST_INTERSECTION_TOLERANCE = 1e-12
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -110,7 +111,7 @@ class ComputeVh(om.ExplicitComponent):
         coeff_k = inputs["data:aerodynamics:wing:cruise:induced_drag_coefficient"]
 
         # Get the available thrust from propulsion system
-        atm = Atmosphere(altitude, altitude_in_feet=False)
+        atm = TabulatedAtmosphere(altitude, altitude_in_feet=False)
         flight_point = FlightPoint(
             mach=air_speed / atm.speed_of_sound,
             altitude=altitude,
@@ -198,63 +199,24 @@ class ComputeVN(om.ExplicitComponent):
         mtow = inputs["data:weight:aircraft:MTOW"]
         mzfw = inputs["data:weight:aircraft:MTOW"]
 
-        atm = Atmosphere(cruise_altitude, altitude_in_feet=False)
+        atm = TabulatedAtmosphere(cruise_altitude, altitude_in_feet=False)
         atm.true_airspeed = v_tas
         design_vc = atm.equivalent_airspeed
 
-        velocity_array_mtow, load_factor_array_mtow, _ = self.flight_domain(
-            inputs,
-            mtow,
-            cruise_altitude,
-            design_vc,
-            design_n_ps=0.0,
-            design_n_ng=0.0,
-        )
-
-        if DOMAIN_PTS_NB < len(velocity_array_mtow):
-            velocity_array_mtow = velocity_array_mtow[0 : DOMAIN_PTS_NB - 1]
-            load_factor_array_mtow = load_factor_array_mtow[0 : DOMAIN_PTS_NB - 1]
-            warnings.warn(
-                "Defined maximum stored domain points at the beginning of the file exceeded!"
-            )
-        else:
-            additional_zeros = list(np.zeros(DOMAIN_PTS_NB - len(velocity_array_mtow)))
-            velocity_array_mtow.extend(additional_zeros)
-            load_factor_array_mtow.extend(additional_zeros)
-
-        outputs["data:mission:sizing:cs23:flight_domain:mtow:velocity"] = np.array(
-            velocity_array_mtow
-        )
-        outputs["data:mission:sizing:cs23:flight_domain:mtow:load_factor"] = np.array(
-            load_factor_array_mtow
-        )
-
-        velocity_array_mzfw, load_factor_array_mzfw, _ = self.flight_domain(
+        # Both flight domains are computed at once
+        velocity_arrays, load_factor_arrays, _ = self.flight_domains(
             inputs,
-            mzfw,
+            np.array([mtow, mzfw]).flatten(),
             cruise_altitude,
             design_vc,
             design_n_ps=0.0,
             design_n_ng=0.0,
         )
 
-        if DOMAIN_PTS_NB < len(velocity_array_mzfw):
-            velocity_array_mzfw = velocity_array_mzfw[0 : DOMAIN_PTS_NB - 1]
-            load_factor_array_mzfw = load_factor_array_mzfw[0 : DOMAIN_PTS_NB - 1]
-            warnings.warn(
-                "Defined maximum stored domain points at the beginning of the file exceeded!"
-            )
-        else:
-            additional_zeros = list(np.zeros(DOMAIN_PTS_NB - len(velocity_array_mzfw)))
-            velocity_array_mzfw.extend(additional_zeros)
-            load_factor_array_mzfw.extend(additional_zeros)
-
-        outputs["data:mission:sizing:cs23:flight_domain:mzfw:velocity"] = np.array(
-            velocity_array_mzfw
-        )
-        outputs["data:mission:sizing:cs23:flight_domain:mzfw:load_factor"] = np.array(
-            load_factor_array_mzfw
-        )
+        outputs["data:mission:sizing:cs23:flight_domain:mtow:velocity"] = velocity_arrays[0]
+        outputs["data:mission:sizing:cs23:flight_domain:mtow:load_factor"] = load_factor_arrays[0]
+        outputs["data:mission:sizing:cs23:flight_domain:mzfw:velocity"] = velocity_arrays[1]
+        outputs["data:mission:sizing:cs23:flight_domain:mzfw:load_factor"] = load_factor_arrays[1]
 
     # noinspection PyUnusedLocal
     def flight_domain(self, inputs, mass, altitude, design_vc, design_n_ps=0.0, design_n_ng=0.0):
@@ -283,33 +245,72 @@ class ComputeVN(om.ExplicitComponent):
         @return conditions: an array containing the conditions at which the diagram was computed
         """
 
+        velocity_arrays, load_factor_arrays, _ = self.flight_domains(
+            inputs, mass, altitude, design_vc, design_n_ps=design_n_ps, design_n_ng=design_n_ng
+        )
+        conditions = [mass, altitude]
+
+        return velocity_arrays[0].tolist(), load_factor_arrays[0].tolist(), conditions
+
+    def flight_domains(
+        self, inputs, masses, altitudes, design_vc, design_n_ps=0.0, design_n_ng=0.0
+    ):
+        """
+        Function that computes at once the flight domains of the aircraft represented in the
+        inputs for several (mass, altitude) cases, see flight_domain for the definition of the
+        speeds and load factors. Masses, altitudes and cruise equivalent airspeeds are broadcast
+        against each other.
+
+        @param inputs: a dictionary containing the properties of the aircraft
+        @param masses: the masses for which we want to compute the flight domain
+        @param altitudes: the altitudes at which we want to compute the flight domain
+        @param design_vc: the cruise equivalent airspeed
+        @param design_n_ps: the positive design load factor, will replace the maneuver load factor
+        if higher than it
+        @param design_n_ng: the negative design load factor, will replace the maneuver load factor
+        if lower than it
+        @return velocity_arrays: an array of shape (number of cases, DOMAIN_PTS_NB) containing the
+        characteristic speeds of each flight domain, ordered as in flight_domain
+        @return load_factor_arrays: an array of shape (number of cases, DOMAIN_PTS_NB) containing
+        the load factors of each flight domain, ordered as in flight_domain
+        @return conditions: an array of shape (number of cases, 2) containing the mass and
+        altitude of each case
+        """
+
+        masses, altitudes, design_vc = np.broadcast_arrays(
+            np.ravel(np.asarray(masses, dtype=float)),
+            np.ravel(np.asarray(altitudes, dtype=float)),
+            np.ravel(np.asarray(design_vc, dtype=float)),
+        )
+        cases_nb = len(masses)
+        zeros = np.zeros(cases_nb)
+
         # Get necessary inputs
-        wing_area = inputs["data:geometry:wing:area"]
-        mtow = inputs["data:weight:aircraft:MTOW"]
-        category = inputs[
-            "data:TLAR:category"
-        ]  # Aerobatic = 1.0, Utility = 2.0, Normal = 3.0, Commuter = 4.0
-        level = inputs["data:TLAR:level"]
-        vh = inputs["data:TLAR:v_max_sl"]
-        root_chord = inputs["data:geometry:wing:root:chord"]
-        tip_chord = inputs["data:geometry:wing:tip:chord"]
-        cl_max_flaps = inputs["data:aerodynamics:aircraft:landing:CL_max"]
-        cl_max = inputs["data:aerodynamics:wing:low_speed:CL_max_clean"]
-        cl_min = inputs["data:aerodynamics:wing:low_speed:CL_min_clean"]
+        wing_area = float(inputs["data:geometry:wing:area"])
+        mtow = float(inputs["data:weight:aircraft:MTOW"])
+        category = float(
+            inputs["data:TLAR:category"]
+        )  # Aerobatic = 1.0, Utility = 2.0, Normal = 3.0, Commuter = 4.0
+        level = float(inputs["data:TLAR:level"])
+        vh = float(inputs["data:TLAR:v_max_sl"])
+        root_chord = float(inputs["data:geometry:wing:root:chord"])
+        tip_chord = float(inputs["data:geometry:wing:tip:chord"])
+        cl_max_flaps = float(inputs["data:aerodynamics:aircraft:landing:CL_max"])
+        cl_max = float(inputs["data:aerodynamics:wing:low_speed:CL_max_clean"])
+        cl_min = float(inputs["data:aerodynamics:wing:low_speed:CL_min_clean"])
         mean_chord = (root_chord + tip_chord) / 2.0
-        atm_0 = Atmosphere(0.0)
-        atm = Atmosphere(altitude, altitude_in_feet=False)
-
-        # Initialise the lists in which we will store the data
-        velocity_array = []
-        load_factor_array = []
+        atm_0 = TabulatedAtmosphere(0.0)
+        atm = TabulatedAtmosphere(altitudes, altitude_in_feet=False)
+        density = np.asarray(atm.density, dtype=float)
+        speed_of_sound = np.asarray(atm.speed_of_sound, dtype=float)
 
         # For some of the correlation presented in the regulation, we need to convert the data
         # of the airplane to imperial units
-        weight_lbf = (mass * g) / self.lbf_to_N
+        weight_lbf = (masses * g) / self.lbf_to_N
         mtow_lbf = (mtow * g) / self.lbf_to_N
         wing_area_sft = wing_area / (self.ft_to_m ** 2.0)
         mtow_loading_psf = mtow_lbf / wing_area_sft  # [lbf/ft**2]
+        wing_loading = weight_lbf / wing_area_sft * self.lbf_to_N / self.ft_to_m ** 2  # [N/m**2]
 
         # We can now start computing the values of the different air-speeds given in the regulation
         # as well as the load factors. We will here make the choice to stick with the limits given
@@ -317,25 +318,21 @@ class ComputeVN(om.ExplicitComponent):
         # over the values written in the documents.
 
         # Lets start by computing the 1g/-1g stall speeds using the usual formulations
-        vs_1g_ps = math.sqrt((2.0 * mass * g) / (atm_0.density * wing_area * cl_max))  # [m/s]
-        vs_1g_ng = math.sqrt((2.0 * mass * g) / (atm_0.density * wing_area * abs(cl_min)))  # [m/s]
-        velocity_array.append(float(vs_1g_ps))
-        load_factor_array.append(1.0)
-        velocity_array.append(float(vs_1g_ng))
-        load_factor_array.append(-1.0)
+        vs_1g_ps = np.sqrt((2.0 * masses * g) / (atm_0.density * wing_area * cl_max))  # [m/s]
+        vs_1g_ng = np.sqrt((2.0 * masses * g) / (atm_0.density * wing_area * abs(cl_min)))  # [m/s]
 
         # As we will consider all the calculated speed to be Vs_1g_ps < V < 1.4*Vh, we will
         # compute cl_alpha for N points equally spaced on log scale (to take into account the
         # high non-linearity effect). If the option is not selected, we will only consider
         # low_speed and cruise cl_alpha points and consider a square regression between both.
 
-        mach_interp = inputs["data:aerodynamics:aircraft:mach_interpolation:mach_vector"]
-        v_interp = []
-        for mach in mach_interp:
-            v_interp.append(float(mach * atm.speed_of_sound))
-        cl_alpha_interp = inputs["data:aerodynamics:aircraft:mach_interpolation:CL_alpha_vector"]
+        # cl_alpha is interpolated on the Mach number so that the same interpolation serves all
+        # the altitudes (equivalent to an interpolation on the velocity at each altitude)
         cl_alpha_fct = interpolate.interp1d(
-            v_interp, cl_alpha_interp, fill_value="extrapolate", kind="quadratic"
+            inputs["data:aerodynamics:aircraft:mach_interpolation:mach_vector"],
+            inputs["data:aerodynamics:aircraft:mach_interpolation:CL_alpha_vector"],
+            fill_value="extrapolate",
+            kind="quadratic",
         )
 
         # We will now establish the minimum limit maneuvering load factors outside of gust load
@@ -359,9 +356,6 @@ class ComputeVN(om.ExplicitComponent):
             n_lim_ng_max = -0.4 * n_lim_ps  # CS 23.337 (b)
         n_lim_ng = min(n_lim_ng_max, design_n_ng)
 
-        load_factor_array.append(float(n_lim_ps))
-        load_factor_array.append(float(n_lim_ng))
-
         # Starting from there, we need to compute the gust lines as it can have an impact on the
         # choice of the maneuvering speed. We will also compute the maximum intensity gust line
         # for later use but keep in mind that this is specific for commuter or level 4 aircraft
@@ -372,58 +366,50 @@ class ComputeVN(om.ExplicitComponent):
         # take into account the case of the commuter nor do we implement the reduction of gust
         # intensity with the location of the gust center
 
-        if altitude <= 20000.0:
-            u_de_vc = 50.0  # [ft/s]
-            u_de_vd = 25.0  # [ft/s]
-            u_de_vmg = 66.0  # [ft/s]
-        elif 20000.0 < altitude < 50000.0:
-            u_de_vc = 66.7 - 0.000833 * altitude  # [ft/s]
-            u_de_vd = 33.4 - 0.000417 * altitude  # [ft/s]
-            u_de_vmg = 84.7 - 0.000933 * altitude  # [ft/s]
-        else:
-            u_de_vc = 25.0  # [ft/s]
-            u_de_vd = 12.5  # [ft/s]
-            u_de_vmg = 38.0  # [ft/s]
+        u_de_vc = np.select(
+            [altitudes <= 20000.0, altitudes < 50000.0], [50.0, 66.7 - 0.000833 * altitudes], 25.0
+        )  # [ft/s]
+        u_de_vd = np.select(
+            [altitudes <= 20000.0, altitudes < 50000.0], [25.0, 33.4 - 0.000417 * altitudes], 12.5
+        )  # [ft/s]
+        u_de_vmg = np.select(
+            [altitudes <= 20000.0, altitudes < 50000.0], [66.0, 84.7 - 0.000933 * altitudes], 38.0
+        )  # [ft/s]
+
+        # Slope of the gust lines (n = 1 +/- slope * V) with the aeroplane mass ratio and
+        # alleviation factor of CS 23.341, cl_alpha depending on the velocity
+        def gust_slope(u_de_v, x):
+            cl_alpha = cl_alpha_fct(x / speed_of_sound)
+            mu_g = (2.0 * masses * g / wing_area) / (density * mean_chord * cl_alpha * g)
+            k_g = (0.88 * mu_g) / (5.3 + mu_g)
+            return k_g * atm_0.density * u_de_v * self.ft_to_m * cl_alpha / (2.0 * wing_loading)
 
-        # Let us define aeroplane mass ratio formula and alleviation factor formula
-        def mu_g(x):
-            return (2.0 * mass * g / wing_area) / (
-                atm.density * mean_chord * x * g
-            )  # [x = cl_alpha]
-
-        def k_g(x):
-            return (0.88 * x) / (5.3 + x)  # [x = mu_g]
-
-        # Now, define the gust function
         def load_factor_gust_p(u_de_v, x):
-            return float(
-                1.0
-                + k_g(mu_g(cl_alpha_fct(x)))
-                * atm_0.density
-                * u_de_v
-                * self.ft_to_m
-                * x
-                * cl_alpha_fct(x)
-                / (2.0 * weight_lbf / wing_area_sft * self.lbf_to_N / self.ft_to_m ** 2)
-            )
+            return 1.0 + gust_slope(u_de_v, x) * x
 
         def load_factor_gust_n(u_de_v, x):
-            return float(
-                1
-                - k_g(mu_g(cl_alpha_fct(x)))
-                * atm_0.density
-                * u_de_v
-                * self.ft_to_m
-                * x
-                * cl_alpha_fct(x)
-                / (2.0 * weight_lbf / wing_area_sft * self.lbf_to_N / self.ft_to_m ** 2)
-            )
-
-        def load_factor_stall_p(x):
-            return (x / vs_1g_ps) ** 2.0
-
-        def load_factor_stall_n(x):
-            return -((x / vs_1g_ng) ** 2.0)
+            return 1.0 - gust_slope(u_de_v, x) * x
+
+        # Intersection of the gust and stall lines, sign * (x / vs) ** 2 = 1 + sign * slope * x
+        # with sign = 1.0 for the positive lines and -1.0 for the negative ones. For a given slope
+        # it is the largest root of a second order polynomial, the variation of cl_alpha with the
+        # velocity being then taken into account by fixed-point iterations (nan where there is no
+        # intersection)
+        def gust_stall_intersection(u_de_v, vs, sign):
+            x = vs
+            for _ in range(GUST_INTERSECTION_MAX_ITERATIONS):
+                slope = gust_slope(u_de_v, x)
+                with np.errstate(invalid="ignore"):
+                    x_new = (
+                        vs ** 2.0 * (slope + np.sqrt(slope ** 2.0 + sign * 4.0 / vs ** 2.0)) / 2.0
+                    )
+                    converged = not np.any(
+                        np.abs(x_new - x) > GUST_INTERSECTION_TOLERANCE * np.abs(x_new)
+                    )
+                x = x_new
+                if converged:
+                    break
+            return x
 
         # We can now go back to the computation of the maneuvering speeds, we will first compute
         # it "traditionally" and should we find out that the line limited by the Cl max is under
@@ -434,45 +420,29 @@ class ComputeVN(om.ExplicitComponent):
 
         vma_ps = vs_1g_ps * math.sqrt(n_lim_ps)  # [m/s]
         vma_ng = vs_1g_ng * math.sqrt(abs(n_lim_ng))  # [m/s]
-        velocity_array.append(float(vma_ps))
-        velocity_array.append(float(vma_ng))
 
         # We now need to check if we are in the aforementioned case (usually happens for low
         # design wing loading aircraft and/or mission wing loading)
 
-        n_ma_ps = load_factor_gust_p(u_de_vc, vma_ps)
-
-        if n_ma_ps > n_lim_ps:
-            # In case the gust line load factor is above the maneuvering load factor, we need to
-            # solve the difference between both curve to be 0.0 to find intersect
-            def delta_maneuver_pos(x):
-                return load_factor_gust_p(u_de_vc, x) - load_factor_stall_p(x)
-
-            vma_ps = max(optimize.fsolve(delta_maneuver_pos, np.array(1000.0)))
-            n_ma_ps = load_factor_gust_p(u_de_vc, vma_ps)  # [-]
-            velocity_array.append(float(vma_ps))
-            load_factor_array.append(float(n_ma_ps))
-        else:
-            velocity_array.append(0.0)
-            load_factor_array.append(0.0)
+        is_gust_ma_ps = load_factor_gust_p(u_de_vc, vma_ps) > n_lim_ps
+        vma_ps_gust = zeros.copy()
+        n_ma_ps_gust = zeros.copy()
+        if np.any(is_gust_ma_ps):
+            vma_ps_gust = np.where(
+                is_gust_ma_ps, gust_stall_intersection(u_de_vc, vs_1g_ps, 1.0), 0.0
+            )
+            n_ma_ps_gust = np.where(is_gust_ma_ps, load_factor_gust_p(u_de_vc, vma_ps_gust), 0.0)
 
         # We now need to do the same thing for the negative maneuvering speed
 
-        n_ma_ng = load_factor_gust_n(u_de_vc, vma_ng)  # [-]
-
-        if n_ma_ng < n_lim_ng:
-            # In case the gust line load factor is above the maneuvering load factor, we need to
-            # solve the difference between both curve to be 0.0 to find intersect
-            def delta_maneuver_neg(x):
-                return load_factor_gust_n(u_de_vc, x) - load_factor_stall_n(x)
-
-            vma_ng = max(optimize.fsolve(delta_maneuver_neg, np.array(1000.0)))
-            n_ma_ng = load_factor_gust_n(u_de_vc, vma_ng)  # [-]
-            velocity_array.append(float(vma_ng))
-            load_factor_array.append(float(n_ma_ng))
-        else:
-            velocity_array.append(0.0)
-            load_factor_array.append(0.0)
+        is_gust_ma_ng = load_factor_gust_n(u_de_vc, vma_ng) < n_lim_ng
+        vma_ng_gust = zeros.copy()
+        n_ma_ng_gust = zeros.copy()
+        if np.any(is_gust_ma_ng):
+            vma_ng_gust = np.where(
+                is_gust_ma_ng, gust_stall_intersection(u_de_vc, vs_1g_ng, -1.0), 0.0
+            )
+            n_ma_ng_gust = np.where(is_gust_ma_ng, load_factor_gust_n(u_de_vc, vma_ng_gust), 0.0)
 
         # For the cruise velocity, things will be different since it is an entry choice. As such
         # we will simply check that it complies with the values given in the certification papers
@@ -500,36 +470,26 @@ class ComputeVN(om.ExplicitComponent):
             else:
                 k_c = 28.6
 
-        vc_min_1 = k_c * math.sqrt(weight_lbf / wing_area_sft) * self.kts_to_ms  # [m/s]
-
+        vc_min_1 = k_c * np.sqrt(weight_lbf / wing_area_sft) * self.kts_to_ms  # [m/s]
         # This second constraint rather refers to the paragraph on maneuvering speeds,
         # which needs to be chosen so that they are smaller than cruising speeds
-        vc_min_2 = vma_ps  # [m/s]
-        vc_min = max(vc_min_1, vc_min_2)  # [m/s]
-
+        vc_min_2 = np.where(is_gust_ma_ps, vma_ps_gust, vma_ps)  # [m/s]
+        vc_min = np.maximum(vc_min_1, vc_min_2)  # [m/s]
         # The certifications specifies that Vc need not be more than 0.9 Vh so we will simply
         # take the minimum value between the Vc_min and this value
 
-        vc_min_fin = min(vc_min, 0.9 * vh)  # [m/s]
-
+        vc_min_fin = np.minimum(vc_min, 0.9 * vh)  # [m/s]
         # The constraint regarding the maximum velocity for cruise does not appear in the
         # certifications but from a physics point of view we can easily infer that the cruise
         # speed will never be greater than the maximum level velocity at sea level hence
 
-        vc = max(min(design_vc, vh), vc_min_fin)  # [m/s]
-        velocity_array.append(float(vc))
-        load_factor_array.append(float(n_lim_ng))
+        vc = np.maximum(np.minimum(design_vc, vh), vc_min_fin)  # [m/s]
 
         # Lets now look at the load factors associated with the Vc, since it is here that the
         # greatest load factors can appear
 
-        n_vc_ps = max(load_factor_gust_p(u_de_vc, vc), n_lim_ps)  # [-]
-        n_vc_ng = min(load_factor_gust_n(u_de_vc, vc), n_lim_ng)  # [-]
-
-        velocity_array.append(float(vc))
-        load_factor_array.append(float(n_vc_ps))
-        velocity_array.append(float(vc))
-        load_factor_array.append(float(n_vc_ng))
+        n_vc_ps = np.maximum(load_factor_gust_p(u_de_vc, vc), n_lim_ps)  # [-]
+        n_vc_ng = np.minimum(load_factor_gust_n(u_de_vc, vc), n_lim_ng)  # [-]
 
         # We now compute the diving speed, methods are described in CS 23.335 (b). We will take
         # the minimum diving speed allowable as our design diving speed. We need to keep in mind
@@ -540,8 +500,6 @@ class ComputeVN(om.ExplicitComponent):
         # https://www.easa.europa.eu/sites/default/files/dfu/CS-23%20Amendment%204.pdf
         # https://www.astm.org/Standards/F3116.htm
 
-        vd_min_1 = 1.25 * vc  # [m/s]
-
         if category == 1.0:
             if mtow_loading_psf < 20.0:
                 k_d = 1.55
@@ -567,20 +525,15 @@ class ComputeVN(om.ExplicitComponent):
             else:
                 k_d = 1.35
 
+        vd_min_1 = 1.25 * vc  # [m/s]
         vd_min_2 = k_d * vc_min_fin  # [m/s]
-        vd = max(vd_min_1, vd_min_2)  # [m/s]
-
-        velocity_array.append(float(vd))
-        load_factor_array.append(float(n_lim_ps))
-        velocity_array.append(float(vd))
-        load_factor_array.append(0.0)
+        vd = np.maximum(vd_min_1, vd_min_2)  # [m/s]
 
         # Similarly to what was done for the design cruising speed we will explore the load
         # factors associated with the diving speed since gusts are likely to broaden the flight
         # domain around these points
 
         n_vd_ps = load_factor_gust_p(u_de_vd, vd)  # [-]
-
         # For the negative load factor at the diving speed, it seems that for non_aerobatic
         # airplanes, it is always sized according to the gust lines, regardless of the negative
         # design load factor. For aerobatic airplanes however, it seems as if it is sized for a
@@ -592,11 +545,6 @@ class ComputeVN(om.ExplicitComponent):
 
         n_vd_ng = load_factor_gust_n(u_de_vd, vd)  # [-]
 
-        velocity_array.append(float(vd))
-        load_factor_array.append(float(n_vd_ps))
-        velocity_array.append(float(vd))
-        load_factor_array.append(float(n_vd_ng))
-
         # We have now calculated all the velocities need to plot the flight domain. For the sake
         # of thoroughness we will also compute the maximal structural cruising speed and cruise
         # never-exceed speed. The computation for these two can be found in CS 23.1505
@@ -614,20 +562,13 @@ class ComputeVN(om.ExplicitComponent):
         # detailed analysis phases
 
         v_ne = 0.9 * vd  # [m/s]
-
-        velocity_array.append(float(v_ne))
-        load_factor_array.append(0.0)
-
         v_no_min = vc_min  # [m/s]
-        v_no_max = min(vc, 0.89 * v_ne)  # [m/s]
+        v_no_max = np.minimum(vc, 0.89 * v_ne)  # [m/s]
 
         # Again we need to make a choice for this speed : what value would be retained. We will
         # take the highest speed acceptable for certification, i.e
 
-        v_no = max(v_no_min, v_no_max)  # [m/s]
-
-        velocity_array.append(float(v_no))
-        load_factor_array.append(0.0)
+        v_no = np.maximum(v_no_min, v_no_max)  # [m/s]
 
         # One additional velocity needs to be computed if we are talking about commuter aircraft.
         # It is the maximum gust intensity velocity. Due to the way we are returning the values,
@@ -645,37 +586,26 @@ class ComputeVN(om.ExplicitComponent):
         # 23.335 (a)
 
         if (level == 4.0) or (category == 4.0):
-
             # We first need to compute the intersection of the stall line with the gust line
             # given by the gust of maximum intensity. Similar calculation were already done in
             # case the maneuvering speed is dictated by the Vc gust line so the computation will
             # be very similar
-            def delta_max_gust_pos(x):
-                return load_factor_gust_p(u_de_vmg, x) - load_factor_stall_p(x)
-
-            vmg_min_1 = max(optimize.fsolve(delta_max_gust_pos, np.array(1000.0)))
-
+            vmg_min_1 = gust_stall_intersection(u_de_vmg, vs_1g_ps, 1.0)
             # The second candidate for the Vmg is given by the stall speed and the load factor at
             # the cruise speed
-            vmg_min_2 = vs_1g_ps * math.sqrt(load_factor_gust_p(u_de_vc, vc))  # [m/s]
-            vmg = min([vmg_min_1, vmg_min_2])  # [m/s]
-
+            vmg_min_2 = vs_1g_ps * np.sqrt(load_factor_gust_p(u_de_vc, vc))  # [m/s]
+            vmg = np.minimum(vmg_min_1, vmg_min_2)  # [m/s]
             # As for the computation of the associated load factor, no source were found for any
             # formula or hint as to its computation. It can however be guessed that depending on
             # the minimum value found above, it will either be on the stall line or at the
             # maximum design load factor
 
-            if vmg == vmg_min_1:  # On the gust line
-                n_vmg = load_factor_gust_p(u_de_vmg, vmg_min_1)  # [-]
-            else:
-                n_vmg = n_vc_ps  # [-]
-
+            n_vmg = np.where(
+                vmg == vmg_min_1, load_factor_gust_p(u_de_vmg, vmg_min_1), n_vc_ps
+            )  # [-]
         else:
-            vmg = 0.0  # [m/s]
-            n_vmg = 0.0
-
-        velocity_array.append(float(vmg))
-        load_factor_array.append(float(n_vmg))
+            vmg = zeros  # [m/s]
+            n_vmg = zeros
 
         # Let us now look at the flight domain in the flap extended configuration. For the
         # computation of these speeds and load factors, we will use the formula provided in CS
@@ -689,17 +619,14 @@ class ComputeVN(om.ExplicitComponent):
         # CS 23.345 (b)
 
         # Let us start by computing the Vfe
-        vs_fe_1g_ps = math.sqrt(
-            (2.0 * mass * g) / (atm_0.density * wing_area * cl_max_flaps)
+        vs_fe_1g_ps = np.sqrt(
+            (2.0 * masses * g) / (atm_0.density * wing_area * cl_max_flaps)
         )  # [m/s]
         vfe_min_1 = 1.4 * vs_1g_ps  # [m/s]
         vfe_min_2 = 1.8 * vs_fe_1g_ps  # [m/s]
-        vfe_min = max(vfe_min_1, vfe_min_2)  # [m/s]
+        vfe_min = np.maximum(vfe_min_1, vfe_min_2)  # [m/s]
         vfe = vfe_min  # [m/s]
 
-        velocity_array.append(float(vs_fe_1g_ps))
-        load_factor_array.append(1.0)
-
         # We can then move on to the computation of the load limitation of the flapped flight
         # domain, which must be equal to either a constant load factor of 2 or a load factor
         # dictated by a gust of 25 fps. Also since the use of flaps is limited to take-off,
@@ -707,16 +634,58 @@ class ComputeVN(om.ExplicitComponent):
 
         u_de_fe = 25.0  # [ft/s]
         n_lim_ps_fe = 2.0
-        n_vfe = max(n_lim_ps_fe, load_factor_gust_n(u_de_fe, vfe))
-
-        velocity_array.append(float(vs_fe_1g_ps * math.sqrt(n_vfe)))
-        load_factor_array.append(float(n_vfe))
-        velocity_array.append(float(vfe))
-        load_factor_array.append(float(n_vfe))
+        n_vfe = np.maximum(n_lim_ps_fe, load_factor_gust_n(u_de_fe, vfe))
+
+        velocity_arrays = np.column_stack(
+            [
+                vs_1g_ps,
+                vs_1g_ng,
+                vma_ps,
+                vma_ng,
+                vma_ps_gust,
+                vma_ng_gust,
+                vc,
+                vc,
+                vc,
+                vd,
+                vd,
+                vd,
+                vd,
+                v_ne,
+                v_no,
+                vmg,
+                vs_fe_1g_ps,
+                vs_fe_1g_ps * np.sqrt(n_vfe),
+                vfe,
+            ]
+        )
+        load_factor_arrays = np.column_stack(
+            [
+                zeros + 1.0,
+                zeros - 1.0,
+                zeros + n_lim_ps,
+                zeros + n_lim_ng,
+                n_ma_ps_gust,
+                n_ma_ng_gust,
+                zeros + n_lim_ng,
+                n_vc_ps,
+                n_vc_ng,
+                zeros + n_lim_ps,
+                zeros,
+                n_vd_ps,
+                n_vd_ng,
+                zeros,
+                zeros,
+                n_vmg,
+                zeros + 1.0,
+                n_vfe,
+                n_vfe,
+            ]
+        )
 
         # We also store the conditions in which the values were computed so that we can easily
         # access them when drawing the flight domains
 
-        conditions = [mass, altitude]
+        conditions = np.column_stack([masses, altitudes])
 
-        return velocity_array, load_factor_array, conditions
+        return velocity_arrays, load_factor_arrays, conditions
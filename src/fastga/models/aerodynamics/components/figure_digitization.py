@@ -17,10 +17,11 @@ coefficient of the aircraft.
 
 import logging
 import os.path as pth
+from functools import lru_cache
 
 import numpy as np
 import openmdao.api as om
-from pandas import read_csv
+from pandas import DataFrame, read_csv
 
 from scipy import interpolate
 
@@ -53,6 +54,15 @@ K_FUS = "k_fus.csv"
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache()
+def _read_chart(file_path: str) -> DataFrame:
+    """
+    Reads a digitized figure once per session (or per worker process in batch runs). The returned
+    table is shared and should not be modified.
+    """
+    return read_csv(file_path)
+
+
 class FigureDigitization(om.ExplicitComponent):
     """Provides lift and drag increments due to high-lift devices."""
 
@@ -72,7 +82,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], DELTA_CD_PLAIN_FLAP)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_15 = db["DELTA_F_15_X"]
         y_15 = db["DELTA_F_15_Y"]
@@ -122,7 +132,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_PLAIN_FLAP)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_10 = db["X_10"]
         y_10 = db["Y_10"]
@@ -205,7 +215,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], CL_DELTA_TH_PLAIN_FLAP)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_0 = db["X_0"]
         y_0 = db["Y_0"]
@@ -274,7 +284,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_CL_DELTA_PLAIN_FLAP)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         # Figure 10.64 b
         cl_alpha_th = 6.3 + np.clip(thickness_ratio, 0.0, 0.2) / 0.2 * (7.3 - 6.3)
@@ -333,7 +343,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_SINGLE_SLOT)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_15 = db["X_15"]
         y_15 = db["Y_15"]
@@ -413,7 +423,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], BASE_INCREMENT_CL_MAX)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_plain = db["X_PLAIN_FLAP"]
         y_plain = db["Y_PLAIN_FLAP"]
@@ -470,7 +480,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K1)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         if flap_type == 1.0 or flap_type == 0.0:
             x = db["X_PLAIN_SINGLE_SPLIT"]
@@ -509,7 +519,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K2)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_plain = db["X_PLAIN_FLAP"]
         y_plain = db["Y_PLAIN_FLAP"]
@@ -563,7 +573,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K3)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         if flap_type == 0.0:
             k3 = 1.0
@@ -611,7 +621,7 @@ class FigureDigitization(om.ExplicitComponent):
 
         taper_ratio = np.clip(taper_ratio, 0.0, 1.0)
         file = pth.join(resources.__path__[0], KB_FLAPS)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_0 = db["X_0"]
         y_0 = db["Y_0"]
@@ -681,7 +691,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], A_DELTA_AIRFOIL)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x = db["X"]
         y = db["Y"]
@@ -711,7 +721,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_A_DELTA)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         if float(aspect_ratio) != np.clip(float(aspect_ratio), 0.0, 10.0):
             _LOGGER.warning(
@@ -834,7 +844,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_P_FLAPS)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         eta_in_1_0 = FigureDigitization.interpolate_database(
             db, "taper_1_0_X", "taper_1_0_Y", eta_in
@@ -893,7 +903,7 @@ class FigureDigitization(om.ExplicitComponent):
             _LOGGER.warning("Chord ratio outside of the range in Roskam's book, value clipped")
 
         file = pth.join(resources.__path__[0], DELTA_CM_DELTA_CL_REF)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_21 = db["TOC_21_X"]
         y_21 = db["TOC_21_Y"]
@@ -969,7 +979,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_DELTA)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_10 = db["X_1_0"]
         y_10 = db["Y_1_0"]
@@ -1038,7 +1048,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_AR_FUSELAGE)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x_06 = db["X_06"]
         y_06 = db["Y_06"]
@@ -1083,7 +1093,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_VH)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x = db["X"]
         y = db["Y"]
@@ -1113,7 +1123,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_CH_ALPHA)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         # Figure 10.64 b
         if thickness_ratio != np.clip(thickness_ratio, 0.0, 0.2):
@@ -1168,7 +1178,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], CH_ALPHA_TH)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         thickness_ratio_data = db["THICKNESS_RATIO"]
         errors = np.isnan(thickness_ratio_data)
@@ -1219,7 +1229,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_CH_DELTA)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         # Figure 10.64 b
         if thickness_ratio != np.clip(thickness_ratio, 0.0, 0.2):
@@ -1286,7 +1296,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], CH_DELTA_TH)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         thickness_ratio_data = db["THICKNESS_RATIO"]
         errors = np.isnan(thickness_ratio_data)
@@ -1334,7 +1344,7 @@ class FigureDigitization(om.ExplicitComponent):
         """
 
         file = pth.join(resources.__path__[0], K_FUS)
-        db = read_csv(file)
+        db = _read_chart(file)
 
         x = db["X_0_25_RATIO"]
         y = db["K_FUS"]
@@ -15,13 +15,12 @@
 import numpy as np
 import math
 
-from typing import Union, Tuple
-
-from scipy import interpolate
+from typing import Union
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
 from .figure_digitization import FigureDigitization
+from .high_lift_increments import HighLiftIncrements
 
 from ..constants import SUBMODEL_DELTA_HIGH_LIFT
 
@@ -32,10 +31,6 @@ class ComputeDeltaHighLift(FigureDigitization):
     Provides lift and drag increments due to high-lift devices.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.phase = None
-
     def setup(self):
 
         self.add_input("data:geometry:wing:span", val=np.nan, units="m")
@@ -88,67 +83,30 @@ class ComputeDeltaHighLift(FigureDigitization):
         mach_ls = inputs["data:aerodynamics:low_speed:mach"]
         wing_area = inputs["data:geometry:wing:area"]
         htp_area = inputs["data:geometry:horizontal_tail:area"]
-        flap_chord_ratio = inputs["data:geometry:flap:chord_ratio"]
-        flap_area_ratio = self._compute_flap_area_ratio(inputs)
 
-        # Computes flaps contribution during low speed operations (take-off/landing)
-        for self.phase in ["landing", "takeoff"]:
-            if self.phase == "landing":
-                flap_angle = float(inputs["data:mission:sizing:landing:flap_angle"])
-                (
-                    outputs["data:aerodynamics:flaps:landing:CL"],
-                    outputs["data:aerodynamics:flaps:landing:CL_max"],
-                ) = self._get_flaps_delta_cl(
-                    inputs,
-                    flap_angle,
-                    mach_ls,
-                )
-                cl_2d = self._compute_delta_cl_airfoil_2d(inputs, flap_angle, mach_ls)
-                outputs["data:aerodynamics:flaps:landing:CL_2D"] = cl_2d
-                outputs["data:aerodynamics:flaps:landing:CM"] = self._get_flaps_delta_cm(
-                    inputs,
-                    flap_angle,
-                    mach_ls,
-                )
-                x_cp_c_prime = self.x_cp_c_prime(flap_chord_ratio)
-                outputs["data:aerodynamics:flaps:landing:CM_2D"] = cl_2d * (0.25 - x_cp_c_prime)
-                cd_3d = self._get_flaps_delta_cd(
-                    inputs["data:geometry:flap_type"],
-                    inputs["data:geometry:flap:chord_ratio"],
-                    inputs["data:geometry:wing:thickness_ratio"],
-                    flap_angle,
-                    flap_area_ratio,
-                )
-                outputs["data:aerodynamics:flaps:landing:CD"] = cd_3d
-                outputs["data:aerodynamics:flaps:landing:CD_2D"] = cd_3d / flap_area_ratio
-            else:
-                flap_angle = float(inputs["data:mission:sizing:takeoff:flap_angle"])
-                (
-                    outputs["data:aerodynamics:flaps:takeoff:CL"],
-                    outputs["data:aerodynamics:flaps:takeoff:CL_max"],
-                ) = self._get_flaps_delta_cl(
-                    inputs,
-                    flap_angle,
-                    mach_ls,
-                )
-                cl_2d = self._compute_delta_cl_airfoil_2d(inputs, flap_angle, mach_ls)
-                outputs["data:aerodynamics:flaps:takeoff:CL_2D"] = cl_2d
-                outputs["data:aerodynamics:flaps:takeoff:CM"] = self._get_flaps_delta_cm(
-                    inputs,
-                    flap_angle,
-                    mach_ls,
-                )
-                x_cp_c_prime = self.x_cp_c_prime(flap_chord_ratio)
-                outputs["data:aerodynamics:flaps:takeoff:CM_2D"] = cl_2d * (0.25 - x_cp_c_prime)
-                cd_3d = self._get_flaps_delta_cd(
-                    inputs["data:geometry:flap_type"],
-                    inputs["data:geometry:flap:chord_ratio"],
-                    inputs["data:geometry:wing:thickness_ratio"],
-                    flap_angle,
-                    self._compute_flap_area_ratio(inputs),
-                )
-                outputs["data:aerodynamics:flaps:takeoff:CD"] = cd_3d
-                outputs["data:aerodynamics:flaps:takeoff:CD_2D"] = cd_3d / flap_area_ratio
+        # Computes flaps contribution during low speed operations (take-off/landing), both phases
+        # being evaluated at once
+        phases = ["landing", "takeoff"]
+        flap_angles = np.array(
+            [float(inputs["data:mission:sizing:" + phase + ":flap_angle"]) for phase in phases]
+        )
+        high_lift = HighLiftIncrements(inputs)
+        delta_cl = high_lift.delta_cl(flap_angles, mach_ls)
+        delta_cl_2d = high_lift.delta_cl_airfoil_2d(flap_angles, mach_ls)
+        delta_cl_max = high_lift.delta_cl_max(flap_angles)
+        delta_cm = high_lift.delta_cm(flap_angles, mach_ls)
+        delta_cm_2d = high_lift.delta_cm_airfoil_2d(flap_angles, mach_ls)
+        delta_cd = high_lift.delta_cd(flap_angles)
+        for idx, phase in enumerate(phases):
+            outputs["data:aerodynamics:flaps:" + phase + ":CL"] = delta_cl[idx]
+            outputs["data:aerodynamics:flaps:" + phase + ":CL_2D"] = delta_cl_2d[idx]
+            outputs["data:aerodynamics:flaps:" + phase + ":CL_max"] = delta_cl_max[idx]
+            outputs["data:aerodynamics:flaps:" + phase + ":CM"] = delta_cm[idx]
+            outputs["data:aerodynamics:flaps:" + phase + ":CM_2D"] = delta_cm_2d[idx]
+            outputs["data:aerodynamics:flaps:" + phase + ":CD"] = delta_cd[idx]
+            outputs["data:aerodynamics:flaps:" + phase + ":CD_2D"] = (
+                delta_cd[idx] / high_lift.flap_area_ratio
+            )
 
         # Computes elevator contribution during low speed operations (for different deflection
         # angle)
@@ -195,298 +153,3 @@ class ComputeDeltaHighLift(FigureDigitization):
         cl_alpha_elev *= 0.9  # Correction for the central fuselage part (no elevator there)
 
         return cl_alpha_elev
-
-    def _get_flaps_delta_cl(self, inputs, flap_angle: float, mach: float) -> Tuple[float, float]:
-        """
-        Method based on...
-
-        :param flap_angle: flap angle (in Degree)
-        :param mach: air speed
-        :return: increment of lift coefficient
-        """
-
-        cl_alpha_wing = inputs["data:aerodynamics:wing:low_speed:CL_alpha"]
-        span_wing = inputs["data:geometry:wing:span"]
-        y1_wing = inputs["data:geometry:fuselage:maximum_width"] / 2.0
-        y2_wing = inputs["data:geometry:wing:root:y"]
-        flap_span_ratio = inputs["data:geometry:flap:span_ratio"]
-        taper_ratio_wing = inputs["data:geometry:wing:taper_ratio"]
-        aspect_ratio_wing = float(inputs["data:geometry:wing:aspect_ratio"])
-        cl_alpha_airfoil_wing = inputs["data:aerodynamics:wing:airfoil:CL_alpha"]
-
-        # 2D flap lift coefficient
-        delta_cl_airfoil = self._compute_delta_cl_airfoil_2d(inputs, flap_angle, mach)
-        # Roskam 3D flap parameters
-        eta_in = y1_wing / (span_wing / 2.0)
-        eta_out = ((y2_wing - y1_wing) + flap_span_ratio * (span_wing / 2.0 - y2_wing)) / (
-            span_wing / 2.0 - y2_wing
-        )
-        kb = self.k_b_flaps(eta_in, eta_out, taper_ratio_wing)
-        a_delta_flap = self.a_delta_airfoil(float(inputs["data:geometry:flap:chord_ratio"]))
-        k_a_delta = self.k_a_delta(a_delta_flap, aspect_ratio_wing)
-        delta_cl0_flaps = (
-            kb * delta_cl_airfoil * (cl_alpha_wing / cl_alpha_airfoil_wing) * k_a_delta
-        )
-        delta_cl_max_flaps = self._compute_delta_cl_max_flaps(inputs, flap_angle)
-
-        return delta_cl0_flaps, delta_cl_max_flaps
-
-    def _get_flaps_delta_cm(self, inputs, flap_angle: float, mach: float) -> float:
-        """
-        Method based on Roskam book.
-
-        :param flap_angle: flap angle (in Degree).
-        :param mach: air speed.
-        :return: increment of moment coefficient.
-        """
-
-        cl_alpha_airfoil_wing = inputs["data:aerodynamics:wing:airfoil:CL_alpha"]
-        span_wing = inputs["data:geometry:wing:span"]
-        y1_wing = inputs["data:geometry:fuselage:maximum_width"] / 2.0
-        y2_wing = inputs["data:geometry:wing:root:y"]
-        flap_span_ratio = inputs["data:geometry:flap:span_ratio"]
-        taper_ratio_wing = float(inputs["data:geometry:wing:taper_ratio"])
-        aspect_ratio_wing = float(inputs["data:geometry:wing:aspect_ratio"])
-        flap_chord_ratio = float(inputs["data:geometry:flap:chord_ratio"])
-        wing_thickness_ratio = float(inputs["data:geometry:wing:thickness_ratio"])
-        sweep_25 = float(inputs["data:geometry:wing:sweep_25"]) * np.pi / 180.0
-
-        beta_ref = np.sqrt(1.0 - mach ** 2.0)
-        k = cl_alpha_airfoil_wing / (2.0 * np.pi)
-        cl_alpha_ref = (
-            2.0 * np.pi * 6.0 / (2.0 + np.sqrt((36.0 * beta_ref ** 2.0 / k ** 2.0 + 4.0)))
-        )
-
-        # First we need to compute the increment in the lift coefficient for the reference case
-        delta_cl_2d_ref = self._compute_delta_cl_airfoil_2d(inputs, flap_angle, mach)
-        eta_in_ref = 0.0
-        eta_out_ref = 1.0
-        kb_ref = self.k_b_flaps(eta_in_ref, eta_out_ref, taper_ratio_wing)
-        a_delta_flap_ref = self.a_delta_airfoil(float(inputs["data:geometry:flap:chord_ratio"]))
-        k_a_delta_ref = self.k_a_delta(a_delta_flap_ref, 6.0)
-        delta_cl_ref = (
-            kb_ref * delta_cl_2d_ref * (cl_alpha_ref / cl_alpha_airfoil_wing) * k_a_delta_ref
-        )
-
-        # Now we can compute the coefficient
-        eta_in = float(y1_wing / (span_wing / 2.0))
-        eta_out = float(
-            ((y2_wing - y1_wing) + flap_span_ratio * (span_wing / 2.0 - y2_wing))
-            / (span_wing / 2.0 - y2_wing)
-        )
-        k_delta = self.k_delta_flaps(taper_ratio_wing, eta_in, eta_out)
-        k_p = self.k_p_flaps(taper_ratio_wing, eta_in, eta_out)
-        delta_cm_delta_cl_ref = self.pitch_to_reference_lift(wing_thickness_ratio, flap_chord_ratio)
-
-        delta_cm_flap = (
-            k_delta * aspect_ratio_wing / 1.5 * np.tan(sweep_25) + k_p * delta_cm_delta_cl_ref
-        ) * delta_cl_ref
-
-        return delta_cm_flap
-
-    @staticmethod
-    def _get_flaps_delta_cd(
-        flap_type, chord_ratio, thickness_ratio, flap_angle: float, area_ratio
-    ) -> float:
-        """
-        Method from Young (in Gudmundsson book; page 725).
-
-        :param flap_angle: flap angle (in Degree).
-        :param flap_type: flap type.
-        :param area_ratio: ratio of control surface area over lifting surface area.
-        :param chord_ratio: ratio of control surface chord over lifting surface chord.
-        :param thickness_ratio: thickness ratio of the lifting surface.
-        :return: increment of drag coefficient.
-        """
-
-        if flap_type == 0.0:  # Plain flap
-            k1_0_12 = (
-                -21.09 * chord_ratio ** 3
-                + 14.091 * chord_ratio ** 2
-                + 3.165 * chord_ratio
-                - 0.00103
-            )
-            k1_0_21 = (
-                -19.988 * chord_ratio ** 3 + 12.68 * chord_ratio ** 2 + 3.363 * chord_ratio - 0.0050
-            )
-            k1_0_30 = (
-                -0.000 * chord_ratio ** 3 + 4.694 * chord_ratio ** 2 + 4.372 * chord_ratio - 0.0031
-            )
-            k1 = interpolate.interp1d(
-                [0.12, 0.21, 0.30], [float(k1_0_12), float(k1_0_21), float(k1_0_30)]
-            )(np.clip(thickness_ratio, 0.12, 0.30))
-            k2 = (
-                -3.795e-7 * flap_angle ** 3
-                + 5.387e-5 * flap_angle ** 2
-                + 6.843e-4 * flap_angle
-                - 1.4729e-3
-            )
-
-        elif flap_type == 1.0:  # slotted flap
-            k1_0_12 = (
-                179.32 * chord_ratio ** 4
-                - 111.6 * chord_ratio ** 3
-                + 28.929 * chord_ratio ** 2
-                + 2.3705 * chord_ratio
-                - 0.0089
-            )
-            k1_0_21 = (
-                0.000 * chord_ratio ** 4
-                - 0.000 * chord_ratio ** 3
-                + 8.2658 * chord_ratio ** 2
-                + 3.4564 * chord_ratio
-                - 0.0054
-            )
-            k1 = interpolate.interp1d([0.12, 0.21], [float(k1_0_12), float(k1_0_21)])(
-                np.clip(thickness_ratio, 0.12, 0.21)
-            )
-            k2_0_12 = (
-                -3.9877e-12 * flap_angle ** 6
-                + 1.1685e-9 * flap_angle ** 5
-                - 1.2846e-7 * flap_angle ** 4
-                + 6.1742e-6 * flap_angle ** 3
-                - 9.89444e-5 * flap_angle ** 2
-                + 6.8324e-4 * flap_angle
-                - 3.892e-4
-            )
-            k2_0_21 = (
-                -0.0 * flap_angle ** 6
-                - 4.6025e-11 * flap_angle ** 5
-                + 1.0025e-8 * flap_angle ** 4
-                - 9.8465e-7 * flap_angle ** 3
-                + 5.6732e-5 * flap_angle ** 2
-                - 2.64884e-4 * flap_angle
-                - 3.3591e-4
-            )
-            k2_0_30 = (
-                0.0 * flap_angle ** 6
-                + 0.0 * flap_angle ** 5
-                - 0.0 * flap_angle ** 4
-                - 3.6841e-7 * flap_angle ** 3
-                + 5.3342e-5 * flap_angle ** 2
-                - 41677e-3 * flap_angle
-                + 6.749e-4
-            )
-            k2 = interpolate.interp1d(
-                [0.12, 0.21, 0.30], [float(k2_0_12), float(k2_0_21), float(k2_0_30)]
-            )(np.clip(thickness_ratio, 0.12, 0.30))
-
-        else:  # Split flap
-            k1_0_12 = (
-                -21.09 * chord_ratio ** 3
-                + 14.091 * chord_ratio ** 2
-                + 3.165 * chord_ratio
-                - 0.00103
-            )
-            k1_0_21 = (
-                -19.988 * chord_ratio ** 3 + 12.68 * chord_ratio ** 2 + 3.363 * chord_ratio - 0.0050
-            )
-            k1_0_30 = (
-                -0.000 * chord_ratio ** 3 + 4.694 * chord_ratio ** 2 + 4.372 * chord_ratio - 0.0031
-            )
-            k1 = interpolate.interp1d(
-                [0.12, 0.21, 0.30], [float(k1_0_12), float(k1_0_21), float(k1_0_30)]
-            )(np.clip(thickness_ratio, 0.12, 0.30))
-            k2_0_12 = (
-                -4.161e-7 * flap_angle ** 3
-                + 5.5496e-5 * flap_angle ** 2
-                + 1.0110e-3 * flap_angle
-                - 2.219e-5
-            )
-            k2_0_21 = (
-                -5.1007e-7 * flap_angle ** 3
-                + 7.4060e-5 * flap_angle ** 2
-                - 4.8877e-5 * flap_angle
-                + 8.1775e-4
-            )
-            k2_0_30 = (
-                -3.2740e-7 * flap_angle ** 3
-                + 5.598e-5 * flap_angle ** 2
-                - 1.2443e-4 * flap_angle
-                + 5.1647e-4
-            )
-            k2 = interpolate.interp1d(
-                [0.12, 0.21, 0.30], [float(k2_0_12), float(k2_0_21), float(k2_0_30)]
-            )(np.clip(thickness_ratio, 0.12, 0.30))
-        delta_cd_flaps = k1 * k2 * area_ratio
-
-        return delta_cd_flaps
-
-    def _compute_delta_cl_airfoil_2d(self, inputs, angle: float, mach: float) -> float:
-        """
-        Compute airfoil 2D lift contribution.
-
-        :param angle: airfoil angle (in Degree).
-        :param mach: air speed.
-        :return: increment of lift coefficient.
-        """
-
-        flap_type = inputs["data:geometry:flap_type"]
-        flap_chord_ratio = float(inputs["data:geometry:flap:chord_ratio"])
-        wing_thickness_ratio = float(inputs["data:geometry:wing:thickness_ratio"])
-        cl_alpha_airfoil_wing = inputs["data:aerodynamics:wing:airfoil:CL_alpha"]
-
-        # 2D flap lift coefficient
-        if flap_type == 1:  # Slotted flap
-            alpha_flap = self.k_prime_single_slotted(angle, flap_chord_ratio)
-            delta_cl_airfoil = (
-                2 * math.pi / math.sqrt(1 - mach ** 2) * alpha_flap * (angle * math.pi / 180)
-            )
-        else:  # Plain flap
-            cl_delta_theory = self.cl_delta_theory_plain_flap(
-                wing_thickness_ratio, flap_chord_ratio
-            )
-            k = self.k_prime_plain_flap(abs(angle), flap_chord_ratio)
-            k_cl_delta = self.k_cl_delta_plain_flap(
-                wing_thickness_ratio, cl_alpha_airfoil_wing, flap_chord_ratio
-            )
-            delta_cl_airfoil = k_cl_delta * cl_delta_theory * k * (angle * math.pi / 180)
-
-        return delta_cl_airfoil
-
-    def _compute_delta_cl_max_flaps(self, inputs, flap_angle) -> float:
-        """
-        Method from Roskam vol.6.  Particularised for single slotted flaps in
-        airfoils with 12% thickness (which is the design case); with
-        chord ratio of 0.25 and typical flap deflections (30deg landing, 10deg TO).
-        Plain flap included (40 deg landing deflection here).
-        """
-
-        flap_type = inputs["data:geometry:flap_type"]
-        el_aero = inputs["data:geometry:wing:thickness_ratio"]
-        flap_chord_ratio = inputs["data:geometry:flap:chord_ratio"]
-        sweep_25 = inputs["data:geometry:wing:sweep_25"] * math.pi / 180.0
-        flap_area_ratio = self._compute_flap_area_ratio(inputs)
-
-        base_increment = self.base_max_lift_increment(el_aero * 100.0, flap_type)
-        k1 = self.k1_max_lift(flap_chord_ratio * 100.0, flap_type)
-        k2 = self.k2_max_lift(flap_angle, flap_type)
-        k3 = self.k3_max_lift(flap_angle, flap_type)
-
-        k_planform = (1.0 - 0.08 * math.cos(sweep_25) ** 2.0) * math.cos(sweep_25) ** (3.0 / 4.0)
-        delta_cl_max_flaps = base_increment * k1 * k2 * k3 * k_planform * flap_area_ratio
-
-        return delta_cl_max_flaps
-
-    @staticmethod
-    def _compute_flap_area_ratio(inputs) -> float:
-        """
-        Compute ratio of flap over wing (reference area).
-        Takes into account the wing portion under the fuselage.
-        """
-
-        wing_span = inputs["data:geometry:wing:span"]
-        wing_area = inputs["data:geometry:wing:area"]
-        wing_taper_ratio = inputs["data:geometry:wing:taper_ratio"]
-        y1_wing = inputs["data:geometry:fuselage:maximum_width"] / 2.0
-        y2_wing = inputs["data:geometry:wing:root:y"]
-        wing_root_chord = inputs["data:geometry:wing:root:chord"]
-        flap_span_ratio = inputs["data:geometry:flap:span_ratio"]
-
-        flap_area = (y2_wing - y1_wing) * wing_root_chord + flap_span_ratio * (
-            wing_span / 2.0 - y2_wing
-        ) * (wing_root_chord * (2 - (1 - wing_taper_ratio) * flap_span_ratio)) * 0.5
-
-        flap_area_ratio = 2 * flap_area / wing_area
-
-        return flap_area_ratio
@@ -0,0 +1,439 @@
+"""
+Vectorized computation of the lift, pitching moment and drag increments due to high-lift devices.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import math
+import os.path as pth
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+import numpy as np
+from pandas import read_csv
+
+from . import resources
+from .figure_digitization import (
+    FigureDigitization,
+    K_PLAIN_FLAP,
+    K_SINGLE_SLOT,
+    K2,
+    K3,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Chord ratios of the curves of Roskam figures 8.13 (plain flap) and 8.17 (single slotted flap)
+PLAIN_FLAP_CHORD_RATIOS = [0.1, 0.15, 0.25, 0.3, 0.4, 0.5]
+SINGLE_SLOT_CHORD_RATIOS = [0.15, 0.20, 0.25, 0.3, 0.4]
+# Reference angle of the flap motion correction factor (Roskam figure 8.34)
+K3_REFERENCE_ANGLE = 45.0
+
+
+@lru_cache()
+def _chart_curve(file_name: str, tag_x: str, tag_y: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a curve of a digitized figure, sorted by increasing abscissa. Figures are read once
+    per session.
+    """
+
+    db = read_csv(pth.join(resources.__path__[0], file_name))
+    x = db[tag_x]
+    y = db[tag_y]
+    errors = np.logical_or(np.isnan(x), np.isnan(y))
+    x = np.array(x[np.logical_not(errors)].tolist())
+    y = np.array(y[np.logical_not(errors)].tolist())
+    order = np.argsort(x, kind="stable")
+
+    return x[order], y[order]
+
+
+def _interpolate_curve(curve: Tuple[np.ndarray, np.ndarray], x: np.ndarray) -> np.ndarray:
+    """Linear interpolation on a curve, values being clipped to the curve range."""
+
+    curve_x, curve_y = curve
+    return np.interp(np.clip(x, curve_x[0], curve_x[-1]), curve_x, curve_y)
+
+
+def _is_clipped(curves: List[Tuple[np.ndarray, np.ndarray]], x: np.ndarray) -> bool:
+    return any(np.any((x < curve_x[0]) | (x > curve_x[-1])) for curve_x, _ in curves)
+
+
+def linear_weights(nodes: List[float], value: float) -> np.ndarray:
+    """
+    Weights of the nodes in the linear interpolation at a value, so that the interpolation of any
+    data at the nodes is the dot product of the weights and the data. The value is clipped to the
+    nodes range.
+
+    :param nodes: increasing abscissa of the nodes.
+    :param value: abscissa of the interpolation.
+    :return: the weights of the nodes.
+    """
+
+    value = np.clip(float(value), nodes[0], nodes[-1])
+
+    return np.array([np.interp(value, nodes, basis) for basis in np.eye(len(nodes))])
+
+
+def flap_area_ratio(inputs) -> float:
+    """
+    Compute ratio of flap over wing (reference area).
+    Takes into account the wing portion under the fuselage.
+    """
+
+    wing_span = inputs["data:geometry:wing:span"]
+    wing_area = inputs["data:geometry:wing:area"]
+    wing_taper_ratio = inputs["data:geometry:wing:taper_ratio"]
+    y1_wing = inputs["data:geometry:fuselage:maximum_width"] / 2.0
+    y2_wing = inputs["data:geometry:wing:root:y"]
+    wing_root_chord = inputs["data:geometry:wing:root:chord"]
+    flap_span_ratio = inputs["data:geometry:flap:span_ratio"]
+
+    flap_area = (y2_wing - y1_wing) * wing_root_chord + flap_span_ratio * (
+        wing_span / 2.0 - y2_wing
+    ) * (wing_root_chord * (2 - (1 - wing_taper_ratio) * flap_span_ratio)) * 0.5
+
+    return 2 * flap_area / wing_area
+
+
+def flaps_delta_cd(
+    flap_type, chord_ratio, thickness_ratio, flap_angle: Union[float, np.ndarray], area_ratio
+) -> Union[float, np.ndarray]:
+    """
+    Method from Young (in Gudmundsson book; page 725).
+
+    :param flap_angle: flap angle (in Degree), float or array.
+    :param flap_type: flap type.
+    :param area_ratio: ratio of control surface area over lifting surface area.
+    :param chord_ratio: ratio of control surface chord over lifting surface chord.
+    :param thickness_ratio: thickness ratio of the lifting surface.
+    :return: increment of drag coefficient.
+    """
+
+    chord_ratio = float(chord_ratio)
+    flap_angle = np.asarray(flap_angle, dtype=float)
+    weights_12_30 = linear_weights([0.12, 0.21, 0.30], thickness_ratio)
+
+    if flap_type == 0.0:  # Plain flap
+        k1_0_12 = (
+            -21.09 * chord_ratio ** 3 + 14.091 * chord_ratio ** 2 + 3.165 * chord_ratio - 0.00103
+        )
+        k1_0_21 = (
+            -19.988 * chord_ratio ** 3 + 12.68 * chord_ratio ** 2 + 3.363 * chord_ratio - 0.0050
+        )
+        k1_0_30 = (
+            -0.000 * chord_ratio ** 3 + 4.694 * chord_ratio ** 2 + 4.372 * chord_ratio - 0.0031
+        )
+        k1 = np.dot(weights_12_30, [k1_0_12, k1_0_21, k1_0_30])
+        k2 = (
+            -3.795e-7 * flap_angle ** 3
+            + 5.387e-5 * flap_angle ** 2
+            + 6.843e-4 * flap_angle
+            - 1.4729e-3
+        )
+
+    elif flap_type == 1.0:  # slotted flap
+        k1_0_12 = (
+            179.32 * chord_ratio ** 4
+            - 111.6 * chord_ratio ** 3
+            + 28.929 * chord_ratio ** 2
+            + 2.3705 * chord_ratio
+            - 0.0089
+        )
+        k1_0_21 = (
+            0.000 * chord_ratio ** 4
+            - 0.000 * chord_ratio ** 3
+            + 8.2658 * chord_ratio ** 2
+            + 3.4564 * chord_ratio
+            - 0.0054
+        )
+        k1 = np.dot(linear_weights([0.12, 0.21], thickness_ratio), [k1_0_12, k1_0_21])
+        k2_0_12 = (
+            -3.9877e-12 * flap_angle ** 6
+            + 1.1685e-9 * flap_angle ** 5
+            - 1.2846e-7 * flap_angle ** 4
+            + 6.1742e-6 * flap_angle ** 3
+            - 9.89444e-5 * flap_angle ** 2
+            + 6.8324e-4 * flap_angle
+            - 3.892e-4
+        )
+        k2_0_21 = (
+            -0.0 * flap_angle ** 6
+            - 4.6025e-11 * flap_angle ** 5
+            + 1.0025e-8 * flap_angle ** 4
+            - 9.8465e-7 * flap_angle ** 3
+            + 5.6732e-5 * flap_angle ** 2
+            - 2.64884e-4 * flap_angle
+            - 3.3591e-4
+        )
+        k2_0_30 = (
+            0.0 * flap_angle ** 6
+            + 0.0 * flap_angle ** 5
+            - 0.0 * flap_angle ** 4
+            - 3.6841e-7 * flap_angle ** 3
+            + 5.3342e-5 * flap_angle ** 2
+            - 41677e-3 * flap_angle
+            + 6.749e-4
+        )
+        k2 = weights_12_30[0] * k2_0_12 + weights_12_30[1] * k2_0_21 + weights_12_30[2] * k2_0_30
+
+    else:  # Split flap
+        k1_0_12 = (
+            -21.09 * chord_ratio ** 3 + 14.091 * chord_ratio ** 2 + 3.165 * chord_ratio - 0.00103
+        )
+        k1_0_21 = (
+            -19.988 * chord_ratio ** 3 + 12.68 * chord_ratio ** 2 + 3.363 * chord_ratio - 0.0050
+        )
+        k1_0_30 = (
+            -0.000 * chord_ratio ** 3 + 4.694 * chord_ratio ** 2 + 4.372 * chord_ratio - 0.0031
+        )
+        k1 = np.dot(weights_12_30, [k1_0_12, k1_0_21, k1_0_30])
+        k2_0_12 = (
+            -4.161e-7 * flap_angle ** 3
+            + 5.5496e-5 * flap_angle ** 2
+            + 1.0110e-3 * flap_angle
+            - 2.219e-5
+        )
+        k2_0_21 = (
+            -5.1007e-7 * flap_angle ** 3
+            + 7.4060e-5 * flap_angle ** 2
+            - 4.8877e-5 * flap_angle
+            + 8.1775e-4
+        )
+        k2_0_30 = (
+            -3.2740e-7 * flap_angle ** 3
+            + 5.598e-5 * flap_angle ** 2
+            - 1.2443e-4 * flap_angle
+            + 5.1647e-4
+        )
+        k2 = weights_12_30[0] * k2_0_12 + weights_12_30[1] * k2_0_21 + weights_12_30[2] * k2_0_30
+
+    return k1 * k2 * area_ratio
+
+
+class HighLiftIncrements:
+    """
+    Lift, pitching moment and drag increments due to the flaps of the wing, evaluated for arrays
+    of flap angles and Mach numbers in one pass. The factors that only depend on the geometry are
+    computed, and the digitized figures interpolated on the flap angle are prepared, once at
+    instantiation.
+
+    :param inputs: geometry and aerodynamic data of the wing, as given to ComputeDeltaHighLift.
+    """
+
+    def __init__(self, inputs):
+
+        self.flap_type = float(inputs["data:geometry:flap_type"])
+        self.flap_chord_ratio = float(inputs["data:geometry:flap:chord_ratio"])
+        self.wing_thickness_ratio = float(inputs["data:geometry:wing:thickness_ratio"])
+        self.cl_alpha_airfoil_wing = float(inputs["data:aerodynamics:wing:airfoil:CL_alpha"])
+        self.flap_area_ratio = float(flap_area_ratio(inputs))
+
+        cl_alpha_wing = float(inputs["data:aerodynamics:wing:low_speed:CL_alpha"])
+        span_wing = float(inputs["data:geometry:wing:span"])
+        y1_wing = float(inputs["data:geometry:fuselage:maximum_width"]) / 2.0
+        y2_wing = float(inputs["data:geometry:wing:root:y"])
+        flap_span_ratio = float(inputs["data:geometry:flap:span_ratio"])
+        taper_ratio_wing = float(inputs["data:geometry:wing:taper_ratio"])
+        aspect_ratio_wing = float(inputs["data:geometry:wing:aspect_ratio"])
+        sweep_25 = float(inputs["data:geometry:wing:sweep_25"]) * math.pi / 180.0
+
+        # 2D lift, flap angle dependent factors being interpolated on the curves of each chord
+        # ratio (weighted by the chord ratio weights)
+        if self.flap_type == 1:  # Slotted flap
+            self._k_prime_curves = [
+                _chart_curve(K_SINGLE_SLOT, "X_%d" % chord, "Y_%d" % chord)
+                for chord in [15, 20, 25, 30, 40]
+            ]
+            chord_ratio_nodes = SINGLE_SLOT_CHORD_RATIOS
+        else:  # Plain flap
+            self._k_prime_curves = [
+                _chart_curve(K_PLAIN_FLAP, "X_%d" % chord, "Y_%d" % chord)
+                for chord in [10, 15, 25, 30, 40, 50]
+            ]
+            chord_ratio_nodes = PLAIN_FLAP_CHORD_RATIOS
+            self._plain_flap_factor = float(
+                FigureDigitization.cl_delta_theory_plain_flap(
+                    self.wing_thickness_ratio, self.flap_chord_ratio
+                )
+                * FigureDigitization.k_cl_delta_plain_flap(
+                    self.wing_thickness_ratio, self.cl_alpha_airfoil_wing, self.flap_chord_ratio
+                )
+            )
+        if self.flap_chord_ratio != np.clip(
+            self.flap_chord_ratio, chord_ratio_nodes[0], chord_ratio_nodes[-1]
+        ):
+            _LOGGER.warning(
+                "Chord ratio value outside of the range in Roskam's book, value clipped"
+            )
+        self._k_prime_weights = linear_weights(chord_ratio_nodes, self.flap_chord_ratio)
+
+        # Roskam 3D flap parameters
+        eta_in = y1_wing / (span_wing / 2.0)
+        eta_out = ((y2_wing - y1_wing) + flap_span_ratio * (span_wing / 2.0 - y2_wing)) / (
+            span_wing / 2.0 - y2_wing
+        )
+        a_delta_flap = FigureDigitization.a_delta_airfoil(self.flap_chord_ratio)
+        self._cl_3d_factor = float(
+            FigureDigitization.k_b_flaps(eta_in, eta_out, taper_ratio_wing)
+            * (cl_alpha_wing / self.cl_alpha_airfoil_wing)
+            * FigureDigitization.k_a_delta(a_delta_flap, aspect_ratio_wing)
+        )
+
+        # Pitching moment, computed from the lift increment of a reference wing
+        self._cl_ref_factor = float(
+            FigureDigitization.k_b_flaps(0.0, 1.0, taper_ratio_wing)
+            * FigureDigitization.k_a_delta(a_delta_flap, 6.0)
+            / self.cl_alpha_airfoil_wing
+        )
+        self._cm_factor = float(
+            FigureDigitization.k_delta_flaps(taper_ratio_wing, eta_in, eta_out)
+            * aspect_ratio_wing
+            / 1.5
+            * np.tan(sweep_25)
+            + FigureDigitization.k_p_flaps(taper_ratio_wing, eta_in, eta_out)
+            * FigureDigitization.pitch_to_reference_lift(
+                self.wing_thickness_ratio, self.flap_chord_ratio
+            )
+        )
+        self._cm_2d_factor = 0.25 - float(FigureDigitization.x_cp_c_prime(self.flap_chord_ratio))
+
+        # Maximum lift
+        k_planform = (1.0 - 0.08 * math.cos(sweep_25) ** 2.0) * math.cos(sweep_25) ** (3.0 / 4.0)
+        self._cl_max_factor = float(
+            FigureDigitization.base_max_lift_increment(
+                self.wing_thickness_ratio * 100.0, self.flap_type
+            )
+            * FigureDigitization.k1_max_lift(self.flap_chord_ratio * 100.0, self.flap_type)
+            * k_planform
+            * self.flap_area_ratio
+        )
+        if self.flap_type == 1.0:
+            self._k2_curve = _chart_curve(K2, "X_SINGLE_SLOT", "Y_SINGLE_SLOT")
+            self._k3_curve = _chart_curve(K3, "X_SINGLE_SLOT", "Y_SINGLE_SLOT")
+        else:
+            if self.flap_type != 0.0:
+                _LOGGER.warning("Flap type not recognized, used plain flap instead")
+            self._k2_curve = _chart_curve(K2, "X_PLAIN_FLAP", "Y_PLAIN_FLAP")
+            self._k3_curve = None
+
+    def _k_prime(self, flap_angle: np.ndarray) -> np.ndarray:
+
+        if _is_clipped(self._k_prime_curves, flap_angle):
+            _LOGGER.warning("Flap angle value outside of the range in Roskam's book, value clipped")
+        k_chord = [_interpolate_curve(curve, flap_angle) for curve in self._k_prime_curves]
+
+        return np.tensordot(self._k_prime_weights, k_chord, axes=1)
+
+    def delta_cl_airfoil_2d(self, flap_angle, mach) -> np.ndarray:
+        """
+        Compute airfoil 2D lift contribution.
+
+        :param flap_angle: flap angle (in Degree), float or array.
+        :param mach: Mach number, float or array broadcastable with flap_angle.
+        :return: increment of lift coefficient.
+        """
+
+        flap_angle = np.asarray(flap_angle, dtype=float)
+
+        if self.flap_type == 1:  # Slotted flap
+            alpha_flap = self._k_prime(flap_angle)
+            return 2 * math.pi / np.sqrt(1 - mach ** 2) * alpha_flap * (flap_angle * math.pi / 180)
+
+        # Plain flap
+        k = self._k_prime(np.abs(flap_angle))
+        return self._plain_flap_factor * k * (flap_angle * math.pi / 180)
+
+    def delta_cl(self, flap_angle, mach) -> np.ndarray:
+        """
+        Method based on Roskam book.
+
+        :param flap_angle: flap angle (in Degree), float or array.
+        :param mach: Mach number, float or array broadcastable with flap_angle.
+        :return: increment of lift coefficient.
+        """
+
+        return self._cl_3d_factor * self.delta_cl_airfoil_2d(flap_angle, mach)
+
+    def delta_cl_max(self, flap_angle) -> np.ndarray:
+        """
+        Method from Roskam vol.6, see ComputeDeltaHighLift.
+
+        :param flap_angle: flap angle (in Degree), float or array.
+        :return: increment of maximum lift coefficient.
+        """
+
+        flap_angle = np.asarray(flap_angle, dtype=float)
+
+        if _is_clipped([self._k2_curve], flap_angle):
+            _LOGGER.warning(
+                "Control surface deflection value outside of the range in Roskam's book, "
+                "value clipped"
+            )
+        k2 = _interpolate_curve(self._k2_curve, flap_angle)
+        if self._k3_curve is None:
+            k3 = 1.0
+        else:
+            if _is_clipped([self._k3_curve], flap_angle / K3_REFERENCE_ANGLE):
+                _LOGGER.warning(
+                    "Control surface deflection value outside of the range in Roskam's book, "
+                    "value clipped, reference value is %f",
+                    K3_REFERENCE_ANGLE,
+                )
+            k3 = _interpolate_curve(self._k3_curve, flap_angle / K3_REFERENCE_ANGLE)
+
+        return self._cl_max_factor * k2 * k3
+
+    def delta_cm(self, flap_angle, mach) -> np.ndarray:
+        """
+        Method based on Roskam book.
+
+        :param flap_angle: flap angle (in Degree), float or array.
+        :param mach: Mach number, float or array broadcastable with flap_angle.
+        :return: increment of moment coefficient.
+        """
+
+        beta_ref = np.sqrt(1.0 - mach ** 2.0)
+        k = self.cl_alpha_airfoil_wing / (2.0 * np.pi)
+        cl_alpha_ref = (
+            2.0 * np.pi * 6.0 / (2.0 + np.sqrt((36.0 * beta_ref ** 2.0 / k ** 2.0 + 4.0)))
+        )
+        delta_cl_ref = (
+            self._cl_ref_factor * cl_alpha_ref * self.delta_cl_airfoil_2d(flap_angle, mach)
+        )
+
+        return self._cm_factor * delta_cl_ref
+
+    def delta_cm_airfoil_2d(self, flap_angle, mach) -> np.ndarray:
+        """
+        :param flap_angle: flap angle (in Degree), float or array.
+        :param mach: Mach number, float or array broadcastable with flap_angle.
+        :return: increment of airfoil moment coefficient.
+        """
+
+        return self.delta_cl_airfoil_2d(flap_angle, mach) * self._cm_2d_factor
+
+    def delta_cd(self, flap_angle) -> np.ndarray:
+        """
+        :param flap_angle: flap angle (in Degree), float or array.
+        :return: increment of drag coefficient.
+        """
+
+        return flaps_delta_cd(
+            self.flap_type,
+            self.flap_chord_ratio,
+            self.wing_thickness_ratio,
+            flap_angle,
+            self.flap_area_ratio,
+        )
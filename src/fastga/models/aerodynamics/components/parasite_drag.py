@@ -0,0 +1,421 @@
+"""
+Parasite drag build-up of the aircraft over arrays of flight conditions.
+"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import warnings
+from typing import Dict
+
+import numpy as np
+import openmdao.api as om
+from stdatm import Atmosphere
+
+# noinspection PyProtectedMember
+from fastoad.module_management._bundle_loader import BundleLoader
+
+from fastga.models.geometry.profiles.get_profile import get_profile
+from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
+
+# CRUD (other undesirable drag). Factor from Gudmundsson book
+CRUD_FACTOR = 1.25
+
+# Names of the parts of the parasite drag breakdown
+CD0_PARTS = [
+    "wing",
+    "fuselage",
+    "horizontal_tail",
+    "vertical_tail",
+    "nacelles",
+    "landing_gear",
+    "other",
+]
+
+
+def skin_friction_coefficient(reynolds, x_trans):
+    """
+    Skin friction coefficient of a surface with a laminar flow up to the transition point and a
+    turbulent flow downstream of it.
+
+    :param reynolds: Reynolds number based on the surface length.
+    :param x_trans: position of the transition, relative to the surface length.
+    """
+    x0_turbulent = 36.9 * x_trans ** 0.625 * (1.0 / reynolds) ** 0.375
+
+    return 0.074 / reynolds ** 0.2 * (1.0 - (x_trans - x0_turbulent)) ** 0.8
+
+
+def compressibility_correction(form_factor, mach, sweep_25):
+    """
+    Form factor of a lifting surface corrected for compressibility effects above Mach 0.2.
+
+    :param form_factor: form factor of the lifting surface at low Mach number.
+    :param mach: Mach number(s).
+    :param sweep_25: sweep angle at 25% of the chord, in degrees.
+    """
+    mach = np.asarray(mach)
+    corrected_form_factor = (
+        form_factor * 1.34 * mach ** 0.18 * (np.cos(sweep_25 * np.pi / 180)) ** 0.28
+    )
+
+    return np.where(mach > 0.2, corrected_form_factor, form_factor)
+
+
+def aircraft_cd0(cd0_wing, cd0_fus, cd0_ht, cd0_vt, cd0_nac, cd0_lg, cd0_other):
+    """
+    Profile drag of the whole aircraft. It is the simple sum of all the profile drag since every
+    subpart was computed with the wing area as a reference and the interaction are taken into
+    account with interference factors.
+    """
+    return CRUD_FACTOR * (cd0_wing + cd0_fus + cd0_ht + cd0_vt + cd0_lg + cd0_nac + cd0_other)
+
+
+def compute_unit_reynolds(mach, altitude):
+    """
+    Unit Reynolds number(s) in the ISA model.
+
+    :param mach: Mach number(s).
+    :param altitude: altitude(s) in meters.
+    """
+    atm = Atmosphere(altitude, altitude_in_feet=False)
+    atm.mach = mach
+
+    return atm.unitary_reynolds
+
+
+class ParasiteDrag:
+    """
+    Profile drag estimation of the parts of the aircraft, for any number of flight conditions.
+
+    Geometry is read from the inputs (any mapping of the data variables, with the units of the
+    CD0 components), flight conditions are given as broadcastable arrays of Mach numbers and unit
+    Reynolds numbers, and each method returns the drag coefficients of a part at all the flight
+    conditions, with the wing area as reference.
+
+    Based on : Gudmundsson, Snorri. General aviation aircraft design: Applied Methods and
+    Procedures. Butterworth-Heinemann, 2013.
+
+    :param inputs: the data variables.
+    :param propulsion_model: propulsion model of one engine, only needed for the nacelles drag.
+    :param wing_airfoil_file: airfoil file of the wing.
+    :param htp_airfoil_file: airfoil file of the horizontal tail.
+    """
+
+    def __init__(
+        self,
+        inputs,
+        propulsion_model: FuelEngineSet = None,
+        wing_airfoil_file: str = "naca23012.af",
+        htp_airfoil_file: str = "naca0012.af",
+    ):
+        self._inputs = inputs
+        self._propulsion_model = propulsion_model
+        self._wing_airfoil_file = wing_airfoil_file
+        self._htp_airfoil_file = htp_airfoil_file
+
+    def wing(self, mach, unit_reynolds) -> np.ndarray:
+        """Profile drag of the wing."""
+
+        inputs = self._inputs
+        l2_wing = inputs["data:geometry:wing:root:chord"]
+        l4_wing = inputs["data:geometry:wing:tip:chord"]
+        y1_wing = inputs["data:geometry:fuselage:maximum_width"] / 2.0
+        y2_wing = inputs["data:geometry:wing:root:y"]
+        span = inputs["data:geometry:wing:span"]
+        sweep_25 = inputs["data:geometry:wing:sweep_25"]
+        wet_area_wing = inputs["data:geometry:wing:wet_area"]
+        wing_area = inputs["data:geometry:wing:area"]
+        thickness = inputs["data:geometry:wing:thickness_ratio"]
+
+        x_t_max = self._max_thickness_position(self._wing_airfoil_file)
+        # Root: 45% NLF
+        cf_root = skin_friction_coefficient(unit_reynolds * l2_wing, 0.45)
+        # Tip: 55% NLF
+        cf_tip = skin_friction_coefficient(unit_reynolds * l4_wing, 0.55)
+        # Global
+        cf_wing = (
+            cf_root * (y2_wing - y1_wing) + 0.5 * (span / 2.0 - y2_wing) * (cf_root + cf_tip)
+        ) / (span / 2.0 - y1_wing)
+        ff = 1 + 0.6 / x_t_max * thickness + 100 * thickness ** 4
+        ff = compressibility_correction(ff, mach, sweep_25)
+
+        return ff * cf_wing * wet_area_wing / wing_area
+
+    def fuselage(self, unit_reynolds) -> np.ndarray:
+        """Profile drag of the fuselage, cockpit window included."""
+
+        inputs = self._inputs
+        height = inputs["data:geometry:fuselage:maximum_height"]
+        width = inputs["data:geometry:fuselage:maximum_width"]
+        length = inputs["data:geometry:fuselage:length"]
+        wet_area_fus = inputs["data:geometry:fuselage:wet_area"]
+        wing_area = inputs["data:geometry:wing:area"]
+
+        # 5% NLF
+        cf_fus = skin_friction_coefficient(unit_reynolds * length, 0.05)
+        f = length / np.sqrt(4 * height * width / np.pi)
+        ff_fus = 1.0 + 60.0 / (f ** 3.0) + f / 400.0
+        # Fuselage
+        cd0_fuselage = cf_fus * ff_fus * wet_area_fus / wing_area
+        # Cockpit window (Gudmundsson p727)
+        cd0_window = 0.002 * (height * width) / wing_area
+
+        return cd0_fuselage + cd0_window
+
+    def horizontal_tail(self, mach, unit_reynolds) -> np.ndarray:
+        """Profile drag of the horizontal tail."""
+
+        x_t_max = self._max_thickness_position(self._htp_airfoil_file)
+
+        return self._tail_plane("horizontal_tail", x_t_max, mach, unit_reynolds)
+
+    def vertical_tail(self, mach, unit_reynolds) -> np.ndarray:
+        """
+        Profile drag of the vertical tail.
+
+        Also based on : Raymer, Daniel. Aircraft design: a conceptual approach. American Institute
+        of Aeronautics and Astronautics, Inc., 2012.
+        """
+
+        x_t_max = self._inputs["data:geometry:vertical_tail:max_thickness:x_ratio"]
+
+        return self._tail_plane("vertical_tail", x_t_max, mach, unit_reynolds)
+
+    def nacelles(self, mach, unit_reynolds) -> np.ndarray:
+        """Profile drag of the engine nacelles."""
+
+        inputs = self._inputs
+        engine_number = inputs["data:geometry:propulsion:engine:count"]
+        prop_layout = inputs["data:geometry:propulsion:engine:layout"]
+        l0_wing = inputs["data:geometry:wing:MAC:length"]
+        wing_area = inputs["data:geometry:wing:area"]
+
+        drag_force = self._propulsion_model.compute_drag(mach, unit_reynolds, l0_wing)
+
+        if (prop_layout == 1.0) or (prop_layout == 2.0):
+            cd0 = drag_force / wing_area * engine_number
+        elif prop_layout == 3.0:
+            cd0 = 0.0
+        else:
+            cd0 = 0.0
+            warnings.warn(
+                "Propulsion layout {} not implemented in model, replaced by layout 1!".format(
+                    prop_layout
+                )
+            )
+
+        return cd0 * np.ones(np.broadcast(mach, unit_reynolds).shape)
+
+    def landing_gear(self, low_speed_aero: bool = False) -> np.ndarray:
+        """
+        Profile drag of the landing gear.
+
+        :param low_speed_aero: True if the landing gear is extended, retractable landing gears
+        being retracted otherwise.
+        """
+
+        inputs = self._inputs
+        lg_type = inputs["data:geometry:landing_gear:type"]
+        lg_height = inputs["data:geometry:landing_gear:height"]
+        wing_area = inputs["data:geometry:wing:area"]
+
+        if lg_type == 0.0:  # non-retractable LG AC (ref: Cirrus SR22)
+            # Gudmundsson example 15.12 (page 721)
+            area_mlg = 15 * 6 * 0.0254 ** 2  # Frontal area of wheel (data in inches)
+            area_nlg = 14 * 5 * 0.0254 ** 2
+            # MLG
+            cd_wheel = 0.484
+            cd0_mlg = cd_wheel * area_mlg / wing_area
+            # NLG
+            cd_wheel = 0.484 / 2
+            cd0_nlg = cd_wheel * area_nlg / wing_area
+            cd0 = cd0_mlg + cd0_nlg
+
+        elif low_speed_aero:  # retractable LG AC
+            tyre_width = 5 * 0.0254
+            # MLG
+            cd_mlg = 1.2
+            area_mlg = tyre_width * 1.8 * lg_height
+            # NLG
+            cd_nlg = 0.65
+            area_nlg = 14 * 5 * 0.0254 ** 2
+            cd0 = (cd_mlg * area_mlg + cd_nlg * area_nlg) / wing_area
+
+        else:
+            cd0 = 0.0 * wing_area
+
+        return cd0
+
+    def other(self) -> np.ndarray:
+        """
+        Profile drag of miscellaneous items such as cowling, cooling and various component.
+        """
+
+        prop_layout = self._inputs["data:geometry:propulsion:engine:layout"]
+        wing_area = self._inputs["data:geometry:wing:area"]
+
+        # COWLING (only if engine in fuselage): cx_cowl*wing_area assumed typical (Gudmundsson p739)
+        if prop_layout == 3.0:
+            cd0_cowling = 0.0267 / wing_area
+        else:
+            cd0_cowling = 0.0
+        # Cooling (piston engine only)
+        # Gudmundsson p715. Assuming cx_cooling*wing area/MTOW value of the book is typical
+        cd0_cooling = (
+            0.0005525  # (7.054E-6 / wing_area * mtow) FIXME: should come from propulsion model...
+        )
+        # Gudmundsson p739. Sum of other components (not calculated here), cx_other*wing_area
+        # assumed typical
+        cd0_components = 0.0253 / wing_area
+
+        return cd0_cowling + cd0_cooling + cd0_components
+
+    def breakdown(self, mach, unit_reynolds, low_speed_aero: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Profile drag of each part of the aircraft and of the whole aircraft.
+
+        :param mach: Mach number(s).
+        :param unit_reynolds: unit Reynolds number(s), in m**-1.
+        :param low_speed_aero: True if the landing gear is extended.
+        :return: dictionary of the drag coefficients, with CD0_PARTS and "aircraft" as keys, as
+        arrays with the shape of the flight conditions.
+        """
+
+        shape = np.broadcast(mach, unit_reynolds).shape
+        cd0 = {
+            "wing": self.wing(mach, unit_reynolds),
+            "fuselage": self.fuselage(unit_reynolds),
+            "horizontal_tail": self.horizontal_tail(mach, unit_reynolds),
+            "vertical_tail": self.vertical_tail(mach, unit_reynolds),
+            "nacelles": self.nacelles(mach, unit_reynolds),
+            "landing_gear": self.landing_gear(low_speed_aero),
+            "other": self.other(),
+        }
+        cd0 = {name: np.broadcast_to(value, shape) * 1.0 for name, value in cd0.items()}
+        cd0["aircraft"] = aircraft_cd0(*[cd0[name] for name in CD0_PARTS])
+
+        return cd0
+
+    def _tail_plane(self, tail_name, x_t_max, mach, unit_reynolds) -> np.ndarray:
+
+        inputs = self._inputs
+        tip_chord = inputs["data:geometry:%s:tip:chord" % tail_name]
+        root_chord = inputs["data:geometry:%s:root:chord" % tail_name]
+        sweep_25 = inputs["data:geometry:%s:sweep_25" % tail_name]
+        wet_area = inputs["data:geometry:%s:wet_area" % tail_name]
+        wing_area = inputs["data:geometry:wing:area"]
+        thickness = inputs["data:geometry:%s:thickness_ratio" % tail_name]
+
+        # Root: 50% NLF
+        cf_root = skin_friction_coefficient(unit_reynolds * root_chord, 0.5)
+        # Tip: 50% NLF
+        cf_tip = skin_friction_coefficient(unit_reynolds * tip_chord, 0.5)
+        # Global
+        cf_tail = (cf_root + cf_tip) * 0.5
+        ff = 1 + 0.6 / x_t_max * thickness + 100 * thickness ** 4
+        ff = ff * 1.05  # Due to hinged elevator (Raymer)
+        ff = compressibility_correction(ff, mach, sweep_25)
+        interference_factor = 1.05
+
+        return ff * interference_factor * cf_tail * wet_area / wing_area
+
+    @staticmethod
+    def _max_thickness_position(airfoil_file: str) -> float:
+        """Relative position of the maximum thickness of the airfoil."""
+
+        relative_thickness = get_profile(file_name=airfoil_file).get_relative_thickness_array()
+
+        return relative_thickness[np.argmax(relative_thickness[:, 1]), 0]
+
+
+class ComputeCd0FlightConditions(om.ExplicitComponent):
+    """
+    Profile drag breakdown of the aircraft at several flight conditions (Mach number and altitude),
+    evaluated for all of them at once, e.g. along a trajectory or for a sweep over the flight
+    domain.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._engine_wrapper = None
+
+    def initialize(self):
+        self.options.declare("number_of_points", default=1, types=int)
+        self.options.declare("low_speed_aero", default=False, types=bool)
+        self.options.declare("propulsion_id", default="", types=str)
+        self.options.declare(
+            "wing_airfoil_file", default="naca23012.af", types=str, allow_none=True
+        )
+        self.options.declare("htp_airfoil_file", default="naca0012.af", types=str, allow_none=True)
+
+    def setup(self):
+        self._engine_wrapper = BundleLoader().instantiate_component(self.options["propulsion_id"])
+        self._engine_wrapper.setup(self)
+
+        n = self.options["number_of_points"]
+
+        self.add_input("mach", val=np.nan, shape=n)
+        self.add_input("altitude", val=np.nan, shape=n, units="m")
+
+        self.add_input("data:geometry:wing:root:chord", val=np.nan, units="m")
+        self.add_input("data:geometry:wing:tip:chord", val=np.nan, units="m")
+        self.add_input("data:geometry:wing:root:y", val=np.nan, units="m")
+        self.add_input("data:geometry:wing:span", val=np.nan, units="m")
+        self.add_input("data:geometry:wing:sweep_25", val=np.nan, units="deg")
+        self.add_input("data:geometry:wing:wet_area", val=np.nan, units="m**2")
+        self.add_input("data:geometry:wing:area", val=np.nan, units="m**2")
+        self.add_input("data:geometry:wing:thickness_ratio", val=np.nan)
+        self.add_input("data:geometry:wing:MAC:length", val=np.nan, units="m")
+        self.add_input("data:geometry:fuselage:maximum_height", val=np.nan, units="m")
+        self.add_input("data:geometry:fuselage:maximum_width", val=np.nan, units="m")
+        self.add_input("data:geometry:fuselage:length", val=np.nan, units="m")
+        self.add_input("data:geometry:fuselage:wet_area", val=np.nan, units="m**2")
+        self.add_input("data:geometry:horizontal_tail:tip:chord", val=np.nan, units="m")
+        self.add_input("data:geometry:horizontal_tail:root:chord", val=np.nan, units="m")
+        self.add_input("data:geometry:horizontal_tail:sweep_25", val=np.nan, units="deg")
+        self.add_input("data:geometry:horizontal_tail:wet_area", val=np.nan, units="m**2")
+        self.add_input("data:geometry:horizontal_tail:thickness_ratio", val=np.nan)
+        self.add_input("data:geometry:vertical_tail:tip:chord", val=np.nan, units="m")
+        self.add_input("data:geometry:vertical_tail:root:chord", val=np.nan, units="m")
+        self.add_input("data:geometry:vertical_tail:sweep_25", val=np.nan, units="deg")
+        self.add_input("data:geometry:vertical_tail:wet_area", val=np.nan, units="m**2")
+        self.add_input("data:geometry:vertical_tail:thickness_ratio", val=np.nan)
+        self.add_input("data:geometry:vertical_tail:max_thickness:x_ratio", val=0.3)
+        self.add_input("data:geometry:propulsion:engine:count", val=np.nan)
+        self.add_input("data:geometry:landing_gear:type", val=np.nan)
+        self.add_input("data:geometry:landing_gear:height", val=np.nan, units="m")
+
+        self.add_output("unit_reynolds", shape=n, units="m**-1")
+        for name in CD0_PARTS:
+            self.add_output("%s:CD0" % name, shape=n)
+        self.add_output("aircraft:CD0", shape=n)
+
+        self.declare_partials("*", "*", method="fd")
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+
+        mach = inputs["mach"]
+        unit_reynolds = compute_unit_reynolds(mach, inputs["altitude"])
+
+        propulsion_model = FuelEngineSet(self._engine_wrapper.get_model(inputs), 1.0)
+        parasite_drag = ParasiteDrag(
+            inputs,
+            propulsion_model,
+            self.options["wing_airfoil_file"],
+            self.options["htp_airfoil_file"],
+        )
+        cd0 = parasite_drag.breakdown(mach, unit_reynolds, self.options["low_speed_aero"])
+
+        outputs["unit_reynolds"] = unit_reynolds
+        for name, value in cd0.items():
+            outputs["%s:CD0" % name] = value
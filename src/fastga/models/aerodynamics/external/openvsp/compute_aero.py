@@ -34,6 +34,7 @@ class ComputeAEROopenvsp(Group):
         self.options.declare("low_speed_aero", default=False, types=bool)
         self.options.declare("compute_mach_interpolation", default=False, types=bool)
         self.options.declare("result_folder_path", default="", types=str)
+        self.options.declare("surrogate_max_error", default=None, types=float, allow_none=True)
         self.options.declare("openvsp_exe_path", default="", types=str, allow_none=True)
         self.options.declare(
             "wing_airfoil_file", default=DEFAULT_WING_AIRFOIL, types=str, allow_none=True
@@ -54,6 +55,7 @@ class ComputeAEROopenvsp(Group):
                 low_speed_aero=self.options["low_speed_aero"],
                 compute_mach_interpolation=self.options["compute_mach_interpolation"],
                 result_folder_path=self.options["result_folder_path"],
+                surrogate_max_error=self.options["surrogate_max_error"],
                 openvsp_exe_path=self.options["openvsp_exe_path"],
                 wing_airfoil_file=self.options["wing_airfoil_file"],
                 htp_airfoil_file=self.options["htp_airfoil_file"],
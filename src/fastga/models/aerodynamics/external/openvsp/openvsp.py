@@ -13,15 +13,16 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import time
 import warnings
 import math
 import os.path as pth
-import pandas as pd
 import numpy as np
 
+from concurrent.futures import ThreadPoolExecutor
 from importlib.resources import path
 
-from openmdao.components.external_code_comp import ExternalCodeComp
+from openmdao.components.external_code_comp import ExternalCodeComp, ExternalCodeDelegate
 from openmdao.utils.file_wrap import InputFileGenerator
 
 from fastoad.model_base import FlightPoint
@@ -39,13 +40,12 @@ from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
 from fastga.models.propulsion.fuel_propulsion.basicIC_engine.basicIC_engine import (
     PROPELLER_EFFICIENCY,
 )
-
-# noinspection PyProtectedMember
-from fastga.command.api import _create_tmp_directory
+from fastga.utils.profiling import record_external_code_run
 
 from . import resources as local_resources
 from . import openvsp3201
 from ...constants import SPAN_MESH_POINT, MACH_NB_PTS, ENGINE_COUNT
+from .. import results_cache, surrogate
 
 from ... import resources
 
@@ -60,15 +60,57 @@ VSPSCRIPT_EXE_NAME = "vspscript.exe"
 VSPAERO_EXE_NAME = "vspaero.exe"
 
 
+class _OpenVSPRun:
+    """
+    Command, files and error stream of one run of OpenVSP, executed in the way ExternalCodeComp
+    does without modifying the options of the component, so that several runs of a component can
+    be done concurrently.
+    """
+
+    def __init__(self, component: ExternalCodeComp, target_directory: str):
+        self.options = {
+            name: component.options[name]
+            for name in ["env_vars", "poll_delay", "timeout", "fail_hard", "allowed_return_codes"]
+        }
+        self.options["command"] = []
+        self.options["external_input_files"] = []
+        self.options["external_output_files"] = []
+        self.stdin = component.stdin
+        self.stdout = component.stdout
+        # Define standard error file by default to avoid error code return
+        self.stderr = pth.join(target_directory, STDERR_FILE_NAME)
+        self.return_code = 0
+        self._process = None
+
+    def execute(self):
+        """Runs the command and checks that the output files are generated."""
+        # Output files of a previous run in the same work directory must not be taken for new ones
+        for output_file in self.options["external_output_files"]:
+            if pth.exists(output_file):
+                os.remove(output_file)
+        start = time.perf_counter()
+        try:
+            ExternalCodeDelegate(self).run_component()
+        finally:
+            record_external_code_run(time.perf_counter() - start)
+
+
 class OPENVSPSimpleGeometry(ExternalCodeComp):
     """Execution of OpenVSP for clean surfaces."""
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.stderr = None
+        # Temporary work directories created by the component and the ones that are not used by a
+        # run, they are kept from one run to another to avoid copying OpenVSP each time
+        self._tmp_directories = []
+        self._available_work_directories = []
 
     def initialize(self):
         self.options.declare("result_folder_path", default="", types=str)
+        # Maximum estimated relative error for the results of a new geometry to be predicted by the
+        # surrogate of the saved ones, instead of being computed (None to always compute them)
+        self.options.declare("surrogate_max_error", default=None, types=float, allow_none=True)
         self.options.declare("openvsp_exe_path", default="", types=str, allow_none=True)
         self.options.declare(
             "wing_airfoil_file", default=DEFAULT_WING_AIRFOIL, types=str, allow_none=True
@@ -113,6 +155,51 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         # let void to avoid logger error on "The command cannot be empty"
         pass
 
+    def _acquire_work_directory(self) -> str:
+        """
+        Returns a work directory holding OpenVSP and the airfoil files, reserved until released.
+        If a folder path is specified for openvsp .exe, it is the work directory, otherwise
+        temporary folders are created when no released one is available.
+        """
+        if self.options["openvsp_exe_path"]:
+            target_directory = pth.abspath(self.options["openvsp_exe_path"])
+            if target_directory not in self._available_work_directories:
+                self._populate_work_directory(target_directory)
+                self._available_work_directories.append(target_directory)
+            return target_directory
+
+        try:
+            return self._available_work_directories.pop()
+        except IndexError:
+            from fastga.command.api import _create_tmp_directory
+
+            tmp_directory = _create_tmp_directory()
+            self._tmp_directories.append(tmp_directory)
+            self._populate_work_directory(tmp_directory.name)
+            return tmp_directory.name
+
+    def _release_work_directory(self, target_directory: str):
+        """Makes a work directory available for the next runs."""
+        if not self.options["openvsp_exe_path"]:
+            self._available_work_directories.append(target_directory)
+
+    def cleanup(self):
+        """Deletes the temporary work directories created by the component."""
+        super().cleanup()
+        for tmp_directory in self._tmp_directories:
+            if tmp_directory.name in self._available_work_directories:
+                self._available_work_directories.remove(tmp_directory.name)
+            tmp_directory.cleanup()
+        self._tmp_directories = []
+
+    def _populate_work_directory(self, target_directory: str):
+        """Copies OpenVSP and the airfoil files in the work directory."""
+        # noinspection PyTypeChecker
+        copy_resource_folder(openvsp3201, target_directory)
+        for airfoil_file in {self.options["wing_airfoil_file"], self.options["htp_airfoil_file"]}:
+            # noinspection PyTypeChecker
+            copy_resource(resources, airfoil_file, target_directory)
+
     def compute_cl_alpha_aircraft(self, inputs, outputs, altitude, mach, aoa_angle):
         """
         Function that perform a complete calculation of aerodynamic parameters under OpenVSP and
@@ -196,8 +283,16 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
                 result_folder_path, geometry_set
             )
 
+        # If no result saved for that geometry, results may be predicted by the surrogate of the
+        # saved ones (already scaled to the area ratio and wing area of the geometry)
+        data = None
+        max_error = self.options["surrogate_max_error"]
+        if result_file_path is None and result_folder_path != "" and max_error is not None:
+            data, _ = self.predict_results(result_folder_path, geometry_set, sref_wing, max_error)
+            saved_area_ratio = area_ratio
+
         # If no result saved for that geometry under this mach condition, computation is done
-        if result_file_path is None:
+        if result_file_path is None and data is None:
 
             # Create result folder first (if it must fail, let it fail as soon as possible)
             if result_folder_path != "":
@@ -208,17 +303,27 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
             if self.options["result_folder_path"] != "":
                 result_file_path = self.save_geometry(result_folder_path, geometry_set)
 
-            # Compute wing alone @ 0°/X° angle of attack
-            wing_0 = self.compute_wing(inputs, outputs, altitude, mach, 0.0)
-            wing_aoa = self.compute_wing(inputs, outputs, altitude, mach, aoa_angle)
-
-            # Compute complete aircraft @ 0°/X° angle of attack
-            _, htp_0, _ = self.compute_aircraft(inputs, outputs, altitude, mach, 0.0)
-            _, htp_aoa, _ = self.compute_aircraft(inputs, outputs, altitude, mach, aoa_angle)
-
-            # Compute isolated HTP @ 0°/X° angle of attack
-            htp_0_isolated = self.compute_isolated_htp(inputs, outputs, altitude, mach, 0.0)
-            htp_aoa_isolated = self.compute_isolated_htp(inputs, outputs, altitude, mach, aoa_angle)
+            # Compute wing alone, complete aircraft and isolated HTP @ 0°/X° angle of attack. Runs
+            # are independent so they are done concurrently, each in its own work directory (one
+            # after the other if a single work directory is specified)
+            sub_runs = [
+                (self.compute_wing, 0.0),
+                (self.compute_wing, aoa_angle),
+                (self.compute_aircraft, 0.0),
+                (self.compute_aircraft, aoa_angle),
+                (self.compute_isolated_htp, 0.0),
+                (self.compute_isolated_htp, aoa_angle),
+            ]
+            max_workers = 1 if self.options["openvsp_exe_path"] else len(sub_runs)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(compute_function, inputs, outputs, altitude, mach, angle)
+                    for compute_function, angle in sub_runs
+                ]
+            wing_0, wing_aoa = futures[0].result(), futures[1].result()
+            _, htp_0, _ = futures[2].result()
+            _, htp_aoa, _ = futures[3].result()
+            htp_0_isolated, htp_aoa_isolated = futures[4].result(), futures[5].result()
 
             # Post-process wing data ---------------------------------------------------------------
             width_max = inputs["data:geometry:fuselage:maximum_width"]
@@ -302,7 +407,8 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         # Else retrieved results are used, eventually adapted with new area ratio
         else:
             # Read values from result file ---------------------------------------------------------
-            data = self.read_results(result_file_path)
+            if data is None:
+                data = self.read_results(result_file_path)
             saved_area_wing = float(data.loc["saved_ref_area", 0])
             cl_0_wing = float(data.loc["cl_0_wing", 0])
             cl_alpha_wing = float(data.loc["cl_alpha_wing", 0])
@@ -388,183 +494,176 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         v_inf = max(atm.speed_of_sound * mach, 0.01)  # avoid V=0 m/s crashes
         reynolds = v_inf * l0_wing / atm.kinematic_viscosity
 
-        # STEP 2/XX - DEFINE WORK DIRECTORY, COPY RESOURCES AND CREATE COMMAND BATCH ###############
-        ############################################################################################
-
-        # If a folder path is specified for openvsp .exe, it becomes working directory (target),
-        # if not temporary folder is created
-        if self.options["openvsp_exe_path"]:
-            target_directory = pth.abspath(self.options["openvsp_exe_path"])
-        else:
-            tmp_directory = _create_tmp_directory()
-            target_directory = tmp_directory.name
-        # Define the list of necessary input files: geometry script and foil file for both wing/HTP
-        input_file_list = [
-            pth.join(target_directory, INPUT_WING_SCRIPT),
-            pth.join(target_directory, self.options["wing_airfoil_file"]),
-        ]
-        self.options["external_input_files"] = input_file_list
-        # Define standard error file by default to avoid error code return
-        self.stderr = pth.join(target_directory, STDERR_FILE_NAME)
-        # Copy resource in working (target) directory
-        # noinspection PyTypeChecker
-        copy_resource_folder(openvsp3201, target_directory)
-        # noinspection PyTypeChecker
-        copy_resource(resources, self.options["wing_airfoil_file"], target_directory)
-        # Create corresponding .bat files (one for each geometry configuration)
-        self.options["command"] = [pth.join(target_directory, "vspscript.bat")]
-        batch_file = open(self.options["command"][0], "w+")
-        batch_file.write("@echo off\n")
-        command = (
-            pth.join(target_directory, VSPSCRIPT_EXE_NAME)
-            + " -script "
-            + pth.join(target_directory, INPUT_WING_SCRIPT)
-            + " >nul 2>nul\n"
-        )
-        batch_file.write(command)
-        batch_file.close()
-
-        # STEP 3/XX - OPEN THE TEMPLATE SCRIPT FOR GEOMETRY GENERATION, MODIFY VALUES AND SAVE TO
-        # WORKDIR #################################################################################
-
-        output_file_list = [
-            pth.join(target_directory, INPUT_WING_SCRIPT.replace(".vspscript", "_DegenGeom.csv"))
-        ]
-        parser = InputFileGenerator()
-        with path(local_resources, INPUT_WING_SCRIPT) as input_template_path:
-            parser.set_template_file(str(input_template_path))
-            parser.set_generated_file(input_file_list[0])
-            # Modify wing parameters
-            parser.mark_anchor("x_wing")
-            parser.transfer_var(float(x_wing), 0, 5)
-            parser.mark_anchor("z_wing")
-            parser.transfer_var(float(z_wing), 0, 5)
-            parser.mark_anchor("y1_wing")
-            parser.transfer_var(float(y1_wing), 0, 5)
-            for i in range(3):
-                parser.mark_anchor("l2_wing")
-                parser.transfer_var(float(l2_wing), 0, 5)
-            parser.reset_anchor()
-            parser.mark_anchor("span2_wing")
-            parser.transfer_var(float(span2_wing), 0, 5)
-            parser.mark_anchor("l4_wing")
-            parser.transfer_var(float(l4_wing), 0, 5)
-            parser.mark_anchor("sweep_0_wing")
-            parser.transfer_var(float(sweep_0_wing), 0, 5)
-            parser.mark_anchor("airfoil_0_file")
-            parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("airfoil_1_file")
-            parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("airfoil_2_file")
-            parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("csv_file")
-            csv_name = output_file_list[0]
-            parser.transfer_var('"' + csv_name.replace("\\", "/") + '"', 0, 3)
-            parser.generate()
-
-        # STEP 4/XX - RUN BATCH TO GENERATE GEOMETRY .CSV FILE #####################################
-        ############################################################################################
-
-        self.options["external_output_files"] = output_file_list
-        super().compute(inputs, outputs)
-
-        # STEP 5/XX - DEFINE NEW INPUT/OUTPUT FILES LIST AND CREATE BATCH FOR VLM COMPUTATION ######
-        ############################################################################################
-
-        input_file_list = output_file_list
-        input_file_list.append(input_file_list[0].replace(".csv", ".vspaero"))
-        output_file_list = [
-            input_file_list[0].replace(".csv", ".lod"),
-            input_file_list[0].replace(".csv", ".polar"),
-        ]
-        self.options["external_input_files"] = input_file_list
-        self.options["external_output_files"] = output_file_list
-        self.options["command"] = [pth.join(target_directory, "vspaero.bat")]
-        batch_file = open(self.options["command"][0], "w+")
-        batch_file.write("@echo off\n")
-        # NOTE: added -stab to perform the stability analysis
-        command = (
-            pth.join(target_directory, VSPAERO_EXE_NAME)
-            + " -stab "   # TO PERFORM STABILITY ANALYSIS
-            + input_file_list[1].replace(".vspaero", "")
-            + " >nul 2>nul\n"
-        )
-        batch_file.write(command)
-        batch_file.close()
-
-        # STEP 6/XX - OPEN THE TEMPLATE VSPAERO FOR COMPUTATION, MODIFY VALUES AND SAVE TO WORKDIR #
+        # STEP 2/XX - RESERVE WORK DIRECTORY AND CREATE COMMAND BATCH ##############################
         ############################################################################################
 
-        parser = InputFileGenerator()
-        template_file = pth.split(input_file_list[1])[1]
-        with path(local_resources, template_file) as input_template_path:
-            parser.set_template_file(str(input_template_path))
-            parser.set_generated_file(input_file_list[1])
-            parser.reset_anchor()
-            parser.mark_anchor("Sref")
-            parser.transfer_var(float(sref_wing), 0, 3)
-            parser.mark_anchor("Cref")
-            parser.transfer_var(float(l0_wing), 0, 3)
-            parser.mark_anchor("Bref")
-            parser.transfer_var(float(span_wing), 0, 3)
-            parser.mark_anchor("X_cg")
-            parser.transfer_var(float(fa_length), 0, 3)
-            parser.mark_anchor("Mach")
-            parser.transfer_var(float(mach), 0, 3)
-            parser.mark_anchor("AOA")
-            parser.transfer_var(float(aoa_angle), 0, 3)
-            parser.mark_anchor("Vinf")
-            parser.transfer_var(float(v_inf), 0, 3)
-            parser.mark_anchor("Rho")
-            parser.transfer_var(float(rho), 0, 3)
-            parser.mark_anchor("ReCref")
-            parser.transfer_var(float(reynolds), 0, 3)
-            parser.generate()
-
-        # STEP 7/XX - RUN BATCH TO GENERATE AERO OUTPUT FILES (.lod, .polar...) ####################
-        ############################################################################################
-
-        super().compute(inputs, outputs)
+        # The work directory, already holding OpenVSP and the airfoil files, is reserved for this
+        # run so that other runs of the component can be done concurrently
+        target_directory = self._acquire_work_directory()
+        try:
+            run = _OpenVSPRun(self, target_directory)
+            # Define the list of necessary input files: geometry script and foil file for both
+            # wing/HTP
+            input_file_list = [
+                pth.join(target_directory, INPUT_WING_SCRIPT),
+                pth.join(target_directory, self.options["wing_airfoil_file"]),
+            ]
+            run.options["external_input_files"] = input_file_list
+            # Create corresponding .bat files (one for each geometry configuration)
+            run.options["command"] = [pth.join(target_directory, "vspscript.bat")]
+            batch_file = open(run.options["command"][0], "w+")
+            batch_file.write("@echo off\n")
+            command = (
+                pth.join(target_directory, VSPSCRIPT_EXE_NAME)
+                + " -script "
+                + pth.join(target_directory, INPUT_WING_SCRIPT)
+                + " >nul 2>nul\n"
+            )
+            batch_file.write(command)
+            batch_file.close()
 
-        # STEP 8/XX - READ FILES, RETURN RESULTS (AND CLEAR TEMPORARY WORKDIR) #####################
-        ############################################################################################
+            # STEP 3/XX - OPEN THE TEMPLATE SCRIPT FOR GEOMETRY GENERATION, MODIFY VALUES AND SAVE TO
+            # WORKDIR ##############################################################################
 
-        # Open .lod file and extract data
-        wing_y_vect = []
-        wing_chord_vect = []
-        wing_cl_vect = []
-        wing_cd_vect = []
-        wing_cm_vect = []
-        with open(output_file_list[0], "r") as file_stream:
-            data = file_stream.readlines()
-            for i, _ in enumerate(data):
-                line = data[i].split()
-                line.append("**")
-                if line[0] == "1":
-                    wing_y_vect.append(float(line[2]))
-                    wing_chord_vect.append(float(line[3]))
-                    wing_cl_vect.append(float(line[5]))
-                    wing_cd_vect.append(float(line[6]))
-                    wing_cm_vect.append(float(line[12]))
-                if line[0] == "Comp":
-                    cl_wing = float(data[i + 1].split()[5]) + float(
-                        data[i + 2].split()[5]
-                    )  # sum CL left/right
-                    cdi_wing = float(data[i + 1].split()[6]) + float(
-                        data[i + 2].split()[6]
-                    )  # sum CDi left/right
-                    cm_wing = float(data[i + 1].split()[12]) + float(
-                        data[i + 2].split()[12]
-                    )  # sum CM left/right
-                    break
-        # Open .polar file and extract data
-        with open(output_file_list[1], "r") as file_stream:
-            data = file_stream.readlines()
-            wing_e = float(data[1].split()[10])
-        # Delete temporary directory
-        if not self.options["openvsp_exe_path"]:
-            # noinspection PyUnboundLocalVariable
-            tmp_directory.cleanup()
+            output_file_list = [
+                pth.join(
+                    target_directory, INPUT_WING_SCRIPT.replace(".vspscript", "_DegenGeom.csv")
+                )
+            ]
+            parser = InputFileGenerator()
+            with path(local_resources, INPUT_WING_SCRIPT) as input_template_path:
+                parser.set_template_file(str(input_template_path))
+                parser.set_generated_file(input_file_list[0])
+                # Modify wing parameters
+                parser.mark_anchor("x_wing")
+                parser.transfer_var(float(x_wing), 0, 5)
+                parser.mark_anchor("z_wing")
+                parser.transfer_var(float(z_wing), 0, 5)
+                parser.mark_anchor("y1_wing")
+                parser.transfer_var(float(y1_wing), 0, 5)
+                for i in range(3):
+                    parser.mark_anchor("l2_wing")
+                    parser.transfer_var(float(l2_wing), 0, 5)
+                parser.reset_anchor()
+                parser.mark_anchor("span2_wing")
+                parser.transfer_var(float(span2_wing), 0, 5)
+                parser.mark_anchor("l4_wing")
+                parser.transfer_var(float(l4_wing), 0, 5)
+                parser.mark_anchor("sweep_0_wing")
+                parser.transfer_var(float(sweep_0_wing), 0, 5)
+                parser.mark_anchor("airfoil_0_file")
+                parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("airfoil_1_file")
+                parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("airfoil_2_file")
+                parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("csv_file")
+                csv_name = output_file_list[0]
+                parser.transfer_var('"' + csv_name.replace("\\", "/") + '"', 0, 3)
+                parser.generate()
+
+            # STEP 4/XX - RUN BATCH TO GENERATE GEOMETRY .CSV FILE #################################
+            ########################################################################################
+
+            run.options["external_output_files"] = output_file_list
+            run.execute()
+
+            # STEP 5/XX - DEFINE NEW INPUT/OUTPUT FILES LIST AND CREATE BATCH FOR VLM COMPUTATION ##
+            ########################################################################################
+
+            input_file_list = output_file_list
+            input_file_list.append(input_file_list[0].replace(".csv", ".vspaero"))
+            output_file_list = [
+                input_file_list[0].replace(".csv", ".lod"),
+                input_file_list[0].replace(".csv", ".polar"),
+            ]
+            run.options["external_input_files"] = input_file_list
+            run.options["external_output_files"] = output_file_list
+            run.options["command"] = [pth.join(target_directory, "vspaero.bat")]
+            batch_file = open(run.options["command"][0], "w+")
+            batch_file.write("@echo off\n")
+            # NOTE: added -stab to perform the stability analysis
+            command = (
+                pth.join(target_directory, VSPAERO_EXE_NAME)
+                + " -stab "   # TO PERFORM STABILITY ANALYSIS
+                + input_file_list[1].replace(".vspaero", "")
+                + " >nul 2>nul\n"
+            )
+            batch_file.write(command)
+            batch_file.close()
+
+            # STEP 6/XX - OPEN THE TEMPLATE VSPAERO FOR COMPUTATION, MODIFY VALUES AND SAVE TO
+            # WORKDIR ##############################################################################
+
+            parser = InputFileGenerator()
+            template_file = pth.split(input_file_list[1])[1]
+            with path(local_resources, template_file) as input_template_path:
+                parser.set_template_file(str(input_template_path))
+                parser.set_generated_file(input_file_list[1])
+                parser.reset_anchor()
+                parser.mark_anchor("Sref")
+                parser.transfer_var(float(sref_wing), 0, 3)
+                parser.mark_anchor("Cref")
+                parser.transfer_var(float(l0_wing), 0, 3)
+                parser.mark_anchor("Bref")
+                parser.transfer_var(float(span_wing), 0, 3)
+                parser.mark_anchor("X_cg")
+                parser.transfer_var(float(fa_length), 0, 3)
+                parser.mark_anchor("Mach")
+                parser.transfer_var(float(mach), 0, 3)
+                parser.mark_anchor("AOA")
+                parser.transfer_var(float(aoa_angle), 0, 3)
+                parser.mark_anchor("Vinf")
+                parser.transfer_var(float(v_inf), 0, 3)
+                parser.mark_anchor("Rho")
+                parser.transfer_var(float(rho), 0, 3)
+                parser.mark_anchor("ReCref")
+                parser.transfer_var(float(reynolds), 0, 3)
+                parser.generate()
+
+            # STEP 7/XX - RUN BATCH TO GENERATE AERO OUTPUT FILES (.lod, .polar...) ################
+            ########################################################################################
+
+            run.execute()
+
+            # STEP 8/XX - READ FILES, RETURN RESULTS (AND RELEASE WORKDIR) #########################
+            ########################################################################################
+
+            # Open .lod file and extract data
+            wing_y_vect = []
+            wing_chord_vect = []
+            wing_cl_vect = []
+            wing_cd_vect = []
+            wing_cm_vect = []
+            with open(output_file_list[0], "r") as file_stream:
+                data = file_stream.readlines()
+                for i, _ in enumerate(data):
+                    line = data[i].split()
+                    line.append("**")
+                    if line[0] == "1":
+                        wing_y_vect.append(float(line[2]))
+                        wing_chord_vect.append(float(line[3]))
+                        wing_cl_vect.append(float(line[5]))
+                        wing_cd_vect.append(float(line[6]))
+                        wing_cm_vect.append(float(line[12]))
+                    if line[0] == "Comp":
+                        cl_wing = float(data[i + 1].split()[5]) + float(
+                            data[i + 2].split()[5]
+                        )  # sum CL left/right
+                        cdi_wing = float(data[i + 1].split()[6]) + float(
+                            data[i + 2].split()[6]
+                        )  # sum CDi left/right
+                        cm_wing = float(data[i + 1].split()[12]) + float(
+                            data[i + 2].split()[12]
+                        )  # sum CM left/right
+                        break
+            # Open .polar file and extract data
+            with open(output_file_list[1], "r") as file_stream:
+                data = file_stream.readlines()
+                wing_e = float(data[1].split()[10])
+        finally:
+            # Make the work directory available for other runs, also after a failure
+            self._release_work_directory(target_directory)
         # Return values
         wing = {
             "y_vector": wing_y_vect,
@@ -616,174 +715,165 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         v_inf = max(atm.speed_of_sound * mach, 0.01)  # avoid V=0 m/s crashes
         reynolds = v_inf * l0_htp / atm.kinematic_viscosity
 
-        # STEP 2/XX - DEFINE WORK DIRECTORY, COPY RESOURCES AND CREATE COMMAND BATCH ###############
+        # STEP 2/XX - RESERVE WORK DIRECTORY AND CREATE COMMAND BATCH ##############################
         ############################################################################################
 
-        # If a folder path is specified for openvsp .exe, it becomes working directory (target),
-        # if not temporary folder is created
-        if self.options["openvsp_exe_path"]:
-            target_directory = pth.abspath(self.options["openvsp_exe_path"])
-        else:
-            tmp_directory = _create_tmp_directory()
-            target_directory = tmp_directory.name
-        # Define the list of necessary input files: geometry script and foil file for both wing/HTP
-        input_file_list = [
-            pth.join(target_directory, INPUT_HTP_SCRIPT),
-            pth.join(target_directory, self.options["htp_airfoil_file"]),
-        ]
-        self.options["external_input_files"] = input_file_list
-        # Define standard error file by default to avoid error code return
-        self.stderr = pth.join(target_directory, STDERR_FILE_NAME)
-        # Copy resource in working (target) directory
-        # noinspection PyTypeChecker
-        copy_resource_folder(openvsp3201, target_directory)
-        # noinspection PyTypeChecker
-        copy_resource(resources, self.options["htp_airfoil_file"], target_directory)
-        # Create corresponding .bat files (one for each geometry configuration)
-        self.options["command"] = [pth.join(target_directory, "vspscript.bat")]
-        batch_file = open(self.options["command"][0], "w+")
-        batch_file.write("@echo off\n")
-        command = (
-            pth.join(target_directory, VSPSCRIPT_EXE_NAME)
-            + " -script "
-            + pth.join(target_directory, INPUT_HTP_SCRIPT)
-            + " >nul 2>nul\n"
-        )
-        batch_file.write(command)
-        batch_file.close()
-
-        # STEP 3/XX - OPEN THE TEMPLATE SCRIPT FOR GEOMETRY GENERATION, MODIFY VALUES AND SAVE TO
-        # WORKDIR ##################################################################################
-
-        output_file_list = [
-            pth.join(target_directory, INPUT_HTP_SCRIPT.replace(".vspscript", "_DegenGeom.csv"))
-        ]
-        parser = InputFileGenerator()
-        with path(local_resources, INPUT_HTP_SCRIPT) as input_template_path:
-            parser.set_template_file(str(input_template_path))
-            parser.set_generated_file(input_file_list[0])
-            # Modify htp parameters
-            parser.mark_anchor("x_htp")
-            parser.transfer_var(float(x_htp), 0, 5)
-            parser.mark_anchor("z_htp")
-            parser.transfer_var(float(z_htp), 0, 5)
-            parser.mark_anchor("semi_span_htp")
-            parser.transfer_var(float(semi_span_htp), 0, 5)
-            parser.mark_anchor("root_chord_htp")
-            parser.transfer_var(float(root_chord_htp), 0, 5)
-            parser.mark_anchor("tip_chord_htp")
-            parser.transfer_var(float(tip_chord_htp), 0, 5)
-            parser.mark_anchor("sweep_25_htp")
-            parser.transfer_var(float(sweep_25_htp), 0, 5)
-            parser.mark_anchor("airfoil_0_file")
-            parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("airfoil_1_file")
-            parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("csv_file")
-            csv_name = output_file_list[0]
-            parser.transfer_var('"' + csv_name.replace("\\", "/") + '"', 0, 3)
-            parser.generate()
-
-        # STEP 4/XX - RUN BATCH TO GENERATE GEOMETRY .CSV FILE #####################################
-        ############################################################################################
-
-        self.options["external_output_files"] = output_file_list
-        super().compute(inputs, outputs)
-
-        # STEP 5/XX - DEFINE NEW INPUT/OUTPUT FILES LIST AND CREATE BATCH FOR VLM COMPUTATION ######
-        ############################################################################################
-
-        input_file_list = output_file_list
-        input_file_list.append(input_file_list[0].replace(".csv", ".vspaero"))
-        output_file_list = [
-            input_file_list[0].replace(".csv", ".lod"),
-            input_file_list[0].replace(".csv", ".polar"),
-        ]
-        self.options["external_input_files"] = input_file_list
-        self.options["external_output_files"] = output_file_list
-        self.options["command"] = [pth.join(target_directory, "vspaero.bat")]
-        batch_file = open(self.options["command"][0], "w+")
-        batch_file.write("@echo off\n")
-        command = (
-            pth.join(target_directory, VSPAERO_EXE_NAME)
-            + " -stab "   # TO PERFORM STABILITY ANALYSIS
-            + input_file_list[1].replace(".vspaero", "")
-            + " >nul 2>nul\n"
-        )
-        batch_file.write(command)
-        batch_file.close()
-
-        # STEP 6/XX - OPEN THE TEMPLATE VSPAERO FOR COMPUTATION, MODIFY VALUES AND SAVE TO WORKDIR #
-        ############################################################################################
-
-        parser = InputFileGenerator()
-        template_file = pth.split(input_file_list[1])[1]
-        with path(local_resources, template_file) as input_template_path:
-            parser.set_template_file(str(input_template_path))
-            parser.set_generated_file(input_file_list[1])
-            parser.reset_anchor()
-            parser.mark_anchor("Sref")
-            parser.transfer_var(float(sref_htp), 0, 3)
-            parser.mark_anchor("Cref")
-            parser.transfer_var(float(l0_htp), 0, 3)
-            parser.mark_anchor("Bref")
-            parser.transfer_var(float(2.0 * semi_span_htp), 0, 3)
-            parser.mark_anchor("X_cg")
-            parser.transfer_var(float(fa_length + lp_htp), 0, 3)
-            parser.mark_anchor("Mach")
-            parser.transfer_var(float(mach), 0, 3)
-            parser.mark_anchor("AOA")
-            parser.transfer_var(float(aoa_angle), 0, 3)
-            parser.mark_anchor("Vinf")
-            parser.transfer_var(float(v_inf), 0, 3)
-            parser.mark_anchor("Rho")
-            parser.transfer_var(float(rho), 0, 3)
-            parser.mark_anchor("ReCref")
-            parser.transfer_var(float(reynolds), 0, 3)
-            parser.generate()
-
-        # STEP 7/XX - RUN BATCH TO GENERATE AERO OUTPUT FILES (.lod, .polar...) ####################
-        ############################################################################################
-
-        super().compute(inputs, outputs)
+        # The work directory, already holding OpenVSP and the airfoil files, is reserved for this
+        # run so that other runs of the component can be done concurrently
+        target_directory = self._acquire_work_directory()
+        try:
+            run = _OpenVSPRun(self, target_directory)
+            # Define the list of necessary input files: geometry script and foil file for both
+            # wing/HTP
+            input_file_list = [
+                pth.join(target_directory, INPUT_HTP_SCRIPT),
+                pth.join(target_directory, self.options["htp_airfoil_file"]),
+            ]
+            run.options["external_input_files"] = input_file_list
+            # Create corresponding .bat files (one for each geometry configuration)
+            run.options["command"] = [pth.join(target_directory, "vspscript.bat")]
+            batch_file = open(run.options["command"][0], "w+")
+            batch_file.write("@echo off\n")
+            command = (
+                pth.join(target_directory, VSPSCRIPT_EXE_NAME)
+                + " -script "
+                + pth.join(target_directory, INPUT_HTP_SCRIPT)
+                + " >nul 2>nul\n"
+            )
+            batch_file.write(command)
+            batch_file.close()
 
-        # STEP 8/XX - READ FILES, RETURN RESULTS (AND CLEAR TEMPORARY WORKDIR) #####################
-        ############################################################################################
+            # STEP 3/XX - OPEN THE TEMPLATE SCRIPT FOR GEOMETRY GENERATION, MODIFY VALUES AND SAVE TO
+            # WORKDIR ##############################################################################
 
-        # Open .lod file and extract data
-        htp_y_vect = []
-        htp_cl_vect = []
-        htp_cd_vect = []
-        htp_cm_vect = []
-        with open(output_file_list[0], "r") as lf:
-            data = lf.readlines()
-            for i in range(len(data)):
-                line = data[i].split()
-                line.append("**")
-                if line[0] == "1":
-                    htp_y_vect.append(float(line[2]))
-                    htp_cl_vect.append(float(line[5]))
-                    htp_cd_vect.append(float(line[6]))
-                    htp_cm_vect.append(float(line[12]))
-                if line[0] == "Comp":
-                    cl_htp = float(data[i + 1].split()[5]) + float(
-                        data[i + 2].split()[5]
-                    )  # sum CL left/right
-                    cdi_htp = float(data[i + 1].split()[6]) + float(
-                        data[i + 2].split()[6]
-                    )  # sum CDi left/right
-                    cm_htp = float(data[i + 1].split()[12]) + float(
-                        data[i + 2].split()[12]
-                    )  # sum CM left/right
-                    break
-        # Open .polar file and extract data
-        with open(output_file_list[1], "r") as lf:
-            data = lf.readlines()
-            htp_e = float(data[1].split()[10])
-        # Delete temporary directory
-        if not (self.options["openvsp_exe_path"]):
-            # noinspection PyUnboundLocalVariable
-            tmp_directory.cleanup()
+            output_file_list = [
+                pth.join(target_directory, INPUT_HTP_SCRIPT.replace(".vspscript", "_DegenGeom.csv"))
+            ]
+            parser = InputFileGenerator()
+            with path(local_resources, INPUT_HTP_SCRIPT) as input_template_path:
+                parser.set_template_file(str(input_template_path))
+                parser.set_generated_file(input_file_list[0])
+                # Modify htp parameters
+                parser.mark_anchor("x_htp")
+                parser.transfer_var(float(x_htp), 0, 5)
+                parser.mark_anchor("z_htp")
+                parser.transfer_var(float(z_htp), 0, 5)
+                parser.mark_anchor("semi_span_htp")
+                parser.transfer_var(float(semi_span_htp), 0, 5)
+                parser.mark_anchor("root_chord_htp")
+                parser.transfer_var(float(root_chord_htp), 0, 5)
+                parser.mark_anchor("tip_chord_htp")
+                parser.transfer_var(float(tip_chord_htp), 0, 5)
+                parser.mark_anchor("sweep_25_htp")
+                parser.transfer_var(float(sweep_25_htp), 0, 5)
+                parser.mark_anchor("airfoil_0_file")
+                parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("airfoil_1_file")
+                parser.transfer_var('"' + input_file_list[1].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("csv_file")
+                csv_name = output_file_list[0]
+                parser.transfer_var('"' + csv_name.replace("\\", "/") + '"', 0, 3)
+                parser.generate()
+
+            # STEP 4/XX - RUN BATCH TO GENERATE GEOMETRY .CSV FILE #################################
+            ########################################################################################
+
+            run.options["external_output_files"] = output_file_list
+            run.execute()
+
+            # STEP 5/XX - DEFINE NEW INPUT/OUTPUT FILES LIST AND CREATE BATCH FOR VLM COMPUTATION ##
+            ########################################################################################
+
+            input_file_list = output_file_list
+            input_file_list.append(input_file_list[0].replace(".csv", ".vspaero"))
+            output_file_list = [
+                input_file_list[0].replace(".csv", ".lod"),
+                input_file_list[0].replace(".csv", ".polar"),
+            ]
+            run.options["external_input_files"] = input_file_list
+            run.options["external_output_files"] = output_file_list
+            run.options["command"] = [pth.join(target_directory, "vspaero.bat")]
+            batch_file = open(run.options["command"][0], "w+")
+            batch_file.write("@echo off\n")
+            command = (
+                pth.join(target_directory, VSPAERO_EXE_NAME)
+                + " -stab "   # TO PERFORM STABILITY ANALYSIS
+                + input_file_list[1].replace(".vspaero", "")
+                + " >nul 2>nul\n"
+            )
+            batch_file.write(command)
+            batch_file.close()
+
+            # STEP 6/XX - OPEN THE TEMPLATE VSPAERO FOR COMPUTATION, MODIFY VALUES AND SAVE TO
+            # WORKDIR ##############################################################################
+
+            parser = InputFileGenerator()
+            template_file = pth.split(input_file_list[1])[1]
+            with path(local_resources, template_file) as input_template_path:
+                parser.set_template_file(str(input_template_path))
+                parser.set_generated_file(input_file_list[1])
+                parser.reset_anchor()
+                parser.mark_anchor("Sref")
+                parser.transfer_var(float(sref_htp), 0, 3)
+                parser.mark_anchor("Cref")
+                parser.transfer_var(float(l0_htp), 0, 3)
+                parser.mark_anchor("Bref")
+                parser.transfer_var(float(2.0 * semi_span_htp), 0, 3)
+                parser.mark_anchor("X_cg")
+                parser.transfer_var(float(fa_length + lp_htp), 0, 3)
+                parser.mark_anchor("Mach")
+                parser.transfer_var(float(mach), 0, 3)
+                parser.mark_anchor("AOA")
+                parser.transfer_var(float(aoa_angle), 0, 3)
+                parser.mark_anchor("Vinf")
+                parser.transfer_var(float(v_inf), 0, 3)
+                parser.mark_anchor("Rho")
+                parser.transfer_var(float(rho), 0, 3)
+                parser.mark_anchor("ReCref")
+                parser.transfer_var(float(reynolds), 0, 3)
+                parser.generate()
+
+            # STEP 7/XX - RUN BATCH TO GENERATE AERO OUTPUT FILES (.lod, .polar...) ################
+            ########################################################################################
+
+            run.execute()
+
+            # STEP 8/XX - READ FILES, RETURN RESULTS (AND RELEASE WORKDIR) #########################
+            ########################################################################################
+
+            # Open .lod file and extract data
+            htp_y_vect = []
+            htp_cl_vect = []
+            htp_cd_vect = []
+            htp_cm_vect = []
+            with open(output_file_list[0], "r") as lf:
+                data = lf.readlines()
+                for i in range(len(data)):
+                    line = data[i].split()
+                    line.append("**")
+                    if line[0] == "1":
+                        htp_y_vect.append(float(line[2]))
+                        htp_cl_vect.append(float(line[5]))
+                        htp_cd_vect.append(float(line[6]))
+                        htp_cm_vect.append(float(line[12]))
+                    if line[0] == "Comp":
+                        cl_htp = float(data[i + 1].split()[5]) + float(
+                            data[i + 2].split()[5]
+                        )  # sum CL left/right
+                        cdi_htp = float(data[i + 1].split()[6]) + float(
+                            data[i + 2].split()[6]
+                        )  # sum CDi left/right
+                        cm_htp = float(data[i + 1].split()[12]) + float(
+                            data[i + 2].split()[12]
+                        )  # sum CM left/right
+                        break
+            # Open .polar file and extract data
+            with open(output_file_list[1], "r") as lf:
+                data = lf.readlines()
+                htp_e = float(data[1].split()[10])
+        finally:
+            # Make the work directory available for other runs, also after a failure
+            self._release_work_directory(target_directory)
         # Return values
         htp = {
             "y_vector": htp_y_vect,
@@ -847,223 +937,212 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         v_inf = max(atm.speed_of_sound * mach, 0.01)  # avoid V=0 m/s crashes
         reynolds = v_inf * l0_wing / atm.kinematic_viscosity
 
-        # STEP 2/XX - DEFINE WORK DIRECTORY, COPY RESOURCES AND CREATE COMMAND BATCH ###############
+        # STEP 2/XX - RESERVE WORK DIRECTORY AND CREATE COMMAND BATCH ##############################
         ############################################################################################
 
-        # If a folder path is specified for openvsp .exe, it becomes working directory (target),
-        # if not temporary folder is created
-        if self.options["openvsp_exe_path"]:
-            target_directory = pth.abspath(self.options["openvsp_exe_path"])
-        else:
-            tmp_directory = _create_tmp_directory()
-            target_directory = tmp_directory.name
-        # Define the list of necessary input files: geometry script and foil file for both wing/HTP
-        input_file_list = [
-            pth.join(target_directory, INPUT_AIRCRAFT_SCRIPT),
-            pth.join(target_directory, self.options["wing_airfoil_file"]),
-            pth.join(target_directory, self.options["htp_airfoil_file"]),
-        ]
-        self.options["external_input_files"] = input_file_list
-        # Define standard error file by default to avoid error code return
-        self.stderr = pth.join(target_directory, STDERR_FILE_NAME)
-        # Copy resource in working (target) directory
-        # noinspection PyTypeChecker
-        copy_resource_folder(openvsp3201, target_directory)
-        # noinspection PyTypeChecker
-        copy_resource(resources, self.options["wing_airfoil_file"], target_directory)
-        # noinspection PyTypeChecker
-        copy_resource(resources, self.options["htp_airfoil_file"], target_directory)
-        # Create corresponding .bat files (one for each geometry configuration)
-        self.options["command"] = [pth.join(target_directory, "vspscript.bat")]
-        batch_file = open(self.options["command"][0], "w+")
-        batch_file.write("@echo off\n")
-        command = (
-            pth.join(target_directory, VSPSCRIPT_EXE_NAME)
-            + " -script "
-            + pth.join(target_directory, INPUT_AIRCRAFT_SCRIPT)
-            + " >nul 2>nul\n"
-        )
-        batch_file.write(command)
-        batch_file.close()
-
-        # STEP 3/XX - OPEN THE TEMPLATE SCRIPT FOR GEOMETRY GENERATION, MODIFY VALUES AND SAVE TO
-        # WORKDIR ##################################################################################
-
-        output_file_list = [
-            pth.join(
-                target_directory, INPUT_AIRCRAFT_SCRIPT.replace(".vspscript", "_DegenGeom.csv")
+        # The work directory, already holding OpenVSP and the airfoil files, is reserved for this
+        # run so that other runs of the component can be done concurrently
+        target_directory = self._acquire_work_directory()
+        try:
+            run = _OpenVSPRun(self, target_directory)
+            # Define the list of necessary input files: geometry script and foil file for both
+            # wing/HTP
+            input_file_list = [
+                pth.join(target_directory, INPUT_AIRCRAFT_SCRIPT),
+                pth.join(target_directory, self.options["wing_airfoil_file"]),
+                pth.join(target_directory, self.options["htp_airfoil_file"]),
+            ]
+            run.options["external_input_files"] = input_file_list
+            # Create corresponding .bat files (one for each geometry configuration)
+            run.options["command"] = [pth.join(target_directory, "vspscript.bat")]
+            batch_file = open(run.options["command"][0], "w+")
+            batch_file.write("@echo off\n")
+            command = (
+                pth.join(target_directory, VSPSCRIPT_EXE_NAME)
+                + " -script "
+                + pth.join(target_directory, INPUT_AIRCRAFT_SCRIPT)
+                + " >nul 2>nul\n"
             )
-        ]
-        parser = InputFileGenerator()
-        with path(local_resources, INPUT_AIRCRAFT_SCRIPT) as input_template_path:
-            parser.set_template_file(str(input_template_path))
-            parser.set_generated_file(input_file_list[0])
-            # Modify wing parameters
-            parser.mark_anchor("x_wing")
-            parser.transfer_var(float(x_wing), 0, 5)
-            parser.mark_anchor("z_wing")
-            parser.transfer_var(float(z_wing), 0, 5)
-            parser.mark_anchor("y1_wing")
-            parser.transfer_var(float(y1_wing), 0, 5)
-            for i in range(3):
-                parser.mark_anchor("l2_wing")
-                parser.transfer_var(float(l2_wing), 0, 5)
-            parser.reset_anchor()
-            parser.mark_anchor("span2_wing")
-            parser.transfer_var(float(span2_wing), 0, 5)
-            parser.mark_anchor("l4_wing")
-            parser.transfer_var(float(l4_wing), 0, 5)
-            parser.mark_anchor("sweep_0_wing")
-            parser.transfer_var(float(sweep_0_wing), 0, 5)
-            parser.mark_anchor("airfoil_0_file")
-            parser.transfer_var('"' + input_file_list[-2].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("airfoil_1_file")
-            parser.transfer_var('"' + input_file_list[-2].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("airfoil_2_file")
-            parser.transfer_var('"' + input_file_list[-2].replace("\\", "/") + '"', 0, 3)
-            # Modify HTP parameters
-            parser.mark_anchor("distance_htp")
-            parser.transfer_var(float(distance_htp), 0, 5)
-            parser.mark_anchor("height_htp")
-            parser.transfer_var(float(height_htp), 0, 5)
-            parser.mark_anchor("span_htp")
-            parser.transfer_var(float(span_htp), 0, 5)
-            parser.mark_anchor("root_chord_htp")
-            parser.transfer_var(float(root_chord_htp), 0, 5)
-            parser.mark_anchor("tip_chord_htp")
-            parser.transfer_var(float(tip_chord_htp), 0, 5)
-            parser.mark_anchor("sweep_25_htp")
-            parser.transfer_var(float(sweep_25_htp), 0, 5)
-            parser.mark_anchor("airfoil_3_file")
-            parser.transfer_var('"' + input_file_list[-1].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("airfoil_4_file")
-            parser.transfer_var('"' + input_file_list[-1].replace("\\", "/") + '"', 0, 3)
-            parser.mark_anchor("csv_file")
-            csv_name = output_file_list[0]
-            parser.transfer_var('"' + csv_name.replace("\\", "/") + '"', 0, 3)
-            parser.generate()
-
-        # STEP 4/XX - RUN BATCH TO GENERATE GEOMETRY .CSV FILE #####################################
-        ############################################################################################
-
-        self.options["external_output_files"] = output_file_list
-        super().compute(inputs, outputs)
-
-        # STEP 5/XX - DEFINE NEW INPUT/OUTPUT FILES LIST AND CREATE BATCH FOR VLM COMPUTATION ######
-        ############################################################################################
-
-        input_file_list = output_file_list
-        input_file_list.append(input_file_list[0].replace("csv", "vspaero"))
-        output_file_list = [
-            input_file_list[0].replace("csv", "lod"),
-            input_file_list[0].replace("csv", "polar"),
-        ]
-        self.options["external_input_files"] = input_file_list
-        self.options["external_output_files"] = output_file_list
-        self.options["command"] = [pth.join(target_directory, "vspaero.bat")]
-        batch_file = open(self.options["command"][0], "w+")
-        batch_file.write("@echo off\n")
-        command = (
-            pth.join(target_directory, VSPAERO_EXE_NAME)
-            + " -stab "   # TO PERFORM STABILITY ANALYSIS
-            + input_file_list[1].replace(".vspaero", "")
-            + " >nul 2>nul\n"
-        )
-        batch_file.write(command)
-        batch_file.close()
-
-        # STEP 6/XX - OPEN THE TEMPLATE VSPAERO FOR COMPUTATION, MODIFY VALUES AND SAVE TO WORKDIR #
-        ############################################################################################
-
-        parser = InputFileGenerator()
-        template_file = pth.split(input_file_list[1])[1]
-        with path(local_resources, template_file) as input_template_path:
-            parser.set_template_file(str(input_template_path))
-            parser.set_generated_file(input_file_list[1])
-            parser.reset_anchor()
-            parser.mark_anchor("Sref")
-            parser.transfer_var(float(sref_wing), 0, 3)
-            parser.mark_anchor("Cref")
-            parser.transfer_var(float(l0_wing), 0, 3)
-            parser.mark_anchor("Bref")
-            parser.transfer_var(float(span_wing), 0, 3)
-            parser.mark_anchor("X_cg")
-            parser.transfer_var(float(fa_length), 0, 3)
-            parser.mark_anchor("Mach")
-            parser.transfer_var(float(mach), 0, 3)
-            parser.mark_anchor("AOA")
-            parser.transfer_var(float(aoa_angle), 0, 3)
-            parser.mark_anchor("Vinf")
-            parser.transfer_var(float(v_inf), 0, 3)
-            parser.mark_anchor("Rho")
-            parser.transfer_var(float(rho), 0, 3)
-            parser.mark_anchor("ReCref")
-            parser.transfer_var(float(reynolds), 0, 3)
-            parser.generate()
-
-        # STEP 7/XX - RUN BATCH TO GENERATE AERO OUTPUT FILES (.lod, .polar...) ####################
-        ############################################################################################
-
-        super().compute(inputs, outputs)
+            batch_file.write(command)
+            batch_file.close()
 
-        # STEP 8/XX - READ FILES, RETURN RESULTS (AND CLEAR TEMPORARY WORKDIR) #####################
-        ############################################################################################
+            # STEP 3/XX - OPEN THE TEMPLATE SCRIPT FOR GEOMETRY GENERATION, MODIFY VALUES AND SAVE TO
+            # WORKDIR ##############################################################################
 
-        # Open .lod file and extract data
-        wing_y_vect = []
-        wing_cl_vect = []
-        wing_cd_vect = []
-        wing_cm_vect = []
-        htp_y_vect = []
-        htp_cl_vect = []
-        htp_cd_vect = []
-        htp_cm_vect = []
-        with open(output_file_list[0], "r") as lf:
-            data = lf.readlines()
-            for i in range(len(data)):
-                line = data[i].split()
-                line.append("**")
-                if line[0] == "1":
-                    wing_y_vect.append(float(line[2]))
-                    wing_cl_vect.append(float(line[5]))
-                    wing_cd_vect.append(float(line[6]))
-                    wing_cm_vect.append(float(line[12]))
-                elif line[0] == "3":
-                    htp_y_vect.append(float(line[2]))
-                    htp_cl_vect.append(float(line[5]))
-                    htp_cd_vect.append(float(line[6]))
-                    htp_cm_vect.append(float(line[12]))
-                if line[0] == "Comp":
-                    cl_wing = float(data[i + 1].split()[5]) + float(
-                        data[i + 2].split()[5]
-                    )  # sum CL left/right
-                    cdi_wing = float(data[i + 1].split()[6]) + float(
-                        data[i + 2].split()[6]
-                    )  # sum CDi left/right
-                    cm_wing = float(data[i + 1].split()[12]) + float(
-                        data[i + 2].split()[12]
-                    )  # sum CM left/right
-                    cl_htp = float(data[i + 3].split()[5]) + float(
-                        data[i + 4].split()[5]
-                    )  # sum CL left/right
-                    cdi_htp = float(data[i + 3].split()[6]) + float(
-                        data[i + 4].split()[6]
-                    )  # sum CDi left/right
-                    cm_htp = float(data[i + 3].split()[12]) + float(
-                        data[i + 4].split()[12]
-                    )  # sum CM left/right
-                    break
-        # Open .polar file and extract data
-        with open(output_file_list[1], "r") as lf:
-            data = lf.readlines()
-            aircraft_cl = float(data[1].split()[4])
-            aircraft_cd0 = float(data[1].split()[5])
-            aircraft_cdi = float(data[1].split()[6])
-            aircraft_e = float(data[1].split()[10])
-        # Delete temporary directory
-        if not (self.options["openvsp_exe_path"]):
-            # noinspection PyUnboundLocalVariable
-            tmp_directory.cleanup()
+            output_file_list = [
+                pth.join(
+                    target_directory, INPUT_AIRCRAFT_SCRIPT.replace(".vspscript", "_DegenGeom.csv")
+                )
+            ]
+            parser = InputFileGenerator()
+            with path(local_resources, INPUT_AIRCRAFT_SCRIPT) as input_template_path:
+                parser.set_template_file(str(input_template_path))
+                parser.set_generated_file(input_file_list[0])
+                # Modify wing parameters
+                parser.mark_anchor("x_wing")
+                parser.transfer_var(float(x_wing), 0, 5)
+                parser.mark_anchor("z_wing")
+                parser.transfer_var(float(z_wing), 0, 5)
+                parser.mark_anchor("y1_wing")
+                parser.transfer_var(float(y1_wing), 0, 5)
+                for i in range(3):
+                    parser.mark_anchor("l2_wing")
+                    parser.transfer_var(float(l2_wing), 0, 5)
+                parser.reset_anchor()
+                parser.mark_anchor("span2_wing")
+                parser.transfer_var(float(span2_wing), 0, 5)
+                parser.mark_anchor("l4_wing")
+                parser.transfer_var(float(l4_wing), 0, 5)
+                parser.mark_anchor("sweep_0_wing")
+                parser.transfer_var(float(sweep_0_wing), 0, 5)
+                parser.mark_anchor("airfoil_0_file")
+                parser.transfer_var('"' + input_file_list[-2].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("airfoil_1_file")
+                parser.transfer_var('"' + input_file_list[-2].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("airfoil_2_file")
+                parser.transfer_var('"' + input_file_list[-2].replace("\\", "/") + '"', 0, 3)
+                # Modify HTP parameters
+                parser.mark_anchor("distance_htp")
+                parser.transfer_var(float(distance_htp), 0, 5)
+                parser.mark_anchor("height_htp")
+                parser.transfer_var(float(height_htp), 0, 5)
+                parser.mark_anchor("span_htp")
+                parser.transfer_var(float(span_htp), 0, 5)
+                parser.mark_anchor("root_chord_htp")
+                parser.transfer_var(float(root_chord_htp), 0, 5)
+                parser.mark_anchor("tip_chord_htp")
+                parser.transfer_var(float(tip_chord_htp), 0, 5)
+                parser.mark_anchor("sweep_25_htp")
+                parser.transfer_var(float(sweep_25_htp), 0, 5)
+                parser.mark_anchor("airfoil_3_file")
+                parser.transfer_var('"' + input_file_list[-1].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("airfoil_4_file")
+                parser.transfer_var('"' + input_file_list[-1].replace("\\", "/") + '"', 0, 3)
+                parser.mark_anchor("csv_file")
+                csv_name = output_file_list[0]
+                parser.transfer_var('"' + csv_name.replace("\\", "/") + '"', 0, 3)
+                parser.generate()
+
+            # STEP 4/XX - RUN BATCH TO GENERATE GEOMETRY .CSV FILE #################################
+            ########################################################################################
+
+            run.options["external_output_files"] = output_file_list
+            run.execute()
+
+            # STEP 5/XX - DEFINE NEW INPUT/OUTPUT FILES LIST AND CREATE BATCH FOR VLM COMPUTATION ##
+            ########################################################################################
+
+            input_file_list = output_file_list
+            input_file_list.append(input_file_list[0].replace("csv", "vspaero"))
+            output_file_list = [
+                input_file_list[0].replace("csv", "lod"),
+                input_file_list[0].replace("csv", "polar"),
+            ]
+            run.options["external_input_files"] = input_file_list
+            run.options["external_output_files"] = output_file_list
+            run.options["command"] = [pth.join(target_directory, "vspaero.bat")]
+            batch_file = open(run.options["command"][0], "w+")
+            batch_file.write("@echo off\n")
+            command = (
+                pth.join(target_directory, VSPAERO_EXE_NAME)
+                + " -stab "   # TO PERFORM STABILITY ANALYSIS
+                + input_file_list[1].replace(".vspaero", "")
+                + " >nul 2>nul\n"
+            )
+            batch_file.write(command)
+            batch_file.close()
+
+            # STEP 6/XX - OPEN THE TEMPLATE VSPAERO FOR COMPUTATION, MODIFY VALUES AND SAVE TO
+            # WORKDIR ##############################################################################
+
+            parser = InputFileGenerator()
+            template_file = pth.split(input_file_list[1])[1]
+            with path(local_resources, template_file) as input_template_path:
+                parser.set_template_file(str(input_template_path))
+                parser.set_generated_file(input_file_list[1])
+                parser.reset_anchor()
+                parser.mark_anchor("Sref")
+                parser.transfer_var(float(sref_wing), 0, 3)
+                parser.mark_anchor("Cref")
+                parser.transfer_var(float(l0_wing), 0, 3)
+                parser.mark_anchor("Bref")
+                parser.transfer_var(float(span_wing), 0, 3)
+                parser.mark_anchor("X_cg")
+                parser.transfer_var(float(fa_length), 0, 3)
+                parser.mark_anchor("Mach")
+                parser.transfer_var(float(mach), 0, 3)
+                parser.mark_anchor("AOA")
+                parser.transfer_var(float(aoa_angle), 0, 3)
+                parser.mark_anchor("Vinf")
+                parser.transfer_var(float(v_inf), 0, 3)
+                parser.mark_anchor("Rho")
+                parser.transfer_var(float(rho), 0, 3)
+                parser.mark_anchor("ReCref")
+                parser.transfer_var(float(reynolds), 0, 3)
+                parser.generate()
+
+            # STEP 7/XX - RUN BATCH TO GENERATE AERO OUTPUT FILES (.lod, .polar...) ################
+            ########################################################################################
+
+            run.execute()
+
+            # STEP 8/XX - READ FILES, RETURN RESULTS (AND RELEASE WORKDIR) #########################
+            ########################################################################################
+
+            # Open .lod file and extract data
+            wing_y_vect = []
+            wing_cl_vect = []
+            wing_cd_vect = []
+            wing_cm_vect = []
+            htp_y_vect = []
+            htp_cl_vect = []
+            htp_cd_vect = []
+            htp_cm_vect = []
+            with open(output_file_list[0], "r") as lf:
+                data = lf.readlines()
+                for i in range(len(data)):
+                    line = data[i].split()
+                    line.append("**")
+                    if line[0] == "1":
+                        wing_y_vect.append(float(line[2]))
+                        wing_cl_vect.append(float(line[5]))
+                        wing_cd_vect.append(float(line[6]))
+                        wing_cm_vect.append(float(line[12]))
+                    elif line[0] == "3":
+                        htp_y_vect.append(float(line[2]))
+                        htp_cl_vect.append(float(line[5]))
+                        htp_cd_vect.append(float(line[6]))
+                        htp_cm_vect.append(float(line[12]))
+                    if line[0] == "Comp":
+                        cl_wing = float(data[i + 1].split()[5]) + float(
+                            data[i + 2].split()[5]
+                        )  # sum CL left/right
+                        cdi_wing = float(data[i + 1].split()[6]) + float(
+                            data[i + 2].split()[6]
+                        )  # sum CDi left/right
+                        cm_wing = float(data[i + 1].split()[12]) + float(
+                            data[i + 2].split()[12]
+                        )  # sum CM left/right
+                        cl_htp = float(data[i + 3].split()[5]) + float(
+                            data[i + 4].split()[5]
+                        )  # sum CL left/right
+                        cdi_htp = float(data[i + 3].split()[6]) + float(
+                            data[i + 4].split()[6]
+                        )  # sum CDi left/right
+                        cm_htp = float(data[i + 3].split()[12]) + float(
+                            data[i + 4].split()[12]
+                        )  # sum CM left/right
+                        break
+            # Open .polar file and extract data
+            with open(output_file_list[1], "r") as lf:
+                data = lf.readlines()
+                aircraft_cl = float(data[1].split()[4])
+                aircraft_cd0 = float(data[1].split()[5])
+                aircraft_cdi = float(data[1].split()[6])
+                aircraft_e = float(data[1].split()[10])
+        finally:
+            # Make the work directory available for other runs, also after a failure
+            self._release_work_directory(target_directory)
         # Return values
         wing = {
             "y_vector": wing_y_vect,
@@ -1094,99 +1173,41 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
     @staticmethod
     def search_results(result_folder_path, geometry_set):
         """Search the results folder to see if the geometry has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "mach",
-                "area_ratio",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy()) == 7:
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if np.sum(saved_set == geometry_set[0:-1]) == 7:
-                                    result_file_path = pth.join(
-                                        result_folder_path, "openvsp_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio = data.loc["area_ratio", 0]
-                                    return result_file_path, saved_area_ratio
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0
+        result_file_path, (saved_area_ratio,) = results_cache.search_results(
+            result_folder_path,
+            geometry_set,
+            results_cache.AERODYNAMIC_GEOMETRY_LABELS,
+            "openvsp",
+            reference_labels=["area_ratio"],
+        )
+
+        return result_file_path, saved_area_ratio
 
     @staticmethod
     def save_geometry(result_folder_path, geometry_set):
         """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "mach",
-            "area_ratio",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")
-
-        return result_file_path
+        return results_cache.save_geometry(
+            result_folder_path, geometry_set, results_cache.AERODYNAMIC_GEOMETRY_LABELS, "openvsp"
+        )
 
     @staticmethod
     def save_results(result_file_path, results):
-        """Reads saved results."""
-        labels = [
-            "cl_0_wing",
-            "cl_alpha_wing",
-            "cm_0_wing",
-            "y_vector_wing",
-            "cl_vector_wing",
-            "chord_vector_wing",
-            "coef_k_wing",
-            "cl_0_htp",
-            "cl_X_htp",
-            "cl_alpha_htp",
-            "cl_alpha_htp_isolated",
-            "y_vector_htp",
-            "cl_vector_htp",
-            "coef_k_htp",
-            "saved_ref_area",
-        ]
-        data = pd.DataFrame(results, index=labels)
-        data.to_csv(result_file_path)
+        """Saves results."""
+        results_cache.save_results(
+            result_file_path, results, results_cache.AERODYNAMIC_RESULTS_LABELS
+        )
 
     @staticmethod
     def read_results(result_file_path):
+        """Reads saved results."""
+        return results_cache.read_results(result_file_path)
 
-        data = pd.read_csv(result_file_path)
-        values = data.to_numpy()[:, 1].tolist()
-        labels = data.to_numpy()[:, 0].tolist()
-
-        return pd.DataFrame(values, index=labels)
+    @staticmethod
+    def predict_results(result_folder_path, geometry_set, ref_area, max_error):
+        """Predicts results with the surrogate of the saved ones, None if not accurate enough."""
+        return surrogate.predict_results(
+            result_folder_path, geometry_set, "openvsp", ref_area, max_error
+        )
 
 
 class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
@@ -1373,6 +1394,8 @@ class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
         if self.options["openvsp_exe_path"]:
             target_directory = pth.abspath(self.options["openvsp_exe_path"])
         else:
+            from fastga.command.api import _create_tmp_directory
+
             tmp_directory = _create_tmp_directory()
             target_directory = tmp_directory.name
         # Define the list of necessary input files: geometry script and foil file for both wing/HTP
@@ -0,0 +1,206 @@
+"""
+Storage of the results of the external aerodynamic codes (VLM, OpenVSP), shared by the
+aerodynamics and handling qualities models.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import os.path as pth
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fastga.utils.profiling import record_cache_access
+
+# Parameters of the geometries analysed by the aerodynamic wrappers of VLM and OpenVSP, the last
+# one being only used to scale the results
+AERODYNAMIC_GEOMETRY_LABELS = [
+    "sweep25_wing",
+    "taper_ratio_wing",
+    "aspect_ratio_wing",
+    "sweep25_htp",
+    "taper_ratio_htp",
+    "aspect_ratio_htp",
+    "mach",
+    "area_ratio",
+]
+AERODYNAMIC_RESULTS_LABELS = [
+    "cl_0_wing",
+    "cl_alpha_wing",
+    "cm_0_wing",
+    "y_vector_wing",
+    "cl_vector_wing",
+    "chord_vector_wing",
+    "coef_k_wing",
+    "cl_0_htp",
+    "cl_X_htp",
+    "cl_alpha_htp",
+    "cl_alpha_htp_isolated",
+    "y_vector_htp",
+    "cl_vector_htp",
+    "coef_k_htp",
+    "saved_ref_area",
+]
+
+# Geometries saved in each results folder, files are read only once per session unless modified:
+# {geometry file path: (modification time, geometry labels, geometry values)}
+_GEOMETRY_INDEX = {}
+# Results files read during the session: {results file path: (modification time, results)}
+_RESULTS = {}
+
+
+def _geometry_file_path(result_folder_path: str, idx: int) -> str:
+    return pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
+
+
+def _read_csv(file_path: str) -> pd.DataFrame:
+    data = pd.read_csv(file_path)
+    values = data.to_numpy()[:, 1].tolist()
+    labels = data.to_numpy()[:, 0].tolist()
+
+    return pd.DataFrame(values, index=labels)
+
+
+def _geometry_index(result_folder_path: str) -> dict:
+    """
+    Returns the geometries saved in the folder as {index: (labels, values)}, reading only the files
+    that are new or were modified.
+    """
+    folder_index = {}
+    idx = 0
+    while pth.exists(_geometry_file_path(result_folder_path, idx)):
+        file_path = pth.abspath(_geometry_file_path(result_folder_path, idx))
+        modification_time = os.stat(file_path).st_mtime_ns
+        if file_path not in _GEOMETRY_INDEX or _GEOMETRY_INDEX[file_path][0] != modification_time:
+            data = _read_csv(file_path)
+            # noinspection PyBroadException
+            try:
+                values = np.array(data[0].to_numpy(), dtype=float)
+            except Exception:
+                values = None
+            _GEOMETRY_INDEX[file_path] = (modification_time, tuple(data.index), values)
+        folder_index[idx] = _GEOMETRY_INDEX[file_path][1:]
+        idx += 1
+
+    return folder_index
+
+
+def search_results(
+    result_folder_path: str,
+    geometry_set: np.ndarray,
+    geometry_set_labels: List[str],
+    result_prefix: str,
+    reference_labels: Sequence[str] = (),
+) -> Tuple[Optional[str], List[float]]:
+    """
+    Search the results folder to see if the geometry has already been calculated. Geometries are
+    only compared to the ones saved with the same labels, so that different codes or analyses can
+    share the same folder.
+
+    :param result_folder_path: folder where results are saved.
+    :param geometry_set: geometry parameters rounded to 6 decimals.
+    :param geometry_set_labels: names of the geometry parameters.
+    :param result_prefix: prefix of the results file of the code (e.g. "vlm" or "openvsp").
+    :param reference_labels: parameters that are not compared since results are scaled with them,
+    their saved values are returned.
+    :return: path of the results file (None if not found) and saved values of the reference
+    parameters (1.0 if not found).
+    """
+    if pth.exists(result_folder_path):
+        compared = np.array([label not in reference_labels for label in geometry_set_labels])
+        for idx, (labels, values) in sorted(_geometry_index(result_folder_path).items()):
+            result_file_path = pth.join(result_folder_path, result_prefix + "_" + str(idx) + ".csv")
+            if (
+                labels != tuple(geometry_set_labels)
+                or values is None
+                or not pth.exists(result_file_path)
+            ):
+                continue
+            if np.all(np.around(values[compared], decimals=6) == geometry_set[compared]):
+                saved_references = [
+                    values[geometry_set_labels.index(label)] for label in reference_labels
+                ]
+                record_cache_access(True)
+                return result_file_path, saved_references
+
+    record_cache_access(False)
+    return None, [1.0] * len(reference_labels)
+
+
+def saved_results(
+    result_folder_path: str, geometry_set_labels: List[str], result_prefix: str
+) -> List[Tuple[str, int, np.ndarray]]:
+    """
+    Lists the results saved in the folder for geometries with the given labels.
+
+    :param result_folder_path: folder where results are saved.
+    :param geometry_set_labels: names of the geometry parameters.
+    :param result_prefix: prefix of the results file of the code (e.g. "vlm" or "openvsp").
+    :return: path and modification time of the results files with the saved geometry parameters.
+    """
+    results = []
+    if pth.exists(result_folder_path):
+        for idx, (labels, values) in sorted(_geometry_index(result_folder_path).items()):
+            result_file_path = pth.join(result_folder_path, result_prefix + "_" + str(idx) + ".csv")
+            if (
+                labels != tuple(geometry_set_labels)
+                or values is None
+                or not pth.exists(result_file_path)
+            ):
+                continue
+            results.append(
+                (result_file_path, os.stat(result_file_path).st_mtime_ns, np.array(values))
+            )
+
+    return results
+
+
+def save_geometry(
+    result_folder_path: str,
+    geometry_set: np.ndarray,
+    geometry_set_labels: List[str],
+    result_prefix: str,
+) -> str:
+    """
+    Save geometry if not already computed by finding first available index.
+
+    :return: path of the results file associated to the geometry.
+    """
+    idx = 0
+    while pth.exists(_geometry_file_path(result_folder_path, idx)):
+        idx += 1
+    data = pd.DataFrame(geometry_set, index=geometry_set_labels)
+    data.to_csv(_geometry_file_path(result_folder_path, idx))
+
+    return pth.join(result_folder_path, result_prefix + "_" + str(idx) + ".csv")
+
+
+def save_results(result_file_path: str, results: list, labels: List[str]):
+    """Saves results."""
+    data = pd.DataFrame(results, index=labels)
+    data.to_csv(result_file_path)
+
+
+def read_results(result_file_path: str) -> pd.DataFrame:
+    """
+    Reads saved results, files are only read once per session unless modified. A copy of the
+    cached results is returned, so that the caller can modify it.
+    """
+    abs_file_path = pth.abspath(result_file_path)
+    modification_time = os.stat(abs_file_path).st_mtime_ns
+    if abs_file_path not in _RESULTS or _RESULTS[abs_file_path][0] != modification_time:
+        _RESULTS[abs_file_path] = (modification_time, _read_csv(abs_file_path))
+
+    return _RESULTS[abs_file_path][1].copy()
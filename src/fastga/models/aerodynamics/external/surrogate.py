@@ -0,0 +1,294 @@
+"""
+Kriging surrogate of the aerodynamic coefficients computed by VLM and OpenVSP, trained on the
+results saved in their results folder.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import math
+import os.path as pth
+import re
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import cho_factor, cho_solve
+
+from . import results_cache
+from .results_cache import AERODYNAMIC_GEOMETRY_LABELS, AERODYNAMIC_RESULTS_LABELS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Geometry parameters the coefficients are interpolated on, the area ratio being only used to
+# scale the results
+INPUT_LABELS = [label for label in AERODYNAMIC_GEOMETRY_LABELS if label != "area_ratio"]
+# Results proportional to the HTP/wing area ratio
+AREA_RATIO_RESULTS_LABELS = [
+    "cl_0_htp",
+    "cl_X_htp",
+    "cl_alpha_htp",
+    "cl_alpha_htp_isolated",
+    "cl_vector_htp",
+    "coef_k_htp",
+]
+# Results proportional to the square root of the wing area
+WING_LENGTH_RESULTS_LABELS = ["y_vector_wing", "chord_vector_wing"]
+VECTOR_RESULTS_LABELS = [
+    "y_vector_wing",
+    "cl_vector_wing",
+    "chord_vector_wing",
+    "y_vector_htp",
+    "cl_vector_htp",
+]
+SCALAR_RESULTS_LABELS = [
+    label
+    for label in AERODYNAMIC_RESULTS_LABELS
+    if label not in VECTOR_RESULTS_LABELS and label != "saved_ref_area"
+]
+
+# Minimum number of saved results before the surrogate is used
+MIN_TRAINING_POINTS = len(INPUT_LABELS) + 1
+# Candidate length scales of the kernel (inputs being normalized by their range), the one with the
+# smallest leave-one-out error is kept
+LENGTH_SCALES = [0.1, 0.2, 0.5, 1.0, 2.0]
+NUGGET = 1e-8
+
+# Surrogates built during the session: {(folder, prefix): (saved results signature, surrogate)}
+_SURROGATES = {}
+
+
+class KrigingModel:
+    """
+    Gaussian process regression with a squared exponential kernel and a constant mean, fitted on
+    all the columns of the outputs at once. Inputs are normalized by their range. The correlation
+    matrix is solved through its Cholesky factorization.
+
+    :param x: inputs of the training points, shape (n_points, n_inputs).
+    :param y: outputs of the training points, shape (n_points, n_outputs).
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        self._x_offset = np.min(x, axis=0)
+        self._x_scale = np.max(x, axis=0) - self._x_offset
+        self._x_scale[self._x_scale == 0.0] = 1.0
+        self._x = (x - self._x_offset) / self._x_scale
+        self._y_mean = np.mean(y, axis=0)
+        y_centered = y - self._y_mean
+
+        # Length scale selection on the closed-form leave-one-out residuals (Rippa), outputs being
+        # normalized by their standard deviation
+        y_std = np.std(y, axis=0)
+        y_normalized = y_centered[:, y_std > 0.0] / y_std[y_std > 0.0]
+        best_loo_error = np.inf
+        for length_scale in LENGTH_SCALES:
+            try:
+                k_factor = cho_factor(self._kernel(self._x, length_scale))
+            except np.linalg.LinAlgError:
+                continue
+            k_inv_diag = np.diag(cho_solve(k_factor, np.eye(len(x))))
+            loo_residuals = cho_solve(k_factor, y_normalized) / k_inv_diag[:, None]
+            loo_error = np.mean(loo_residuals ** 2)
+            if loo_error < best_loo_error:
+                best_loo_error = loo_error
+                self.length_scale = length_scale
+                self._k_factor = k_factor
+        if np.isinf(best_loo_error):
+            raise np.linalg.LinAlgError("Kriging correlation matrix is not positive definite")
+
+        self._weights = cho_solve(self._k_factor, y_centered)
+        # Process variance of each output (maximum likelihood estimate)
+        self._variance = np.sum(y_centered * self._weights, axis=0) / len(x)
+
+    def _kernel(self, x: np.ndarray, length_scale: float) -> np.ndarray:
+        distances = np.sum((x[:, None, :] - self._x[None, :, :]) ** 2, axis=2)
+        kernel = np.exp(-0.5 * distances / length_scale ** 2)
+        if x is self._x:
+            kernel += NUGGET * np.eye(len(x))
+
+        return kernel
+
+    def predict(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param x: inputs of the point, shape (n_inputs,).
+        :return: predicted outputs and their standard deviation.
+        """
+        x = (np.asarray(x, dtype=float) - self._x_offset) / self._x_scale
+        correlation = self._kernel(x[None, :], self.length_scale)[0]
+        prediction = self._y_mean + np.dot(correlation, self._weights)
+        reduction = 1.0 - np.dot(correlation, cho_solve(self._k_factor, correlation))
+
+        return prediction, np.sqrt(self._variance * max(reduction, 0.0))
+
+
+def _parse_vector(value) -> np.ndarray:
+    return np.array(re.split(r"[,\s]+", str(value).strip("[] \n")), dtype=float)
+
+
+class AerodynamicSurrogate:
+    """
+    Kriging surrogate of the results saved by a code in a results folder. Results are normalized
+    by the reference parameters they scale with (area ratio, wing area), so that the surrogate is
+    built on the compared geometry parameters only.
+
+    :param geometries: geometry parameters of the saved results, shape (n_points, n_geometry).
+    :param results: saved results, as read by :func:`results_cache.read_results`.
+    """
+
+    def __init__(self, geometries: np.ndarray, results: list):
+        self._vector_sizes = {}
+        outputs = []
+        for geometry, data in zip(geometries, results):
+            area_ratio = geometry[AERODYNAMIC_GEOMETRY_LABELS.index("area_ratio")]
+            ref_area = float(data.loc["saved_ref_area", 0])
+            point_outputs = []
+            for label in SCALAR_RESULTS_LABELS + VECTOR_RESULTS_LABELS:
+                if label in VECTOR_RESULTS_LABELS:
+                    value = _parse_vector(data.loc[label, 0])
+                    self._vector_sizes.setdefault(label, len(value))
+                else:
+                    value = np.array([float(data.loc[label, 0])])
+                if label in AREA_RATIO_RESULTS_LABELS:
+                    value = value / area_ratio
+                elif label in WING_LENGTH_RESULTS_LABELS:
+                    value = value / math.sqrt(ref_area)
+                point_outputs.append(value)
+            outputs.append(np.concatenate(point_outputs))
+
+        outputs = np.array(outputs)
+        inputs = geometries[:, [AERODYNAMIC_GEOMETRY_LABELS.index(label) for label in INPUT_LABELS]]
+        self._scalar_scale = np.mean(np.abs(outputs[:, : len(SCALAR_RESULTS_LABELS)]), axis=0)
+        # Zero padding of the vectors is kept exact
+        self._padding = np.all(outputs == 0.0, axis=0)
+        self.model = KrigingModel(inputs, outputs)
+
+    def predict(self, geometry_set: np.ndarray, ref_area: float) -> Tuple[pd.DataFrame, float]:
+        """
+        :param geometry_set: geometry parameters, ordered as AERODYNAMIC_GEOMETRY_LABELS.
+        :param ref_area: wing area the results are scaled to.
+        :return: predicted results, in the format of the saved results with area ratio and
+        reference area of the given geometry, and estimated relative error of the scalar
+        coefficients.
+        """
+        inputs = [geometry_set[AERODYNAMIC_GEOMETRY_LABELS.index(label)] for label in INPUT_LABELS]
+        prediction, std = self.model.predict(np.array(inputs))
+        prediction[self._padding] = 0.0
+
+        scalar_count = len(SCALAR_RESULTS_LABELS)
+        scale = np.maximum(np.abs(prediction[:scalar_count]), self._scalar_scale)
+        scale[scale == 0.0] = 1.0
+        relative_error = float(np.max(std[:scalar_count] / scale))
+
+        area_ratio = geometry_set[AERODYNAMIC_GEOMETRY_LABELS.index("area_ratio")]
+        values = {}
+        idx = 0
+        for label in SCALAR_RESULTS_LABELS + VECTOR_RESULTS_LABELS:
+            size = self._vector_sizes.get(label, 1)
+            value = prediction[idx : idx + size]
+            idx += size
+            if label in AREA_RATIO_RESULTS_LABELS:
+                value = value * area_ratio
+            elif label in WING_LENGTH_RESULTS_LABELS:
+                value = value * math.sqrt(ref_area)
+            values[label] = str(value.tolist()) if label in VECTOR_RESULTS_LABELS else value[0]
+        values["saved_ref_area"] = ref_area
+
+        data = pd.DataFrame(
+            [values[label] for label in AERODYNAMIC_RESULTS_LABELS],
+            index=AERODYNAMIC_RESULTS_LABELS,
+        )
+
+        return data, relative_error
+
+
+def _get_surrogate(result_folder_path: str, result_prefix: str) -> Optional[AerodynamicSurrogate]:
+    """
+    Returns the surrogate of the results saved in the folder, built again only if results were
+    added or modified. None is returned if there are not enough results or if their vectors have
+    different sizes.
+    """
+    saved_results = results_cache.saved_results(
+        result_folder_path, AERODYNAMIC_GEOMETRY_LABELS, result_prefix
+    )
+    signature = tuple(
+        (result_file_path, modification_time)
+        for result_file_path, modification_time, _ in saved_results
+    )
+    key = (pth.abspath(result_folder_path), result_prefix)
+    if key in _SURROGATES and _SURROGATES[key][0] == signature:
+        return _SURROGATES[key][1]
+
+    surrogate = None
+    if len(saved_results) >= MIN_TRAINING_POINTS:
+        geometries = np.array([geometry for _, _, geometry in saved_results])
+        results = [
+            results_cache.read_results(result_file_path) for result_file_path, _, _ in saved_results
+        ]
+        # noinspection PyBroadException
+        try:
+            surrogate = AerodynamicSurrogate(geometries, results)
+        except Exception:
+            _LOGGER.debug(
+                "Surrogate can not be built on the %s results of %s",
+                result_prefix,
+                result_folder_path,
+                exc_info=True,
+            )
+    _SURROGATES[key] = (signature, surrogate)
+
+    return surrogate
+
+
+def predict_results(
+    result_folder_path: str,
+    geometry_set: np.ndarray,
+    result_prefix: str,
+    ref_area: float,
+    max_error: float,
+) -> Tuple[Optional[pd.DataFrame], float]:
+    """
+    Predicts the results of a geometry with the kriging surrogate of the results saved in the
+    folder.
+
+    :param result_folder_path: folder where results are saved.
+    :param geometry_set: geometry parameters, ordered as AERODYNAMIC_GEOMETRY_LABELS.
+    :param result_prefix: prefix of the results file of the code (e.g. "vlm" or "openvsp").
+    :param ref_area: wing area the results are scaled to.
+    :param max_error: maximum estimated relative error of the scalar coefficients for the
+    prediction to be used.
+    :return: the predicted results, in the format of the saved results (None if the surrogate is
+    not available or not accurate enough), and the estimated relative error (inf if the surrogate
+    is not available).
+    """
+    if not pth.exists(result_folder_path):
+        return None, np.inf
+    surrogate = _get_surrogate(result_folder_path, result_prefix)
+    if surrogate is None:
+        return None, np.inf
+
+    data, relative_error = surrogate.predict(geometry_set, ref_area)
+    if relative_error > max_error:
+        _LOGGER.debug(
+            "Surrogate of %s results not used, estimated error %.2e exceeds %.2e",
+            result_prefix,
+            relative_error,
+            max_error,
+        )
+        return None, relative_error
+
+    _LOGGER.info(
+        "Aerodynamic coefficients predicted by the surrogate of %s results (estimated error %.2e)",
+        result_prefix,
+        relative_error,
+    )
+    return data, relative_error
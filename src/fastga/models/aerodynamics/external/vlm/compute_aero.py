@@ -36,6 +36,7 @@ class ComputeAEROvlm(Group):
     def initialize(self):
         self.options.declare("low_speed_aero", default=False, types=bool)
         self.options.declare("result_folder_path", default="", types=str)
+        self.options.declare("surrogate_max_error", default=None, types=float, allow_none=True)
         self.options.declare("compute_mach_interpolation", default=False, types=bool)
         self.options.declare(
             "wing_airfoil_file", default=DEFAULT_WING_AIRFOIL, types=str, allow_none=True
@@ -98,6 +99,7 @@ class ComputeAEROvlm(Group):
             _ComputeAEROvlm(
                 low_speed_aero=self.options["low_speed_aero"],
                 result_folder_path=self.options["result_folder_path"],
+                surrogate_max_error=self.options["surrogate_max_error"],
                 compute_mach_interpolation=self.options["compute_mach_interpolation"],
                 wing_airfoil_file=self.options["wing_airfoil_file"],
                 htp_airfoil_file=self.options["htp_airfoil_file"],
@@ -240,7 +242,7 @@ class _ComputeAEROvlm(VLMSimpleGeometry):
                     units="rad**-1",
                 )
 
-        self.declare_partials("*", "*", method="fd")
+        self.declare_partials("*", "*", method="cs")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
@@ -19,15 +19,14 @@ from typing import Optional
 import os
 import os.path as pth
 import warnings
-import pandas as pd
 import logging
 import numpy as np
 
-from stdatm import Atmosphere
-
 from fastga.models.geometry.profiles.get_profile import get_profile
+from fastga.utils.complex_step import ComplexStepAtmosphere, interp, to_scalar
 
 from ...constants import SPAN_MESH_POINT, POLAR_POINT_COUNT, MACH_NB_PTS
+from .. import results_cache, surrogate
 
 DEFAULT_NX = 19
 DEFAULT_NY1 = 3
@@ -54,6 +53,9 @@ class VLMSimpleGeometry(om.ExplicitComponent):
     def initialize(self):
         self.options.declare("low_speed_aero", default=False, types=bool)
         self.options.declare("result_folder_path", default="", types=str)
+        # Maximum estimated relative error for the results of a new geometry to be predicted by the
+        # surrogate of the saved ones, instead of being computed (None to always compute them)
+        self.options.declare("surrogate_max_error", default=None, types=float, allow_none=True)
         self.options.declare(
             "wing_airfoil_file", default="naca23012.af", types=str, allow_none=True
         )
@@ -107,7 +109,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         _, cl_alpha_wing, _, _, _, _, _, _, cl_alpha_htp, _, _, _, _, _ = self.compute_aero_coef(
             inputs, altitude, mach, aoa_angle
         )
-        return float(cl_alpha_wing + cl_alpha_htp)
+        return to_scalar(cl_alpha_wing + cl_alpha_htp)
 
     def compute_cl_alpha_mach(self, inputs, outputs, aoa_angle, altitude, cruise_mach):
         """
@@ -115,7 +117,9 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         function of Mach for later use in the computation of the V-n diagram.
         """
         mach_interp = np.log(np.linspace(np.exp(0.15), np.exp(1.55 * cruise_mach), MACH_NB_PTS))
-        cl_alpha_interp = np.zeros(np.size(mach_interp))
+        cl_alpha_interp = np.zeros(
+            np.size(mach_interp), dtype=complex if self.under_complex_step else float
+        )
         for idx, _ in enumerate(mach_interp):
             cl_alpha_interp[idx] = self.compute_cl_alpha_aircraft(
                 inputs, altitude, mach_interp[idx], aoa_angle
@@ -143,8 +147,10 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         coef_k_htp parameters.
         """
 
-        # Fix mach number of digits to consider similar results
-        mach = round(float(mach) * 1e3) / 1e3
+        # Fix mach number of digits to consider similar results (imaginary part is kept for
+        # complex step)
+        mach = to_scalar(mach)
+        mach = np.round(np.real(mach) * 1e3) / 1e3 + (mach - np.real(mach))
 
         # Get inputs necessary to define global geometry
         if self.options["low_speed_aero"]:
@@ -159,17 +165,17 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             cdp_htp_airfoil = inputs["data:aerodynamics:horizontal_tail:cruise:CDp"]
         width_max = inputs["data:geometry:fuselage:maximum_width"]
         span_wing = inputs["data:geometry:wing:span"]
-        sref_wing = float(inputs["data:geometry:wing:area"])
-        sref_htp = float(inputs["data:geometry:horizontal_tail:area"])
+        sref_wing = to_scalar(inputs["data:geometry:wing:area"])
+        sref_htp = to_scalar(inputs["data:geometry:horizontal_tail:area"])
         area_ratio = sref_htp / sref_wing
-        sweep25_wing = float(inputs["data:geometry:wing:sweep_25"])
-        taper_ratio_wing = float(inputs["data:geometry:wing:taper_ratio"])
-        aspect_ratio_wing = float(inputs["data:geometry:wing:aspect_ratio"])
-        sweep25_htp = float(inputs["data:geometry:horizontal_tail:sweep_25"])
-        aspect_ratio_htp = float(inputs["data:geometry:horizontal_tail:aspect_ratio"])
-        taper_ratio_htp = float(inputs["data:geometry:horizontal_tail:taper_ratio"])
+        sweep25_wing = to_scalar(inputs["data:geometry:wing:sweep_25"])
+        taper_ratio_wing = to_scalar(inputs["data:geometry:wing:taper_ratio"])
+        aspect_ratio_wing = to_scalar(inputs["data:geometry:wing:aspect_ratio"])
+        sweep25_htp = to_scalar(inputs["data:geometry:horizontal_tail:sweep_25"])
+        aspect_ratio_htp = to_scalar(inputs["data:geometry:horizontal_tail:aspect_ratio"])
+        taper_ratio_htp = to_scalar(inputs["data:geometry:horizontal_tail:taper_ratio"])
         geometry_set = np.around(
-            np.array(
+            np.real(
                 [
                     sweep25_wing,
                     taper_ratio_wing,
@@ -184,8 +190,11 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             decimals=6,
         )
 
-        # Search if results already exist:
+        # Search if results already exist (saved results are real so they are neither used nor
+        # saved under complex step):
         result_folder_path = self.options["result_folder_path"]
+        if self.under_complex_step:
+            result_folder_path = ""
         result_file_path = None
         saved_area_ratio = 1.0
         if result_folder_path != "":
@@ -193,8 +202,16 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                 result_folder_path, geometry_set
             )
 
+        # If no result saved for that geometry, results may be predicted by the surrogate of the
+        # saved ones (already scaled to the area ratio and wing area of the geometry)
+        data = None
+        max_error = self.options["surrogate_max_error"]
+        if result_file_path is None and result_folder_path != "" and max_error is not None:
+            data, _ = self.predict_results(result_folder_path, geometry_set, sref_wing, max_error)
+            saved_area_ratio = area_ratio
+
         # If no result saved for that geometry under this mach condition, computation is done
-        if result_file_path is None:
+        if result_file_path is None and data is None:
 
             # Create result folder first (if it must fail, let it fail as soon as possible)
             if result_folder_path != "":
@@ -202,7 +219,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                     os.makedirs(pth.join(result_folder_path), exist_ok=True)
 
             # Save the geometry (result_file_path is None entering the function)
-            if self.options["result_folder_path"] != "":
+            if result_folder_path != "":
                 result_file_path = self.save_geometry(result_folder_path, geometry_set)
 
             # Compute wing alone @ 0°/X° angle of attack
@@ -227,11 +244,11 @@ class VLMSimpleGeometry(om.ExplicitComponent):
 
             # Post-process wing data ---------------------------------------------------------------
             k_fus = 1 + 0.025 * width_max / span_wing - 0.025 * (width_max / span_wing) ** 2
-            beta = math.sqrt(1 - mach ** 2)  # Prandtl-Glauert
-            cl_0_wing = float(wing_0["cl"] * k_fus / beta)
-            cl_aoa_wing = float(wing_aoa["cl"] * k_fus / beta)
-            cm_0_wing = float(wing_0["cm"] * k_fus / beta)
-            cl_alpha_wing = (cl_aoa_wing - cl_0_wing) / (aoa_angle * math.pi / 180)
+            beta = np.sqrt(1 - mach ** 2)  # Prandtl-Glauert
+            cl_0_wing = to_scalar(wing_0["cl"] * k_fus / beta)
+            cl_aoa_wing = to_scalar(wing_aoa["cl"] * k_fus / beta)
+            cm_0_wing = to_scalar(wing_0["cm"] * k_fus / beta)
+            cl_alpha_wing = (cl_aoa_wing - cl_0_wing) / (aoa_angle * np.pi / 180)
             y_vector_wing = wing_0["y_vector"]
             cl_vector_wing = (np.array(wing_0["cl_vector"]) * k_fus / beta).tolist()
             chord_vector_wing = wing_0["chord_vector"]
@@ -242,16 +259,16 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                 coef_e = wing_aoa["coef_e"] * (
                     -0.001521 * ((mach - 0.05) / 0.3 - 1) ** 10.82 + 1
                 )  # Mach correction
-            cdi = cl_aoa_wing ** 2 / (math.pi * aspect_ratio_wing * coef_e) + cdp_foil
-            coef_e = wing_aoa["cl"] ** 2 / (math.pi * aspect_ratio_wing * cdi)
+            cdi = cl_aoa_wing ** 2 / (np.pi * aspect_ratio_wing * coef_e) + cdp_foil
+            coef_e = wing_aoa["cl"] ** 2 / (np.pi * aspect_ratio_wing * cdi)
             k_fus = 1 - 2 * (width_max / span_wing) ** 2  # Fuselage correction
-            coef_e = float(coef_e * k_fus)
-            coef_k_wing = float(1.0 / (math.pi * aspect_ratio_wing * coef_e))
+            coef_e = to_scalar(coef_e * k_fus)
+            coef_k_wing = to_scalar(1.0 / (np.pi * aspect_ratio_wing * coef_e))
 
             # Post-process HTP-aircraft data -------------------------------------------------------
-            cl_0_htp = float(htp_0["cl"]) / beta * area_ratio
-            cl_aoa_htp = float(htp_aoa["cl"]) / beta * area_ratio
-            cl_alpha_htp = float((cl_aoa_htp - cl_0_htp) / (aoa_angle * math.pi / 180))
+            cl_0_htp = to_scalar(htp_0["cl"]) / beta * area_ratio
+            cl_aoa_htp = to_scalar(htp_aoa["cl"]) / beta * area_ratio
+            cl_alpha_htp = to_scalar((cl_aoa_htp - cl_0_htp) / (aoa_angle * np.pi / 180))
             cdp_foil = self._interpolate_cdp(cl_htp_airfoil, cdp_htp_airfoil, htp_aoa["cl"] / beta)
             if mach <= 0.4:
                 coef_e = htp_aoa["coef_e"]
@@ -259,17 +276,17 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                 coef_e = htp_aoa["coef_e"] * (
                     -0.001521 * ((mach - 0.05) / 0.3 - 1) ** 10.82 + 1
                 )  # Mach correction
-            cdi = (htp_aoa["cl"] / beta) ** 2 / (math.pi * aspect_ratio_htp * coef_e) + cdp_foil
-            coef_k_htp = float(cdi / cl_aoa_htp ** 2 * area_ratio)
+            cdi = (htp_aoa["cl"] / beta) ** 2 / (np.pi * aspect_ratio_htp * coef_e) + cdp_foil
+            coef_k_htp = to_scalar(cdi / cl_aoa_htp ** 2 * area_ratio)
             y_vector_htp = htp_aoa["y_vector"]
             cl_vector_htp = (np.array(htp_aoa["cl_vector"]) / beta * area_ratio).tolist()
 
             # Post-process HTP-isolated data -------------------------------------------------------
             cl_alpha_htp_isolated = (
-                float(htp_aoa_isolated["cl"] - htp_0_isolated["cl"])
+                to_scalar(htp_aoa_isolated["cl"] - htp_0_isolated["cl"])
                 / beta
                 * area_ratio
-                / (aoa_angle * math.pi / 180)
+                / (aoa_angle * np.pi / 180)
             )
 
             # Resize vectors -----------------------------------------------------------------------
@@ -299,7 +316,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                 cl_vector_htp.extend(additional_zeros)
 
             # Save results to defined path ---------------------------------------------------------
-            if self.options["result_folder_path"] != "":
+            if result_folder_path != "":
                 results = [
                     cl_0_wing,
                     cl_alpha_wing,
@@ -322,7 +339,8 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         # Else retrieved results are used, eventually adapted with new area ratio
         else:
             # Read values from result file ---------------------------------------------------------
-            data = self.read_results(result_file_path)
+            if data is None:
+                data = self.read_results(result_file_path)
             saved_area_wing = float(data.loc["saved_ref_area", 0])
             cl_0_wing = float(data.loc["cl_0_wing", 0])
             cl_alpha_wing = float(data.loc["cl_alpha_wing", 0])
@@ -394,7 +412,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         self._run(inputs)
 
         # Get inputs
-        aspect_ratio = float(inputs["data:geometry:wing:aspect_ratio"])
+        aspect_ratio = to_scalar(inputs["data:geometry:wing:aspect_ratio"])
         meanchord = inputs["data:geometry:wing:MAC:length"]
 
         # Initialization
@@ -410,12 +428,14 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         self.apply_deflection(inputs, flaps_angle)
 
         # Compute air speed
-        v_inf = max(
-            Atmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach, 0.01
-        )  # avoid V=0 m/s crashes
+        v_inf = to_scalar(
+            ComplexStepAtmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach
+        )
+        if np.real(v_inf) < 0.01:
+            v_inf = 0.01  # avoid V=0 m/s crashes
 
         # Calculate all the aerodynamic parameters
-        aoa_angle = aoa_angle * math.pi / 180
+        aoa_angle = aoa_angle * np.pi / 180
         alpha = np.add(panelangle_vect, aoa_angle)
         gamma = -np.dot(aic_inv, alpha) * v_inf
         c_p = -2 / v_inf * np.divide(gamma, panelchord)
@@ -425,9 +445,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         alphaind = np.dot(aic_wake, gamma) / v_inf
         cdind_panel = c_p * alphaind
         cdi_wing = np.sum(cdind_panel * panelsurf) / np.sum(panelsurf)
-        wing_e = (
-            cl_wing ** 2 / (math.pi * aspect_ratio * cdi_wing) * 0.955
-        )  # !!!: manual correction?
+        wing_e = cl_wing ** 2 / (np.pi * aspect_ratio * cdi_wing) * 0.955  # !!!: manual correction?
         cmpanel = np.multiply(c_p, (x_c[: self.n_x * self.n_y] - meanchord / 4))
         cm_wing = np.sum(cmpanel * panelsurf) / np.sum(panelsurf)
 
@@ -486,7 +504,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         self._run(inputs)
 
         # Get inputs
-        aspect_ratio = float(inputs["data:geometry:horizontal_tail:aspect_ratio"])
+        aspect_ratio = to_scalar(inputs["data:geometry:horizontal_tail:aspect_ratio"])
         meanchord = inputs["data:geometry:horizontal_tail:MAC:length"]
 
         # Initialization
@@ -501,12 +519,14 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         aic_wake = self.htp["aic_wake"]
 
         # Compute air speed
-        v_inf = max(
-            Atmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach, 0.01
-        )  # avoid V=0 m/s crashes
+        v_inf = to_scalar(
+            ComplexStepAtmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach
+        )
+        if np.real(v_inf) < 0.01:
+            v_inf = 0.01  # avoid V=0 m/s crashes
 
         # Calculate all the aerodynamic parameters
-        aoa_angle = aoa_angle * math.pi / 180
+        aoa_angle = aoa_angle * np.pi / 180
         alpha = np.add(panelangle_vect, aoa_angle)
         gamma = -np.dot(aic_inv, alpha) * v_inf
         c_p = -2 / v_inf * np.divide(gamma, panelchord)
@@ -516,7 +536,9 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         alphaind = np.dot(aic_wake, gamma) / v_inf
         cdind_panel = c_p * alphaind
         cdi_htp = np.sum(cdind_panel * panelsurf) / np.sum(panelsurf)
-        htp_e = cl_htp ** 2 / (math.pi * aspect_ratio * max(cdi_htp, 1e-12))  # avod 0.0 division
+        if np.real(cdi_htp) < 1e-12:
+            cdi_htp = 1e-12  # avoid 0.0 division
+        htp_e = cl_htp ** 2 / (np.pi * aspect_ratio * cdi_htp)
         cmpanel = np.multiply(c_p, (x_c[: self.n_x * self.n_y] - meanchord / 4))
         cm_htp = np.sum(cmpanel * panelsurf) / np.sum(panelsurf)
 
@@ -571,7 +593,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         """
 
         # Get inputs
-        aspect_ratio_wing = float(inputs["data:geometry:wing:aspect_ratio"])
+        aspect_ratio_wing = to_scalar(inputs["data:geometry:wing:aspect_ratio"])
 
         # Compute wing
         wing = self.compute_wing(
@@ -580,7 +602,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
 
         # Calculate downwash angle based on Gudmundsson model (p.467)
         cl_wing = wing["cl"]
-        beta = math.sqrt(1 - mach ** 2)  # Prandtl-Glauert
+        beta = np.sqrt(1 - mach ** 2)  # Prandtl-Glauert
         downwash_angle = 2.0 * np.array(cl_wing) / beta * 180.0 / (aspect_ratio_wing * np.pi ** 2)
         aoa_angle_corrected = aoa_angle - downwash_angle
 
@@ -594,7 +616,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
 
     def _run(self, inputs):
 
-        wing_break = float(inputs["data:geometry:wing:kink:span_ratio"])
+        wing_break = np.real(to_scalar(inputs["data:geometry:wing:kink:span_ratio"]))
 
         # Define mesh size
         self.n_x = int(DEFAULT_NX)
@@ -610,25 +632,27 @@ class VLMSimpleGeometry(om.ExplicitComponent):
 
         self.n_y = int(self.ny1 + self.ny2 + self.ny3)
         # Define elements
+        # Complex arrays are needed to propagate complex step perturbations
+        dtype = complex if self.under_complex_step else float
         self.wing = {
-            "x_panel": np.zeros((self.n_x + 1, 2 * self.n_y + 1)),
-            "y_panel": np.zeros(2 * self.n_y + 1),
-            "z": np.zeros(self.n_x + 1),
-            "x_le": np.zeros(2 * self.n_y + 1),
-            "chord": np.zeros(2 * self.n_y + 1),
-            "panel_span": np.zeros(2 * self.n_y),
-            "panel_chord": np.zeros(self.n_x * self.n_y),
-            "panel_surf": np.zeros(self.n_x * self.n_y),
-            "x_c": np.zeros(self.n_x * 2 * self.n_y),
-            "yc": np.zeros(self.n_x * 2 * self.n_y),
-            "x1": np.zeros(self.n_x * 2 * self.n_y),
-            "x2": np.zeros(self.n_x * 2 * self.n_y),
-            "y1": np.zeros(self.n_x * 2 * self.n_y),
-            "y2": np.zeros(self.n_x * 2 * self.n_y),
-            "panel_angle": np.zeros(self.n_x),
-            "panel_angle_vect": np.zeros(self.n_x * self.n_y),
-            "aic": np.zeros((self.n_x * self.n_y, self.n_x * self.n_y)),
-            "aic_wake": np.zeros((self.n_x * self.n_y, self.n_x * self.n_y)),
+            "x_panel": np.zeros((self.n_x + 1, 2 * self.n_y + 1), dtype=dtype),
+            "y_panel": np.zeros(2 * self.n_y + 1, dtype=dtype),
+            "z": np.zeros(self.n_x + 1, dtype=dtype),
+            "x_le": np.zeros(2 * self.n_y + 1, dtype=dtype),
+            "chord": np.zeros(2 * self.n_y + 1, dtype=dtype),
+            "panel_span": np.zeros(2 * self.n_y, dtype=dtype),
+            "panel_chord": np.zeros(self.n_x * self.n_y, dtype=dtype),
+            "panel_surf": np.zeros(self.n_x * self.n_y, dtype=dtype),
+            "x_c": np.zeros(self.n_x * 2 * self.n_y, dtype=dtype),
+            "yc": np.zeros(self.n_x * 2 * self.n_y, dtype=dtype),
+            "x1": np.zeros(self.n_x * 2 * self.n_y, dtype=dtype),
+            "x2": np.zeros(self.n_x * 2 * self.n_y, dtype=dtype),
+            "y1": np.zeros(self.n_x * 2 * self.n_y, dtype=dtype),
+            "y2": np.zeros(self.n_x * 2 * self.n_y, dtype=dtype),
+            "panel_angle": np.zeros(self.n_x, dtype=dtype),
+            "panel_angle_vect": np.zeros(self.n_x * self.n_y, dtype=dtype),
+            "aic": np.zeros((self.n_x * self.n_y, self.n_x * self.n_y), dtype=dtype),
+            "aic_wake": np.zeros((self.n_x * self.n_y, self.n_x * self.n_y), dtype=dtype),
         }
         # Duplicate for HTP
         self.htp = copy.deepcopy(self.wing)
@@ -775,48 +799,32 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                         i, self.n_y + j
                     ] + 0.25 * (x_panel[i + 1, self.n_y + j] - x_panel[i, self.n_y + j])
                     y_2[self.n_x * self.n_y + (i * self.n_y + j)] = y_panel[self.n_y + j]
-        # Aerodynamic coefficients computation (Right side)
-        for i in range(self.n_x * self.n_y):
-            for j in range(self.n_x * self.n_y):
-                # Right wing
-                coeff_1 = x_c[i] - x_1[j]
-                coeff_2 = y_c[i] - y_1[j]
-                coeff_3 = x_c[i] - x_2[j]
-                coeff_4 = y_c[i] - y_2[j]
-                coeff_5 = math.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
-                coeff_6 = math.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
-                coeff_7 = x_2[j] - x_1[j]
-                coeff_8 = y_2[j] - y_1[j]
-                coeff_10 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
-                    coeff_7 * coeff_3 + coeff_8 * coeff_4
-                ) / coeff_6
-                coeff_11 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
-                if coeff_1 * coeff_4 - coeff_2 * coeff_3 != 0:
-                    aic[i, j] = (coeff_10 / (coeff_1 * coeff_4 - coeff_2 * coeff_3)) / (4 * math.pi)
-                aic_wake[i, j] = coeff_11 / (4 * math.pi)
-                aic[i, j] = aic[i, j] + coeff_11 / (4 * math.pi)
-        # Aerodynamic coefficients computation (Left side)
-        for i in range(self.n_x * self.n_y):
-            for j in range(self.n_x * self.n_y):
-                # Left wing
-                coeff_1 = x_c[i] - x_1[self.n_x * self.n_y + j]
-                coeff_2 = y_c[i] - y_1[self.n_x * self.n_y + j]
-                coeff_3 = x_c[i] - x_2[self.n_x * self.n_y + j]
-                coeff_4 = y_c[i] - y_2[self.n_x * self.n_y + j]
-                coeff_5 = math.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
-                coeff_6 = math.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
-                coeff_7 = x_2[self.n_x * self.n_y + j] - x_1[self.n_x * self.n_y + j]
-                coeff_8 = y_2[self.n_x * self.n_y + j] - y_1[self.n_x * self.n_y + j]
-                coeff_9 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
-                    coeff_7 * coeff_3 + coeff_8 * coeff_4
-                ) / coeff_6
-                coeff_10 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
-                if coeff_1 * coeff_4 - coeff_2 * coeff_3 != 0:
-                    aic[i, j] = aic[i, j] + (coeff_9 / (coeff_1 * coeff_4 - coeff_2 * coeff_3)) / (
-                        4 * math.pi
-                    )
-                aic_wake[i, j] = aic_wake[i, j] + coeff_10 / (4 * math.pi)
-                aic[i, j] = aic[i, j] + coeff_10 / (4 * math.pi)
+        # Aerodynamic coefficients computation: influence of the right side (j < n_x * n_y) and
+        # left side (j >= n_x * n_y) horseshoe vortices on the right side control points
+        n_panels = self.n_x * self.n_y
+        for side in range(2):
+            x_1_side = x_1[side * n_panels : (side + 1) * n_panels]
+            y_1_side = y_1[side * n_panels : (side + 1) * n_panels]
+            x_2_side = x_2[side * n_panels : (side + 1) * n_panels]
+            y_2_side = y_2[side * n_panels : (side + 1) * n_panels]
+            coeff_1 = x_c[:n_panels, np.newaxis] - x_1_side[np.newaxis, :]
+            coeff_2 = y_c[:n_panels, np.newaxis] - y_1_side[np.newaxis, :]
+            coeff_3 = x_c[:n_panels, np.newaxis] - x_2_side[np.newaxis, :]
+            coeff_4 = y_c[:n_panels, np.newaxis] - y_2_side[np.newaxis, :]
+            coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
+            coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
+            coeff_7 = x_2_side - x_1_side
+            coeff_8 = y_2_side - y_1_side
+            coeff_9 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
+                coeff_7 * coeff_3 + coeff_8 * coeff_4
+            ) / coeff_6
+            coeff_10 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
+            coeff_11 = coeff_1 * coeff_4 - coeff_2 * coeff_3
+            # Bound vortex contribution is ignored when the control point is aligned with it
+            aligned = coeff_11 == 0
+            bound = np.where(aligned, 0.0, coeff_9 / np.where(aligned, 1.0, coeff_11))
+            aic[:n_panels, :n_panels] += (bound + coeff_10) / (4 * math.pi)
+            aic_wake[:n_panels, :n_panels] += coeff_10 / (4 * math.pi)
         # Save data
         dictionary["x_panel"] = x_panel
         dictionary["panel_span"] = panelspan
@@ -838,17 +846,17 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         panelangle = dictionary["panel_angle"]
 
         # Initialization
-        z_panel = np.zeros(self.n_x + 1)
+        z_panel = np.zeros(self.n_x + 1, dtype=x_panel.dtype)
         rootchord = x_panel[self.n_x, 0] - x_panel[0, 0]
         # Calculation of panelangle_vect
         profile = get_profile(file_name=file_name)
-        mean_line = profile.get_mean_line()
+        x_mean_line, z_mean_line = profile.get_mean_line_array().T
         for i in range(self.n_x + 1):
             xred = (x_panel[i, 0] - x_panel[0, 0]) / rootchord
-            z_panel[i] = np.interp(
-                min(max(xred, min(mean_line["x"])), max(mean_line["x"])),
-                mean_line["x"],
-                mean_line["z"],
+            z_panel[i] = interp(
+                min(max(xred, min(x_mean_line), key=np.real), max(x_mean_line), key=np.real),
+                x_mean_line,
+                z_mean_line,
             )
         z_panel = z_panel * rootchord
         for i in range(self.n_x):
@@ -870,24 +878,24 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         x_start = (1.0 - inputs["data:geometry:flap:chord_ratio"]) * root_chord
         y1_wing = inputs["data:geometry:fuselage:maximum_width"] / 2.0
 
-        deflection_angle *= math.pi / 180  # converted to radian
+        deflection_angle *= np.pi / 180  # converted to radian
         # z_ = self.wing["z"]
         x_panel = self.wing["x_panel"]
         y_panel = self.wing["y_panel"]
         panelangle = self.wing["panel_angle"]
         panelangle_vect = self.wing["panel_angle_vect"]
 
-        z_panel = np.zeros(self.n_x + 1)
-        z_panel_no_flaps = np.zeros(self.n_x + 1)
+        z_panel = np.zeros(self.n_x + 1, dtype=x_panel.dtype)
+        z_panel_no_flaps = np.zeros(self.n_x + 1, dtype=x_panel.dtype)
         for i in range(self.n_x + 1):
-            if x_panel[i, 0] > x_start:
-                z_panel[i] = z_panel_no_flaps[i] - math.sin(deflection_angle) * (
+            if np.real(x_panel[i, 0]) > np.real(x_start):
+                z_panel[i] = z_panel_no_flaps[i] - np.sin(deflection_angle) * (
                     x_panel[i, 0] - x_start
                 )
         for i in range(self.n_x):
             panelangle[i] = (z_panel[i] - z_panel[i + 1]) / (x_panel[i + 1, 0] - x_panel[i, 0])
         for j in range(self.ny1):
-            if y_panel[j] > y1_wing:
+            if np.real(y_panel[j]) > np.real(y1_wing):
                 for i in range(self.n_x):
                     panelangle_vect[i * self.n_y + j] += panelangle[i]
         for j in range(self.ny1, self.ny1 + self.ny2):
@@ -915,11 +923,13 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                 drag_coeff = drag_coeff[0:idx]
                 break
 
-        # Interpolate value if within the interpolation range
-        if min(lift_coeff) <= ojective <= max(lift_coeff):
-            idx_max = int(float(np.where(lift_coeff == max(lift_coeff))[0]))
-            return np.interp(ojective, lift_coeff[0 : idx_max + 1], drag_coeff[0 : idx_max + 1])
-        elif ojective < lift_coeff[0]:
+        # Interpolate value if within the interpolation range (comparisons done on real part for
+        # complex step)
+        lift_coeff_real = np.real(lift_coeff)
+        if min(lift_coeff_real) <= np.real(ojective) <= max(lift_coeff_real):
+            idx_max = int(float(np.where(lift_coeff_real == max(lift_coeff_real))[0]))
+            return interp(ojective, lift_coeff[0 : idx_max + 1], drag_coeff[0 : idx_max + 1])
+        elif np.real(ojective) < lift_coeff_real[0]:
             cdp = drag_coeff[0] + (ojective - lift_coeff[0]) * (drag_coeff[1] - drag_coeff[0]) / (
                 lift_coeff[1] - lift_coeff[0]
             )
@@ -927,102 +937,44 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             cdp = drag_coeff[-1] + (ojective - lift_coeff[-1]) * (
                 drag_coeff[-1] - drag_coeff[-2]
             ) / (lift_coeff[-1] - lift_coeff[-2])
-        _LOGGER.warning("CL not in range. Linear extrapolation of CDp value %f", cdp)
+        _LOGGER.warning("CL not in range. Linear extrapolation of CDp value %f", np.real(cdp))
         return cdp
 
     @staticmethod
     def search_results(result_folder_path, geometry_set):
         """Search the results folder to see if the geometry has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "mach",
-                "area_ratio",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "vlm_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy()) == 7:
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if np.sum(saved_set == geometry_set[0:-1]) == 7:
-                                    result_file_path = pth.join(
-                                        result_folder_path, "vlm_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio = data.loc["area_ratio", 0]
-                                    return result_file_path, saved_area_ratio
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0
+        result_file_path, (saved_area_ratio,) = results_cache.search_results(
+            result_folder_path,
+            geometry_set,
+            results_cache.AERODYNAMIC_GEOMETRY_LABELS,
+            "vlm",
+            reference_labels=["area_ratio"],
+        )
+
+        return result_file_path, saved_area_ratio
 
     @staticmethod
     def save_geometry(result_folder_path, geometry_set):
         """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "mach",
-            "area_ratio",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "vlm_" + str(idx) + ".csv")
-
-        return result_file_path
+        return results_cache.save_geometry(
+            result_folder_path, geometry_set, results_cache.AERODYNAMIC_GEOMETRY_LABELS, "vlm"
+        )
 
     @staticmethod
     def save_results(result_file_path, results):
-        """Reads saved results."""
-        labels = [
-            "cl_0_wing",
-            "cl_alpha_wing",
-            "cm_0_wing",
-            "y_vector_wing",
-            "cl_vector_wing",
-            "chord_vector_wing",
-            "coef_k_wing",
-            "cl_0_htp",
-            "cl_X_htp",
-            "cl_alpha_htp",
-            "cl_alpha_htp_isolated",
-            "y_vector_htp",
-            "cl_vector_htp",
-            "coef_k_htp",
-            "saved_ref_area",
-        ]
-        data = pd.DataFrame(results, index=labels)
-        data.to_csv(result_file_path)
+        """Saves results."""
+        results_cache.save_results(
+            result_file_path, results, results_cache.AERODYNAMIC_RESULTS_LABELS
+        )
 
     @staticmethod
     def read_results(result_file_path):
+        """Reads saved results."""
+        return results_cache.read_results(result_file_path)
 
-        data = pd.read_csv(result_file_path)
-        values = data.to_numpy()[:, 1].tolist()
-        labels = data.to_numpy()[:, 0].tolist()
-
-        return pd.DataFrame(values, index=labels)
+    @staticmethod
+    def predict_results(result_folder_path, geometry_set, ref_area, max_error):
+        """Predicts results with the surrogate of the saved ones, None if not accurate enough."""
+        return surrogate.predict_results(
+            result_folder_path, geometry_set, "vlm", ref_area, max_error
+        )
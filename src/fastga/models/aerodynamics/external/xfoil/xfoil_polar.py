@@ -37,6 +37,7 @@ from . import resources as local_resources
 
 from fastga.models.geometry.profiles.get_profile import get_profile
 from fastga.models.aerodynamics.external.xfoil import xfoil699
+from fastga.utils.profiling import record_cache_access
 
 OPTION_RESULT_POLAR_FILENAME = "result_polar_filename"
 OPTION_RESULT_FOLDER_PATH = "result_folder_path"
@@ -214,6 +215,7 @@ class XfoilPolar(ExternalCodeComp):
                         value = (lower_value * x_ratio + upper_value * (1 - x_ratio)).tolist()
                         interpolated_result.loc[label, index_lower_reynolds] = str(value)
 
+        record_cache_access(interpolated_result is not None)
         if interpolated_result is None:
             # Create result folder first (if it must fail, let it fail as soon as possible)
             result_folder_path = self.options[OPTION_RESULT_FOLDER_PATH]
@@ -241,11 +243,11 @@ class XfoilPolar(ExternalCodeComp):
             tmp_profile_file_path = pth.join(tmp_directory.name, _TMP_PROFILE_FILE_NAME)
             profile = get_profile(
                 file_name=self.options["airfoil_file"],
-            ).get_sides()
+            ).get_sides_array()
             # noinspection PyTypeChecker
             np.savetxt(
                 tmp_profile_file_path,
-                profile.to_numpy(),
+                profile,
                 fmt="%.15f",
                 delimiter=" ",
                 header="Wing",
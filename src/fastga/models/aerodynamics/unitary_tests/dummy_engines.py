@@ -63,10 +63,7 @@ class DummyEngineBE76(AbstractFuelPropulsion):
         return [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
 
     def compute_drag(self, mach, unit_reynolds, wing_mac):
-        if mach < 0.15:
-            return 0.01934377
-        else:
-            return 0.01771782
+        return np.where(np.asarray(mach) < 0.15, 0.01934377, 0.01771782)
 
     def get_consumed_mass(self, flight_point: FlightPoint, time_step: float) -> float:
         return 0.0
@@ -134,10 +131,7 @@ class DummyEngineSR22(AbstractFuelPropulsion):
         return [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
 
     def compute_drag(self, mach, unit_reynolds, wing_mac):
-        if mach < 0.15:
-            return 0.01934377
-        else:
-            return 0.01771782
+        return np.where(np.asarray(mach) < 0.15, 0.01934377, 0.01771782)
 
     def get_consumed_mass(self, flight_point: FlightPoint, time_step: float) -> float:
         return 0.0
@@ -0,0 +1,100 @@
+"""Dry-run stand-in of the OpenVSP executables for aerodynamic module!"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import math
+import os.path as pth
+import time
+
+from fastga.models.aerodynamics.external.openvsp.openvsp import (
+    INPUT_AIRCRAFT_SCRIPT,
+    VSPAERO_EXE_NAME,
+    VSPSCRIPT_EXE_NAME,
+)
+
+# Number of span stations written for each surface
+STRIP_COUNT = 5
+
+
+class DryRunOpenVSP:
+    """
+    Stand-in of vspscript/vspaero: with execute_local used in place of
+    ExternalCodeDelegate._execute_local, the batch files generated by the OpenVSP components are
+    read and output files with the layout of the real ones are written after a given delay (lift
+    of a flat plate for the given angle of attack).
+    Executed commands are listed in calls as (command name, start time, end time).
+
+    :param delay: duration of each run in seconds.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+
+    def execute_local(self, command):
+        """Same as ExternalCodeDelegate._execute_local, returns return code and error message."""
+        start = time.perf_counter()
+        with open(command[0], "r") as batch_file:
+            arguments = batch_file.readlines()[-1].split()
+        time.sleep(self.delay)
+
+        executable_name = pth.basename(arguments[0])
+        if executable_name == VSPSCRIPT_EXE_NAME:
+            self._vspscript(arguments[2])
+        elif executable_name == VSPAERO_EXE_NAME:
+            self._vspaero(arguments[2])
+        else:
+            return 1, "Unknown command %s" % executable_name
+        self.calls.append((executable_name, start, time.perf_counter()))
+
+        return 0, ""
+
+    @staticmethod
+    def _vspscript(script_file_path: str):
+        with open(script_file_path.replace(".vspscript", "_DegenGeom.csv"), "w") as file:
+            file.write("# Dry-run geometry\n")
+
+    @staticmethod
+    def _vspaero(base_file_path: str):
+        with open(base_file_path + ".vspaero", "r") as file:
+            for line in file.readlines():
+                if line.startswith("AoA"):
+                    aoa_angle = float(line.split()[2])
+        cl = 0.1 + 2.0 * math.pi * aoa_angle * math.pi / 180.0 * 0.8
+        cdi = cl ** 2.0 / (math.pi * 8.0 * 0.8)
+
+        # Isolated surfaces are numbered 1, for the complete aircraft wing is 1 and HTP is 3
+        surfaces = ["1"]
+        if pth.basename(base_file_path).startswith(INPUT_AIRCRAFT_SCRIPT.replace(".vspscript", "")):
+            surfaces.append("3")
+        lines = ["Dry-run load distribution\n"]
+        for surface in surfaces:
+            for idx in range(STRIP_COUNT):
+                y = 0.5 + idx
+                values = [surface, "0", y, 1.5, 0.0, cl * (1.0 - (idx / STRIP_COUNT) ** 2.0)]
+                values += [cdi, 0.0, 0.0, 0.0, 0.0, 0.0, -0.05]
+                lines.append(" ".join(str(value) for value in values) + "\n")
+        lines.append("Comp Name Mach AoA Beta CL CDi CS CFx CFy CFz Cmx Cmy Cmz\n")
+        for surface in surfaces:
+            for _ in ["left", "right"]:
+                values = [surface, "Surf", 0.0, aoa_angle, 0.0, cl / 2.0, cdi / 2.0]
+                values += [0.0, 0.0, 0.0, 0.0, 0.0, -0.025]
+                lines.append(" ".join(str(value) for value in values) + "\n")
+        with open(base_file_path + ".lod", "w") as file:
+            file.writelines(lines)
+
+        polar_values = [0.0, 0.0, aoa_angle, 0.0, cl, 0.01, cdi, cdi + 0.01, cl / (cdi + 0.01)]
+        polar_values += [0.0, 0.8]
+        with open(base_file_path + ".polar", "w") as file:
+            file.write("Beta Mach AoA Re/1e6 CL CDo CDi CDtot L/D CS E\n")
+            file.write(" ".join(str(value) for value in polar_values) + "\n")
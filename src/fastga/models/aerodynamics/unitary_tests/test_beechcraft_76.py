@@ -12,12 +12,39 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os.path as pth
 import pytest
 
 from platform import system
 import numpy as np
+from stdatm import Atmosphere
+from openmdao.components.external_code_comp import ExternalCodeDelegate
+
+# noinspection PyProtectedMember
+from fastoad.module_management._bundle_loader import BundleLoader
+
+from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
+
+from fastga.models.aerodynamics.components.compute_vn import ComputeVN, DOMAIN_PTS_NB
+from fastga.models.aerodynamics.components.high_lift_aero import ComputeDeltaHighLift
+from fastga.models.aerodynamics.components.high_lift_increments import HighLiftIncrements
+from fastga.models.aerodynamics.components.parasite_drag import (
+    ComputeCd0FlightConditions,
+    ParasiteDrag,
+)
+from fastga.models.aerodynamics.external.vlm.vlm import VLMSimpleGeometry
+from fastga.models.aerodynamics.external.openvsp import ComputeAEROopenvsp
+from fastga.models.aerodynamics.external.openvsp.openvsp import (
+    OPENVSPSimpleGeometry,
+    VSPAERO_EXE_NAME,
+)
+from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
+from fastga.models.handling_qualities.stability_derivatives.external.openvsp.openvsp import (
+    OPENVSPSimpleGeometry as OPENVSPStabilityGeometry,
+)
 
 from .dummy_engines import ENGINE_WRAPPER_BE76 as ENGINE_WRAPPER
+from .dummy_openvsp import DryRunOpenVSP
 
 from .test_functions import (
     xfoil_path,
@@ -51,6 +78,7 @@ from .test_functions import (
     propeller,
     non_equilibrated_cl_cd_polar,
     equilibrated_cl_cd_polar,
+    complex_step_derivatives,
 )
 
 XML_FILE = "beechcraft_76.xml"
@@ -100,6 +128,50 @@ def test_cd0_low_speed():
     )
 
 
+def test_cd0_flight_conditions():
+    """Tests profile drag breakdown computed for several flight conditions at once."""
+    mach = [0.11791720574958639, 0.24882140127923863, 0.3]
+    altitude = [0.0, 8000.0, 8000.0]
+    ivc = get_indep_var_comp(
+        list_inputs(ComputeCd0FlightConditions(propulsion_id=ENGINE_WRAPPER, number_of_points=3)),
+        __file__,
+        XML_FILE,
+    )
+    ivc.add_output("mach", val=mach)
+    ivc.add_output("altitude", val=altitude, units="ft")
+
+    problem = run_system(
+        ComputeCd0FlightConditions(propulsion_id=ENGINE_WRAPPER, number_of_points=3), ivc
+    )
+    assert problem["unit_reynolds"][:2] == pytest.approx([2746998.9, 4629639.5], abs=1)
+    assert problem["wing:CD0"][:2] == pytest.approx([0.00587, 0.00541], abs=1e-5)
+    assert problem["fuselage:CD0"][:2] == pytest.approx([0.00543, 0.00490], abs=1e-5)
+    assert problem["horizontal_tail:CD0"][:2] == pytest.approx([0.00129, 0.00119], abs=1e-5)
+    assert problem["vertical_tail:CD0"][:2] == pytest.approx([0.00074, 0.00066], abs=1e-5)
+    assert problem["nacelles:CD0"][:2] == pytest.approx([0.00229, 0.00209], abs=1e-5)
+    assert problem["landing_gear:CD0"] == pytest.approx([0.0, 0.0, 0.0], abs=1e-12)
+    assert problem["other:CD0"] == pytest.approx([0.00205] * 3, abs=1e-5)
+    assert problem["aircraft:CD0"][1] == pytest.approx(0.02040, abs=1e-5)
+    # Higher Reynolds number reduces the skin friction
+    assert problem["fuselage:CD0"][2] < problem["fuselage:CD0"][1]
+
+    # Landing gear extended, without OpenMDAO problem
+    inputs = {
+        name: problem[name]
+        for name in list_inputs(ComputeCd0FlightConditions(propulsion_id=ENGINE_WRAPPER))
+    }
+    propulsion_model = FuelEngineSet(
+        BundleLoader().instantiate_component(ENGINE_WRAPPER).get_model(inputs), 1.0
+    )
+    cd0 = ParasiteDrag(inputs, propulsion_model).breakdown(
+        np.array(mach[:1]), problem["unit_reynolds"][:1], low_speed_aero=True
+    )
+    assert cd0["landing_gear"] == pytest.approx([0.01459], abs=1e-5)
+    assert cd0["wing"] == pytest.approx(problem["wing:CD0"][:1], rel=1e-12)
+    assert cd0["nacelles"] == pytest.approx(problem["nacelles:CD0"][:1], rel=1e-12)
+    assert cd0["aircraft"] == pytest.approx([0.04036], abs=1e-5)
+
+
 @pytest.mark.skipif(
     system() != "Windows" and xfoil_path is None or SKIP_STEPS,
     reason="No XFOIL executable available",
@@ -569,6 +641,36 @@ def test_high_lift():
     )
 
 
+def test_high_lift_increments():
+    """Tests high-lift increments computed for several flap angles and Mach numbers at once."""
+    ivc = get_indep_var_comp(list_inputs(ComputeDeltaHighLift()), __file__, XML_FILE)
+    problem = run_system(ComputeDeltaHighLift(), ivc)
+    inputs = {
+        name: problem[name]
+        for name in list_inputs(ComputeDeltaHighLift())
+        if name.startswith("data:geometry") or name.startswith("data:aerodynamics")
+    }
+
+    high_lift = HighLiftIncrements(inputs)
+    flap_angles = np.array([[10.0], [30.0]])
+    mach = np.array([0.1, float(problem["data:aerodynamics:low_speed:mach"]), 0.25])
+    delta_cl = high_lift.delta_cl(flap_angles, mach)
+    delta_cm = high_lift.delta_cm(flap_angles, mach)
+    assert delta_cl.shape == (2, 3)
+    assert delta_cl[1, 1] == pytest.approx(problem["data:aerodynamics:flaps:landing:CL"], rel=1e-12)
+    assert delta_cl[0, 1] == pytest.approx(problem["data:aerodynamics:flaps:takeoff:CL"], rel=1e-12)
+    assert delta_cm[1, 1] == pytest.approx(problem["data:aerodynamics:flaps:landing:CM"], rel=1e-12)
+    # Compressibility increases the lift increment
+    assert np.all(np.diff(delta_cl, axis=1) > 0.0)
+
+    delta_cl_max = high_lift.delta_cl_max(np.array([10.0, 30.0]))
+    delta_cd = high_lift.delta_cd(np.array([10.0, 30.0]))
+    assert delta_cl_max == pytest.approx(
+        [problem["data:aerodynamics:flaps:takeoff:CL_max"][0], 0.3613], abs=1e-4
+    )
+    assert delta_cd[1] == pytest.approx(problem["data:aerodynamics:flaps:landing:CD"], rel=1e-12)
+
+
 @pytest.mark.skipif(
     system() != "Windows",
     reason="No XFOIL executable available: not computed with empty result folder",
@@ -989,6 +1091,147 @@ def test_equilibrated_cl_cd_polar():
     )
 
 
+def test_complex_step_derivatives():
+    """Tests complex-step derivatives of equilibrated polar and VLM against finite differences."""
+    complex_step_derivatives(XML_FILE)
+
+
+def test_external_results_cache(tmpdir):
+    """Tests the results storage shared by the VLM, OpenVSP and stability derivatives wrappers."""
+    folder = str(tmpdir)
+    aero_set = np.around(np.array([0.0, 0.5, 8.0, 0.1, 0.6, 4.0, 0.2, 1.1]), decimals=6)
+    assert VLMSimpleGeometry.search_results(folder, aero_set) == (None, 1.0)
+
+    vlm_file = VLMSimpleGeometry.save_geometry(folder, aero_set)
+    VLMSimpleGeometry.save_results(vlm_file, list(range(15)))
+    # Same geometry with another area ratio: results are found and the saved ratio returned
+    scaled_set = aero_set.copy()
+    scaled_set[-1] = 1.3
+    assert VLMSimpleGeometry.search_results(folder, scaled_set) == (vlm_file, 1.1)
+    # No OpenVSP result for that geometry even if stored in the same folder
+    assert OPENVSPSimpleGeometry.search_results(folder, aero_set)[0] is None
+    openvsp_file = OPENVSPSimpleGeometry.save_geometry(folder, aero_set)
+    assert openvsp_file != vlm_file
+    OPENVSPSimpleGeometry.save_results(openvsp_file, list(range(15)))
+    assert OPENVSPSimpleGeometry.search_results(folder, aero_set)[0] == openvsp_file
+
+    # Stability analysis has a different geometry set, it is not mixed up with aerodynamics
+    stab_set = np.around(np.linspace(0.1, 1.4, 14), decimals=6)
+    assert OPENVSPStabilityGeometry.search_results(folder, stab_set)[0] is None
+    stab_file = OPENVSPStabilityGeometry.save_geometry(folder, stab_set)
+    OPENVSPStabilityGeometry.save_results(stab_file, list(range(18)))
+    assert OPENVSPStabilityGeometry.search_results(folder, stab_set)[0] == stab_file
+    assert OPENVSPStabilityGeometry.search_results_fuselage(folder, stab_set)[0] is None
+    assert float(OPENVSPStabilityGeometry.read_results(stab_file).loc["cn_r", 0]) == 17.0
+    # Modifying the read results does not modify the cached ones
+    OPENVSPStabilityGeometry.read_results(stab_file).loc["cn_r", 0] = 0.0
+    assert float(OPENVSPStabilityGeometry.read_results(stab_file).loc["cn_r", 0]) == 17.0
+
+
+def test_external_results_surrogate(tmpdir):
+    """Tests the prediction of the aerodynamic coefficients from the saved results."""
+
+    def results(geometry, ref_area):
+        sweep_wing, taper_wing, ar_wing, _, _, ar_htp, mach, area_ratio = geometry
+        beta_2 = 1.0 + np.tan(np.radians(sweep_wing)) ** 2.0 - mach ** 2.0
+        cl_alpha_wing = 2.0 * np.pi * ar_wing / (2.0 + np.sqrt(4.0 + ar_wing ** 2.0 * beta_2))
+        cl_alpha_htp = 2.0 * np.pi * ar_htp / (2.0 + np.sqrt(4.0 + ar_htp ** 2.0)) * area_ratio
+        y_vector_htp = list(np.linspace(0.1, 1.0, 4)) + [0.0] * 3
+        y_vector_wing = list(np.sqrt(ref_area) * np.array(y_vector_htp))
+        cl_vector = (
+            list(0.1 * cl_alpha_wing * (1.0 - taper_wing * np.linspace(0.0, 1.0, 4))) + [0.0] * 3
+        )
+        return [
+            0.1 * cl_alpha_wing,
+            cl_alpha_wing,
+            -0.05 * taper_wing,
+            y_vector_wing,
+            cl_vector,
+            y_vector_wing,
+            1.0 / (0.9 * np.pi * ar_wing),
+            0.01 * area_ratio,
+            0.17 * cl_alpha_htp,
+            cl_alpha_htp,
+            1.1 * cl_alpha_htp,
+            y_vector_htp,
+            cl_vector,
+            0.3 * area_ratio,
+            ref_area,
+        ]
+
+    folder = str(tmpdir)
+    random_state = np.random.RandomState(1)
+    lower_bounds = np.array([0.0, 0.4, 7.0, 0.0, 0.5, 3.5, 0.1, 0.2])
+    upper_bounds = np.array([5.0, 1.0, 9.0, 5.0, 1.0, 5.0, 0.3, 0.25])
+    aero_set = np.around(np.array([2.5, 0.7, 8.0, 2.5, 0.75, 4.2, 0.2, 0.22]), decimals=6)
+    for idx in range(30):
+        # Not enough results saved to build the surrogate
+        if idx == 5:
+            assert VLMSimpleGeometry.predict_results(folder, aero_set, 16.0, 1.0) == (None, np.inf)
+        saved_set = lower_bounds + random_state.rand(8) * (upper_bounds - lower_bounds)
+        saved_set = np.around(saved_set, decimals=6)
+        vlm_file = VLMSimpleGeometry.save_geometry(folder, saved_set)
+        VLMSimpleGeometry.save_results(vlm_file, results(saved_set, 15.0))
+
+    # Results are scaled to the wing area and area ratio of the geometry
+    data, error = VLMSimpleGeometry.predict_results(folder, aero_set, 16.0, 1.0)
+    assert data is not None
+    expected_data = results(aero_set, 16.0)
+    for idx, label in enumerate(data.index):
+        if isinstance(expected_data[idx], list):
+            predicted_vector = [float(value) for value in data.loc[label, 0][1:-1].split(",")]
+            assert predicted_vector == pytest.approx(expected_data[idx], rel=1e-2, abs=1e-2)
+        else:
+            assert float(data.loc[label, 0]) == pytest.approx(expected_data[idx], rel=2e-2)
+
+    # Estimated error grows with the distance to the saved geometries, the farthest ones being left
+    # to the external code
+    _, saved_error = VLMSimpleGeometry.predict_results(folder, saved_set, 15.0, np.inf)
+    far_set = np.array([30.0, 0.1, 20.0, 20.0, 0.1, 10.0, 0.7, 0.2])
+    data, far_error = VLMSimpleGeometry.predict_results(folder, far_set, 16.0, error)
+    assert saved_error < error < far_error
+    assert data is None
+    # OpenVSP results are not mixed up with VLM ones
+    assert OPENVSPSimpleGeometry.predict_results(folder, aero_set, 16.0, 1.0) == (None, np.inf)
+
+
+def test_openvsp_concurrent_runs(monkeypatch):
+    """Tests that the OpenVSP runs of the aerodynamic coefficients are done concurrently."""
+    dry_run = DryRunOpenVSP(delay=0.2)
+    monkeypatch.setattr(ExternalCodeDelegate, "_execute_local", dry_run.execute_local)
+
+    ivc = get_indep_var_comp(list_inputs(ComputeAEROopenvsp()), __file__, XML_FILE)
+    problem = run_system(ComputeAEROopenvsp(), ivc)
+    # Wing, aircraft and isolated HTP at 2 angles of attack, geometry then aerodynamic computation
+    assert len(dry_run.calls) == 12
+    assert [call[0] for call in dry_run.calls].count(VSPAERO_EXE_NAME) == 6
+    duration = max(call[2] for call in dry_run.calls) - min(call[1] for call in dry_run.calls)
+    assert duration < 6 * dry_run.delay
+    assert problem.get_val(
+        "data:aerodynamics:wing:cruise:CL_alpha", units="rad**-1"
+    ) == pytest.approx(5.0, abs=0.1)
+
+    # Work directories are reused by the next runs
+    aero_openvsp = problem.model.component.aero_openvsp
+    assert len(aero_openvsp._tmp_directories) == 6
+    problem.run_model()
+    assert len(dry_run.calls) == 24
+    assert len(aero_openvsp._tmp_directories) == 6
+
+    # Work directories are released after a failed run too
+    monkeypatch.setattr(ExternalCodeDelegate, "_execute_local", lambda *_: (1, "OpenVSP failure"))
+    with pytest.raises(RuntimeError):
+        problem.run_model()
+    assert len(aero_openvsp._available_work_directories) == 6
+
+    # and deleted at cleanup
+    tmp_directory_paths = [tmp_directory.name for tmp_directory in aero_openvsp._tmp_directories]
+    problem.cleanup()
+    assert not aero_openvsp._tmp_directories
+    assert not aero_openvsp._available_work_directories
+    assert not any(pth.exists(tmp_directory_path) for tmp_directory_path in tmp_directory_paths)
+
+
 def test_cl_alpha_vt():
     """Tests Cl alpha vt."""
     cl_alpha_vt(XML_FILE, cl_alpha_vt_ls=2.6812, k_ar_effective=1.8630, cl_alpha_vt_cruise=2.7321)
@@ -1086,6 +1329,48 @@ def test_v_n_diagram():
     )
 
 
+def test_flight_domains():
+    """Tests the flight domains of several mass and altitude cases computed at once."""
+    ivc = get_indep_var_comp(list_inputs(ComputeVN()), __file__, XML_FILE)
+    problem = run_system(ComputeVN(), ivc)
+    component = problem.model.component
+    inputs = {name: component._inputs[name].copy() for name in list_inputs(ComputeVN())}
+
+    mtow = problem.get_val("data:weight:aircraft:MTOW", units="kg")
+    cruise_altitude = problem.get_val("data:mission:sizing:main_route:cruise:altitude", units="m")
+    atm = Atmosphere(cruise_altitude, altitude_in_feet=False)
+    atm.true_airspeed = problem.get_val("data:TLAR:v_cruise", units="m/s")
+    masses, altitudes = np.meshgrid(np.linspace(0.6, 1.0, 5) * mtow, [0.0, float(cruise_altitude)])
+    velocity_arrays, load_factor_arrays, conditions = component.flight_domains(
+        inputs, masses.flatten(), altitudes.flatten(), atm.equivalent_airspeed
+    )
+    assert np.shape(velocity_arrays) == (10, DOMAIN_PTS_NB)
+    assert np.shape(load_factor_arrays) == (10, DOMAIN_PTS_NB)
+    # Last case is the MTOW at cruise altitude
+    assert conditions[-1] == pytest.approx([mtow[0], cruise_altitude[0]])
+    assert velocity_arrays[-1] == pytest.approx(
+        problem.get_val("data:mission:sizing:cs23:flight_domain:mtow:velocity", units="m/s"),
+        rel=1e-9,
+    )
+    assert load_factor_arrays[-1] == pytest.approx(
+        problem["data:mission:sizing:cs23:flight_domain:mtow:load_factor"], rel=1e-9
+    )
+    # Stall speed decreases with mass
+    assert np.all(np.diff(velocity_arrays[:5, 0]) > 0.0)
+
+    # With a low wing loading, maneuvering speeds of the lightest cases are given by the
+    # intersection of the gust and stall lines
+    inputs["data:geometry:wing:area"] = 2.5 * inputs["data:geometry:wing:area"]
+    velocity_arrays, load_factor_arrays, _ = component.flight_domains(
+        inputs, masses.flatten(), altitudes.flatten(), atm.equivalent_airspeed
+    )
+    on_gust_line = velocity_arrays[:, 4] > 0.0
+    assert np.any(on_gust_line)
+    assert load_factor_arrays[on_gust_line, 4] == pytest.approx(
+        (velocity_arrays[on_gust_line, 4] / velocity_arrays[on_gust_line, 0]) ** 2.0, rel=1e-9
+    )
+
+
 def test_load_factor():
     # load all inputs
     load_factor(
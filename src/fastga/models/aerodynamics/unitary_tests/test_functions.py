@@ -33,6 +33,7 @@ from fastga.models.aerodynamics.components.cd0 import Cd0
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
 from fastga.models.aerodynamics.external.xfoil import resources
 from fastga.models.aerodynamics.external.vlm import ComputeAEROvlm
+from fastga.models.aerodynamics.external.vlm.compute_aero import _ComputeAEROvlm
 from fastga.models.aerodynamics.external.openvsp import ComputeAEROopenvsp
 from fastga.models.aerodynamics.external.openvsp.compute_aero_slipstream import (
     ComputeSlipstreamOpenvsp,
@@ -58,6 +59,7 @@ from fastga.models.aerodynamics.components import (
     ComputeExtremeCLHtp,
 )
 from fastga.models.aerodynamics.components.compute_equilibrated_polar import FIRST_INVALID_COEFF
+from fastga.models.aerodynamics.constants import POLAR_POINT_COUNT
 from fastga.models.aerodynamics.aerodynamics_high_speed import AerodynamicsHighSpeed
 from fastga.models.aerodynamics.aerodynamics_low_speed import AerodynamicsLowSpeed
 from fastga.models.aerodynamics.load_factor import LoadFactor
@@ -1319,3 +1321,70 @@ def equilibrated_cl_cd_polar(
     polar_cl = np.array(problem.get_val("data:aerodynamics:aircraft:cruise:equilibrated:CL"))
     valid_polar_cl = polar_cl[np.where(polar_cl < FIRST_INVALID_COEFF)[0]]
     assert list(valid_polar_cl)[::10] == pytest.approx(cl_polar_cruise_, abs=1e-2)
+
+
+def _complex_step_vs_finite_difference(problem, of: str, wrt: str):
+    """
+    Returns the derivative of output "of" with regard to input "wrt" computed with complex-step
+    and with centered finite differences on the already ran problem.
+    """
+    value = np.array(problem.get_val(wrt))
+    step = 1e-6 * np.abs(value)
+    problem.set_val(wrt, value + step)
+    problem.run_model()
+    output_plus = np.array(problem.get_val(of))
+    problem.set_val(wrt, value - step)
+    problem.run_model()
+    output_minus = np.array(problem.get_val(of))
+    problem.set_complex_step_mode(True)
+    problem.set_val(wrt, value + 1e-40j)
+    problem.run_model()
+    derivative_cs = np.imag(problem.get_val(of)) / 1e-40
+    problem.set_complex_step_mode(False)
+    problem.set_val(wrt, value)
+    problem.run_model()
+    derivative_fd = (output_plus - output_minus) / (2.0 * step)
+
+    return derivative_cs, derivative_fd
+
+
+def complex_step_derivatives(XML_FILE: str):
+    """Tests complex-step derivatives of equilibrated polar and VLM against finite differences"""
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(
+        list_inputs(ComputeEquilibratedPolar(low_speed_aero=True, cg_ratio=0.5)), __file__, XML_FILE
+    )
+
+    # Run problem and check complex-step derivatives match finite differences, isolated points
+    # are excluded since finite differences are polluted by fsolve convergence noise
+    problem = run_system(ComputeEquilibratedPolar(low_speed_aero=True, cg_ratio=0.5), ivc)
+    polar_cd = np.array(problem.get_val("data:aerodynamics:aircraft:low_speed:equilibrated:CD"))
+    valid_index = np.where(polar_cd < FIRST_INVALID_COEFF)[0]
+    for wrt in ["data:aerodynamics:aircraft:low_speed:CD0", "data:geometry:wing:area"]:
+        derivative_cs, derivative_fd = _complex_step_vs_finite_difference(
+            problem, "data:aerodynamics:aircraft:low_speed:equilibrated:CD", wrt
+        )
+        relative_error = np.abs(derivative_cs[valid_index] / derivative_fd[valid_index] - 1.0)
+        assert np.median(relative_error) < 1e-3
+        assert np.percentile(relative_error, 90) < 1e-2
+
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(list_inputs(_ComputeAEROvlm(low_speed_aero=True)), __file__, XML_FILE)
+    # Airfoil polars are normally computed by XFOIL, a parabolic polar is used instead
+    cl_airfoil = np.linspace(-0.5, 1.5, POLAR_POINT_COUNT)
+    for surface in ["wing", "horizontal_tail"]:
+        ivc.add_output("data:aerodynamics:" + surface + ":low_speed:CL", cl_airfoil)
+        ivc.add_output(
+            "data:aerodynamics:" + surface + ":low_speed:CDp", 0.006 + 0.004 * cl_airfoil ** 2
+        )
+
+    # Run problem and check complex-step derivatives match finite differences
+    problem = run_system(_ComputeAEROvlm(low_speed_aero=True), ivc)
+    for wrt in ["data:geometry:wing:span", "data:geometry:horizontal_tail:area"]:
+        for of in [
+            "data:aerodynamics:wing:low_speed:CL_alpha",
+            "data:aerodynamics:wing:low_speed:induced_drag_coefficient",
+            "data:aerodynamics:horizontal_tail:low_speed:CL_alpha",
+        ]:
+            derivative_cs, derivative_fd = _complex_step_vs_finite_difference(problem, of, wrt)
+            assert derivative_cs == pytest.approx(derivative_fd, rel=1e-4, abs=1e-8)
@@ -137,30 +137,22 @@ def tank_volume_distribution(inputs, y_array_orig):
     y_tank_beginning = semi_span * y_ratio_tank_beginning
     y_tank_end = semi_span * y_ratio_tank_end
 
-    y_in_tank_index = np.where((y_array >= y_tank_beginning) & (y_array <= y_tank_end))[0]
-    y_in_tank_array = y_array[y_in_tank_index]
+    in_tank = (y_array >= y_tank_beginning) & (y_array <= y_tank_end)
+    y_in_tank_array = y_array[in_tank]
 
     slope_chord = (tip_chord - root_chord) / (tip_y - root_y)
 
-    chord_array = np.zeros_like(y_array)
-    for y in y_in_tank_array:
-        idx = np.where(y_array == y)[0]
-        if y < root_y:
-            chord_array[idx] = root_chord
-        else:
-            chord_array[idx] = slope_chord * y + root_chord
+    chord_array = np.where(
+        in_tank, np.where(y_array < root_y, root_chord, slope_chord * y_array + root_chord), 0.0
+    )
 
     # Computation of the thickness ratio profile along the span, as tc = slope * y +
     # tc_fuselage_center.
     slope_tc = (tip_tc - root_tc) / (tip_y - root_y)
     # fuselage_center_virtual_tc = 0.5 * (root_tc + tip_tc - slope_tc * (root_y + tip_y))
-    thickness_ratio_array = np.zeros_like(y_array)
-    for y in y_in_tank_array:
-        idx = np.where(y_array == y)[0]
-        if y < root_y:
-            thickness_ratio_array[idx] = root_tc
-        else:
-            thickness_ratio_array[idx] = slope_tc * y + root_tc
+    thickness_ratio_array = np.where(
+        in_tank, np.where(y_array < root_y, root_tc, slope_tc * y_array + root_tc), 0.0
+    )
     # thickness_ratio_array = slope_tc * y_array + fuselage_center_virtual_tc
 
     # The k factor stating the depth of the fuel tanks is included here.
@@ -176,10 +168,10 @@ def tank_volume_distribution(inputs, y_array_orig):
 
     y_eng_array = semi_span * np.array(y_ratio)
 
-    in_eng_nacelle = np.full(len(y_in_tank_array), False)
-    for y_eng in y_eng_array:
-        for i in np.where(abs(y_in_tank_array - y_eng) <= nacelle_width / 2.0):
-            in_eng_nacelle[i] = True
+    in_eng_nacelle = np.any(
+        np.abs(y_in_tank_array - np.ravel(y_eng_array)[:, np.newaxis]) <= nacelle_width / 2.0,
+        axis=0,
+    )
     where_engine = np.where(in_eng_nacelle)
 
     width_array = (
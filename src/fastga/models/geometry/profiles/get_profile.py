@@ -19,13 +19,19 @@ import math
 import warnings
 import logging
 
+import os
 import os.path as pth
 from .profile import Profile
 
 from fastga.models.aerodynamics import resources
+from fastga.utils.profiling import record_cache_access
 
 _LOGGER = logging.getLogger(__name__)
 
+# Profiles read during the session, files are parsed only once unless modified:
+# {profile file path: (modification time, profile with the thickness and chord of the file)}
+_PROFILES = {}
+
 
 def get_profile(
     file_name: str = None,
@@ -33,7 +39,9 @@ def get_profile(
     chord_length=None,
 ) -> Profile:
     """
-    Reads profile from indicated resource file and returns it after resize
+    Reads profile from indicated resource file and returns it after resize. The file is only
+    parsed on first call (or if modified), the returned profile is a copy that can be freely
+    modified.
 
     :param file_name: name of resource (ex: "naca23012.af")
     :param thickness_ratio:
@@ -41,9 +49,7 @@ def get_profile(
     :return: Profile object.
     """
 
-    profile = Profile()
-    x_z = genfromtxt(pth.join(resources.__path__[0], file_name))
-    profile.set_points(x_z["x"], x_z["z"])
+    profile = _read_profile(pth.join(resources.__path__[0], file_name)).copy()
 
     if thickness_ratio:
         if abs(profile.thickness_ratio - thickness_ratio) / thickness_ratio > 0.01:
@@ -60,6 +66,20 @@ def get_profile(
     return profile
 
 
+def _read_profile(file_path: str) -> Profile:
+    """Returns the profile of the file, from the session cache if the file has not changed."""
+    modification_time = os.stat(file_path).st_mtime_ns
+    cached = file_path in _PROFILES and _PROFILES[file_path][0] == modification_time
+    record_cache_access(cached)
+    if not cached:
+        profile = Profile()
+        x_z = genfromtxt(file_path)
+        profile.set_points(x_z["x"], x_z["z"])
+        _PROFILES[file_path] = (modification_time, profile)
+
+    return _PROFILES[file_path][1]
+
+
 def genfromtxt(file_name: str = None) -> pd.DataFrame:
     with open(pth.join(resources.__path__[0], file_name), "r") as lf:
         data = lf.readlines()
@@ -16,7 +16,6 @@ import operator
 import numpy as np
 import pandas as pd
 
-from scipy.interpolate import interp1d
 from collections import namedtuple
 from typing import Sequence, Tuple
 
@@ -28,20 +27,26 @@ THICKNESS = "thickness"
 
 
 class Profile:
-    """Class for managing 2D wing profiles."""
+    """
+    Class for managing 2D wing profiles.
+
+    Mean line and thickness are stored as read-only numpy arrays, the get_*_array methods return
+    the points as (n, 2) arrays. The methods returning DataFrames are kept for compatibility.
+    """
 
     # pylint: disable=invalid-name
     # X and Z are valid names in this context
 
+    __slots__ = ("chord_length", "_x", "_z", "_thickness", "_max_relative_thickness")
+
     def __init__(self, chord_length: float = 0.0):
 
-        self._rel_mean_line_and_thickness = pd.DataFrame(columns=[X, Z, THICKNESS])
-        """
-        Data of mean line and thickness, computed after inputs of :meth:`set_points`_.
-        DataFrame keys are 'x', 'z' and 'thickness'.
-        - 'x' and 'z' are relative to chord_length
-        - 'thickness' is relative to max thickness (and given according to 'x').
-        """
+        # Data of mean line and thickness, computed after inputs of :meth:`set_points`_.
+        # - x and z are relative to chord_length
+        # - thickness is relative to max thickness (and given according to x).
+        self._x = _read_only(np.zeros(0))
+        self._z = _read_only(np.zeros(0))
+        self._thickness = _read_only(np.zeros(0))
 
         self.chord_length: float = chord_length
         # in meters
@@ -49,6 +54,16 @@ class Profile:
         self._max_relative_thickness: float = 0.0
         # max thickness / chord length
 
+    def copy(self) -> "Profile":
+        """Returns an independent copy of the profile, without re-computing the mean line."""
+        profile = Profile(self.chord_length)
+        # Arrays are read-only, they can be shared
+        profile._x = self._x
+        profile._z = self._z
+        profile._thickness = self._thickness
+        profile._max_relative_thickness = self._max_relative_thickness
+        return profile
+
     @property
     def thickness_ratio(self) -> float:
         """thickness-to-chord ratio"""
@@ -60,7 +75,7 @@ class Profile:
         # mean line is modified accordingly
         if self._max_relative_thickness != 0.0:
             coeff = value / self._max_relative_thickness
-            self._rel_mean_line_and_thickness[Z] *= coeff
+            self._z = _read_only(self._z * coeff)
         self._max_relative_thickness = value
 
     def set_points(
@@ -96,13 +111,39 @@ class Profile:
         if not keep_relative_thickness or self.thickness_ratio == 0.0:
             self.thickness_ratio = max_thickness / chord_length
 
+    def get_mean_line_array(self) -> np.ndarray:
+        """Points of mean line of the profile as a (n, 2) array of x and z, given in meters."""
+        return np.column_stack((self._x, self._z)) * self.chord_length
+
+    def get_relative_thickness_array(self) -> np.ndarray:
+        """
+        Points of relative thickness of the profile as a (n, 2) array of x and thickness, relative
+        to chord_length. x is from 0. to 1.
+        """
+        return np.column_stack((self._x, self._thickness * self.thickness_ratio))
+
+    def get_upper_side_array(self) -> np.ndarray:
+        """Points of upper side of the profile as a (n, 2) array of x and z, given in meters."""
+        return self._get_side_points(operator.add)
+
+    def get_lower_side_array(self) -> np.ndarray:
+        """Points of lower side of the profile as a (n, 2) array of x and z, given in meters."""
+        return self._get_side_points(operator.sub)
+
+    def get_sides_array(self) -> np.ndarray:
+        """
+        Points of the whole profile as a (2n-1, 2) array of x and z, given in meters.
+
+        Points are given from trailing edge to trailing edge, starting by upper side.
+        """
+        return np.concatenate((self.get_upper_side_array()[::-1], self.get_lower_side_array()[1:]))
+
     def get_mean_line(self) -> pd.DataFrame:
         """Point set of mean line of the profile.
 
         DataFrame keys are 'x' and 'z', given in meters.
         """
-        mean_line = self._rel_mean_line_and_thickness[[X, Z]] * self.chord_length
-        return mean_line
+        return pd.DataFrame(self.get_mean_line_array(), columns=[X, Z])
 
     def get_relative_thickness(self) -> pd.DataFrame:
         """Point set of relative thickness of the profile.
@@ -110,115 +151,96 @@ class Profile:
         DataFrame keys are 'x' and 'thickness' and are relative to chord_length.
         'x' is form 0. to 1.
         """
-        return self._rel_mean_line_and_thickness[[X, THICKNESS]] * [1.0, self.thickness_ratio]
+        return pd.DataFrame(self.get_relative_thickness_array(), columns=[X, THICKNESS])
 
     def get_upper_side(self) -> pd.DataFrame:
         """Point set of upper side of the profile.
 
         DataFrame keys are 'x' and 'z', given in meters.
         """
-        return self._get_side_points(operator.add)
+        return pd.DataFrame(self.get_upper_side_array(), columns=[X, Z])
 
     def get_lower_side(self) -> pd.DataFrame:
         """Point set of lower side of the profile.
 
         DataFrame keys are 'x' and 'z', given in meters.
         """
-        return self._get_side_points(operator.sub)
+        return pd.DataFrame(self.get_lower_side_array(), columns=[X, Z])
 
     def get_sides(self) -> pd.DataFrame:
         """Point set of the whole profile
 
         Points are given from trailing edge to trailing edge, starting by upper side.
         """
-        return pd.concat(
-            [self.get_upper_side().sort_values(by=X, ascending=False), self.get_lower_side()[1:]]
-        )
+        point_count = len(self._x)
+        index = np.concatenate((np.arange(point_count)[::-1], np.arange(1, point_count)))
+        return pd.DataFrame(self.get_sides_array(), columns=[X, Z], index=index)
 
-    def _get_side_points(self, operator_) -> pd.DataFrame:
+    def _get_side_points(self, operator_) -> np.ndarray:
         """
         Computes upper or lower side points.
 
         operator_ ==  operator.add() -> upper side
         operator_ ==  operator.sub() -> lower side
         """
-        mean_line = self._rel_mean_line_and_thickness[[X, Z]]
-        half_thickness = pd.DataFrame().reindex_like(mean_line)
-        half_thickness[X] = 0.0
-        half_thickness[Z] = (
-            self._rel_mean_line_and_thickness[THICKNESS] / 2.0 * self.thickness_ratio
-        )
-        points = operator_(mean_line, half_thickness) * self.chord_length
-        return points
+        half_thickness = self._thickness / 2.0 * self.thickness_ratio
+        return np.column_stack((self._x, operator_(self._z, half_thickness))) * self.chord_length
 
     def _compute_mean_line_and_thickness(
-        self, upper_side_points, lower_side_points
+        self, upper_side_points: np.ndarray, lower_side_points: np.ndarray
     ) -> Tuple[float, float]:
         """
-        Computes mean line and thickness from upper_side_points and lower_side_points.
+        Computes mean line and thickness from upper_side_points and lower_side_points, (n, 2)
+        arrays of x and z sorted by x.
 
-        Fills self._rel_mean_line_and_thickness with relative values.
+        Fills mean line and thickness arrays with relative values.
         Returns actual chord length and maximum thickness (in meters)
         """
-        x_up_vect = list(np.array(upper_side_points[X]).tolist())
-        x_lo_vect = list(np.array(lower_side_points[X]).tolist())
-        x_start = (np.logspace(0, 1, 15) - 1) / 9.0 * (
-            0.1 - max(min(x_up_vect), min(x_lo_vect))
-        ) + max(min(x_up_vect), min(x_lo_vect))
-        x_interp = np.append(x_start, np.linspace(0.13, min(max(x_up_vect), max(x_lo_vect)), 25))
-        interp_lower = interp1d(lower_side_points[X], lower_side_points[Z], kind="slinear")
-        interp_upper = interp1d(upper_side_points[X], upper_side_points[Z], kind="slinear")
-        z_sides = pd.DataFrame(
-            {"z_lower": interp_lower(x_interp), "z_upper": interp_upper(x_interp)}
+        x_up_vect = upper_side_points[:, 0]
+        x_lo_vect = lower_side_points[:, 0]
+        x_min = max(np.min(x_up_vect), np.min(x_lo_vect))
+        x_start = (np.logspace(0, 1, 15) - 1) / 9.0 * (0.1 - x_min) + x_min
+        x_interp = np.append(
+            x_start, np.linspace(0.13, min(np.max(x_up_vect), np.max(x_lo_vect)), 25)
         )
-        z = z_sides.mean(axis=1)
-        thickness = z_sides.diff(axis=1).iloc[:, -1]
+        z_lower = np.interp(x_interp, x_lo_vect, lower_side_points[:, 1])
+        z_upper = np.interp(x_interp, x_up_vect, upper_side_points[:, 1])
+        z = (z_lower + z_upper) / 2.0
+        thickness = z_upper - z_lower
 
         chord_length = np.max(x_interp) - np.min(x_interp)
         max_thickness = np.max(thickness)
-        self._rel_mean_line_and_thickness = pd.DataFrame(
-            data={
-                X: (x_interp / chord_length).tolist(),
-                Z: (z / chord_length).tolist(),
-                THICKNESS: (thickness / max_thickness).tolist(),
-            }
-        )
+        self._x = _read_only(x_interp / chord_length)
+        self._z = _read_only(z / chord_length)
+        self._thickness = _read_only(thickness / max_thickness)
         return chord_length, max_thickness
 
     @staticmethod
-    def _create_upper_lower_sides(x: Sequence, z: Sequence) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """returns upper side points and lower side points using provided x and z"""
+    def _create_upper_lower_sides(x: Sequence, z: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        returns upper side points and lower side points using provided x and z, as (n, 2) arrays
+        sorted by x without duplicated points
+        """
 
         # Find middle point (inversion of delta_x locally for 1-0-1 (or 0-1-0) chord struct. or
         # permanently for 0-1/0-1 (or 1-0/1-0) chord struct.)
-        x_vect = np.array(x)
+        x_vect = np.array(x, dtype=float)
+        z_vect = np.array(z, dtype=float)
         if x_vect[0] > x_vect[1]:
             list_index = np.where(x_vect[0 : len(x_vect) - 1] < x_vect[1 : len(x_vect)])[0].tolist()
         else:
             list_index = np.where(x_vect[0 : len(x_vect) - 1] > x_vect[1 : len(x_vect)])[0].tolist()
         index = int(list_index[0] + 1)
 
-        if index is None:
-            side1 = pd.DataFrame({X: x, Z: z})
-            # noinspection PyTypeChecker
-            side2 = pd.DataFrame({X: x, Z: -1.0 * z})
-        else:
-            side1 = pd.DataFrame({X: x[0:index], Z: z[0:index]})
-            side2 = pd.DataFrame({X: x[index:], Z: z[index:]})
-
-        side1.sort_values(by=X, inplace=True)
-        side2.sort_values(by=X, inplace=True)
+        # Sorting by x (then z) and removing duplicated points
+        side1 = np.unique(np.column_stack((x_vect[0:index], z_vect[0:index])), axis=0)
+        side2 = np.unique(np.column_stack((x_vect[index:], z_vect[index:])), axis=0)
 
-        if np.max(side1[Z]) > np.max(side2[Z]):
-            upper_side_points = side1
-            lower_side_points = side2
-        else:
-            upper_side_points = side2
-            lower_side_points = side1
+        if np.max(side1[:, 1]) > np.max(side2[:, 1]):
+            return side1, side2
+        return side2, side1
 
-        upper_side_points.drop_duplicates(inplace=True)
-        lower_side_points.drop_duplicates(inplace=True)
-        upper_side_points.reset_index(drop=True, inplace=True)
-        lower_side_points.reset_index(drop=True, inplace=True)
 
-        return upper_side_points, lower_side_points
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
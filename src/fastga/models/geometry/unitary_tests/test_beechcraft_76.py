@@ -59,6 +59,8 @@ from ..geom_components.landing_gears.compute_lg import ComputeLGGeometry
 from ..geom_components.wing_tank import ComputeMFWSimple, ComputeMFWAdvanced
 from ..geom_components import ComputeTotalArea
 from ..geometry import GeometryFixedFuselage, GeometryFixedTailDistance
+from ..profiles import get_profile as get_profile_module
+from ..profiles.get_profile import get_profile
 
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
 
@@ -608,3 +610,49 @@ def test_complete_geometry_FL():
     problem = run_system(GeometryFixedFuselage(propulsion_id=ENGINE_WRAPPER), ivc)
     total_surface = problem.get_val("data:geometry:aircraft:wet_area", units="m**2")
     assert total_surface == pytest.approx(80.932, abs=1e-3)
+
+
+def test_profile_cache(monkeypatch):
+    """Tests that airfoil files are parsed once and that returned profiles are independent."""
+
+    get_profile_module._PROFILES.clear()
+    parsed_files = []
+    genfromtxt = get_profile_module.genfromtxt
+
+    def counting_genfromtxt(file_name):
+        parsed_files.append(file_name)
+        return genfromtxt(file_name)
+
+    monkeypatch.setattr(get_profile_module, "genfromtxt", counting_genfromtxt)
+
+    profile = get_profile(file_name="naca23012.af", thickness_ratio=0.15, chord_length=2.0)
+    assert profile.thickness_ratio == pytest.approx(0.15, abs=1e-9)
+    assert profile.chord_length == pytest.approx(2.0, abs=1e-9)
+    assert np.max(profile.get_upper_side()["x"]) == pytest.approx(2.0, rel=1e-3)
+
+    # Resize of the first profile should not modify the cached one
+    profile.thickness_ratio = 0.09
+    new_profile = get_profile(file_name="naca23012.af")
+    assert len(parsed_files) == 1
+    assert new_profile.thickness_ratio == pytest.approx(0.12, abs=1e-3)
+    assert new_profile.chord_length == pytest.approx(0.9973, abs=1e-4)
+
+
+def test_profile_arrays():
+    """Tests that array accessors of the profile are consistent with the DataFrame ones."""
+
+    profile = get_profile(file_name="naca23012.af", thickness_ratio=0.15, chord_length=2.0)
+    sides = profile.get_sides_array()
+    assert sides.shape == (79, 2)
+    assert np.array_equal(sides, profile.get_sides().to_numpy())
+    # From trailing edge to trailing edge, starting by upper side
+    assert sides[0, 0] == pytest.approx(2.0, rel=1e-3)
+    assert sides[39, 0] == pytest.approx(0.0, abs=1e-3)
+    assert np.max(sides[:40, 1]) > np.max(sides[40:, 1])
+    assert np.array_equal(profile.get_mean_line_array(), profile.get_mean_line().to_numpy())
+    relative_thickness = profile.get_relative_thickness_array()
+    assert np.max(relative_thickness[:, 1]) == pytest.approx(0.15, abs=1e-9)
+    assert np.array_equal(relative_thickness, profile.get_relative_thickness().to_numpy())
+    upper_side = profile.get_upper_side_array()
+    lower_side = profile.get_lower_side_array()
+    assert np.max(upper_side[:, 1] - lower_side[:, 1]) == pytest.approx(0.3, abs=1e-9)
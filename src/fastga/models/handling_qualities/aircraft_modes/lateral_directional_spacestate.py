@@ -16,6 +16,8 @@ import math
 
 from openmdao.core.explicitcomponent import ExplicitComponent
 
+from .longitudinal_spacestate import oscillatory_mode_characteristics
+
 
 class LateralDirectionalSpaceStateMatrix(ExplicitComponent):
     # TODOC
@@ -23,46 +25,53 @@ class LateralDirectionalSpaceStateMatrix(ExplicitComponent):
     Dimensional Lateral-Directional Equations of motion in State-Space form.
     DX = AX + BU where X = {beta, p, r, phi}
     Y = CX + DU
+
+    As for the longitudinal modes, the flight_point_count option allows computing the modes of
+    several points of the flight envelope in a single call.
     """
+    def initialize(self):
+        self.options.declare("flight_point_count", default=1, types=int)
+
     def setup(self):
+        n = self.options["flight_point_count"]
 
-        self.add_input("data:reference_flight_condition:CL", val=np.nan)
-        self.add_input("data:reference_flight_condition:air_density", val=np.nan, units="slug/ft**3")
-        self.add_input("data:reference_flight_condition:theta", val=np.nan, units="deg")
-        self.add_input("data:reference_flight_condition:weight", val=np.nan, units="slug")
-        self.add_input("data:reference_flight_condition:Ixx", val=np.nan, units="slug*ft**2")
-        self.add_input("data:reference_flight_condition:Izz", val=np.nan, units="slug*ft**2")
-        self.add_input("data:reference_flight_condition:Ixz", val=np.nan, units="slug*ft**2")
-        self.add_input("data:reference_flight_condition:speed", val=np.nan, units="ft/s")
+        self.add_input("data:reference_flight_condition:CL", shape=n, val=np.nan)
+        self.add_input("data:reference_flight_condition:air_density", shape=n, val=np.nan, units="slug/ft**3")
+        self.add_input("data:reference_flight_condition:theta", shape=n, val=np.nan, units="deg")
+        self.add_input("data:reference_flight_condition:weight", shape=n, val=np.nan, units="slug")
+        self.add_input("data:reference_flight_condition:Ixx", shape=n, val=np.nan, units="slug*ft**2")
+        self.add_input("data:reference_flight_condition:Izz", shape=n, val=np.nan, units="slug*ft**2")
+        self.add_input("data:reference_flight_condition:Ixz", shape=n, val=np.nan, units="slug*ft**2")
+        self.add_input("data:reference_flight_condition:speed", shape=n, val=np.nan, units="ft/s")
 
         self.add_input("data:geometry:wing:area", val=np.nan, units="ft**2")
         self.add_input("data:geometry:wing:span", val=np.nan, units="ft")
 
-        self.add_input("data:handling_qualities:lateral:derivatives:CY:beta", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:lateral:derivatives:CY:rollrate", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:lateral:derivatives:CY:yawrate", val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:CY:beta", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:CY:rollrate", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:CY:yawrate", shape=n, val=np.nan, units="rad**-1")
 
-        self.add_input("data:handling_qualities:lateral:derivatives:Cl:beta", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:lateral:derivatives:Cl:rollrate", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:lateral:derivatives:Cl:yawrate", val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:Cl:beta", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:Cl:rollrate", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:Cl:yawrate", shape=n, val=np.nan, units="rad**-1")
 
-        self.add_input("data:handling_qualities:lateral:derivatives:Cn:beta", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:lateral:derivatives:Cn:rollrate", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:lateral:derivatives:Cn:yawrate", val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:Cn:beta", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:Cn:rollrate", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:lateral:derivatives:Cn:yawrate", shape=n, val=np.nan, units="rad**-1")
 
-        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:real_part", units="s**-1")
-        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:imag_part", units="s**-1")
-        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:damping_ratio")
-        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:undamped_frequency", units="s**-1")
-        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:period", units="s")
-        self.add_output("data:handling_qualities:lateral:modes:roll:real_part", units="s**-1")
-        self.add_output("data:handling_qualities:lateral:modes:roll:imag_part", units="s**-1")
-        self.add_output("data:handling_qualities:lateral:modes:roll:time_half", units="s")
-        self.add_output("data:handling_qualities:lateral:modes:roll:time_double", units="s")
-        self.add_output("data:handling_qualities:lateral:modes:spiral:real_part", units="s**-1")
-        self.add_output("data:handling_qualities:lateral:modes:spiral:imag_part", units="s**-1")
-        self.add_output("data:handling_qualities:lateral:modes:spiral:time_half", units="s")
-        self.add_output("data:handling_qualities:lateral:modes:spiral:time_double", units="s")
+        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:real_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:imag_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:damping_ratio", shape=n)
+        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:undamped_frequency", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:lateral:modes:dutch_roll:period", shape=n, units="s")
+        self.add_output("data:handling_qualities:lateral:modes:roll:real_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:lateral:modes:roll:imag_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:lateral:modes:roll:time_half", shape=n, units="s")
+        self.add_output("data:handling_qualities:lateral:modes:roll:time_double", shape=n, units="s")
+        self.add_output("data:handling_qualities:lateral:modes:spiral:real_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:lateral:modes:spiral:imag_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:lateral:modes:spiral:time_half", shape=n, units="s")
+        self.add_output("data:handling_qualities:lateral:modes:spiral:time_double", shape=n, units="s")
 
 
 
@@ -116,59 +125,36 @@ class LateralDirectionalSpaceStateMatrix(ExplicitComponent):
 
         g = 32.174   # gravity acceleration in imperial units (ft/s**2)
 
-        a11 = float(Y_beta / u_s)
-        a12 = float(Y_p / u_s)
-        a13 = float(Y_r / u_s - 1.0)
-        a14 = float(g * math.cos(theta_s) / u_s)
-
-        a21 = float((L_beta + i_x * N_beta) / (1 - i_x * i_z))
-        a22 = float((L_p + i_x * N_p) / (1 - i_x * i_z))
-        a23 = float((L_r + i_x * N_r) / (1 - i_x * i_z))
-        a24 = 0.0
+        a_matrix = np.zeros((len(u_s), 4, 4))
+        a_matrix[:, 0, 0] = Y_beta / u_s
+        a_matrix[:, 0, 1] = Y_p / u_s
+        a_matrix[:, 0, 2] = Y_r / u_s - 1.0
+        a_matrix[:, 0, 3] = g * np.cos(theta_s) / u_s
 
-        a31 = float((N_beta + i_z * L_beta) / (1 - i_x * i_z))
-        a32 = float((N_p + i_z * L_p) / (1 - i_x * i_z))
-        a33 = float((N_r + i_z * L_r) / (1 - i_x * i_z))
-        a34 = 0.0
+        a_matrix[:, 1, 0] = (L_beta + i_x * N_beta) / (1 - i_x * i_z)
+        a_matrix[:, 1, 1] = (L_p + i_x * N_p) / (1 - i_x * i_z)
+        a_matrix[:, 1, 2] = (L_r + i_x * N_r) / (1 - i_x * i_z)
 
-        a41 = 0.0
-        a42 = 1.0
-        a43 = 0.0
-        a44 = 0.0
+        a_matrix[:, 2, 0] = (N_beta + i_z * L_beta) / (1 - i_x * i_z)
+        a_matrix[:, 2, 1] = (N_p + i_z * L_p) / (1 - i_x * i_z)
+        a_matrix[:, 2, 2] = (N_r + i_z * L_r) / (1 - i_x * i_z)
 
-        A = np.array([[a11, a12, a13, a14],
-                      [a21, a22, a23, a24],
-                      [a31, a32, a33, a34],
-                      [a41, a42, a43, a44]])
+        a_matrix[:, 3, 1] = 1.0
 
 
         ###### LATERAL-DIRECTIONAL MODES ######
         # TODO: raise exception or warning if any of the eigenvalues does not have the expected form (real or imaginary)
-        # Obtaining eigenvalues from matrix A
-        w, v = np.linalg.eig(A)
-        w.sort()
+        # Obtaining eigenvalues from the matrices of all flight points at once
+        w = np.sort(np.linalg.eigvals(a_matrix), axis=-1)
 
         ## Dutch-roll mode ##
-        w_dr = w[2]
-        real_dr = w_dr.real
-        imag_dr = w_dr.imag
-        wn_dr = math.sqrt(real_dr**2 + imag_dr**2)
-        damp_dr = - real_dr / math.sqrt(real_dr**2 + imag_dr**2)
-        period_dr = 2*math.pi / imag_dr
+        real_dr, imag_dr, damp_dr, wn_dr, period_dr = oscillatory_mode_characteristics(w[:, 2])
 
         ## Roll mode ##
-        w_roll = w[0]
-        real_roll = w_roll.real
-        imag_roll = w_roll.imag
-        t_half_roll = - math.log(2) / real_roll
-        t_double_roll = math.log(2) / real_roll
+        real_roll, imag_roll, t_half_roll, t_double_roll = aperiodic_mode_characteristics(w[:, 0])
 
         ## Spiral mode ##
-        w_spi = w[3]
-        real_spi = w_spi.real
-        imag_spi = w_spi.imag
-        t_half_spi = - math.log(2) / real_spi
-        t_double_spi = math.log(2) / real_spi
+        real_spi, imag_spi, t_half_spi, t_double_spi = aperiodic_mode_characteristics(w[:, 3])
 
         outputs["data:handling_qualities:lateral:modes:dutch_roll:real_part"] = real_dr
         outputs["data:handling_qualities:lateral:modes:dutch_roll:imag_part"] = imag_dr
@@ -185,3 +171,15 @@ class LateralDirectionalSpaceStateMatrix(ExplicitComponent):
         outputs["data:handling_qualities:lateral:modes:spiral:time_double"] = t_double_spi
 
 
+def aperiodic_mode_characteristics(eigenvalues: np.ndarray):
+    """
+    :param eigenvalues: array of the eigenvalues of the mode, one per flight point.
+    :return: real part, imaginary part, time to half and time to double amplitude of the mode.
+    """
+    real_part = eigenvalues.real
+    imag_part = eigenvalues.imag
+    with np.errstate(divide="ignore"):
+        time_half = - math.log(2) / real_part
+        time_double = math.log(2) / real_part
+
+    return real_part, imag_part, time_half, time_double
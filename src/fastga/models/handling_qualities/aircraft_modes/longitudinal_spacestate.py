@@ -26,49 +26,59 @@ class LongitudinalSpaceStateMatrix(om.ExplicitComponent):
     Dimensional Longitudinal Equations of motion in State-Space form.
     DX = AX + BU where X = {u, alpha, q, theta}
     Y = CX + DU
+
+    With the flight_point_count option, the reference flight condition and the derivatives are
+    arrays describing several points of the flight envelope (e.g. different speeds, altitudes,
+    masses and CG positions): the state matrices are stacked and all the eigenproblems are solved
+    in a single batched call, the modes outputs having one value per point.
     """
 
+    def initialize(self):
+        self.options.declare("flight_point_count", default=1, types=int)
+
     def setup(self):
+        n = self.options["flight_point_count"]
+
         # Reference Flight Conditions
-        self.add_input("data:reference_flight_condition:CL", val=np.nan)
-        self.add_input("data:reference_flight_condition:CD", val=np.nan)
-        self.add_input("data:reference_flight_condition:CT", val=np.nan)
-        self.add_input("data:reference_flight_condition:air_density", val=np.nan, units="slug/ft**3")
-        self.add_input("data:reference_flight_condition:theta", val=np.nan, units="deg")
-        self.add_input("data:reference_flight_condition:weight", val=np.nan, units="slug")
-        self.add_input("data:reference_flight_condition:Iyy", val=np.nan, units="slug*ft**2")
-        self.add_input("data:reference_flight_condition:speed", val=np.nan, units="ft/s")
+        self.add_input("data:reference_flight_condition:CL", shape=n, val=np.nan)
+        self.add_input("data:reference_flight_condition:CD", shape=n, val=np.nan)
+        self.add_input("data:reference_flight_condition:CT", shape=n, val=np.nan)
+        self.add_input("data:reference_flight_condition:air_density", shape=n, val=np.nan, units="slug/ft**3")
+        self.add_input("data:reference_flight_condition:theta", shape=n, val=np.nan, units="deg")
+        self.add_input("data:reference_flight_condition:weight", shape=n, val=np.nan, units="slug")
+        self.add_input("data:reference_flight_condition:Iyy", shape=n, val=np.nan, units="slug*ft**2")
+        self.add_input("data:reference_flight_condition:speed", shape=n, val=np.nan, units="ft/s")
 
         self.add_input("data:geometry:wing:MAC:length", val=np.nan, units="ft")
         self.add_input("data:geometry:wing:area", val=np.nan, units="ft**2")
 
-        self.add_input("data:handling_qualities:longitudinal:derivatives:CL:speed", val=np.nan)
-        self.add_input("data:handling_qualities:longitudinal:derivatives:CD:speed", val=np.nan)
-        self.add_input("data:handling_qualities:longitudinal:derivatives:Cm:speed", val=np.nan)
-        self.add_input("data:handling_qualities:longitudinal:derivatives:thrust:CX:speed", val=0.0)
-        self.add_input("data:handling_qualities:longitudinal:derivatives:thrust:Cm:speed", val=0.0)
+        self.add_input("data:handling_qualities:longitudinal:derivatives:CL:speed", shape=n, val=np.nan)
+        self.add_input("data:handling_qualities:longitudinal:derivatives:CD:speed", shape=n, val=np.nan)
+        self.add_input("data:handling_qualities:longitudinal:derivatives:Cm:speed", shape=n, val=np.nan)
+        self.add_input("data:handling_qualities:longitudinal:derivatives:thrust:CX:speed", shape=n, val=0.0)
+        self.add_input("data:handling_qualities:longitudinal:derivatives:thrust:Cm:speed", shape=n, val=0.0)
 
-        self.add_input("data:handling_qualities:longitudinal:derivatives:CD:alpha", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:longitudinal:derivatives:CL:alpha", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:longitudinal:derivatives:Cm:alpha", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:longitudinal:derivatives:thrust:Cm:alpha", val=0.0, units="rad**-1")
+        self.add_input("data:handling_qualities:longitudinal:derivatives:CD:alpha", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:longitudinal:derivatives:CL:alpha", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:longitudinal:derivatives:Cm:alpha", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:longitudinal:derivatives:thrust:Cm:alpha", shape=n, val=0.0, units="rad**-1")
 
-        self.add_input("data:handling_qualities:longitudinal:derivatives:CL:alpharate", val=0.0, units="rad**-1")
-        self.add_input("data:handling_qualities:longitudinal:derivatives:Cm:alpharate", val=0.0, units="rad**-1")
+        self.add_input("data:handling_qualities:longitudinal:derivatives:CL:alpharate", shape=n, val=0.0, units="rad**-1")
+        self.add_input("data:handling_qualities:longitudinal:derivatives:Cm:alpharate", shape=n, val=0.0, units="rad**-1")
 
-        self.add_input("data:handling_qualities:longitudinal:derivatives:CL:pitchrate", val=np.nan, units="rad**-1")
-        self.add_input("data:handling_qualities:longitudinal:derivatives:Cm:pitchrate", val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:longitudinal:derivatives:CL:pitchrate", shape=n, val=np.nan, units="rad**-1")
+        self.add_input("data:handling_qualities:longitudinal:derivatives:Cm:pitchrate", shape=n, val=np.nan, units="rad**-1")
 
-        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:real_part", units="s**-1")
-        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:imag_part", units="s**-1")
-        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:damping_ratio")
-        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:undamped_frequency", units="s**-1")
-        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:period", units="s")
-        self.add_output("data:handling_qualities:longitudinal:modes:short_period:real_part", units="s**-1")
-        self.add_output("data:handling_qualities:longitudinal:modes:short_period:imag_part", units="s**-1")
-        self.add_output("data:handling_qualities:longitudinal:modes:short_period:damping_ratio")
-        self.add_output("data:handling_qualities:longitudinal:modes:short_period:undamped_frequency", units="s**-1")
-        self.add_output("data:handling_qualities:longitudinal:modes:short_period:period", units="s")
+        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:real_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:imag_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:damping_ratio", shape=n)
+        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:undamped_frequency", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:longitudinal:modes:phugoid:period", shape=n, units="s")
+        self.add_output("data:handling_qualities:longitudinal:modes:short_period:real_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:longitudinal:modes:short_period:imag_part", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:longitudinal:modes:short_period:damping_ratio", shape=n)
+        self.add_output("data:handling_qualities:longitudinal:modes:short_period:undamped_frequency", shape=n, units="s**-1")
+        self.add_output("data:handling_qualities:longitudinal:modes:short_period:period", shape=n, units="s")
 
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
@@ -156,62 +166,42 @@ class LongitudinalSpaceStateMatrix(om.ExplicitComponent):
         g = 32.174   # gravity acceleration in imperial units (ft/s**2)
 
         # Building the matrix (Roskam)
-        a11 = float(X_u)
-        a12 = float(X_a)
-        a13 = 0.0
-        a14 = float(-g*math.cos(theta_s))
-
-        a21 = float(Z_u / (u_s - Z_a_dot))
-        a22 = float(Z_a / (u_s - Z_a_dot))
-        a23 = float((u_s + Z_q) / (u_s - Z_a_dot))
-        a24 = float(-g*math.sin(theta_s) / (u_s - Z_a_dot))
-
-        a31 = float(M_u + M_a_dot * Z_u / (u_s - Z_a_dot))
-        a32 = float(M_a + M_a_dot * Z_a / (u_s - Z_a_dot))
-        a33 = float(M_q + M_a_dot * (u_s + Z_q) / (u_s - Z_a_dot))
-        a34 = float(- M_a_dot * g * math.sin(theta_s) / (u_s - Z_a_dot))
-
-        a41 = 0.0
-        a42 = 0.0
-        a43 = 1.0
-        a44 = 0.0
+        a_matrix = np.zeros((len(u_s), 4, 4))
+        a_matrix[:, 0, 0] = X_u
+        a_matrix[:, 0, 1] = X_a
+        a_matrix[:, 0, 3] = -g*np.cos(theta_s)
+
+        a_matrix[:, 1, 0] = Z_u / (u_s - Z_a_dot)
+        a_matrix[:, 1, 1] = Z_a / (u_s - Z_a_dot)
+        a_matrix[:, 1, 2] = (u_s + Z_q) / (u_s - Z_a_dot)
+        a_matrix[:, 1, 3] = -g*np.sin(theta_s) / (u_s - Z_a_dot)
+
+        a_matrix[:, 2, 0] = M_u + M_a_dot * Z_u / (u_s - Z_a_dot)
+        a_matrix[:, 2, 1] = M_a + M_a_dot * Z_a / (u_s - Z_a_dot)
+        a_matrix[:, 2, 2] = M_q + M_a_dot * (u_s + Z_q) / (u_s - Z_a_dot)
+        a_matrix[:, 2, 3] = - M_a_dot * g * np.sin(theta_s) / (u_s - Z_a_dot)
+
+        a_matrix[:, 3, 2] = 1.0
 
         # b11 =
         # b21 =
         # b31 =
         # b41 = 0.0
 
-        A = np.array([
-            [a11, a12, a13, a14],
-            [a21, a22, a23, a24],
-            [a31, a32, a33, a34],
-            [a41, a42, a43, a44]])
-
         # B = np.array([b11],[b21],[b31],[b41])
 
         ###### LONGITUDINAL MODES ######
-        # Obtaining eigenvalues from matrix A
-        w, v = np.linalg.eig(A)
-        w.sort()
+        # Obtaining eigenvalues from the matrices of all flight points at once
+        w = np.sort(np.linalg.eigvals(a_matrix), axis=-1)
         # t_adim = c / (2*u_s)
         # w = w / t_adim
 
         # Selection of the eigenvalues of each mode
         ## Short period mode ##
-        w_sp = w[1]
-        real_sp = w_sp.real
-        imag_sp = w_sp.imag
-        wn_sp = math.sqrt(real_sp**2 + imag_sp**2)
-        damp_sp = - real_sp / math.sqrt(real_sp**2 + imag_sp**2)
-        period_sp = 2*math.pi / imag_sp
+        real_sp, imag_sp, damp_sp, wn_sp, period_sp = oscillatory_mode_characteristics(w[:, 1])
 
         ## Phugoid mode ##
-        w_ph = w[3]
-        real_ph = w_ph.real
-        imag_ph = w_ph.imag
-        wn_ph = math.sqrt(real_ph**2 + imag_ph**2)
-        damp_ph = - real_ph / math.sqrt(real_ph**2 + imag_ph**2)
-        period_ph = 2*math.pi / imag_ph
+        real_ph, imag_ph, damp_ph, wn_ph, period_ph = oscillatory_mode_characteristics(w[:, 3])
 
         outputs["data:handling_qualities:longitudinal:modes:phugoid:real_part"] = real_ph
         outputs["data:handling_qualities:longitudinal:modes:phugoid:imag_part"] = imag_ph
@@ -225,3 +215,17 @@ class LongitudinalSpaceStateMatrix(om.ExplicitComponent):
         outputs["data:handling_qualities:longitudinal:modes:short_period:period"] = period_sp
 
 
+def oscillatory_mode_characteristics(eigenvalues: np.ndarray):
+    """
+    :param eigenvalues: array of the eigenvalues of the mode, one per flight point.
+    :return: real part, imaginary part, damping ratio, undamped frequency and period of the mode.
+    A period is infinite if the corresponding eigenvalue is real.
+    """
+    real_part = eigenvalues.real
+    imag_part = eigenvalues.imag
+    undamped_frequency = np.abs(eigenvalues)
+    with np.errstate(divide="ignore"):
+        damping_ratio = - real_part / undamped_frequency
+        period = 2*math.pi / imag_part
+
+    return real_part, imag_part, damping_ratio, undamped_frequency, period
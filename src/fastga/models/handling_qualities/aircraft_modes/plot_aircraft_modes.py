@@ -13,7 +13,6 @@
 
 import openmdao.api as om
 import numpy as np
-import matplotlib.pyplot as plt
 import os
 
 
@@ -51,8 +50,11 @@ class PlotAircraftModes(om.ExplicitComponent):
         imag_parts = [imag_ph, imag_sp, imag_dr, imag_roll, imag_spiral]
 
         ### PLOT ###
-        # fig, ax = plt.subplots(figsize=(11.2, 8.4))
-        fig, ax = plt.subplots()
+        from matplotlib.figure import Figure
+
+        # fig = Figure(figsize=(11.2, 8.4))
+        fig = Figure()
+        ax = fig.subplots()
         ax.set_title("Aircraft Modes in the s-plane")
         ax.set_xlabel(r"$n$")
         ax.set_ylabel(r"$jw$")
@@ -15,17 +15,18 @@ import math
 import os
 import openmdao.api as om
 import numpy as np
-import matplotlib.pyplot as plt
 from openmdao.utils.file_wrap import InputFileGenerator
 from importlib.resources import path
 from ... import resources as local_resources
+from ..mode_check import ModeCheck, get_plot_path
 
 
-class CheckDutchRoll(om.ExplicitComponent):
+class CheckDutchRoll(ModeCheck):
     """
     # TODOC:
     """
     def initialize(self):
+        super().initialize()
         self.options.declare("result_folder_path", default="", types=str)
 
     def setup(self):
@@ -71,8 +72,15 @@ class CheckDutchRoll(om.ExplicitComponent):
             z_dr, wn_dr, z_wn_dr, level_1_dr_reqs, level_2_dr_reqs, level_3_dr_reqs)
 
 
-        ### PLOT ###
-        self.plot_s_plane(real_dr, imag_dr, level_1_dr_reqs, level_2_dr_reqs, level_3_dr_reqs, results_folder_path)
+        ### RECORD ###
+        # Plots are drawn afterwards from the recorded results (see plot_check_modes)
+        self.record_check(
+            real_part=real_dr, imag_part=imag_dr, damping_ratio=z_dr, undamped_frequency=wn_dr,
+            damping_ratio_frequency_product=z_wn_dr, level_1_requirements=level_1_dr_reqs,
+            level_2_requirements=level_2_dr_reqs, level_3_requirements=level_3_dr_reqs,
+            damping_ratio_satisfaction_level=check_damping_ratio,
+            undamped_frequency_satisfaction_level=check_undamped_frequency,
+            damping_ratio_frequency_product_satisfaction_level=check_product)
 
         ### WRITE RESULTS ###
         self.write_results(
@@ -179,8 +187,17 @@ class CheckDutchRoll(om.ExplicitComponent):
 
         return check_damping_ratio, check_undamped_frequency, check_product
 
+    def plot_check(self, record, results_folder_path, plot_name_suffix=""):
+
+        return [
+            self.plot_s_plane(
+                record["real_part"], record["imag_part"], record["level_1_requirements"],
+                record["level_2_requirements"], record["level_3_requirements"], results_folder_path,
+                plot_name_suffix),
+        ]
+
     @staticmethod
-    def plot_s_plane(real_dr, imag_dr, level_1_dr_reqs, level_2_dr_reqs, level_3_dr_reqs, results_folder_path):
+    def plot_s_plane(real_dr, imag_dr, level_1_dr_reqs, level_2_dr_reqs, level_3_dr_reqs, results_folder_path, plot_name_suffix=""):
 
         def get_damping_limits(damping_ratio):
             phi = math.asin(damping_ratio)
@@ -218,8 +235,11 @@ class CheckDutchRoll(om.ExplicitComponent):
 
         ### PLOT ###
         ### s-plane ###
-        # fig, ax = plt.subplots(figsize=(11.2, 8.4))
-        fig, ax = plt.subplots()
+        from matplotlib.figure import Figure
+
+        # fig = Figure(figsize=(11.2, 8.4))
+        fig = Figure()
+        ax = fig.subplots()
         ax.set_title("Check of Dutch Roll Characteristics Versus Flying Quality Requirements")
         ax.set_xlabel(r"$n$")
         ax.set_ylabel(r"$jw$")
@@ -261,14 +281,10 @@ class CheckDutchRoll(om.ExplicitComponent):
         ax.set_ybound(-0.5, 4.0)
         # plt.show()
 
-        results_dir = results_folder_path
-        plots_dir = os.path.join(results_dir, 'Check Modes Plots/')
-        plot_name = "dutch_roll_s-plane.png"
-
-        if not os.path.isdir(plots_dir):
-            os.makedirs(plots_dir)
+        plot_path = get_plot_path(results_folder_path, "dutch_roll_s-plane" + plot_name_suffix + ".png")
+        fig.savefig(plot_path)
 
-        fig.savefig(plots_dir + plot_name)
+        return plot_path
 
         return
 
@@ -14,18 +14,19 @@
 import os
 import openmdao.api as om
 import numpy as np
-import matplotlib.pyplot as plt
 from importlib.resources import path
 from ... import resources as local_resources
+from ..mode_check import ModeCheck, get_plot_path
 
 from openmdao.utils.file_wrap import InputFileGenerator
 
 
-class CheckRollMode(om.ExplicitComponent):
+class CheckRollMode(ModeCheck):
     """
     # TODOC:
     """
     def initialize(self):
+        super().initialize()
         self.options.declare("result_folder_path", default="", types=str)
 
     def setup(self):
@@ -57,8 +58,10 @@ class CheckRollMode(om.ExplicitComponent):
         # CHECK REQUIREMENTS
         check_time_constant = self.check_roll_mode_requirements(time_constant_roll, tc_roll_req)
 
-        # PLOT S-PLANE
-        self.plot_s_plane(real_roll, imag_roll, tc_roll_req, results_folder_path)
+        # RECORD RESULTS, plots are drawn afterwards from them (see plot_check_modes)
+        self.record_check(
+            real_part=real_roll, imag_part=imag_roll, time_constant=time_constant_roll,
+            time_constant_requirements=tc_roll_req, time_constant_satisfaction_level=check_time_constant)
 
         # WRITE RESULTS
         self.write_results(real_roll, imag_roll, time_constant_roll, check_time_constant, results_folder_path)
@@ -123,8 +126,16 @@ class CheckRollMode(om.ExplicitComponent):
         return check_time_constant
 
 
+    def plot_check(self, record, results_folder_path, plot_name_suffix=""):
+
+        return [
+            self.plot_s_plane(
+                record["real_part"], record["imag_part"], record["time_constant_requirements"],
+                results_folder_path, plot_name_suffix),
+        ]
+
     @staticmethod
-    def plot_s_plane(real_roll, imag_roll, tc_roll_req, results_folder_path):
+    def plot_s_plane(real_roll, imag_roll, tc_roll_req, results_folder_path, plot_name_suffix=""):
 
         def get_vertical_limits(time_constant):
 
@@ -138,8 +149,11 @@ class CheckRollMode(om.ExplicitComponent):
         tc_roll_req_2 = tc_roll_req[1]
         tc_roll_req_3 = tc_roll_req[2]
 
-        # fig, ax = plt.subplots(figsize=(11.2, 8.4))
-        fig, ax = plt.subplots()
+        from matplotlib.figure import Figure
+
+        # fig = Figure(figsize=(11.2, 8.4))
+        fig = Figure()
+        ax = fig.subplots()
         ax.set_title("Check of Roll Mode Characteristics Versus Flying Quality Requirements")
         ax.set_xlabel(r"$n$")
         ax.set_ylabel(r"$jw$")
@@ -166,14 +180,10 @@ class CheckRollMode(om.ExplicitComponent):
         ax.set_ybound(-5.0, 5.0)
         # plt.show()
 
-        results_dir = results_folder_path
-        plots_dir = os.path.join(results_dir, 'Check Modes Plots/')
-        plot_name = "roll_mode_s-plane.png"
-
-        if not os.path.isdir(plots_dir):
-            os.makedirs(plots_dir)
+        plot_path = get_plot_path(results_folder_path, "roll_mode_s-plane" + plot_name_suffix + ".png")
+        fig.savefig(plot_path)
 
-        fig.savefig(plots_dir + plot_name)
+        return plot_path
 
 
     @staticmethod
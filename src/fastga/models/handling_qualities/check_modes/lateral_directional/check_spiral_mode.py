@@ -15,17 +15,18 @@ import math
 import os
 import openmdao.api as om
 import numpy as np
-import matplotlib.pyplot as plt
 from openmdao.utils.file_wrap import InputFileGenerator
 from importlib.resources import path
 from ... import resources as local_resources
+from ..mode_check import ModeCheck, get_plot_path
 
 
-class CheckSpiralMode(om.ExplicitComponent):
+class CheckSpiralMode(ModeCheck):
     """
     # TODOC:
     """
     def initialize(self):
+        super().initialize()
         self.options.declare("result_folder_path", default="", types=str)
 
     def setup(self):
@@ -53,8 +54,10 @@ class CheckSpiralMode(om.ExplicitComponent):
         # CHECK
         check_spiral = self.check_spiral_requirements(t_2, t_2_req)
 
-        # PLOT
-        self.plot_s_plane(real_spiral, imag_spiral, t_2_req, results_folder_path)
+        # RECORD, plots are drawn afterwards from the recorded results (see plot_check_modes)
+        self.record_check(
+            real_part=real_spiral, imag_part=imag_spiral, time_to_double=t_2, time_to_double_requirements=t_2_req,
+            time_to_double_satisfaction_level=check_spiral)
 
         # WRITE RESULTS
         self.write_results(real_spiral, imag_spiral, t_2, check_spiral, results_folder_path)
@@ -111,8 +114,16 @@ class CheckSpiralMode(om.ExplicitComponent):
         return check_spiral
 
 
+    def plot_check(self, record, results_folder_path, plot_name_suffix=""):
+
+        return [
+            self.plot_s_plane(
+                record["real_part"], record["imag_part"], record["time_to_double_requirements"],
+                results_folder_path, plot_name_suffix),
+        ]
+
     @staticmethod
-    def plot_s_plane(real_spiral, imag_spiral, t_2_req, results_folder_path):
+    def plot_s_plane(real_spiral, imag_spiral, t_2_req, results_folder_path, plot_name_suffix=""):
 
         def get_vertical_limits(t_2_req):
 
@@ -126,8 +137,11 @@ class CheckSpiralMode(om.ExplicitComponent):
         t_2_req_2 = t_2_req[1]
         t_2_req_3 = t_2_req[2]
 
-        # fig, ax = plt.subplots(figsize=(11.2, 8.4))
-        fig, ax = plt.subplots()
+        from matplotlib.figure import Figure
+
+        # fig = Figure(figsize=(11.2, 8.4))
+        fig = Figure()
+        ax = fig.subplots()
         ax.set_title("Check of Spiral Mode Characteristics Versus Flying Quality Requirements")
         ax.set_xlabel(r"$n$")
         ax.set_ylabel(r"$jw$")
@@ -153,14 +167,10 @@ class CheckSpiralMode(om.ExplicitComponent):
         ax.set_ybound(-0.1, 0.1)
         # plt.show()
 
-        results_dir = results_folder_path
-        plots_dir = os.path.join(results_dir, 'Check Modes Plots/')
-        plot_name = "spiral_mode_s-plane.png"
-
-        if not os.path.isdir(plots_dir):
-            os.makedirs(plots_dir)
+        plot_path = get_plot_path(results_folder_path, "spiral_mode_s-plane" + plot_name_suffix + ".png")
+        fig.savefig(plot_path)
 
-        fig.savefig(plots_dir + plot_name)
+        return plot_path
 
     @staticmethod
     def write_results(real_part, imag_part, time_to_double, check_time_to_double, results_folder_path):
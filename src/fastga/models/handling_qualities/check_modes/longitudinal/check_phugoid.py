@@ -14,18 +14,19 @@ import math
 import os
 import openmdao.api as om
 import numpy as np
-import matplotlib.pyplot as plt
 
 from ... import resources as local_resources
+from ..mode_check import ModeCheck, get_plot_path
 from openmdao.utils.file_wrap import InputFileGenerator
 from importlib.resources import path
 
 
-class CheckPhugoid(om.ExplicitComponent):
+class CheckPhugoid(ModeCheck):
     """
     # TODOC:
     """
     def initialize(self):
+        super().initialize()
         self.options.declare("result_folder_path", default="", types=str)
 
 
@@ -65,8 +66,12 @@ class CheckPhugoid(om.ExplicitComponent):
         elif real_ph <= n_req_3:
             check_phugoid_damping = 3.0
 
-        ### PLOT ###
-        self.plot_s_plane(real_ph, imag_ph, z_ph_req_1, z_ph_req_2, n_req_3, results_folder_path)
+        ### RECORD ###
+        # Plots are drawn afterwards from the recorded results (see plot_check_modes)
+        self.record_check(
+            real_part=real_ph, imag_part=imag_ph, damping_ratio=z_ph, undamped_frequency=wn_ph,
+            damping_ratio_requirements=[z_ph_req_1, z_ph_req_2], real_part_requirement=n_req_3,
+            damping_ratio_satisfaction_level=check_phugoid_damping)
 
         ### WRITE RESULTS IN FILE ###
         self.write_results(real_ph, imag_ph, z_ph, check_phugoid_damping, results_folder_path)
@@ -74,8 +79,17 @@ class CheckPhugoid(om.ExplicitComponent):
         outputs["data:handling_qualities:longitudinal:modes:phugoid:check:damping_ratio:satisfaction_level"] = check_phugoid_damping
 
 
+    def plot_check(self, record, results_folder_path, plot_name_suffix=""):
+
+        return [
+            self.plot_s_plane(
+                record["real_part"], record["imag_part"], record["damping_ratio_requirements"][0],
+                record["damping_ratio_requirements"][1], record["real_part_requirement"], results_folder_path,
+                plot_name_suffix),
+        ]
+
     @staticmethod
-    def plot_s_plane(real_ph, imag_ph, z_ph_req_1, z_ph_req_2, n_req_3, results_folder_path):
+    def plot_s_plane(real_ph, imag_ph, z_ph_req_1, z_ph_req_2, n_req_3, results_folder_path, plot_name_suffix=""):
 
         def get_damping_limits(damping_ratio):
             phi = math.asin(damping_ratio)
@@ -92,8 +106,11 @@ class CheckPhugoid(om.ExplicitComponent):
             return x, y
 
         ### PLOT ###
-        # fig, ax = plt.subplots(figsize=(11.2, 8.4))
-        fig, ax = plt.subplots()
+        from matplotlib.figure import Figure
+
+        # fig = Figure(figsize=(11.2, 8.4))
+        fig = Figure()
+        ax = fig.subplots()
         ax.set_title("Check of Phugoid Characteristics Versus Flying Quality Requirements")
         ax.set_xlabel(r"$n$")
         ax.set_ylabel(r"$jw$")
@@ -120,14 +137,10 @@ class CheckPhugoid(om.ExplicitComponent):
         ax.set_ybound(-imag_ph, imag_ph * 4)
         # plt.show()
 
-        results_dir = results_folder_path
-        plots_dir = os.path.join(results_dir, 'Check Modes Plots/')
-        plot_name = "phugoid_s-plane.png"
-
-        if not os.path.isdir(plots_dir):
-            os.makedirs(plots_dir)
+        plot_path = get_plot_path(results_folder_path, "phugoid_s-plane" + plot_name_suffix + ".png")
+        fig.savefig(plot_path)
 
-        fig.savefig(plots_dir + plot_name)
+        return plot_path
 
 
     @staticmethod
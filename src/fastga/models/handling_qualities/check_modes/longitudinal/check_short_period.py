@@ -22,19 +22,20 @@ from ... import resources as local_resources
 
 import openmdao.api as om
 import numpy as np
-import matplotlib.pyplot as plt
 from importlib.resources import path
 
 from fastga.models.handling_qualities.resources import digit_figures
+from ..mode_check import ModeCheck, get_plot_path
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class CheckShortPeriod(om.ExplicitComponent):
+class CheckShortPeriod(ModeCheck):
     """
     # TODOC:
     """
     def initialize(self):
+        super().initialize()
         self.options.declare("result_folder_path", default="", types=str)
 
     def setup(self):
@@ -77,66 +78,13 @@ class CheckShortPeriod(om.ExplicitComponent):
         check_shortperiod_damping, check_shortperiod_frequency = self.check_short_period_requirements(
             z_sp, wn_sp, z_sp_reqs, wn_sp_reqs)
 
-        ### PLOT ###
-        ### Frequency vs. n/alpha plot ###
-        # TODO: add rest of flight phase categories.
-        file = pth.join(digit_figures.__path__[0], "sp_frequency_req_B.csv")
-        db = read_csv(file)
-
-        level1_up_x = db["level1_up_X"]
-        level1_up_y = db["level1_up_Y"]
-        errors = np.logical_or(np.isnan(level1_up_x), np.isnan(level1_up_y))
-        level1_up_x = level1_up_x[np.logical_not(errors)].tolist()
-        level1_up_y = level1_up_y[np.logical_not(errors)].tolist()
-
-        level1_down_x = db["level1_down_X"]
-        level1_down_y = db["level1_down_Y"]
-        errors = np.logical_or(np.isnan(level1_down_x), np.isnan(level1_down_y))
-        level1_down_x = level1_down_x[np.logical_not(errors)].tolist()
-        level1_down_y = level1_down_y[np.logical_not(errors)].tolist()
-
-        level2_up_x = db["level2_up_X"]
-        level2_up_y = db["level2_up_Y"]
-        errors = np.logical_or(np.isnan(level2_up_x), np.isnan(level2_up_y))
-        level2_up_x = level2_up_x[np.logical_not(errors)].tolist()
-        level2_up_y = level2_up_y[np.logical_not(errors)].tolist()
-
-        level2_down_x = db["level2_down_X"]
-        level2_down_y = db["level2_down_Y"]
-        errors = np.logical_or(np.isnan(level2_down_x), np.isnan(level2_down_y))
-        level2_down_x = level2_down_x[np.logical_not(errors)].tolist()
-        level2_down_y = level2_down_y[np.logical_not(errors)].tolist()
-
-        # fig1, ax1 = plt.subplots(figsize=(11.2, 8.4))
-        fig1, ax1 = plt.subplots()
-        ax1.set_yscale('log')
-        ax1.set_xscale('log')
-        ax1.set_title("Check of Short Period Frequency Versus Flying Quality Requirements")
-        ax1.set_xlabel(r"$n / \alpha$")
-        ax1.set_ylabel("$w_n (rad/s)$")
-        ax1.grid(True, which="both")
-
-        ax1.scatter(n_alpha, wn_sp, label=r"$w_{n_{sp}}$")
-        ax1.plot(level1_up_x, level1_up_y, linestyle="--", color="red", label="Level 1")
-        ax1.plot(level1_down_x, level1_down_y, linestyle="--", color="red", label="")
-        ax1.plot(level2_up_x, level2_up_y, linestyle="--", color="orange", label="Level 2")
-        ax1.plot(level2_down_x, level2_down_y, linestyle="--", color="yellow", label="Level 2 & 3")
-        ax1.legend(loc="upper right")
-        ax1.set_xbound(1.0, 1000.0)
-        ax1.set_ybound(0.1, 1000.0)
-        # plt.show()
-
-        results_dir = results_folder_path
-        plots_dir = os.path.join(results_dir, 'Check Modes Plots/')
-        plot_name = "short_period_frequency_requirement.png"
-
-        if not os.path.isdir(plots_dir):
-            os.makedirs(plots_dir)
-
-        fig1.savefig(plots_dir + plot_name)
-
-        ### s-plane plot ###
-        self.plot_s_plane(real_sp, imag_sp, z_sp_reqs, wn_sp_reqs, results_folder_path)
+        ### RECORD ###
+        # Plots are drawn afterwards from the recorded results (see plot_check_modes)
+        self.record_check(
+            real_part=real_sp, imag_part=imag_sp, damping_ratio=z_sp, undamped_frequency=wn_sp, n_alpha=n_alpha,
+            damping_ratio_requirements=z_sp_reqs, undamped_frequency_requirements=wn_sp_reqs,
+            damping_ratio_satisfaction_level=check_shortperiod_damping,
+            undamped_frequency_satisfaction_level=check_shortperiod_frequency)
 
         ### write results ###
         self.write_results(
@@ -275,8 +223,80 @@ class CheckShortPeriod(om.ExplicitComponent):
         return check_shortperiod_damping, check_shortperiod_frequency
 
 
+    def plot_check(self, record, results_folder_path, plot_name_suffix=""):
+
+        return [
+            self.plot_frequency_requirement(
+                record["n_alpha"], record["undamped_frequency"], results_folder_path, plot_name_suffix),
+            self.plot_s_plane(
+                record["real_part"], record["imag_part"], record["damping_ratio_requirements"],
+                record["undamped_frequency_requirements"], results_folder_path, plot_name_suffix),
+        ]
+
+
+    @staticmethod
+    def plot_frequency_requirement(n_alpha, wn_sp, results_folder_path, plot_name_suffix=""):
+
+        ### Frequency vs. n/alpha plot ###
+        # TODO: add rest of flight phase categories.
+        file = pth.join(digit_figures.__path__[0], "sp_frequency_req_B.csv")
+        db = read_csv(file)
+
+        level1_up_x = db["level1_up_X"]
+        level1_up_y = db["level1_up_Y"]
+        errors = np.logical_or(np.isnan(level1_up_x), np.isnan(level1_up_y))
+        level1_up_x = level1_up_x[np.logical_not(errors)].tolist()
+        level1_up_y = level1_up_y[np.logical_not(errors)].tolist()
+
+        level1_down_x = db["level1_down_X"]
+        level1_down_y = db["level1_down_Y"]
+        errors = np.logical_or(np.isnan(level1_down_x), np.isnan(level1_down_y))
+        level1_down_x = level1_down_x[np.logical_not(errors)].tolist()
+        level1_down_y = level1_down_y[np.logical_not(errors)].tolist()
+
+        level2_up_x = db["level2_up_X"]
+        level2_up_y = db["level2_up_Y"]
+        errors = np.logical_or(np.isnan(level2_up_x), np.isnan(level2_up_y))
+        level2_up_x = level2_up_x[np.logical_not(errors)].tolist()
+        level2_up_y = level2_up_y[np.logical_not(errors)].tolist()
+
+        level2_down_x = db["level2_down_X"]
+        level2_down_y = db["level2_down_Y"]
+        errors = np.logical_or(np.isnan(level2_down_x), np.isnan(level2_down_y))
+        level2_down_x = level2_down_x[np.logical_not(errors)].tolist()
+        level2_down_y = level2_down_y[np.logical_not(errors)].tolist()
+
+        from matplotlib.figure import Figure
+
+        # fig1 = Figure(figsize=(11.2, 8.4))
+        fig1 = Figure()
+        ax1 = fig1.subplots()
+        ax1.set_yscale('log')
+        ax1.set_xscale('log')
+        ax1.set_title("Check of Short Period Frequency Versus Flying Quality Requirements")
+        ax1.set_xlabel(r"$n / \alpha$")
+        ax1.set_ylabel("$w_n (rad/s)$")
+        ax1.grid(True, which="both")
+
+        ax1.scatter(n_alpha, wn_sp, label=r"$w_{n_{sp}}$")
+        ax1.plot(level1_up_x, level1_up_y, linestyle="--", color="red", label="Level 1")
+        ax1.plot(level1_down_x, level1_down_y, linestyle="--", color="red", label="")
+        ax1.plot(level2_up_x, level2_up_y, linestyle="--", color="orange", label="Level 2")
+        ax1.plot(level2_down_x, level2_down_y, linestyle="--", color="yellow", label="Level 2 & 3")
+        ax1.legend(loc="upper right")
+        ax1.set_xbound(1.0, 1000.0)
+        ax1.set_ybound(0.1, 1000.0)
+        # plt.show()
+
+        plot_path = get_plot_path(
+            results_folder_path, "short_period_frequency_requirement" + plot_name_suffix + ".png")
+        fig1.savefig(plot_path)
+
+        return plot_path
+
+
     @staticmethod
-    def plot_s_plane(real_sp, imag_sp, z_sp_reqs, wn_sp_reqs, results_folder_path):
+    def plot_s_plane(real_sp, imag_sp, z_sp_reqs, wn_sp_reqs, results_folder_path, plot_name_suffix=""):
 
         def get_damping_limits(damping_ratio):
             if damping_ratio == 0.0:
@@ -313,8 +333,11 @@ class CheckShortPeriod(om.ExplicitComponent):
         wn_sp_max_req_2 = wn_sp_reqs[3]
         wn_sp_min_req_3 = wn_sp_reqs[4]
 
-        # fig2, ax2 = plt.subplots(figsize=(11.2, 8.4))
-        fig2, ax2 = plt.subplots()
+        from matplotlib.figure import Figure
+
+        # fig2 = Figure(figsize=(11.2, 8.4))
+        fig2 = Figure()
+        ax2 = fig2.subplots()
         ax2.set_title("Check of Short Period Characteristics Versus Flying Quality Requirements")
         ax2.set_xlabel(r"$n$")
         ax2.set_ylabel(r"$jw$")
@@ -361,14 +384,10 @@ class CheckShortPeriod(om.ExplicitComponent):
         ax2.set_ybound(-4.0, 20.0)
         # plt.show()
 
-        results_dir = results_folder_path
-        plots_dir = os.path.join(results_dir, 'Check Modes Plots/')
-        plot_name = "short_period_s-plane.png"
-
-        if not os.path.isdir(plots_dir):
-            os.makedirs(plots_dir)
+        plot_path = get_plot_path(results_folder_path, "short_period_s-plane" + plot_name_suffix + ".png")
+        fig2.savefig(plot_path)
 
-        fig2.savefig(plots_dir + plot_name)
+        return plot_path
 
 
     @staticmethod
@@ -0,0 +1,121 @@
+"""
+Recording of the handling qualities mode checks and deferred rendering of their plots.
+"""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+from abc import ABCMeta, abstractmethod
+from typing import List
+
+import numpy as np
+import openmdao.api as om
+
+PLOTS_FOLDER_NAME = "Check Modes Plots"
+
+
+class ModeCheck(om.ExplicitComponent, metaclass=ABCMeta):
+    """
+    Base class of the mode checks. Each evaluation only records its numeric results (eigenvalue,
+    damping, frequency, requirements and satisfaction levels) in check_records, the plots being
+    drawn afterwards from these records with :func:`plot_check_modes`.
+
+    With the keep_records option set to "last" (default), only the record of the last evaluation
+    is kept. With "all", a record is kept per evaluation until clear_records is called, so that
+    each iteration can be plotted.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.check_records = []
+
+    def initialize(self):
+        self.options.declare("keep_records", default="last", values=["last", "all"])
+
+    def record_check(self, **results):
+        """Records the results of the current evaluation, as floats or lists of floats."""
+        record = {}
+        for name, value in results.items():
+            value = np.real(np.asarray(value, dtype=complex))
+            record[name] = float(value) if value.size == 1 else value.tolist()
+        if self.options["keep_records"] == "last":
+            self.check_records.clear()
+        self.check_records.append(record)
+
+    def clear_records(self):
+        """Drops the records of the previous evaluations."""
+        self.check_records.clear()
+
+    @abstractmethod
+    def plot_check(
+        self, record: dict, results_folder_path: str, plot_name_suffix: str = ""
+    ) -> List[str]:
+        """
+        Draws the plots of a recorded evaluation.
+
+        :param record: results of the evaluation, as recorded by record_check.
+        :param results_folder_path: folder where the "Check Modes Plots" folder is written.
+        :param plot_name_suffix: suffix added to the names of the plot files.
+        :return: the paths of the plot files.
+        """
+
+
+def get_plot_path(results_folder_path: str, plot_name: str) -> str:
+    """Returns the path of a plot file, the plots folder being created if needed."""
+    plots_dir = os.path.join(results_folder_path, PLOTS_FOLDER_NAME)
+    if not os.path.isdir(plots_dir):
+        os.makedirs(plots_dir)
+
+    return os.path.join(plots_dir, plot_name)
+
+
+def plot_check_modes(
+    system, results_folder_path: str = None, iterations: str = "final", clear_records: bool = False
+) -> List[str]:
+    """
+    Draws the plots of the mode checks of a system from the results recorded during its
+    evaluations. Figures are not attached to any GUI backend, so that plots can be drawn on
+    machines without display.
+
+    :param system: the problem (or any system) containing the mode checks.
+    :param results_folder_path: folder where the "Check Modes Plots" folder is written, if not
+    provided the result_folder_path option of each check is used.
+    :param iterations: "final" to plot the last evaluation only, "all" to plot each evaluation
+    kept by the check (see the keep_records option of ModeCheck), the plot file names being then
+    suffixed with the evaluation number.
+    :param clear_records: if True, the records of the checks are dropped once plotted.
+    :return: the paths of the plot files.
+    """
+    if iterations not in ("final", "all"):
+        raise ValueError('iterations should be "final" or "all", not "%s"' % iterations)
+
+    if isinstance(system, om.Problem):
+        system = system.model
+
+    plot_paths = []
+    for subsystem in system.system_iter(include_self=True, recurse=True, typ=ModeCheck):
+        records = subsystem.check_records
+        if not records:
+            continue
+        folder_path = results_folder_path
+        if folder_path is None:
+            folder_path = subsystem.options["result_folder_path"]
+        if iterations == "final":
+            plot_paths += subsystem.plot_check(records[-1], folder_path)
+        else:
+            for idx, record in enumerate(records):
+                plot_paths += subsystem.plot_check(record, folder_path, "_%d" % idx)
+        if clear_records:
+            subsystem.clear_records()
+
+    return plot_paths
@@ -15,7 +15,6 @@
 import os
 import math
 import os.path as pth
-import pandas as pd
 import numpy as np
 
 from importlib.resources import path
@@ -39,11 +38,9 @@ from fastga.models.propulsion.fuel_propulsion.basicIC_engine.basicIC_engine impo
     PROPELLER_EFFICIENCY,
 )
 
-# noinspection PyProtectedMember
-from fastga.command.api import _create_tmp_directory
-
 from . import resources as local_resources
-from . import openvsp3201
+from fastga.models.aerodynamics.external.openvsp import openvsp3201
+from fastga.models.aerodynamics.external import results_cache
 from fastga.models.handling_qualities import resources
 
 DEFAULT_WING_AIRFOIL = "naca23012.af"
@@ -58,6 +55,50 @@ STDERR_FILE_NAME = "vspaero_calc.err"
 VSPSCRIPT_EXE_NAME = "vspscript.exe"
 VSPAERO_EXE_NAME = "vspaero.exe"
 
+GEOMETRY_SET_LABELS = [
+    "sweep25_wing",
+    "taper_ratio_wing",
+    "aspect_ratio_wing",
+    "dihedral_wing",
+    "twist_wing",
+    "sweep25_htp",
+    "taper_ratio_htp",
+    "aspect_ratio_htp",
+    "sweep25_vtp",
+    "taper_ratio_vtp",
+    "aspect_ratio_vtp",
+    "mach",
+    "area_ratio_htp",
+    "area_ratio_vtp",
+]
+GEOMETRY_SET_FUSELAGE_LABELS = GEOMETRY_SET_LABELS + [
+    "fus_length",
+    "fus_front_length",
+    "fus_rear_length",
+    "fus_max_width",
+    "fus_max_height",
+]
+RESULTS_LABELS = [
+    "cL_u",
+    "cD_u",
+    "cm_u",
+    "cL_alpha",
+    "cD_alpha",
+    "cm_alpha",
+    "cL_q",
+    "cD_q",
+    "cm_q",
+    "cY_beta",
+    "cl_beta",
+    "cn_beta",
+    "cY_p",
+    "cl_p",
+    "cn_p",
+    "cY_r",
+    "cl_r",
+    "cn_r",
+]
+
 
 class OPENVSPSimpleGeometry(ExternalCodeComp):
     """Execution of OpenVSP for clean surfaces."""
@@ -463,6 +504,8 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
         if self.options["openvsp_exe_path"]:
             target_directory = pth.abspath(self.options["openvsp_exe_path"])
         else:
+            from fastga.command.api import _create_tmp_directory
+
             tmp_directory = _create_tmp_directory()
             target_directory = tmp_directory.name
         # Define the list of necessary input files: geometry script and foil file for both wing/HTP
@@ -813,204 +856,38 @@ class OPENVSPSimpleGeometry(ExternalCodeComp):
     @staticmethod
     def search_results(result_folder_path, geometry_set):
         """Search the results folder to see if the geometry has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "dihedral_wing",
-                "twist_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "sweep25_vtp",
-                "taper_ratio_vtp",
-                "aspect_ratio_vtp",
-                "mach",
-                "area_ratio_htp",
-                "area_ratio_vtp",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy()) == 7:
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if np.sum(saved_set == geometry_set[0:-1]) == 7:
-                                    result_file_path = pth.join(
-                                        result_folder_path, "openvsp_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio_htp = data.loc["area_ratio_htp", 0]
-                                    saved_area_ratio_vtp = data.loc["area_ratio_vtp", 0]
-                                    return result_file_path, saved_area_ratio_htp, saved_area_ratio_vtp
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0, 1.0
+        return _search_stability_results(result_folder_path, geometry_set, GEOMETRY_SET_LABELS)
 
     @staticmethod
     def search_results_fuselage(result_folder_path, geometry_set):
         """Search the results folder to see if the geometry (with fuselage) has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "dihedral_wing",
-                "twist_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "sweep25_vtp",
-                "taper_ratio_vtp",
-                "aspect_ratio_vtp",
-                "mach",
-                "area_ratio_htp",
-                "area_ratio_vtp",
-                "fus_length",
-                "fus_front_length",
-                "fus_rear_length",
-                "fus_max_width",
-                "fus_max_height",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy()) == 7:
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if np.sum(saved_set == geometry_set[0:-1]) == 7:
-                                    result_file_path = pth.join(
-                                        result_folder_path, "openvsp_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio_htp = data.loc["area_ratio_htp", 0]
-                                    saved_area_ratio_vtp = data.loc["area_ratio_vtp", 0]
-                                    return result_file_path, saved_area_ratio_htp, saved_area_ratio_vtp
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0, 1.0
+        return _search_stability_results(
+            result_folder_path, geometry_set, GEOMETRY_SET_FUSELAGE_LABELS
+        )
 
     @staticmethod
     def save_geometry(result_folder_path, geometry_set):
         """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "dihedral_wing",
-            "twist_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "sweep25_vtp",
-            "taper_ratio_vtp",
-            "aspect_ratio_vtp",
-            "mach",
-            "area_ratio_htp",
-            "area_ratio_vtp",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")
-
-        return result_file_path
+        return results_cache.save_geometry(
+            result_folder_path, geometry_set, GEOMETRY_SET_LABELS, "openvsp"
+        )
 
     @staticmethod
     def save_geometry_fuselage(result_folder_path, geometry_set):
         """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "dihedral_wing",
-            "twist_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "sweep25_vtp",
-            "taper_ratio_vtp",
-            "aspect_ratio_vtp",
-            "mach",
-            "area_ratio_htp",
-            "area_ratio_vtp",
-            "fus_length",
-            "fus_front_length",
-            "fus_rear_length",
-            "fus_max_width",
-            "fus_max_height",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "openvsp_" + str(idx) + ".csv")
-
-        return result_file_path
+        return results_cache.save_geometry(
+            result_folder_path, geometry_set, GEOMETRY_SET_FUSELAGE_LABELS, "openvsp"
+        )
 
     @staticmethod
     def save_results(result_file_path, results):
-        """Reads saved results."""
-
-        labels = [
-            "cL_u",
-            "cD_u",
-            "cm_u",
-            "cL_alpha",
-            "cD_alpha",
-            "cm_alpha",
-            "cL_q",
-            "cD_q",
-            "cm_q",
-            "cY_beta",
-            "cl_beta",
-            "cn_beta",
-            "cY_p",
-            "cl_p",
-            "cn_p",
-            "cY_r",
-            "cl_r",
-            "cn_r",
-        ]
-        data = pd.DataFrame(results, index=labels)
-        data.to_csv(result_file_path)
+        """Saves results."""
+        results_cache.save_results(result_file_path, results, RESULTS_LABELS)
 
     @staticmethod
     def read_results(result_file_path):
-
-        data = pd.read_csv(result_file_path)
-        values = data.to_numpy()[:, 1].tolist()
-        labels = data.to_numpy()[:, 0].tolist()
-
-        return pd.DataFrame(values, index=labels)
+        """Reads saved results."""
+        return results_cache.read_results(result_file_path)
 
     @staticmethod
     def read_stab_file(filename):
@@ -1310,6 +1187,8 @@ class OPENVSPSimpleGeometryDP(OPENVSPSimpleGeometry):
         if self.options["openvsp_exe_path"]:
             target_directory = pth.abspath(self.options["openvsp_exe_path"])
         else:
+            from fastga.command.api import _create_tmp_directory
+
             tmp_directory = _create_tmp_directory()
             target_directory = tmp_directory.name
         # Define the list of necessary input files: geometry script and foil file for both wing/HTP
@@ -1581,3 +1460,17 @@ def generate_wing_rotor_file(engine_count: int):
     file.close()
 
     return rotor_template_file_name
+
+
+def _search_stability_results(result_folder_path, geometry_set, geometry_set_labels):
+    """
+    Stability derivatives are not scaled with the tail area ratios, so they are part of the
+    compared geometry and the saved ones are those of the current geometry.
+    """
+    result_file_path, _ = results_cache.search_results(
+        result_folder_path, geometry_set, geometry_set_labels, "openvsp"
+    )
+    saved_area_ratio_htp = geometry_set[geometry_set_labels.index("area_ratio_htp")]
+    saved_area_ratio_vtp = geometry_set[geometry_set_labels.index("area_ratio_vtp")]
+
+    return result_file_path, saved_area_ratio_htp, saved_area_ratio_vtp
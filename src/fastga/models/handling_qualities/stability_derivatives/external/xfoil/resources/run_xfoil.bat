@@ -1,2 +0,0 @@
-@echo off
-"xfoil.exe" <"polar_session.txt" > "polar_calc.log" 2>&1
@@ -37,11 +37,6 @@ class UpdateVTArea(om.Group):
         self.add_subsystem(
             "vtp_area", _UpdateVTArea(propulsion_id=self.options["propulsion_id"]), promotes=["*"]
         )
-        self.add_subsystem(
-            "vp_constraints",
-            _ComputeVTPAreaConstraints(propulsion_id=self.options["propulsion_id"]),
-            promotes=["*"],
-        )
 
 
 def side_wash_effect(area_vtp, inputs):
@@ -460,6 +455,9 @@ class _UpdateVTArea(VTPConstraints):
       - compensate 1-failed engine linear trajectory at limited altitude (5000ft).
       - compensate 1-failed engine linear trajectory at takeoff.
       - compensate 1-failed engine linear trajectory at landing.
+
+    Each constraint is evaluated once, the margins of the area with respect to the constraints
+    being computed together with the area.
     """
 
     def setup(self):
@@ -514,6 +512,11 @@ class _UpdateVTArea(VTPConstraints):
         )
 
         self.add_output("data:geometry:vertical_tail:area", val=2.5, units="m**2")
+        self.add_output("data:constraints:vertical_tail:target_cruise_stability", units="m**2")
+        self.add_output("data:constraints:vertical_tail:crosswind_landing", units="m**2")
+        self.add_output("data:constraints:vertical_tail:engine_out_climb", units="m**2")
+        self.add_output("data:constraints:vertical_tail:engine_out_takeoff", units="m**2")
+        self.add_output("data:constraints:vertical_tail:engine_out_landing", units="m**2")
 
         self.declare_partials(
             "*",
@@ -574,138 +577,11 @@ class _UpdateVTArea(VTPConstraints):
         else:
             area_5 = 0.0
 
-        outputs["data:geometry:vertical_tail:area"] = max(area_1, area_2, area_3, area_4, area_5)
-
-
-class _ComputeVTPAreaConstraints(VTPConstraints):
-    """
-    Computes the difference between actual VT_area and the following constraints:
-      - have enough rotational moment/controllability during cruise.
-      - maintain a straight flight path during a crosswind landing.
-      - compensate 1-failed engine linear trajectory at limited altitude (5000ft).
-      - compensate 1-failed engine linear trajectory at takeoff.
-      - compensate 1-failed engine linear trajectory at landing.
-    """
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._engine_wrapper = None
-
-    def initialize(self):
-        self.options.declare("propulsion_id", default="", types=str)
-
-    def setup(self):
-        self._engine_wrapper = BundleLoader().instantiate_component(self.options["propulsion_id"])
-        self._engine_wrapper.setup(self)
-
-        self.add_input("data:TLAR:v_approach", val=np.nan, units="m/s")
-        self.add_input("data:TLAR:v_cruise", val=np.nan, units="m/s")
-        self.add_input("data:geometry:propulsion:engine:count", val=np.nan)
-        self.add_input("data:geometry:wing:area", val=np.nan, units="m**2")
-        self.add_input("data:geometry:wing:span", val=np.nan, units="m")
-        self.add_input("data:geometry:wing:aspect_ratio", val=np.nan)
-        self.add_input("data:geometry:wing:sweep_25", val=np.nan, units="rad")
-        self.add_input("data:geometry:wing:MAC:length", val=np.nan, units="m")
-        self.add_input("data:geometry:wing:MAC:at25percent:x", val=np.nan, units="m")
-        self.add_input("data:geometry:fuselage:maximum_width", val=np.nan, units="m")
-        self.add_input("data:geometry:fuselage:maximum_height", val=np.nan, units="m")
-        self.add_input("data:geometry:fuselage:front_length", val=np.nan, units="m")
-        self.add_input("data:geometry:fuselage:rear_length", val=np.nan, units="m")
-        self.add_input("data:geometry:cabin:length", val=np.nan, units="m")
-        self.add_input(
-            "data:geometry:vertical_tail:MAC:at25percent:x:from_wingMAC25", val=np.nan, units="m"
-        )
-        self.add_input("data:geometry:vertical_tail:rudder:max_deflection", val=np.nan, units="deg")
-        self.add_input("data:geometry:vertical_tail:area", val=np.nan, units="m**2")
-        self.add_input(
-            "data:geometry:propulsion:nacelle:y", val=np.nan, shape=ENGINE_COUNT, units="m"
-        )
-        self.add_input("data:weight:aircraft:CG:aft:MAC_position", val=np.nan)
-        self.add_input("data:weight:aircraft:MTOW", val=np.nan, units="kg")
-        self.add_input("data:weight:aircraft:OWE", val=np.nan, units="kg")
-        self.add_input("data:weight:aircraft:payload", val=np.nan, units="kg")
-        self.add_input("data:aerodynamics:wing:low_speed:CL_max_clean", val=np.nan)
-        self.add_input("data:aerodynamics:aircraft:landing:CL_max", val=np.nan)
-        self.add_input("data:aerodynamics:aircraft:takeoff:CL_max", val=np.nan)
-        self.add_input("data:aerodynamics:fuselage:cruise:CnBeta", val=np.nan)
-        self.add_input(
-            "data:aerodynamics:vertical_tail:cruise:CL_alpha", val=np.nan, units="rad**-1"
-        )
-        self.add_input(
-            "data:aerodynamics:vertical_tail:low_speed:CL_alpha", val=np.nan, units="rad**-1"
-        )
-        self.add_input("data:aerodynamics:rudder:low_speed:Cy_delta_r", val=np.nan, units="rad**-1")
-
-        self.add_input("data:mission:sizing:landing:target_sideslip", val=11.5, units="deg")
-        self.add_input("data:mission:sizing:main_route:cruise:altitude", val=np.nan, units="m")
-
-        self.add_input(
-            "settings:handling_qualities:rudder:safety_margin",
-            val=0.20,
-            desc="Ratio of the total rudder deflection not used in the computation of the VT area "
-            "to leave a safety margin",
-        )
-
-        self.add_output("data:constraints:vertical_tail:target_cruise_stability", units="m**2")
-        self.add_output("data:constraints:vertical_tail:crosswind_landing", units="m**2")
-        self.add_output("data:constraints:vertical_tail:engine_out_climb", units="m**2")
-        self.add_output("data:constraints:vertical_tail:engine_out_takeoff", units="m**2")
-        self.add_output("data:constraints:vertical_tail:engine_out_landing", units="m**2")
-
-    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        # Margin with respect to the sizing constraints for the vertical tail.
-
-        area_vtp = inputs["data:geometry:vertical_tail:area"]
-
-        engine_number = inputs["data:geometry:propulsion:engine:count"]
-
-        mtow = inputs["data:weight:aircraft:MTOW"]
-
-        # CASE1: OBJECTIVE TORQUE @ CRUISE #########################################################
-
-        area_diff_1 = area_vtp - self.target_stability_constraint(inputs)
-
-        # CASE 2 : CROSSWIND LANDING ###############################################################
-        # In this case we need to solve the lateral equilibrium equation. This method is adapted
-        # form what is presented in : Al-Shamma, Omran, Rashid Ali, and Haitham S. Hasan. "An
-        # Educational Rudder Sizing Algorithm for Utilization in Aircraft Design Software."
-        # International Journal of Applied Engineering Research 13.10 (2018):
-        # 7889-7894.
-
-        area_diff_2 = area_vtp - self.crosswind_landing_constraint(inputs, area_vtp)
-
-        # CASE3: ENGINE FAILURE COMPENSATION DURING CLIMB ##########################################
-
-        if engine_number != 1.0:
-            area_diff_3 = area_vtp - self.engine_out_climb(inputs)
-        else:
-            area_diff_3 = area_vtp
-
-        # CASE4: ENGINE FAILURE COMPENSATION DURING TAKEOFF ########################################
-
-        if engine_number != 1.0:
-            area_diff_4 = area_vtp - self.engine_out_takeoff(inputs)
-        else:
-            area_diff_4 = area_vtp
-
-        # CASE5: ENGINE FAILURE COMPENSATION DURING LANDING ########################################
-        # ACCORDING TO CS 23.149 (c) ONLY APPLIES TO AIRCRAFT POWERED BY RECIPROCATING ENGINE AND
-        # WEIGHING MORE THAN 2722 KG
-        # ##########################################################################################
-
-        if not (
-            (self.options["propulsion_id"] == "fastga.wrapper.propulsion.basicIC_engine")
-            and (mtow < 2722.0)
-        ):
-            if engine_number == 2.0:
-                area_diff_5 = area_vtp - self.engine_out_landing(inputs)
-            else:
-                area_diff_5 = area_vtp
-        else:
-            area_diff_5 = area_vtp
+        area_vtp = max(area_1, area_2, area_3, area_4, area_5)
 
-        outputs["data:constraints:vertical_tail:target_cruise_stability"] = area_diff_1
-        outputs["data:constraints:vertical_tail:crosswind_landing"] = area_diff_2
-        outputs["data:constraints:vertical_tail:engine_out_climb"] = area_diff_3
-        outputs["data:constraints:vertical_tail:engine_out_takeoff"] = area_diff_4
-        outputs["data:constraints:vertical_tail:engine_out_landing"] = area_diff_5
+        outputs["data:geometry:vertical_tail:area"] = area_vtp
+        outputs["data:constraints:vertical_tail:target_cruise_stability"] = area_vtp - area_1
+        outputs["data:constraints:vertical_tail:crosswind_landing"] = area_vtp - area_2
+        outputs["data:constraints:vertical_tail:engine_out_climb"] = area_vtp - area_3
+        outputs["data:constraints:vertical_tail:engine_out_takeoff"] = area_vtp - area_4
+        outputs["data:constraints:vertical_tail:engine_out_landing"] = area_vtp - area_5
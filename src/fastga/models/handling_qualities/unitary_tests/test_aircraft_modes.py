@@ -12,6 +12,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import openmdao.api as om
+import pytest
 
 from fastga.models.handling_qualities.aircraft_modes.lateral_directional_spacestate import \
     LateralDirectionalSpaceStateMatrix
@@ -276,4 +277,63 @@ def test_aircraft_modes():
         use_openvsp,
         add_fuselage,
         XML_FILE
-    )
\ No newline at end of file
+    )
+
+def test_modes_flight_envelope():
+    """
+    Modes of several points of the flight envelope of Airplane A from Appendix B in Roskam (different speeds,
+    altitudes, masses and CG positions) computed in a single call should be the same as the ones computed point by
+    point.
+    """
+    flight_points = {
+        "data:reference_flight_condition:CL": ([0.307, 0.41, 0.62], None),
+        "data:reference_flight_condition:CD": ([0.032, 0.036, 0.047], None),
+        "data:reference_flight_condition:CT": ([0.032, 0.036, 0.047], None),
+        "data:reference_flight_condition:air_density": ([0.00204834, 0.00204834, 0.00237717], "slug/ft**3"),
+        "data:reference_flight_condition:theta": ([0.0, 0.0, 2.0], "deg"),
+        "data:reference_flight_condition:weight": ([2650.0, 2650.0, 2400.0], "lb"),
+        "data:reference_flight_condition:speed": ([220.1, 190.0, 140.0], "ft/s"),
+        "data:reference_flight_condition:Iyy": ([1346.0, 1346.0, 1250.0], "slug*ft**2"),
+        "data:reference_flight_condition:Ixx": ([948.0, 948.0, 900.0], "slug*ft**2"),
+        "data:reference_flight_condition:Izz": ([1967.0, 1967.0, 1900.0], "slug*ft**2"),
+        "data:reference_flight_condition:Ixz": ([0.0, 0.0, 10.0], "slug*ft**2"),
+        "data:handling_qualities:longitudinal:derivatives:CL:speed": ([0.0, 0.0, 0.0], None),
+        "data:handling_qualities:longitudinal:derivatives:CD:speed": ([0.0, 0.0, 0.0], None),
+        "data:handling_qualities:longitudinal:derivatives:Cm:speed": ([0.0, 0.0, 0.0], None),
+        "data:handling_qualities:longitudinal:derivatives:thrust:CX:speed": ([-0.096, -0.11, -0.15], None),
+        "data:handling_qualities:longitudinal:derivatives:CD:alpha": ([0.121, 0.16, 0.24], "rad**-1"),
+        "data:handling_qualities:longitudinal:derivatives:CL:alpha": ([4.41, 4.41, 4.41], "rad**-1"),
+        "data:handling_qualities:longitudinal:derivatives:Cm:alpha": ([-0.613, -0.613, -0.45], "rad**-1"),
+        "data:handling_qualities:longitudinal:derivatives:CL:alpharate": ([1.7, 1.7, 1.7], "rad**-1"),
+        "data:handling_qualities:longitudinal:derivatives:Cm:alpharate": ([-7.27, -7.27, -7.0], "rad**-1"),
+        "data:handling_qualities:longitudinal:derivatives:CL:pitchrate": ([3.9, 3.9, 3.8], "rad**-1"),
+        "data:handling_qualities:longitudinal:derivatives:Cm:pitchrate": ([-12.4, -12.4, -11.9], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:CY:beta": ([-0.393, -0.393, -0.40], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:CY:rollrate": ([-0.075, -0.075, -0.07], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:CY:yawrate": ([0.214, 0.214, 0.22], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:Cl:beta": ([-0.0923, -0.0923, -0.095], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:Cl:rollrate": ([-0.484, -0.484, -0.48], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:Cl:yawrate": ([0.0798, 0.0798, 0.11], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:Cn:beta": ([0.0587, 0.0587, 0.06], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:Cn:rollrate": ([-0.0278, -0.0278, -0.035], "rad**-1"),
+        "data:handling_qualities:lateral:derivatives:Cn:yawrate": ([-0.0937, -0.0937, -0.095], "rad**-1"),
+    }
+
+    def get_ivc(index=None):
+        ivc = om.IndepVarComp()
+        for name, (values, units) in flight_points.items():
+            ivc.add_output(name, val=values if index is None else values[index], units=units)
+        ivc.add_output("data:geometry:wing:MAC:length", val=4.9, units="ft")
+        ivc.add_output("data:geometry:wing:span", val=36.0, units="ft")
+        ivc.add_output("data:geometry:wing:area", val=174.0, units="ft**2")
+        return ivc
+
+    for component_class in [LongitudinalSpaceStateMatrix, LateralDirectionalSpaceStateMatrix]:
+        batch_problem = run_system(component_class(flight_point_count=3), get_ivc())
+        outputs = batch_problem.model.component.list_outputs(prom_name=True, out_stream=None)
+        for index in range(3):
+            problem = run_system(component_class(), get_ivc(index))
+            for _, metadata in outputs:
+                assert batch_problem.get_val(metadata["prom_name"])[index] == pytest.approx(
+                    problem.get_val(metadata["prom_name"])[0], rel=1e-10
+                )
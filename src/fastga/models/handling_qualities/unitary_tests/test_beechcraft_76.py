@@ -11,6 +11,10 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os.path as pth
+
+import numpy as np
+import openmdao.api as om
 import pytest
 
 from .test_functions import alpha_derivatives, check_aircraft_modes, aircraft_modes, short_period_tail_sizing, \
@@ -20,6 +24,8 @@ from ..tail_sizing.update_vt_area import UpdateVTArea
 from ..tail_sizing.update_ht_area import UpdateHTArea
 from ..tail_sizing.compute_to_rotation_limit import ComputeTORotationLimitGroup
 from ..tail_sizing.compute_balked_landing_limit import ComputeBalkedLandingLimit
+from ..utils.reference_flight_condition import compute_flight_conditions, ReferenceFlightCondition, \
+    write_flight_condition_reports, REPORT_FILE_NAME
 
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
 
@@ -210,3 +216,75 @@ def test_dutch_roll_tail_sizing():
     )
 
 
+def test_flight_conditions():
+    """Tests the computation of several reference flight conditions at once"""
+
+    mach = np.array([0.2, 0.25, 0.3])
+    altitude = np.array([0.0, 5000.0, 8000.0])
+    theta = np.array([0.0, 3.0, -2.0])
+    weight = np.array([1600.0, 1700.0, 1760.0])
+    cg_x = np.array([2.4, 2.5, 2.6])
+    body_inertias = [2000.0, 3000.0, 4500.0, 150.0]
+
+    flight_conditions = compute_flight_conditions(
+        mach, altitude, theta, weight, cg_x, 16.6, 0.03, 0.045, body_inertias
+    )
+    for idx in range(3):
+        flight_condition = compute_flight_conditions(
+            mach[idx], altitude[idx], theta[idx], weight[idx], cg_x[idx], 16.6, 0.03, 0.045, body_inertias
+        )
+        for value, values in zip(flight_condition, flight_conditions):
+            assert np.ndim(values) == 0 or values[idx] == pytest.approx(value, rel=1e-12)
+
+    # Stability axes inertias are the body ones when theta is null
+    assert flight_conditions.Ixx_S[0] == pytest.approx(2000.0, rel=1e-12)
+    assert flight_conditions.Izz_S[0] == pytest.approx(4500.0, rel=1e-12)
+    assert flight_conditions.Ixz_S[0] == pytest.approx(150.0, rel=1e-12)
+    assert flight_conditions.dynamic_pressure[1] == pytest.approx(3688.4, rel=1e-3)
+
+
+def test_flight_condition_reports(tmpdir):
+    """Tests the report of the reference flight condition, written once the evaluations are done"""
+
+    ivc = om.IndepVarComp()
+    ivc.add_output("data:weight:aircraft:MTOW", 1769.0, units="kg")
+    ivc.add_output("data:weight:aircraft:inertia:Iox", 2000.0, units="kg*m**2")
+    ivc.add_output("data:weight:aircraft:inertia:Ioy", 3000.0, units="kg*m**2")
+    ivc.add_output("data:weight:aircraft:inertia:Ioz", 4500.0, units="kg*m**2")
+    ivc.add_output("data:weight:aircraft:inertia:Ioxz", 150.0, units="kg*m**2")
+    ivc.add_output("data:geometry:wing:area", 16.6, units="m**2")
+    ivc.add_output("data:aerodynamics:aircraft:cruise:CD0", 0.03)
+    ivc.add_output("data:aerodynamics:wing:cruise:induced_drag_coefficient", 0.045)
+    ivc.add_output("data:weight:aircraft:CG:aft:x", 2.6, units="m")
+    ivc.add_output("data:weight:aircraft:CG:fwd:x", 2.4, units="m")
+    component = ReferenceFlightCondition(
+        result_folder_path=str(tmpdir), airplane_file="beechcraft_76.xml", use_openvsp=False
+    )
+    problem = run_system(component, ivc)
+
+    # Nothing is written during the evaluations
+    assert not pth.exists(pth.join(tmpdir, REPORT_FILE_NAME))
+    assert write_flight_condition_reports(problem) == [pth.join(tmpdir, REPORT_FILE_NAME)]
+
+    with open(pth.join(tmpdir, REPORT_FILE_NAME), "r") as report_file:
+        lines = report_file.readlines()
+    assert "airplane .xml file : beechcraft_76.xml\n" in lines
+    report = {}
+    for line in lines:
+        words = line.split()
+        if len(words) >= 2 and not line.startswith("#"):
+            report[words[0]] = words[2] if words[1] == "=" else words[1]
+
+    flight_condition = compute_flight_conditions(
+        0.201, 5000.0, 0.0, 0.9 * 1769.0, 2.5, 16.6, 0.03, 0.045, [2000.0, 3000.0, 4500.0, 150.0]
+    )
+    assert report["add_fuselage"] == "False"
+    assert report["use_openvsp"] == "False"
+    for report_name, name in [
+        ("mach", "mach"), ("alpha", "alpha"), ("theta", "theta"), ("altitude", "altitude"), ("speed", "speed"),
+        ("rho", "air_density"), ("flaps_deflection", "flaps_deflection"), ("CL_s", "CL"), ("CD_s", "CD"),
+        ("CT_s", "CT"), ("weight", "weight"), ("cg_x_position", "cg_x"), ("cg_z_position", "cg_z"),
+        ("Ixx_B", "Ixx_B"), ("Iyy_B", "Iyy_B"), ("Izz_B", "Izz_B"), ("Ixz_B", "Ixz_B"), ("Ixx_S", "Ixx_S"),
+        ("Iyy_S", "Iyy_S"), ("Izz_S", "Izz_S"), ("Ixz_S", "Ixz_S"),
+    ]:
+        assert float(report[report_name]) == pytest.approx(float(getattr(flight_condition, name)), abs=1e-5)
@@ -11,6 +11,8 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+
 import pytest
 import openmdao.api as om
 
@@ -23,6 +25,7 @@ from fastga.models.handling_qualities.check_modes.lateral_directional.check_spir
 from fastga.models.handling_qualities.check_modes.longitudinal.check_longitudinal import CheckLongitudinal
 from fastga.models.handling_qualities.check_modes.longitudinal.check_phugoid import CheckPhugoid
 from fastga.models.handling_qualities.check_modes.longitudinal.check_short_period import CheckShortPeriod
+from fastga.models.handling_qualities.check_modes.mode_check import ModeCheck, plot_check_modes
 from fastga.models.handling_qualities.unitary_tests.test_functions import check_aircraft_modes
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
 
@@ -190,4 +193,55 @@ def test_check_lateral_modes():
     )) == pytest.approx(1.0, abs=0.001)
 
 
-
+def test_plot_check_modes(tmp_path):
+    group = om.Group()
+    check_phugoid = group.add_subsystem(
+        "check_phugoid", CheckPhugoid(result_folder_path=str(tmp_path), keep_records="all"))
+    check_roll_mode = group.add_subsystem("check_roll_mode", CheckRollMode(result_folder_path=str(tmp_path)))
+    problem = om.Problem(group)
+    problem.setup()
+
+    # Records as written by two evaluations of the checks, nothing being plotted
+    for real_part in [-0.02, -0.01]:
+        check_phugoid.record_check(
+            real_part=np.array([real_part]), imag_part=np.array([0.2]), damping_ratio=-real_part / 0.2,
+            undamped_frequency=0.2, damping_ratio_requirements=[0.04, 0.0], real_part_requirement=0.0126,
+            damping_ratio_satisfaction_level=1.0)
+    check_roll_mode.record_check(
+        real_part=-5.0, imag_part=0.0, time_constant=0.2, time_constant_requirements=[1.0, 1.4, 10.0],
+        time_constant_satisfaction_level=1.0)
+    assert check_phugoid.check_records[0]["real_part"] == pytest.approx(-0.02, abs=1e-12)
+    assert check_phugoid.check_records[0]["damping_ratio_requirements"] == [0.04, 0.0]
+    assert not (tmp_path / "Check Modes Plots").exists()
+
+    plot_paths = plot_check_modes(problem)
+    assert sorted(os.path.basename(plot_path) for plot_path in plot_paths) == [
+        "phugoid_s-plane.png", "roll_mode_s-plane.png"]
+
+    plot_paths = plot_check_modes(problem, iterations="all")
+    assert sorted(os.path.basename(plot_path) for plot_path in plot_paths) == [
+        "phugoid_s-plane_0.png", "phugoid_s-plane_1.png", "roll_mode_s-plane_0.png"]
+    assert all(os.path.isfile(plot_path) for plot_path in plot_paths)
+
+    with pytest.raises(ValueError):
+        plot_check_modes(problem, iterations="last")
+
+    # Only the last record is kept by default, and records can be dropped once plotted
+    for real_part in [-5.0, -4.0]:
+        check_roll_mode.record_check(
+            real_part=real_part, imag_part=0.0, time_constant=-1.0 / real_part,
+            time_constant_requirements=[1.0, 1.4, 10.0], time_constant_satisfaction_level=1.0)
+    assert len(check_roll_mode.check_records) == 1
+    assert check_roll_mode.check_records[0]["real_part"] == pytest.approx(-4.0, abs=1e-12)
+    plot_paths = plot_check_modes(problem, clear_records=True)
+    assert len(plot_paths) == 2
+    assert not check_phugoid.check_records and not check_roll_mode.check_records
+    assert plot_check_modes(problem) == []
+
+    # Checks can not be used without a plot
+    class CheckWithoutPlot(ModeCheck):
+        def compute(self, inputs, outputs):
+            self.record_check(value=1.0)
+
+    with pytest.raises(TypeError):
+        CheckWithoutPlot()
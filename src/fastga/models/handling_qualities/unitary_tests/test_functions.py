@@ -21,8 +21,6 @@ import os.path as pth
 import pytest
 import numpy as np
 import math
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 
 from importlib.resources import path
 
@@ -615,6 +613,8 @@ def dynamic_tail_sizing_loop(add_fuselage, use_openvsp, XML_FILE):
 
 
     ### PLOT ###
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
     ax.set_title("Short Period Eigenvalues for different HT Areas for $X_{CG} = %s $" % float(x_cg))
     ax.set_xlabel(r"$n$")
@@ -777,6 +777,9 @@ def short_period_tail_sizing(add_fuselage, use_openvsp, XML_FILE, XML_OPTIM_FILE
     wn_sp_max_req_1 = wn_sp_reqs[1]
 
     ### PLOT ###
+    import matplotlib.pyplot as plt
+    import matplotlib.cm as cm
+
     fig, ax = plt.subplots(figsize=(11.2, 8.4))
     title = "Short Period Eigenvalues for different HT Areas and CG positions, " \
             + "altitude = " + str(ref_flight_condition_dict["altitude"]) + " ft. " \
@@ -977,6 +980,8 @@ def dutch_roll_tail_sizing(add_fuselage, use_openvsp, XML_FILE, XML_OPTIM_FILE):
     min_wn_dr_1 = level_1_dr_reqs[2]
 
     ### PLOT ###
+    import matplotlib.pyplot as plt
+
     # fig, ax = plt.subplots(figsize=(11.2, 8.4))
     fig, ax = plt.subplots()
     title = "Dutch Roll Eigenvalues for different VT Areas and Dihedral Angles, " \
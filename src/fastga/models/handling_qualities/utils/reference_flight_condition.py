@@ -13,6 +13,8 @@
 import math
 import numpy as np
 import os
+from collections import namedtuple
+from typing import List
 
 import openmdao.api as om
 from fastoad.model_base import Atmosphere
@@ -21,10 +23,167 @@ from .. import resources as local_resources
 from openmdao.utils.file_wrap import InputFileGenerator
 from importlib.resources import path
 
+REPORT_FILE_NAME = "readme_test_data.txt"
+
+# Reference flight condition held in memory, attributes being floats or arrays when several conditions are computed
+# together. Inertias are given in body axes (_B) and in stability axes (_S).
+FlightCondition = namedtuple(
+    "FlightCondition",
+    ["mach", "alpha", "theta", "altitude", "speed", "air_density", "dynamic_pressure", "weight", "CL", "CD0", "CD",
+     "CT", "cg_x", "cg_z", "flaps_deflection", "flight_phase_category", "Ixx_B", "Iyy_B", "Izz_B", "Ixz_B", "Ixx_S",
+     "Iyy_S", "Izz_S", "Ixz_S"],
+)
+
+
+def compute_flight_conditions(mach, altitude, theta, weight, cg_x, wing_area, cd0, induced_drag_coefficient,
+                              body_inertias):
+    """
+    Computes one or several reference flight conditions at once, mach, altitude, theta, weight and cg_x being floats
+    or arrays of same shape.
+
+    :param mach: Mach number.
+    :param altitude: altitude in feet.
+    :param theta: pitch angle in degrees.
+    :param weight: aircraft mass in kg.
+    :param cg_x: center of gravity position in m.
+    :param wing_area: wing area in m**2.
+    :param cd0: profile drag coefficient.
+    :param induced_drag_coefficient: induced drag coefficient.
+    :param body_inertias: Ixx, Iyy, Izz and Ixz inertias in body axes, in kg*m**2.
+    :return: the FlightCondition.
+    """
+    g = 9.81
+    theta = np.asarray(theta, dtype=float)
+    theta_rad = theta * math.pi / 180.0
+
+    # NOTE: aoa in reference condition is always zero due to having chosen the stability axes (body-axis that
+    # NOTE: confuse with wind axis in trim condition)
+    alpha = np.zeros_like(theta)
+    atmosphere = Atmosphere(altitude, True)
+    speed = mach * atmosphere.speed_of_sound   # m/s
+    rho = atmosphere.density   # kg/m**3
+    q = 0.5 * rho * speed**2   # Pa
+
+    L = np.cos(theta_rad) * weight * g
+    CL = L / (q * wing_area)
+    CD = cd0 + induced_drag_coefficient * CL ** 2
+    CT = CD + np.sin(theta_rad) * weight / (q * wing_area)
+
+    # Rotation of the inertias from body axes to stability axes
+    Ixx_B, Iyy_B, Izz_B, Ixz_B = body_inertias
+    cos_square = np.cos(theta_rad) ** 2
+    sin_square = np.sin(theta_rad) ** 2
+    sin_double = np.sin(2 * theta_rad)
+    Ixx_S = cos_square * Ixx_B + sin_square * Izz_B - sin_double * Ixz_B
+    Izz_S = sin_square * Ixx_B + cos_square * Izz_B + sin_double * Ixz_B
+    Ixz_S = 0.5 * sin_double * Ixx_B - 0.5 * sin_double * Izz_B + np.cos(2 * theta_rad) * Ixz_B
+    Iyy_S = Iyy_B
+
+    return FlightCondition(
+        mach=mach, alpha=alpha, theta=theta, altitude=altitude, speed=speed, air_density=rho, dynamic_pressure=q,
+        weight=weight, CL=CL, CD0=cd0, CD=CD, CT=CT, cg_x=cg_x, cg_z=np.zeros_like(theta),
+        flaps_deflection=np.zeros_like(theta), flight_phase_category=2.0, Ixx_B=Ixx_B, Iyy_B=Iyy_B, Izz_B=Izz_B,
+        Ixz_B=Ixz_B, Ixx_S=Ixx_S, Iyy_S=Iyy_S, Izz_S=Izz_S, Ixz_S=Ixz_S,
+    )
+
+
+def write_flight_condition_report(flight_condition, results_file_path, airplane_file="", add_fuselage=False,
+                                  use_openvsp=True):
+    """
+    Writes the report of a single reference flight condition.
+
+    :param flight_condition: the FlightCondition.
+    :param results_file_path: path of the written file.
+    :param airplane_file: airplane file written in the report.
+    :param add_fuselage: add_fuselage option written in the report.
+    :param use_openvsp: use_openvsp option written in the report.
+    """
+    (mach, alpha, theta, altitude, speed, rho, _, weight, CL, _, CD, CT, cg_x, cg_z, flaps_deflection, _, Ixx_B,
+     Iyy_B, Izz_B, Ixz_B, Ixx_S, Iyy_S, Izz_S, Ixz_S) = flight_condition
+
+    parser = InputFileGenerator()
+    with path(local_resources, REPORT_FILE_NAME) as input_template_path:
+        parser.set_template_file(str(input_template_path))
+        parser.set_generated_file(results_file_path)
+        parser.mark_anchor("airplane_xml_file")
+        if airplane_file == "":
+            parser.transfer_var("Not Specified", 0, 5)
+        else:
+            parser.transfer_var(airplane_file, 0, 5)
+        parser.reset_anchor()
+        parser.mark_anchor("add_fuselage_bool")
+        if add_fuselage is True:
+            parser.transfer_var("True", 0, 2)
+        else:
+            parser.transfer_var("False", 0, 2)
+        parser.reset_anchor()
+        parser.mark_anchor("use_openvsp_bool")
+        if use_openvsp is True:
+            parser.transfer_var("True", 0, 2)
+
+        else:
+            parser.transfer_var("False", 0, 2)
+        parser.reset_anchor()
+        parser.mark_anchor("mach_data")
+        parser.transfer_var(round(float(mach), 5), 0, 2)
+        parser.mark_anchor("alpha_data")
+        parser.transfer_var(round(float(alpha), 5), 0, 2)
+        parser.mark_anchor("theta_data")
+        parser.transfer_var(round(float(theta), 5), 0, 2)
+        parser.reset_anchor()
+        parser.mark_anchor("altitude_data")
+        parser.transfer_var(round(float(altitude), 5), 0, 2)
+        parser.mark_anchor("speed_data")
+        parser.transfer_var(round(float(speed), 5), 0, 2)
+        parser.mark_anchor("rho_data")
+        parser.transfer_var(round(float(rho), 5), 0, 2)
+        parser.mark_anchor("flaps_deflection_data")
+        parser.transfer_var(round(float(flaps_deflection), 5), 0, 2)
+        parser.reset_anchor()
+        parser.mark_anchor("CL_data")
+        parser.transfer_var(round(float(CL), 5), 0, 2)
+        parser.mark_anchor("CD_data")
+        parser.transfer_var(round(float(CD), 5), 0, 2)
+        parser.mark_anchor("CT_data")
+        parser.transfer_var(round(float(CT), 5), 0, 2)
+        parser.reset_anchor()
+        parser.mark_anchor("weight_data")
+        parser.transfer_var(round(float(weight), 5), 0, 2)
+        parser.mark_anchor("cg_x_position_data")
+        parser.transfer_var(round(float(cg_x), 5), 0, 2)
+        parser.mark_anchor("cg_z_position_data")
+        parser.transfer_var(round(float(cg_z), 5), 0, 2)
+        parser.mark_anchor("Ixx_B_data")
+        parser.transfer_var(round(float(Ixx_B), 5), 0, 3)
+        parser.mark_anchor("Iyy_B_data")
+        parser.transfer_var(round(float(Iyy_B), 5), 0, 3)
+        parser.mark_anchor("Izz_B_data")
+        parser.transfer_var(round(float(Izz_B), 5), 0, 3)
+        parser.mark_anchor("Ixz_B_data")
+        parser.transfer_var(round(float(Ixz_B), 5), 0, 3)
+        parser.mark_anchor("Ixx_S_data")
+        parser.transfer_var(round(float(Ixx_S), 5), 0, 3)
+        parser.mark_anchor("Iyy_S_data")
+        parser.transfer_var(round(float(Iyy_S), 5), 0, 3)
+        parser.mark_anchor("Izz_S_data")
+        parser.transfer_var(round(float(Izz_S), 5), 0, 3)
+        parser.mark_anchor("Ixz_S_data")
+        parser.transfer_var(round(float(Ixz_S), 5), 0, 3)
+        parser.reset_anchor()
+
+        parser.generate()
 
 
 class ReferenceFlightCondition(om.ExplicitComponent):
-    """ Establishes the reference flight condition for the stability analysis  """
+    """
+    Establishes the reference flight condition for the stability analysis. The last computed condition is kept in
+    memory as flight_condition, its report being written with write_report once the run is done (see
+    fastga.command.api.enable_flight_condition_reports).
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.flight_condition = None
 
     def initialize(self):
         """Definition of the options of the group"""
@@ -35,6 +194,7 @@ class ReferenceFlightCondition(om.ExplicitComponent):
         self.options.declare("use_openvsp", default=True, types=bool)
 
 
+
     def setup(self):
 
         self.add_input("data:weight:aircraft:MTOW", val=np.nan, units="kg")
@@ -74,200 +234,95 @@ class ReferenceFlightCondition(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-
-        g = 9.81
-        S = inputs["data:geometry:wing:area"]
-        flight_phase_category = 2.0
         MTOW = inputs["data:weight:aircraft:MTOW"]
 
         if self.options["reference_flight_condition"] == {}:
 
             mach = 0.201
-            # NOTE: aoa in reference condition is always zero due to having chosen the stability axes (body-axis that
-            # NOTE: confuse with wind axis in trim condition)
-            alpha = 0.0   # deg
             theta = 0.0   # deg
-            theta_rad = theta * math.pi / 180.0
             altitude = 5000.0    # altitude in feet
-            sound_speed = Atmosphere(altitude, True).speed_of_sound   # m/s
-            speed = mach * sound_speed   # m/s
-            rho = Atmosphere(altitude, True).density   # kg/m**3
-            q = 0.5 * rho * speed**2   # Pa
-
             weight = 0.9*MTOW   # kg
-            L = math.cos(theta * math.pi / 180.0) * weight * g
-            CL = L / (q * S)
-
-            CD0 = inputs["data:aerodynamics:aircraft:cruise:CD0"]
-            k = inputs["data:aerodynamics:wing:cruise:induced_drag_coefficient"]
-            CD = CD0 + k * CL ** 2
-            CT = CD + math.sin(theta * math.pi / 180.0) * weight / (q * S)
-
-            flaps_deflection = 0.0
 
             # NOTE: for purposes of preliminary design, the most critical airplane configurations occur at the most forward
             # NOTE:  and at the most aft center of gravity locations.
             cg_aft = inputs["data:weight:aircraft:CG:aft:x"]
             cg_fwd = inputs["data:weight:aircraft:CG:fwd:x"]
             cg_x = (cg_fwd + cg_aft) / 2.0
-            cg_z = 0.0
-
-            Ixx_B = float(inputs["data:weight:aircraft:inertia:Iox"])
-            Iyy_B = float(inputs["data:weight:aircraft:inertia:Ioy"])
-            Izz_B = float(inputs["data:weight:aircraft:inertia:Ioz"])
-            Ixz_B = float(inputs["data:weight:aircraft:inertia:Ioxz"])
-
-            transformation_matrix = np.array([
-                [(math.cos(theta_rad))**2, (math.sin(theta_rad))**2, -math.sin(2*theta_rad)],
-                [(math.sin(theta_rad))**2, (math.cos(theta_rad))**2, math.sin(2*theta_rad)],
-                [0.5*math.sin(2*theta_rad), -0.5*math.sin(2*theta_rad), math.cos(2*theta_rad)]
-            ])
-
-            body_inertias = np.array([Ixx_B, Izz_B, Ixz_B])
-            stability_inertias = transformation_matrix.dot(body_inertias)
-            [Ixx_S, Izz_S, Ixz_S] = stability_inertias
-            Iyy_S = Iyy_B
-
 
         else:
             ref_flight_cond_dict = self.options["reference_flight_condition"]
 
             mach = ref_flight_cond_dict["mach"]
-            alpha = 0.0
             altitude = ref_flight_cond_dict["altitude"]
             theta = ref_flight_cond_dict["theta"]
-            theta_rad = theta * math.pi / 180.0
-            sound_speed = Atmosphere(altitude, True).speed_of_sound   # m/s
-            speed = mach * sound_speed   # m/s
-            rho = Atmosphere(altitude, True).density   # kg/m**3
-            q = 0.5 * rho * speed**2   # Pa
-
             weight = ref_flight_cond_dict["weight"]
-            L = math.cos(theta * math.pi / 180.0) * weight * g
-            CL = L / (q * S)
-
-            CD0 = inputs["data:aerodynamics:aircraft:cruise:CD0"]
-            k = inputs["data:aerodynamics:wing:cruise:induced_drag_coefficient"]
-            CD = CD0 + k * CL ** 2
-            CT = CD + math.sin(theta * math.pi / 180.0) * weight / (q * S)
-
-            flaps_deflection = 0.0
-
             cg_x = ref_flight_cond_dict["cg_x"]
-            cg_z = 0.0
-
-            Ixx_B = float(inputs["data:weight:aircraft:inertia:Iox"])
-            Iyy_B = float(inputs["data:weight:aircraft:inertia:Ioy"])
-            Izz_B = float(inputs["data:weight:aircraft:inertia:Ioz"])
-            Ixz_B = float(inputs["data:weight:aircraft:inertia:Ioxz"])
-
-            transformation_matrix = np.array([
-                [(math.cos(theta_rad)) ** 2, (math.sin(theta_rad)) ** 2, -math.sin(2 * theta_rad)],
-                [(math.sin(theta_rad)) ** 2, (math.cos(theta_rad)) ** 2, math.sin(2 * theta_rad)],
-                [0.5 * math.sin(2 * theta_rad), -0.5 * math.sin(2 * theta_rad), math.cos(2 * theta_rad)]
-            ])
-
-            body_inertias = np.array([Ixx_B, Izz_B, Ixz_B])
-            stability_inertias = transformation_matrix.dot(body_inertias)
-            [Ixx_S, Izz_S, Ixz_S] = stability_inertias
-            Iyy_S = Iyy_B
-
-
-        airplane_file = self.options["airplane_file"]
-
-        file_name = "readme_test_data.txt"
-        dir_name = self.options["result_folder_path"]
-        RESULTS_FILE = os.path.join(dir_name, file_name)
-
-        parser = InputFileGenerator()
-        with path(local_resources, "readme_test_data.txt") as input_template_path:
-            parser.set_template_file(str(input_template_path))
-            parser.set_generated_file(RESULTS_FILE)
-            parser.mark_anchor("airplane_xml_file")
-            if airplane_file == "":
-                parser.transfer_var("Not Specified", 0, 5)
-            else:
-                parser.transfer_var(airplane_file, 0, 5)
-            parser.reset_anchor()
-            parser.mark_anchor("add_fuselage_bool")
-            if self.options["add_fuselage"] is True:
-                parser.transfer_var("True", 0, 2)
-            else:
-                parser.transfer_var("False", 0, 2)
-            parser.reset_anchor()
-            parser.mark_anchor("use_openvsp_bool")
-            if self.options["use_openvsp"] is True:
-                parser.transfer_var("True", 0, 2)
-
-            else:
-                parser.transfer_var("False", 0, 2)
-            parser.reset_anchor()
-            parser.mark_anchor("mach_data")
-            parser.transfer_var(round(float(mach), 5), 0, 2)
-            parser.mark_anchor("alpha_data")
-            parser.transfer_var(round(float(alpha), 5), 0, 2)
-            parser.mark_anchor("theta_data")
-            parser.transfer_var(round(float(theta), 5), 0, 2)
-            parser.reset_anchor()
-            parser.mark_anchor("altitude_data")
-            parser.transfer_var(round(float(altitude), 5), 0, 2)
-            parser.mark_anchor("speed_data")
-            parser.transfer_var(round(float(speed), 5), 0, 2)
-            parser.mark_anchor("rho_data")
-            parser.transfer_var(round(float(rho), 5), 0, 2)
-            parser.mark_anchor("flaps_deflection_data")
-            parser.transfer_var(round(float(flaps_deflection), 5), 0, 2)
-            parser.reset_anchor()
-            parser.mark_anchor("CL_data")
-            parser.transfer_var(round(float(CL), 5), 0, 2)
-            parser.mark_anchor("CD_data")
-            parser.transfer_var(round(float(CD), 5), 0, 2)
-            parser.mark_anchor("CT_data")
-            parser.transfer_var(round(float(CT), 5), 0, 2)
-            parser.reset_anchor()
-            parser.mark_anchor("weight_data")
-            parser.transfer_var(round(float(weight), 5), 0, 2)
-            parser.mark_anchor("cg_x_position_data")
-            parser.transfer_var(round(float(cg_x), 5), 0, 2)
-            parser.mark_anchor("cg_z_position_data")
-            parser.transfer_var(round(float(cg_z), 5), 0, 2)
-            parser.mark_anchor("Ixx_B_data")
-            parser.transfer_var(round(float(Ixx_B), 5), 0, 3)
-            parser.mark_anchor("Iyy_B_data")
-            parser.transfer_var(round(float(Iyy_B), 5), 0, 3)
-            parser.mark_anchor("Izz_B_data")
-            parser.transfer_var(round(float(Izz_B), 5), 0, 3)
-            parser.mark_anchor("Ixz_B_data")
-            parser.transfer_var(round(float(Ixz_B), 5), 0, 3)
-            parser.mark_anchor("Ixx_S_data")
-            parser.transfer_var(round(float(Ixx_S), 5), 0, 3)
-            parser.mark_anchor("Iyy_S_data")
-            parser.transfer_var(round(float(Iyy_S), 5), 0, 3)
-            parser.mark_anchor("Izz_S_data")
-            parser.transfer_var(round(float(Izz_S), 5), 0, 3)
-            parser.mark_anchor("Ixz_S_data")
-            parser.transfer_var(round(float(Ixz_S), 5), 0, 3)
-            parser.reset_anchor()
-
-            parser.generate()
-
-        outputs["data:reference_flight_condition:mach"] = mach
-        outputs["data:reference_flight_condition:alpha"] = alpha
-        outputs["data:reference_flight_condition:theta"] = theta
-        outputs["data:reference_flight_condition:speed"] = speed
-        outputs["data:reference_flight_condition:weight"] = weight
-        outputs["data:reference_flight_condition:Ixx"] = Ixx_S
-        outputs["data:reference_flight_condition:Iyy"] = Iyy_S
-        outputs["data:reference_flight_condition:Izz"] = Izz_S
-        outputs["data:reference_flight_condition:Ixz"] = Ixz_S
-        outputs["data:reference_flight_condition:altitude"] = altitude
-        outputs["data:reference_flight_condition:air_density"] = rho
-        outputs["data:reference_flight_condition:CL"] = CL
-        outputs["data:reference_flight_condition:CD"] = CD
-        outputs["data:reference_flight_condition:CT"] = CT
-        outputs["data:reference_flight_condition:dynamic_pressure"] = q
-        outputs["data:reference_flight_condition:CG:x"] = cg_x
-        outputs["data:reference_flight_condition:CG:z"] = cg_z
-        outputs["data:reference_flight_condition:flaps_deflection"] = flaps_deflection
-        outputs["data:reference_flight_condition:CD0"] = CD0
-        outputs["data:reference_flight_condition:flight_phase_category"] = flight_phase_category
+
+        body_inertias = [
+            float(inputs["data:weight:aircraft:inertia:Iox"]),
+            float(inputs["data:weight:aircraft:inertia:Ioy"]),
+            float(inputs["data:weight:aircraft:inertia:Ioz"]),
+            float(inputs["data:weight:aircraft:inertia:Ioxz"]),
+        ]
+
+        flight_condition = compute_flight_conditions(
+            mach, altitude, theta, weight, cg_x, inputs["data:geometry:wing:area"],
+            inputs["data:aerodynamics:aircraft:cruise:CD0"],
+            inputs["data:aerodynamics:wing:cruise:induced_drag_coefficient"], body_inertias)
+        self.flight_condition = flight_condition
+
+        outputs["data:reference_flight_condition:mach"] = flight_condition.mach
+        outputs["data:reference_flight_condition:alpha"] = flight_condition.alpha
+        outputs["data:reference_flight_condition:theta"] = flight_condition.theta
+        outputs["data:reference_flight_condition:speed"] = flight_condition.speed
+        outputs["data:reference_flight_condition:weight"] = flight_condition.weight
+        outputs["data:reference_flight_condition:Ixx"] = flight_condition.Ixx_S
+        outputs["data:reference_flight_condition:Iyy"] = flight_condition.Iyy_S
+        outputs["data:reference_flight_condition:Izz"] = flight_condition.Izz_S
+        outputs["data:reference_flight_condition:Ixz"] = flight_condition.Ixz_S
+        outputs["data:reference_flight_condition:altitude"] = flight_condition.altitude
+        outputs["data:reference_flight_condition:air_density"] = flight_condition.air_density
+        outputs["data:reference_flight_condition:CL"] = flight_condition.CL
+        outputs["data:reference_flight_condition:CD"] = flight_condition.CD
+        outputs["data:reference_flight_condition:CT"] = flight_condition.CT
+        outputs["data:reference_flight_condition:dynamic_pressure"] = flight_condition.dynamic_pressure
+        outputs["data:reference_flight_condition:CG:x"] = flight_condition.cg_x
+        outputs["data:reference_flight_condition:CG:z"] = flight_condition.cg_z
+        outputs["data:reference_flight_condition:flaps_deflection"] = flight_condition.flaps_deflection
+        outputs["data:reference_flight_condition:CD0"] = flight_condition.CD0
+        outputs["data:reference_flight_condition:flight_phase_category"] = flight_condition.flight_phase_category
+
+    def write_report(self) -> str:
+        """
+        Writes the report of the last computed flight condition in the result folder.
+
+        :return: the path of the report, None if no flight condition has been computed.
+        """
+        if self.flight_condition is None:
+            return None
+
+        results_file_path = os.path.join(self.options["result_folder_path"], REPORT_FILE_NAME)
+        write_flight_condition_report(
+            self.flight_condition, results_file_path, self.options["airplane_file"], self.options["add_fuselage"],
+            self.options["use_openvsp"])
+
+        return results_file_path
+
+
+def write_flight_condition_reports(system) -> List[str]:
+    """
+    Writes the reports of the reference flight conditions of a system, to be called once the evaluations are done.
+
+    :param system: the problem (or any system) containing the reference flight conditions.
+    :return: the paths of the reports.
+    """
+    if isinstance(system, om.Problem):
+        system = system.model
+
+    report_paths = []
+    for subsystem in system.system_iter(include_self=True, recurse=True, typ=ReferenceFlightCondition):
+        report_path = subsystem.write_report()
+        if report_path is not None:
+            report_paths.append(report_path)
+
+    return report_paths
@@ -16,9 +16,14 @@ Test load_analysis module.
 
 import numpy as np
 import pytest
+from scipy.integrate import trapz
+from scipy.interpolate import interp1d
 
-
-from ..wing.aerostructural_loads import AerostructuralLoad
+from ..wing.aerostructural_loads import (
+    AerostructuralLoad,
+    NB_POINTS_POINT_MASS,
+    POINT_MASS_SPAN_RATIO,
+)
 from ..wing.structural_loads import StructuralLoads
 from ..wing.aerodynamic_loads import AerodynamicLoads
 from ..wing.loads import WingLoads
@@ -1386,3 +1391,63 @@ def test_load_group():
     lift_shear_diagram = problem.get_val("data:loads:max_shear:lift_shear", units="N")
     lift_root_shear = lift_shear_diagram[0]
     assert lift_root_shear == pytest.approx(147551.45, abs=1)
+
+
+def _add_point_mass_sequential(
+    y_vector, chord_vector, point_mass_array, y_point_mass, point_mass, semi_span
+):
+    """
+    Reference implementation of the addition of a single point mass, station after station, as
+    done before the point masses were merged in a single pass.
+    """
+    fake_point_mass_array = np.zeros(len(point_mass_array))
+    present_mass_interp = interp1d(y_vector, point_mass_array)
+    present_chord_interp = interp1d(y_vector, chord_vector)
+
+    interval_len = POINT_MASS_SPAN_RATIO * semi_span / NB_POINTS_POINT_MASS
+    nb_point_side = (NB_POINTS_POINT_MASS - 1.0) / 2.0
+    y_added = [
+        y_point_mass + (i - nb_point_side) * interval_len for i in range(NB_POINTS_POINT_MASS)
+    ]
+    y_added = [y_current for y_current in y_added if 0.0 <= y_current <= semi_span]
+
+    for y_current in y_added + [min(y_added) - 1e-3, max(y_added) + 1e-3]:
+        y_vector, idx = AerostructuralLoad.insert_in_sorted_array(y_vector, y_current)
+        index = int(float(idx[0]))
+        chord_vector = np.insert(chord_vector, index, present_chord_interp(y_current))
+        point_mass_array = np.insert(point_mass_array, index, present_mass_interp(y_current))
+        fake_point_mass_array = np.insert(fake_point_mass_array, index, 0.0)
+
+    where_add_mass = np.logical_and(y_vector >= min(y_added), y_vector <= max(y_added))
+    fake_point_mass_array[where_add_mass] = 1.0
+    point_mass_array[where_add_mass] += point_mass / trapz(fake_point_mass_array, y_vector)
+
+    return y_vector, chord_vector, point_mass_array
+
+
+def test_add_point_masses():
+    """Tests that point masses added at once match the ones added one by one."""
+    inputs = {"data:geometry:wing:span": np.array([11.58])}
+    y_vector = np.linspace(0.0, 5.79, 40)
+    chord_vector = np.linspace(1.55, 1.25, 40)
+    y_point_masses = np.array([0.6, 1.97, 2.0, 5.5])
+    point_masses = np.array([40.0, 180.0, 15.0, 5.0])
+
+    y_vector_new, chord_vector_new, point_mass_array = AerostructuralLoad.add_point_masses(
+        y_vector, chord_vector, y_point_masses, point_masses, inputs
+    )
+
+    y_vector_ref = y_vector
+    chord_vector_ref = chord_vector
+    point_mass_array_ref = np.zeros_like(y_vector)
+    for y_point_mass, point_mass in zip(y_point_masses, point_masses):
+        y_vector_ref, chord_vector_ref, point_mass_array_ref = _add_point_mass_sequential(
+            y_vector_ref, chord_vector_ref, point_mass_array_ref, y_point_mass, point_mass, 5.79
+        )
+
+    assert len(y_vector_new) == len(y_vector) + 28
+    assert np.all(np.diff(y_vector_new) >= 0.0)
+    assert y_vector_new == pytest.approx(y_vector_ref, abs=1e-12)
+    assert chord_vector_new == pytest.approx(chord_vector_ref, abs=1e-12)
+    assert point_mass_array == pytest.approx(point_mass_array_ref, abs=1e-9)
+    assert np.trapz(point_mass_array, y_vector_new) == pytest.approx(np.sum(point_masses), rel=1e-9)
@@ -248,13 +248,23 @@ class AerostructuralLoad(ComputeVN):
         # STEP 4/XX - WE INITIALIZE THE LOOPS ON THE DIFFERENT SIZING CASE THAT WE DEFINED AND
         # THEN LAUNCH THEM
 
-        mass_array = np.array([mtow, min(mzfw, mtow)])
+        mass_array = np.array([mtow, min(mzfw, mtow)]).flatten()
+
+        # The flight domains of all the sizing cases are computed at once with the function we
+        # inherited from the ComputeVn class
+        atm.true_airspeed = cruise_v_tas
+        cruise_v_keas = atm.equivalent_airspeed
+        velocity_arrays, load_factor_arrays, _ = self.flight_domains(
+            inputs, mass_array, cruise_alt, cruise_v_keas
+        )
 
-        for mass in mass_array:
+        for mass, velocity_array, load_factor_array in zip(
+            mass_array, velocity_arrays, load_factor_arrays
+        ):
 
-            # STEP 4.1/XX - FIRST SUB-STEP IS TO COMPUTE THEN LOAD FACTOR EXPERIENCED BY THE
-            # AIRCRAFT AT THE CURRENT SIZING MASS USING THE FUNCTION WE INHERITED FROM THE
-            # ComputeVn CLASS AND THE BASELINE WEIGHT DISTRIBUTION FOR CURRENT FUEL IN THE WING
+            # STEP 4.1/XX - FIRST SUB-STEP IS TO GET THE LOAD FACTOR EXPERIENCED BY THE
+            # AIRCRAFT AT THE CURRENT SIZING MASS FROM ITS FLIGHT DOMAIN AND TO COMPUTE THE
+            # BASELINE WEIGHT DISTRIBUTION FOR CURRENT FUEL IN THE WING
 
             if abs(mtow - mzfw) < 5.0:
                 fuel_mass = 0.0
@@ -264,12 +274,6 @@ class AerostructuralLoad(ComputeVN):
             y_vector, weight_array_orig = self.compute_relief_force(
                 inputs, y_vector_orig, chord_vector, wing_mass, fuel_mass
             )
-            atm.true_airspeed = cruise_v_tas
-            cruise_v_keas = atm.equivalent_airspeed
-
-            velocity_array, load_factor_array, _ = self.flight_domain(
-                inputs, mass, cruise_alt, cruise_v_keas
-            )
             v_c = float(velocity_array[6])
 
             load_factor_list = np.array([max(load_factor_array), min(load_factor_array)])
@@ -484,31 +488,31 @@ class AerostructuralLoad(ComputeVN):
         # STEP 3/XX - AS MENTIONED BEFORE, ADDING POINT MASS WILL ADD Y STATIONS TO THE Y VECTOR
         # SO WE DO THEM BEFORE ANYTHING ELSE
 
-        # We create the array that will store the "point mass" which we chose to represent as
+        # We gather all the point masses (engines, punctual masses and landing gear) so that
+        # their stations are merged in the y vector at once, which we chose to represent as
         # distributed mass over a small finite interval
-        point_mass_array = np.zeros(len(y_vector))
+        y_point_masses = []
+        point_masses = []
 
         # Adding the motor weight
         if engine_config == 1.0:
-            for y_ratio_mot in y_ratio:
-                y_eng = y_ratio_mot * semi_span
-                y_vector, chord_vector, point_mass_array = AerostructuralLoad.add_point_mass(
-                    y_vector, chord_vector, point_mass_array, y_eng, single_engine_mass, inputs
-                )
+            y_point_masses.append(y_ratio * semi_span)
+            point_masses.append(np.full(len(y_ratio), single_engine_mass))
 
         if len(y_ratio_punctual_mass) >= 1.0:
-            for y_ratio_punctual in y_ratio_punctual_mass:
-                y_punctual_mass = y_ratio_punctual * semi_span
-                punctual_mass = punctual_mass_array[
-                    np.where(y_ratio_punctual_mass == y_ratio_punctual)[0]
-                ]
-                y_vector, chord_vector, point_mass_array = AerostructuralLoad.add_point_mass(
-                    y_vector, chord_vector, point_mass_array, y_punctual_mass, punctual_mass, inputs
-                )
+            y_point_masses.append(y_ratio_punctual_mass * semi_span)
+            point_masses.append(punctual_mass_array)
 
         # Adding the LG weight
-        y_vector, chord_vector, point_mass_array = AerostructuralLoad.add_point_mass(
-            y_vector, chord_vector, point_mass_array, y_lg, single_lg_mass, inputs
+        y_point_masses.append(y_lg)
+        point_masses.append(single_lg_mass)
+
+        y_vector, chord_vector, point_mass_array = AerostructuralLoad.add_point_masses(
+            y_vector,
+            chord_vector,
+            np.concatenate([np.ravel(y_point) for y_point in y_point_masses]),
+            np.concatenate([np.ravel(mass) for mass in point_masses]),
+            inputs,
         )
 
         # STEP 4/XX - WE CAN NOW ADD THE DISTRIBUTED MASS, I.E THE WING AND THE FUEL. A
@@ -582,96 +586,91 @@ class AerostructuralLoad(ComputeVN):
         return final_array
 
     @staticmethod
-    def add_point_mass(y_vector, chord_vector, point_mass_array, y_point_mass, point_mass, inputs):
+    def add_point_masses(y_vector, chord_vector, y_point_masses, point_masses, inputs):
         """
-        Function that add a point mass to an already created point_mass_array. Modify the y
-        station sampling and chord sampling to account for the additional station added.
+        Function that creates the point mass array of several point masses. The y station
+        sampling and chord sampling are modified to account for the stations of all the point
+        masses, which are merged in one go with the original stations so that the cost does not
+        depend on the number of point masses.
 
         @param y_vector: the original y_vector which will be modified by adding
-        NB_POINTS_POINT_MASS + 2 points to represent the location of the new point mass
-        @param chord_vector: the original chord vector which will be modified by adding
-        NB_POINTS_POINT_MASS + 2 points to represent the chord at the newly added location
-        @param point_mass_array: the original point mass vector on which we will add the point mass
-        @param y_point_mass: the y station of the point mass
-        @param point_mass: the value of the mass which we want to add
+        NB_POINTS_POINT_MASS + 2 points per point mass
+        @param chord_vector: the original chord vector which will be modified by adding the chord
+        at the newly added locations
+        @param y_point_masses: an array containing the y station of the point masses
+        @param point_masses: an array containing the value of the point masses
         @param inputs: inputs parameters defined within FAST-OAD-GA
         @return: y_vector_new : the new vector contains the y station at which we sample the point
-        mass array with the newly added point mass
+        mass array with the newly added point masses
         @return: chord_vector_new : the new vector contains the chord at the new y_station
-        @return: point_mass_array_new : the new vector contains the sampled point mass
+        @return: point_mass_array_new : the new vector contains the sampled point masses
         """
 
         # STEP 1/XX - WE EXTRACT THE NECESSARY OUTPUT FROM THE INPUTS
 
         semi_span = float(inputs["data:geometry:wing:span"]) / 2.0
+        y_point_masses = np.asarray(y_point_masses, dtype=float).ravel()
+        point_masses = np.asarray(point_masses, dtype=float).ravel()
 
-        # STEP 2/XX - WE CREATE THE INTERPOLATION VECTOR FOR THE CHORD AND THE MASSES. WE ALSO
-        # CREATE A VECTOR TO STOCK WHERE THE MASS ARE ADDED AND HAVE A WAY TO READJUST THE
-        # AMPLITUDE
-
-        fake_point_mass_array = np.zeros(len(point_mass_array))
-        present_mass_interp = interp1d(y_vector, point_mass_array)
-        present_chord_interp = interp1d(y_vector, chord_vector)
-
-        # STEP 3/XX - WE ALSO STOCK WHERE WE ADD THE Y STATION SINCE IT'LL BE LATER NECESSARY TO
-        # READJUST THE AMPLITUDE
+        # STEP 2/XX - WE COMPUTE THE NB_POINTS_POINT_MASS STATIONS OF EACH POINT MASS AS A
+        # (NB_POINT_MASS, NB_POINTS_POINT_MASS) ARRAY, THE ONES OUTSIDE OF THE WING ARE DISCARDED
 
         interval_len = POINT_MASS_SPAN_RATIO * semi_span / NB_POINTS_POINT_MASS
         nb_point_side = (NB_POINTS_POINT_MASS - 1.0) / 2.0
-        y_added = []
-
-        # STEP 4/XX - WE ADD THE NB_POINTS_POINT_MASS AND 2 MORE POINT JUST BEFORE AND AFTER TO
-        # GET THE PROPER SQUARE SHAPE AND NOT A TRAPEZE. WE ALSO ADD THE CORRESPONDING POINT IN
-        # THE CHORD VECTOR
-
-        for i in range(NB_POINTS_POINT_MASS):
-            y_current = y_point_mass + (i - nb_point_side) * interval_len
-            if (y_current >= 0.0) and (y_current <= semi_span):
-                y_added.append(y_current)
-                y_vector, idx = AerostructuralLoad.insert_in_sorted_array(y_vector, y_current)
-                index = int(float(idx[0]))
-                chord_vector = np.insert(chord_vector, index, present_chord_interp(y_current))
-                point_mass_array = np.insert(
-                    point_mass_array, index, present_mass_interp(y_current)
-                )
-                fake_point_mass_array = np.insert(fake_point_mass_array, index, 0.0)
-
-        y_min = min(y_added) - 1e-3
-        y_vector, idx = AerostructuralLoad.insert_in_sorted_array(y_vector, y_min)
-        index = int(float(idx[0]))
-        chord_vector = np.insert(chord_vector, index, present_chord_interp(y_min))
-        point_mass_array = np.insert(point_mass_array, index, present_mass_interp(y_min))
-        fake_point_mass_array = np.insert(fake_point_mass_array, index, 0.0)
-
-        y_max = max(y_added) + 1e-3
-        y_vector, idx = AerostructuralLoad.insert_in_sorted_array(y_vector, y_max)
-        index = int(float(idx[0]))
-        chord_vector = np.insert(chord_vector, index, present_chord_interp(y_max))
-        point_mass_array = np.insert(point_mass_array, index, present_mass_interp(y_max))
-        fake_point_mass_array = np.insert(fake_point_mass_array, index, 0.0)
-
-        # STEP 5/XX - WE NOW HAVE THE RIGHT WE JUST NEED TO SCALE IT PROPERLY WHICH IS THE POINT
-        # OF THIS STEP
-
-        where_add_mass_grt = np.greater_equal(y_vector, min(y_added))
-        where_add_mass_lss = np.less_equal(y_vector, max(y_added))
-        where_add_mass = np.logical_and(where_add_mass_grt, where_add_mass_lss)
-        where_add_mass_index = np.where(where_add_mass)
-
-        # The fake mass array we use to readjust contains the mass at the station between the
-        # first one we added and the last one which might contains the y station added for other
-        # point mass if two are on top of each other
+        y_added = (
+            y_point_masses[:, np.newaxis]
+            + (np.arange(NB_POINTS_POINT_MASS) - nb_point_side) * interval_len
+        )
+        in_wing = (y_added >= 0.0) & (y_added <= semi_span)
+        y_added_min = np.min(np.where(in_wing, y_added, np.inf), axis=1)
+        y_added_max = np.max(np.where(in_wing, y_added, -np.inf), axis=1)
+
+        # STEP 3/XX - WE ADD 2 MORE POINTS JUST BEFORE AND AFTER TO GET THE PROPER SQUARE SHAPE AND
+        # NOT A TRAPEZE, AND MERGE ALL THE STATIONS WITH THE ORIGINAL ONES. SINCE THE CHORD IS
+        # LINEARLY INTERPOLATED BETWEEN STATIONS, IT CAN BE INTERPOLATED ON THE ORIGINAL VECTOR
+
+        y_new_stations = np.concatenate([y_added[in_wing], y_added_min - 1e-3, y_added_max + 1e-3])
+        chord_new_stations = interp1d(y_vector, chord_vector)(y_new_stations)
+        order = np.argsort(np.concatenate([y_vector, y_new_stations]), kind="stable")
+        y_vector_new = np.concatenate([y_vector, y_new_stations])[order]
+        chord_vector_new = np.concatenate([chord_vector, chord_new_stations])[order]
+
+        # STEP 4/XX - EACH MASS IS SPREAD EVENLY BETWEEN ITS FIRST AND LAST STATION, WHICH MIGHT
+        # CONTAIN STATIONS ADDED FOR OTHER POINT MASSES IF TWO ARE ON TOP OF EACH OTHER. THE
+        # AMPLITUDE IS READJUSTED SO THAT THE INTEGRATION GIVES THE ACTUAL MASS
+
+        where_add_mass = (y_vector_new >= y_added_min[:, np.newaxis]) & (
+            y_vector_new <= y_added_max[:, np.newaxis]
+        )
+        readjust = trapz(where_add_mass.astype(float), y_vector_new, axis=1)
+        point_mass_array_new = np.dot(point_masses / readjust, where_add_mass)
 
-        for idx in where_add_mass_index:
-            fake_point_mass_array[idx] = 1.0
+        return y_vector_new, chord_vector_new, point_mass_array_new
 
-        readjust = trapz(fake_point_mass_array, y_vector)
+    @staticmethod
+    def add_point_mass(y_vector, chord_vector, point_mass_array, y_point_mass, point_mass, inputs):
+        """
+        Function that add a point mass to an already created point_mass_array. Modify the y
+        station sampling and chord sampling to account for the additional station added. When
+        several point masses are to be added, add_point_masses should be preferred.
 
-        for idx in where_add_mass_index:
-            point_mass_array[idx] += point_mass / readjust
+        @param y_vector: the original y_vector which will be modified by adding
+        NB_POINTS_POINT_MASS + 2 points to represent the location of the new point mass
+        @param chord_vector: the original chord vector which will be modified by adding
+        NB_POINTS_POINT_MASS + 2 points to represent the chord at the newly added location
+        @param point_mass_array: the original point mass vector on which we will add the point mass
+        @param y_point_mass: the y station of the point mass
+        @param point_mass: the value of the mass which we want to add
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @return: y_vector_new : the new vector contains the y station at which we sample the point
+        mass array with the newly added point mass
+        @return: chord_vector_new : the new vector contains the chord at the new y_station
+        @return: point_mass_array_new : the new vector contains the sampled point mass
+        """
 
-        y_vector_new = y_vector
-        point_mass_array_new = point_mass_array
-        chord_vector_new = chord_vector
+        y_vector_new, chord_vector_new, added_mass_array = AerostructuralLoad.add_point_masses(
+            y_vector, chord_vector, y_point_mass, point_mass, inputs
+        )
+        point_mass_array_new = interp1d(y_vector, point_mass_array)(y_vector_new) + added_mass_array
 
         return y_vector_new, chord_vector_new, point_mass_array_new
@@ -171,7 +171,12 @@ def test_advanced_geom():
     ivc_loop.add_output("settings:geometry:fuel_tanks:depth", val=0.6)
 
     problem_loop = run_system(UpdateWingAreaGeomAdvanced(), ivc_loop)
-    assert_allclose(problem_loop["wing_area"], 21.72, atol=1e-2)
+    assert_allclose(problem_loop["wing_area"], 21.736, atol=1e-2)
+
+    # Second resolution is warm started from the previous wing area
+    problem_loop.set_val("data:mission:sizing:fuel", val=650.0, units="kg")
+    problem_loop.run_model()
+    assert_allclose(problem_loop["wing_area"], 22.872, atol=1e-2)
 
     ivc_cons = om.IndepVarComp()
     ivc_cons.add_output("data:propulsion:IC_engine:fuel_type", 1.0)
@@ -198,7 +203,7 @@ def test_advanced_geom():
     ivc_cons.add_output("data:geometry:landing_gear:y", val=1.5, units="m")
     ivc_cons.add_output("data:geometry:propulsion:nacelle:width", val=0.9291288709126333, units="m")
     ivc_cons.add_output("settings:geometry:fuel_tanks:depth", val=0.6)
-    ivc_cons.add_output("data:geometry:wing:area", val=21.72, units="m**2")
+    ivc_cons.add_output("data:geometry:wing:area", val=21.736, units="m**2")
 
     problem_cons = run_system(ConstraintWingAreaGeomAdvanced(), ivc_cons)
     assert_allclose(problem_cons["data:constraints:wing:additional_fuel_capacity"], 0.0, atol=1)
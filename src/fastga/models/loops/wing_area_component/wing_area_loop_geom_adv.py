@@ -16,18 +16,14 @@ advanced computation of the maximum fuel weight.
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
-import copy
 
 import numpy as np
 import openmdao.api as om
-from openmdao.utils.units import convert_units
 
-from scipy.optimize import fsolve
+from scipy.optimize import brentq
 
 from fastoad.module_management.service_registry import RegisterSubmodel
 
-from fastga.command.api import generate_block_analysis
-
 from fastga.models.aerodynamics.constants import ENGINE_COUNT
 from fastga.models.geometry.geom_components.wing.components.compute_wing_y import ComputeWingY
 from fastga.models.geometry.geom_components.wing.components.compute_wing_l2_l3 import (
@@ -42,6 +38,13 @@ from ..constants import SUBMODEL_WING_AREA_GEOM_LOOP, SUBMODEL_WING_AREA_GEOM_CO
 
 _LOGGER = logging.getLogger(__name__)
 
+# Initial guess of the wing area when no previous solution is available, in m**2
+DEFAULT_WING_AREA = 16.8871
+# Factor applied to the wing area to bracket the solution, and limits of the search, in m**2
+BRACKET_FACTOR = 1.2
+MIN_WING_AREA = 1.0
+MAX_WING_AREA = 1000.0
+
 
 @RegisterSubmodel(
     SUBMODEL_WING_AREA_GEOM_LOOP, "fastga.submodel.loop.wing_area.update.geom.advanced"
@@ -49,10 +52,16 @@ _LOGGER = logging.getLogger(__name__)
 class UpdateWingAreaGeomAdvanced(om.ExplicitComponent):
     """
     Computes needed wing area to be able to load enough fuel to achieve the sizing mission. For
-    the mission wing area the code uses the fsolve algorithm on a function that computes the wing
-    area following the same approach as in compute_mfw.
+    the mission wing area, the fuel capacity of the wing following the same approach as in
+    compute_mfw being monotonic with the wing area, the code brackets the solution starting
+    from the previously found wing area and uses Brent's method.
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._tank_capacity = None
+        self._previous_wing_area = DEFAULT_WING_AREA
+
     def setup(self):
 
         self.add_input("data:geometry:wing:aspect_ratio", val=np.nan)
@@ -86,24 +95,41 @@ class UpdateWingAreaGeomAdvanced(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
-        mfw_mission = inputs["data:mission:sizing:fuel"]
-
-        # TODO: Why is it hardcoded ?
-        wing_area_mission_initial = 16.8871
-
-        wing_area_mission, _, ier, _ = fsolve(
-            compute_wing_area_new,
-            np.array([wing_area_mission_initial]),
-            args=(inputs, mfw_mission),
-            xtol=0.01,
-            full_output=True,
-        )
-
-        if ier != 1:
+        mfw_mission = float(inputs["data:mission:sizing:fuel"])
+
+        if self._tank_capacity is None:
+            self._tank_capacity = WingTankCapacity()
+        self._tank_capacity.set_inputs(inputs)
+
+        def residual(wing_area):
+            return self._tank_capacity.mfw(wing_area) - mfw_mission
+
+        # Fuel capacity increases with the wing area: the bracket is extended from the previous
+        # solution in the direction of the root
+        lower_area = upper_area = self._previous_wing_area
+        residual_lower = residual_upper = residual(lower_area)
+        while residual_lower > 0.0 and lower_area > MIN_WING_AREA:
+            upper_area, residual_upper = lower_area, residual_lower
+            lower_area = max(lower_area / BRACKET_FACTOR, MIN_WING_AREA)
+            residual_lower = residual(lower_area)
+        while residual_upper < 0.0 and upper_area < MAX_WING_AREA:
+            lower_area, residual_lower = upper_area, residual_upper
+            upper_area = min(upper_area * BRACKET_FACTOR, MAX_WING_AREA)
+            residual_upper = residual(upper_area)
+
+        if residual_lower > 0.0 or residual_upper < 0.0:
             _LOGGER.warning(
-                "Could not find a wing area that suits the requirement for fuel inside the wing, "
-                "setting the value to 0.0",
+                "Could not find a wing area between %f m**2 and %f m**2 that suits the "
+                "requirement for fuel inside the wing, setting the value to the closest bound",
+                MIN_WING_AREA,
+                MAX_WING_AREA,
             )
+            wing_area_mission = lower_area if residual_lower > 0.0 else upper_area
+        elif residual_lower == 0.0 or residual_upper == 0.0:
+            wing_area_mission = lower_area if residual_lower == 0.0 else upper_area
+        else:
+            wing_area_mission = brentq(residual, lower_area, upper_area, xtol=1e-4)
+            self._previous_wing_area = wing_area_mission
 
         outputs["wing_area"] = wing_area_mission
 
@@ -118,6 +144,10 @@ class ConstraintWingAreaGeomAdvanced(om.ExplicitComponent):
     computation of the fuel inside the wing.
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._tank_capacity = None
+
     def setup(self):
         self.add_input("data:geometry:wing:aspect_ratio", val=np.nan)
         self.add_input("data:geometry:wing:taper_ratio", val=np.nan)
@@ -154,8 +184,12 @@ class ConstraintWingAreaGeomAdvanced(om.ExplicitComponent):
         mfw_mission = inputs["data:mission:sizing:fuel"]
         wing_area = inputs["data:geometry:wing:area"]
 
-        outputs["data:constraints:wing:additional_fuel_capacity"] = compute_wing_area_new(
-            wing_area, inputs, mfw_mission
+        if self._tank_capacity is None:
+            self._tank_capacity = WingTankCapacity()
+        self._tank_capacity.set_inputs(inputs)
+
+        outputs["data:constraints:wing:additional_fuel_capacity"] = (
+            self._tank_capacity.mfw(float(wing_area)) - mfw_mission
         )
 
 
@@ -169,168 +203,53 @@ def compute_wing_area_new(wing_area, inputs, fuel_mission):
     :param inputs: inputs of the component
     :param fuel_mission: fuel needed to achieve the mission, in kg
     """
-    wing_ar = float(inputs["data:geometry:wing:aspect_ratio"])
-    wing_taper_ratio = float(inputs["data:geometry:wing:taper_ratio"])
-    fus_width = float(inputs["data:geometry:fuselage:maximum_width"])
-    kink_span_ratio = float(inputs["data:geometry:wing:kink:span_ratio"])
-
-    fuel_type = float(inputs["data:propulsion:IC_engine:fuel_type"])
-    root_tc = float(inputs["data:geometry:wing:root:thickness_ratio"])
-    tip_tc = float(inputs["data:geometry:wing:tip:thickness_ratio"])
-    flap_chord_ratio = float(inputs["data:geometry:flap:chord_ratio"])
-    aileron_chord_ratio = float(inputs["data:geometry:wing:aileron:chord_ratio"])
-    y_ratio_tank_beginning = float(inputs["data:geometry:propulsion:tank:y_ratio_tank_beginning"])
-    y_ratio_tank_end = float(inputs["data:geometry:propulsion:tank:y_ratio_tank_end"])
-    engine_config = float(inputs["data:geometry:propulsion:engine:layout"])
-    y_ratio_tank = inputs["data:geometry:propulsion:engine:y_ratio"]
-    le_chord_percentage = float(inputs["data:geometry:propulsion:tank:LE_chord_percentage"])
-    te_chord_percentage = float(inputs["data:geometry:propulsion:tank:TE_chord_percentage"])
-    nacelle_width = float(inputs["data:geometry:propulsion:nacelle:width"])
-    lg_type = float(inputs["data:geometry:landing_gear:type"])
-    y_lg = float(inputs["data:geometry:landing_gear:y"])
-    k = float(inputs["settings:geometry:fuel_tanks:depth"])
-
-    # We first have to recompute all the data needed for the tank capacity computation that
-    # depends on the wing area To ensure coherency with the method used, we will use the
-    # generate block analysis method on the component that compute said value and then use a
-    # block_analysis on the compute_mfw_advanced component.
-
-    # First we need to compute the y positions and the span
-
-    var_inputs_compute_y = [
-        "data:geometry:wing:aspect_ratio",
-        "data:geometry:fuselage:maximum_width",
-        "data:geometry:wing:area",
-        "data:geometry:wing:kink:span_ratio",
-    ]
-
-    compute_wing_y = generate_block_analysis(ComputeWingY(), var_inputs_compute_y, "", False)
-
-    var_dict_compute_y = {
-        "data:geometry:wing:aspect_ratio": (wing_ar, None),
-        "data:geometry:fuselage:maximum_width": (fus_width, "m"),
-        "data:geometry:wing:area": (wing_area, "m**2"),
-        "data:geometry:wing:kink:span_ratio": (kink_span_ratio, None),
-    }
-
-    var_outputs_compute_y = compute_wing_y(var_dict_compute_y)
-
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    wing_span_original_val = var_outputs_compute_y.get("data:geometry:wing:span")[0]
-    wing_span_original_unit = var_outputs_compute_y.get("data:geometry:wing:span")[1]
-    wing_span = convert_units(wing_span_original_val, wing_span_original_unit, "m")
-
-    root_y_original_val = var_outputs_compute_y.get("data:geometry:wing:root:y")[0]
-    root_y_original_unit = var_outputs_compute_y.get("data:geometry:wing:root:y")[1]
-    root_y = convert_units(root_y_original_val, root_y_original_unit, "m")
-
-    tip_y_original_val = var_outputs_compute_y.get("data:geometry:wing:tip:y")[0]
-    tip_y_original_unit = var_outputs_compute_y.get("data:geometry:wing:tip:y")[1]
-    tip_y = convert_units(tip_y_original_val, tip_y_original_unit, "m")
-
-    # We now compute the root chord
-
-    var_inputs_compute_root_chord = [
-        "data:geometry:wing:taper_ratio",
-        "data:geometry:wing:area",
-        "data:geometry:wing:root:y",
-        "data:geometry:wing:tip:y",
-    ]
-
-    compute_wing_root_chord = generate_block_analysis(
-        ComputeWingL2AndL3(), var_inputs_compute_root_chord, "", False
-    )
-
-    var_dict_compute_root_chord = {
-        "data:geometry:wing:taper_ratio": (wing_taper_ratio, None),
-        "data:geometry:wing:area": (wing_area, "m**2"),
-        "data:geometry:wing:root:y": (root_y, "m"),
-        "data:geometry:wing:tip:y": (tip_y, "m"),
-    }
-
-    var_outputs_compute_root_chord = compute_wing_root_chord(var_dict_compute_root_chord)
-
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    root_chord_original_value = var_outputs_compute_root_chord.get("data:geometry:wing:root:chord")[
-        0
-    ]
-    root_chord_original_unit = var_outputs_compute_root_chord.get("data:geometry:wing:root:chord")[
-        1
-    ]
-    root_chord = convert_units(root_chord_original_value, root_chord_original_unit, "m")
-
-    # We now compute the tip chord
-
-    var_inputs_compute_tip_chord = copy.copy(var_inputs_compute_root_chord)
-
-    compute_wing_tip_chord = generate_block_analysis(
-        ComputeWingL1AndL4(), var_inputs_compute_tip_chord, "", False
-    )
-
-    var_dict_compute_root_chord = copy.copy(var_dict_compute_root_chord)
-
-    var_outputs_compute_tip_chord = compute_wing_tip_chord(var_dict_compute_root_chord)
-
-    # We ensure that the units are in the SI system using openmdao convert unit_function
-    tip_chord_original_value = var_outputs_compute_tip_chord.get("data:geometry:wing:tip:chord")[0]
-    tip_chord_original_unit = var_outputs_compute_tip_chord.get("data:geometry:wing:tip:chord")[1]
-    tip_chord = convert_units(tip_chord_original_value, tip_chord_original_unit, "m")
-
-    # We can now move on to the computation of the mfw for that wing area and then return the
-    # difference to solve for the right wing_area
-
-    var_inputs_compute_mfw = [
-        "data:propulsion:IC_engine:fuel_type",
-        "data:geometry:wing:root:chord",
-        "data:geometry:wing:tip:chord",
-        "data:geometry:wing:root:y",
-        "data:geometry:wing:tip:y",
-        "data:geometry:wing:root:thickness_ratio",
-        "data:geometry:wing:tip:thickness_ratio",
-        "data:geometry:flap:chord_ratio",
-        "data:geometry:wing:aileron:chord_ratio",
-        "data:geometry:propulsion:tank:y_ratio_tank_beginning",
-        "data:geometry:propulsion:tank:y_ratio_tank_end",
-        "data:geometry:propulsion:engine:layout",
-        "data:geometry:propulsion:engine:y_ratio",
-        "data:geometry:propulsion:tank:LE_chord_percentage",
-        "data:geometry:propulsion:tank:TE_chord_percentage",
-        "data:geometry:propulsion:nacelle:width",
-        "data:geometry:wing:span",
-        "data:geometry:landing_gear:type",
-        "data:geometry:landing_gear:y",
-        "settings:geometry:fuel_tanks:depth",
-    ]
-
-    compute_mfw = generate_block_analysis(ComputeMFWAdvanced(), var_inputs_compute_mfw, "", False)
-
-    var_dict_compute_root_chord = {
-        "data:propulsion:IC_engine:fuel_type": (fuel_type, None),
-        "data:geometry:wing:root:chord": (root_chord, "m"),
-        "data:geometry:wing:tip:chord": (tip_chord, "m"),
-        "data:geometry:wing:root:y": (root_y, "m"),
-        "data:geometry:wing:tip:y": (tip_y, "m"),
-        "data:geometry:wing:root:thickness_ratio": (root_tc, None),
-        "data:geometry:wing:tip:thickness_ratio": (tip_tc, None),
-        "data:geometry:flap:chord_ratio": (flap_chord_ratio, None),
-        "data:geometry:wing:aileron:chord_ratio": (aileron_chord_ratio, None),
-        "data:geometry:propulsion:tank:y_ratio_tank_beginning": (y_ratio_tank_beginning, None),
-        "data:geometry:propulsion:tank:y_ratio_tank_end": (y_ratio_tank_end, None),
-        "data:geometry:propulsion:engine:layout": (engine_config, None),
-        "data:geometry:propulsion:engine:y_ratio": (y_ratio_tank, None),
-        "data:geometry:propulsion:tank:LE_chord_percentage": (le_chord_percentage, None),
-        "data:geometry:propulsion:tank:TE_chord_percentage": (te_chord_percentage, None),
-        "data:geometry:propulsion:nacelle:width": (nacelle_width, "m"),
-        "data:geometry:wing:span": (wing_span, "m"),
-        "data:geometry:landing_gear:type": (lg_type, None),
-        "data:geometry:landing_gear:y": (y_lg, "m"),
-        "settings:geometry:fuel_tanks:depth": (k, None),
-    }
-
-    var_outputs_compute_mfw = compute_mfw(var_dict_compute_root_chord)
-
-    mfw_original_val = var_outputs_compute_mfw.get("data:weight:aircraft:MFW")[0]
-    mfw_original_unit = var_outputs_compute_mfw.get("data:weight:aircraft:MFW")[1]
-    mfw = convert_units(mfw_original_val, mfw_original_unit, "kg")
-
-    return mfw - fuel_mission
+    tank_capacity = WingTankCapacity()
+    tank_capacity.set_inputs(inputs)
+
+    return tank_capacity.mfw(float(wing_area)) - fuel_mission
+
+
+class WingTankCapacity:
+    """
+    Computes the maximum fuel weight that can be stored in the wing as a function of the wing
+    area, the other parameters of the wing and tanks being fixed. To ensure coherency with the
+    method used in the geometry module, the wing y positions, span and chords are computed with
+    the same components as compute_mfw_advanced, in a problem that is set up once and re-run for
+    each wing area.
+    """
+
+    def __init__(self):
+        model = om.Group()
+        model.add_subsystem("wing_y", ComputeWingY(), promotes=["*"])
+        model.add_subsystem("wing_l2_l3", ComputeWingL2AndL3(), promotes=["*"])
+        model.add_subsystem("wing_l1_l4", ComputeWingL1AndL4(), promotes=["*"])
+        model.add_subsystem("mfw", ComputeMFWAdvanced(), promotes=["*"])
+        self._problem = om.Problem(model)
+        self._problem.setup()
+        # Inputs that are not computed inside the problem, apart from the wing area
+        model = self._problem.model
+        self._inputs = sorted(
+            {meta["prom_name"] for _, meta in model.list_inputs(out_stream=None, prom_name=True)}
+            - {meta["prom_name"] for _, meta in model.list_outputs(out_stream=None, prom_name=True)}
+            - {"data:geometry:wing:area"}
+        )
+
+    def set_inputs(self, inputs):
+        """
+        Sets the wing and tanks parameters other than the wing area.
+
+        :param inputs: inputs of a component with the same names and units as the geometry
+        components.
+        """
+        for name in self._inputs:
+            self._problem.set_val(name, inputs[name])
+
+    def mfw(self, wing_area: float) -> float:
+        """
+        :param wing_area: wing area, in m**2
+        :return: maximum fuel weight that can be stored in the wing, in kg.
+        """
+        self._problem.set_val("data:geometry:wing:area", wing_area, units="m**2")
+        self._problem.run_model()
+
+        return float(self._problem.get_val("data:weight:aircraft:MFW", units="kg"))
@@ -22,8 +22,10 @@ import openmdao.api as om
 from scipy.constants import g
 from scipy.optimize import fsolve
 import pandas as pd
+from typing import Callable, Optional, Sequence, Tuple
 
-from stdatm import Atmosphere
+from fastga.utils.atmosphere import TabulatedAtmosphere
+from fastga.utils.complex_step import complex_newton_correction, to_scalar
 
 CSV_DATA_LABELS = [
     "time",
@@ -44,9 +46,71 @@ CSV_DATA_LABELS = [
     "name",
 ]
 
+# Tabulated equilibrium: number of altitude and mass points of the grid, mass range covered below
+# the initial mass of the phase, and maximum interpolation error (relative to the range of each
+# tabulated value) checked against exact solutions at the centre of some cells of the grid
+TABLE_ALTITUDE_POINTS_NB = 5
+TABLE_MASS_POINTS_NB = 3
+TABLE_MASS_RANGE = 0.1
+TABLE_VALIDATION_POINTS_NB = 3
+TABLE_TOLERANCE = 5.0e-3
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class EquilibriumTable:
+    """
+    Dynamic equilibrium tabulated on an (altitude, mass) grid, the flight conditions (path angle,
+    dynamic pressure and acceleration) being functions of the altitude along the profile of a
+    phase. Equilibrium is linearly interpolated between the points of the grid.
+
+    :param altitudes: altitudes of the grid in m, in ascending order.
+    :param masses: masses of the grid in kg, in ascending order.
+    :param results: equilibrium (alpha, thrust, cl_wing, cl_htp, delta_e, error) at each point of
+    the grid, shape (altitude points, mass points, 6).
+    """
+
+    def __init__(self, altitudes: np.ndarray, masses: np.ndarray, results: np.ndarray):
+        self.altitudes = np.asarray(altitudes, dtype=float)
+        self.masses = np.asarray(masses, dtype=float)
+        self.results = np.asarray(results, dtype=float)
+
+    @staticmethod
+    def _weights(grid: np.ndarray, value: float) -> Tuple[int, float]:
+        if len(grid) == 1:
+            return 0, 0.0
+        idx = int(np.clip(np.searchsorted(grid, value) - 1, 0, len(grid) - 2))
+
+        return idx, (value - grid[idx]) / (grid[idx + 1] - grid[idx])
+
+    def contains(self, altitude: float, mass: float) -> bool:
+        """Checks that the point is within the grid (altitude being rounded to 1 mm)."""
+        altitude = round(float(altitude), 3)
+
+        return (
+            self.altitudes[0] <= altitude <= self.altitudes[-1]
+            and self.masses[0] <= float(mass) <= self.masses[-1]
+        )
+
+    def __call__(self, altitude: float, mass: float) -> tuple:
+        """
+        :return: interpolated equilibrium, in the format of DynamicEquilibrium.dynamic_equilibrium,
+        the error being raised if it is raised at one of the surrounding points of the grid.
+        """
+        i, u = self._weights(self.altitudes, float(altitude))
+        j, v = self._weights(self.masses, float(mass))
+        i_1 = min(i + 1, len(self.altitudes) - 1)
+        result = (
+            (1.0 - u) * (1.0 - v) * self.results[i, j]
+            + (1.0 - u) * v * self.results[i, j + 1]
+            + u * (1.0 - v) * self.results[i_1, j]
+            + u * v * self.results[i_1, j + 1]
+        )
+        error = bool(np.any(self.results[i : i_1 + 1, j : j + 2, 5] > 0.0))
+
+        return tuple(result[:5]) + (error,)
+
+
 class DynamicEquilibrium(om.ExplicitComponent):
     """
     Compute the derivatives and associated lift-drag-thrust decomposition depending if DP model
@@ -62,6 +126,13 @@ class DynamicEquilibrium(om.ExplicitComponent):
 
     def initialize(self):
         self.options.declare("out_file", default="", types=str)
+        self.options.declare(
+            "tabulated_equilibrium",
+            default=False,
+            types=bool,
+            desc="If True, equilibrium of the phase is interpolated in a table computed once on an "
+            "(altitude, mass) grid instead of being solved at each time step",
+        )
 
     def setup(self):
         self.add_input("data:geometry:wing:MAC:leading_edge:x:local", val=np.nan, units="m")
@@ -155,20 +226,24 @@ class DynamicEquilibrium(om.ExplicitComponent):
         cl_min_clean_htp = inputs["data:aerodynamics:horizontal_tail:low_speed:CL_min_clean"]
 
         if len(previous_step) == 2:
-            result = fsolve(
-                self.equation_outer,
-                np.array([previous_step[0] * 180.0 / math.pi, previous_step[1] / 1000.0]),
-                args=(inputs, gamma, q, dvx_dt, dvz_dt, mass, flap_condition, low_speed, x_cg),
-                xtol=1.0e-3,
+            x_init = np.array(
+                [
+                    np.real(previous_step[0]) * 180.0 / math.pi,
+                    np.real(previous_step[1]) / 1000.0,
+                ]
             )
         else:
-            result = fsolve(
-                self.equation_outer,
-                np.array([0.0, 1.0]),
-                args=(inputs, gamma, q, dvx_dt, dvz_dt, mass, flap_condition, low_speed, x_cg),
-                xtol=1.0e-3,
-            )
-        alpha_equilibrium = result[0] * math.pi / 180.0
+            x_init = np.array([0.0, 1.0])
+        args = (inputs, gamma, q, dvx_dt, dvz_dt, mass, flap_condition, low_speed, x_cg)
+        result = fsolve(self.equation_outer_real, x_init, args=args, xtol=1.0e-3)
+
+        # Under complex step, the real equilibrium found by fsolve is corrected so that the
+        # derivatives are carried by the imaginary part of the solution
+        if self.under_complex_step:
+            result = complex_newton_correction(self.equation_outer, result, args)
+            self.equation_outer(result, *args)
+
+        alpha_equilibrium = result[0] * np.pi / 180.0
         # noinspection PyTypeChecker
         thrust_equilibrium = result[1] * 1000.0
 
@@ -176,7 +251,9 @@ class DynamicEquilibrium(om.ExplicitComponent):
         cl_htp_local = self.cl_tail_sol
         delta_elevator = self.delta_e_sol
 
-        if (cl_htp_local > cl_max_clean_htp) or (cl_htp_local < cl_min_clean_htp):
+        if (np.real(cl_htp_local) > np.real(cl_max_clean_htp)) or (
+            np.real(cl_htp_local) < np.real(cl_min_clean_htp)
+        ):
             error_on_htp = True
         else:
             error_on_htp = False
@@ -194,6 +271,96 @@ class DynamicEquilibrium(om.ExplicitComponent):
             error,
         )
 
+    def equilibrium_table(
+        self,
+        inputs,
+        flight_conditions: Callable[[float], Tuple[float, float, float]],
+        altitudes: Sequence[float],
+        mass: float,
+    ) -> Optional[EquilibriumTable]:
+        """
+        Computes the equilibrium of a phase on an (altitude, mass) grid, with the clean
+        configuration and cruise aerodynamic models. The table is checked against exact solutions
+        at the centre of some cells of the grid.
+
+        :param inputs: inputs derived from aero and mass models
+        :param flight_conditions: function of the altitude (in m) returning the path angle (in
+        rad.), the dynamic pressure and the acceleration linear to air speed along the phase
+        :param altitudes: altitudes of the grid in m
+        :param mass: initial mass of the phase, the grid covering TABLE_MASS_RANGE below it
+        :return: the equilibrium table, None if the tabulated mode is disabled, under complex step
+        or if the interpolation error is above TABLE_TOLERANCE.
+        """
+
+        if not self.options["tabulated_equilibrium"] or self.under_complex_step:
+            return None
+
+        altitudes = np.unique(np.round(np.asarray(altitudes, dtype=float), 3))
+        mass = float(mass)
+        masses = np.linspace(mass * (1.0 - TABLE_MASS_RANGE), mass, TABLE_MASS_POINTS_NB)
+
+        def solve(altitude, mass_point, previous_step):
+            gamma, q, dvx_dt = flight_conditions(altitude)
+            equilibrium = self.dynamic_equilibrium(
+                inputs, gamma, q, dvx_dt, 0.0, mass_point, "none", previous_step
+            )
+
+            return np.array([np.real(value) for value in equilibrium], dtype=float)
+
+        results = np.zeros((len(altitudes), len(masses), 6))
+        previous_step = ()
+        for i, altitude in enumerate(altitudes):
+            for j, mass_point in enumerate(masses):
+                results[i, j] = solve(altitude, mass_point, previous_step)
+                previous_step = tuple(results[i, j, 0:2])
+        table = EquilibriumTable(altitudes, masses, results)
+
+        # Check interpolation at the centre of cells spread over the grid
+        scale = np.max(np.abs(results[:, :, 0:4]), axis=(0, 1))
+        scale[scale == 0.0] = 1.0
+        cells = [
+            (int(i), int(j))
+            for i, j in zip(
+                np.linspace(0, max(len(altitudes) - 2, 0), TABLE_VALIDATION_POINTS_NB),
+                np.linspace(0, len(masses) - 2, TABLE_VALIDATION_POINTS_NB),
+            )
+        ]
+        for i, j in sorted(set(cells)):
+            altitude = np.mean(altitudes[i : i + 2])
+            mass_point = np.mean(masses[j : j + 2])
+            exact = solve(altitude, mass_point, tuple(results[i, j, 0:2]))
+            error = np.max(np.abs(np.array(table(altitude, mass_point)[0:4]) - exact[0:4]) / scale)
+            if error > TABLE_TOLERANCE:
+                _LOGGER.info(
+                    "Equilibrium interpolation error %.2e above %.2e, exact equilibrium used",
+                    error,
+                    TABLE_TOLERANCE,
+                )
+                return None
+
+        return table
+
+    def tabulated_dynamic_equilibrium(
+        self,
+        inputs,
+        table: Optional[EquilibriumTable],
+        altitude: float,
+        gamma: float,
+        q: float,
+        dvx_dt: float,
+        mass: float,
+        previous_step: tuple,
+    ):
+        """
+        Equilibrium interpolated in the table if available and if the point is within its grid,
+        otherwise solved with dynamic_equilibrium (clean configuration, no vertical acceleration).
+        """
+
+        if table is not None and table.contains(altitude, mass):
+            return table(altitude, mass)
+
+        return self.dynamic_equilibrium(inputs, gamma, q, dvx_dt, 0.0, mass, "none", previous_step)
+
     @staticmethod
     def found_cl_repartition(
         inputs,
@@ -252,19 +419,19 @@ class DynamicEquilibrium(om.ExplicitComponent):
         a22 = x_htp - x_cg
         b2 = (cm0_wing + delta_cm + (cm_alpha_fus / cl_alpha_wing) * cl0_wing) * l0_wing
 
-        a = np.array([[a11, a12], [float(a21), float(a22)]])
-        b = np.array([b1, b2])
+        a = np.array([[a11, a12], [to_scalar(a21), to_scalar(a22)]])
+        b = np.array([to_scalar(b1), to_scalar(b2)])
         inv_a = np.linalg.inv(a)
         cl_array = np.dot(inv_a, b)
 
         # Return equilibrated lift coefficients if low speed maximum clean Cl not exceeded
         # otherwise only cl_wing, 3rd term is an error flag returned by the function
-        if cl_array[0] < cl_max_clean:
-            cl_wing_return = float(cl_array[0])
-            cl_htp_return = float(cl_array[1])
+        if np.real(cl_array[0]) < np.real(to_scalar(cl_max_clean)):
+            cl_wing_return = cl_array[0]
+            cl_htp_return = cl_array[1]
             error = False
         else:
-            cl_wing_return = float(mass * g * load_factor / (q * wing_area))
+            cl_wing_return = to_scalar(mass * g * load_factor / (q * wing_area))
             cl_htp_return = 0.0
             error = True
 
@@ -306,7 +473,7 @@ class DynamicEquilibrium(om.ExplicitComponent):
         thrust = float(equilibrium_result[1])
         cl_wing = float(equilibrium_result[2])
         cl_htp = float(equilibrium_result[3])
-        atm = Atmosphere(altitude, altitude_in_feet=False)
+        atm = TabulatedAtmosphere(altitude, altitude_in_feet=False)
         mach = v_tas / atm.speed_of_sound
         if not os.path.exists(self.options["out_file"]):
             df = pd.DataFrame(columns=CSV_DATA_LABELS)
@@ -403,15 +570,13 @@ class DynamicEquilibrium(om.ExplicitComponent):
         z_eng = z_cg_aircraft - z_cg_engine
         alpha_eng = 0.0  # fixme: angle between propulsion and wing not defined
 
-        alpha = x[0] * math.pi / 180.0  # defined in degree to be homogenous on x-tolerance
+        alpha = x[0] * np.pi / 180.0  # defined in degree to be homogenous on x-tolerance
         thrust = x[1] * 1000.0  # defined in kN to be homogenous on x-tolerance
 
-        load_factor = (
-            -dvz_dt + g * math.cos(gamma) - thrust / mass * math.sin(alpha - alpha_eng)
-        ) / g
+        load_factor = (-dvz_dt + g * np.cos(gamma) - thrust / mass * np.sin(alpha - alpha_eng)) / g
         # Additional aerodynamics
         delta_cl = 0.0
-        delta_cm = z_eng * thrust * math.cos(alpha - alpha_eng) / (wing_mac * q * wing_area)
+        delta_cm = z_eng * thrust * np.cos(alpha - alpha_eng) / (wing_mac * q * wing_area)
         cl_wing_blown, cl_htp, error_tag = self.found_cl_repartition(
             inputs, load_factor, mass, q, delta_cm, low_speed, x_cg
         )
@@ -444,13 +609,21 @@ class DynamicEquilibrium(om.ExplicitComponent):
         )
         drag = q * cd * wing_area
         # Divide the results by characteristic number to have homogeneous responses
-        f1 = float(
-            thrust * math.cos(alpha - alpha_eng) - mass * g * math.sin(gamma) - drag - mass * dvx_dt
-        ) / (float(mass) / 10.0)
-        f2 = float(cl_wing_blown - (cl_wing + delta_cl)) / float(cl_max_clean)
+        f1 = to_scalar(
+            thrust * np.cos(alpha - alpha_eng) - mass * g * np.sin(gamma) - drag - mass * dvx_dt
+        ) / (to_scalar(mass) / 10.0)
+        f2 = to_scalar(cl_wing_blown - (cl_wing + delta_cl)) / to_scalar(cl_max_clean)
 
         self.cl_wing_sol = cl_wing_blown
-        self.cl_tail_sol = cl_htp
-        self.delta_e_sol = delta_e
+        self.cl_tail_sol = to_scalar(cl_htp)
+        self.delta_e_sol = to_scalar(delta_e)
 
         return np.array([f1, f2])
+
+    def equation_outer_real(self, x, *args):
+        """
+        Real part of the equation_outer residuals, used by the solver since fsolve does not handle
+        complex values (complex step).
+        """
+
+        return np.real(self.equation_outer(x, *args))
@@ -24,8 +24,6 @@ from scipy.constants import g
 from scipy.interpolate import interp1d
 import time
 
-from stdatm import Atmosphere
-
 from fastoad.model_base import FlightPoint
 
 # noinspection PyProtectedMember
@@ -35,10 +33,14 @@ from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
 from fastoad.module_management.constants import ModelDomain
 
 from fastga.models.performances.mission.takeoff import SAFETY_HEIGHT, TakeOffPhase
-from fastga.models.performances.mission.dynamic_equilibrium import DynamicEquilibrium
+from fastga.models.performances.mission.dynamic_equilibrium import (
+    DynamicEquilibrium,
+    TABLE_ALTITUDE_POINTS_NB,
+)
 
 from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
 from fastga.models.weight.cg.cg_variation import InFlightCGVariation
+from fastga.utils.atmosphere import TabulatedAtmosphere
 
 POINTS_NB_CLIMB = 100
 POINTS_NB_CRUISE = 100
@@ -68,6 +70,7 @@ class Mission(om.Group):
     def initialize(self):
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
         self.options.declare("out_file", default="", types=str)
+        self.options.declare("tabulated_equilibrium", default=False, types=bool)
 
     def setup(self):
         self.add_subsystem("in_flight_cg_variation", InFlightCGVariation(), promotes=["*"])
@@ -87,6 +90,7 @@ class Mission(om.Group):
             _compute_climb(
                 propulsion_id=self.options["propulsion_id"],
                 out_file=self.options["out_file"],
+                tabulated_equilibrium=self.options["tabulated_equilibrium"],
             ),
             promotes=["*"],
         )
@@ -95,6 +99,7 @@ class Mission(om.Group):
             _compute_cruise(
                 propulsion_id=self.options["propulsion_id"],
                 out_file=self.options["out_file"],
+                tabulated_equilibrium=self.options["tabulated_equilibrium"],
             ),
             promotes=["*"],
         )
@@ -104,6 +109,7 @@ class Mission(om.Group):
             _compute_descent(
                 propulsion_id=self.options["propulsion_id"],
                 out_file=self.options["out_file"],
+                tabulated_equilibrium=self.options["tabulated_equilibrium"],
             ),
             promotes=["*"],
         )
@@ -193,7 +199,7 @@ class UpdateFW(om.ExplicitComponent):
         outputs["data:mission:sizing:fuel"] = m_total
 
 
-class _Atmosphere(Atmosphere):
+class _Atmosphere(TabulatedAtmosphere):
     def __init__(
         self,
         altitude: Union[float, Sequence[float]],
@@ -216,15 +222,15 @@ class _Atmosphere(Atmosphere):
             if self._mach is not None:
                 self._true_airspeed = self._mach * self.speed_of_sound
             if self._equivalent_airspeed is not None:
-                sea_level = Atmosphere(0)
+                sea_level = TabulatedAtmosphere(0)
                 self._true_airspeed = self._return_value(
                     self._equivalent_airspeed * np.sqrt(sea_level.density / self.density)
                 )
             if self._unitary_reynolds is not None:
                 self._true_airspeed = self._unitary_reynolds * self.kinematic_viscosity
             if self._calibrated_airspeed is not None:
-                sea_level = Atmosphere(0)
-                current_level = Atmosphere(self._altitude, altitude_in_feet=False)
+                sea_level = TabulatedAtmosphere(0)
+                current_level = TabulatedAtmosphere(self._altitude, altitude_in_feet=False)
                 impact_pressure = sea_level.pressure * (
                     (
                         (np.asarray(self._calibrated_airspeed) / sea_level.speed_of_sound) ** 2.0
@@ -246,8 +252,8 @@ class _Atmosphere(Atmosphere):
         """Calibrated airspeed (CAS) in m/s."""
         if self._calibrated_airspeed is None:
             if self._true_airspeed is not None:
-                sea_level = Atmosphere(0)
-                current_level = Atmosphere(self._altitude, altitude_in_feet=False)
+                sea_level = TabulatedAtmosphere(0)
+                current_level = TabulatedAtmosphere(self._altitude, altitude_in_feet=False)
                 mach = np.asarray(self._true_airspeed) / current_level.speed_of_sound
                 gamma = 1.4
                 sigma_0 = (1.0 + (gamma - 1.0) / 2.0 * mach ** 2.0) ** (gamma / (gamma - 1.0))
@@ -259,8 +265,8 @@ class _Atmosphere(Atmosphere):
                     ** 0.5
                 )
             if self._mach is not None:
-                sea_level = Atmosphere(0)
-                current_level = Atmosphere(self._altitude, altitude_in_feet=False)
+                sea_level = TabulatedAtmosphere(0)
+                current_level = TabulatedAtmosphere(self._altitude, altitude_in_feet=False)
                 gamma = 1.4
                 sigma_0 = (1.0 + (gamma - 1.0) / 2.0 * self._mach ** 2.0) ** (gamma / (gamma - 1.0))
                 total_pressure = sigma_0 * current_level.pressure
@@ -333,11 +339,17 @@ class _compute_taxi(om.ExplicitComponent):
         if self.options["taxi_out"]:
             thrust_rate = inputs["data:mission:sizing:taxi_out:thrust_rate"]
             duration = inputs["data:mission:sizing:taxi_out:duration"]
-            mach = inputs["data:mission:sizing:taxi_out:speed"] / Atmosphere(0.0).speed_of_sound
+            mach = (
+                inputs["data:mission:sizing:taxi_out:speed"]
+                / TabulatedAtmosphere(0.0).speed_of_sound
+            )
         else:
             thrust_rate = inputs["data:mission:sizing:taxi_in:thrust_rate"]
             duration = inputs["data:mission:sizing:taxi_in:duration"]
-            mach = inputs["data:mission:sizing:taxi_in:speed"] / Atmosphere(0.0).speed_of_sound
+            mach = (
+                inputs["data:mission:sizing:taxi_in:speed"]
+                / TabulatedAtmosphere(0.0).speed_of_sound
+            )
 
         # FIXME: no specific settings for taxi (to be changed in fastoad\constants.py)
         flight_point = FlightPoint(
@@ -442,26 +454,47 @@ class _compute_climb(DynamicEquilibrium):
         # Define specific time step ~POINTS_NB_CLIMB points for calculation (with ground conditions)
         time_step = ((cruise_altitude - SAFETY_HEIGHT) / climb_rate_sl) / float(POINTS_NB_CLIMB)
 
-        while altitude_t < cruise_altitude:
-
-            # Calculate dynamic pressure
-            atm = _Atmosphere(altitude_t, altitude_in_feet=False)
+        def flight_conditions(altitude):
+            """Atmosphere, speeds, path angle, dynamic pressure and acceleration at altitude."""
+            atm = _Atmosphere(altitude, altitude_in_feet=False)
             atm.calibrated_airspeed = v_cas
             v_tas = atm.true_airspeed
             climb_rate = interp1d([0.0, float(cruise_altitude)], [climb_rate_sl, climb_rate_cl])(
-                altitude_t
+                altitude
             )
             gamma = math.asin(climb_rate / v_tas)
             mach = v_tas / atm.speed_of_sound
-            atm_1 = _Atmosphere(altitude_t + 1.0, altitude_in_feet=False)
+            atm_1 = _Atmosphere(altitude + 1.0, altitude_in_feet=False)
             atm_1.calibrated_airspeed = v_cas
             dv_tas_dh = atm_1.true_airspeed - v_tas
             dvx_dt = dv_tas_dh * v_tas * math.sin(gamma)
             q = 0.5 * atm.density * v_tas ** 2
 
+            return atm, v_tas, mach, gamma, q, dvx_dt
+
+        # Equilibrium table if tabulated equilibrium is enabled
+        equilibrium_table = self.equilibrium_table(
+            inputs,
+            lambda altitude: flight_conditions(altitude)[3:],
+            np.linspace(SAFETY_HEIGHT, float(cruise_altitude), TABLE_ALTITUDE_POINTS_NB),
+            mass_t,
+        )
+
+        while altitude_t < cruise_altitude:
+
+            # Calculate dynamic pressure
+            atm, v_tas, mach, gamma, q, dvx_dt = flight_conditions(altitude_t)
+
             # Find equilibrium
-            previous_step = self.dynamic_equilibrium(
-                inputs, gamma, q, dvx_dt, 0.0, mass_t, "none", previous_step[0:2]
+            previous_step = self.tabulated_dynamic_equilibrium(
+                inputs,
+                equilibrium_table,
+                altitude_t,
+                gamma,
+                q,
+                dvx_dt,
+                mass_t,
+                previous_step[0:2],
             )
             thrust = float(previous_step[1])
 
@@ -612,14 +645,27 @@ class _compute_cruise(DynamicEquilibrium):
         mach = atm.mach
         previous_step = ()
 
+        # Equilibrium table if tabulated equilibrium is enabled
+        q = 0.5 * atm.density * v_tas ** 2
+        equilibrium_table = self.equilibrium_table(
+            inputs, lambda altitude: (0.0, q, 0.0), [float(cruise_altitude)], mass_t
+        )
+
         while distance_t < cruise_distance:
 
             # Calculate dynamic pressure
             q = 0.5 * atm.density * v_tas ** 2
 
             # Find equilibrium
-            previous_step = self.dynamic_equilibrium(
-                inputs, 0.0, q, 0.0, 0.0, mass_t, "none", previous_step[0:2]
+            previous_step = self.tabulated_dynamic_equilibrium(
+                inputs,
+                equilibrium_table,
+                cruise_altitude,
+                0.0,
+                q,
+                0.0,
+                mass_t,
+                previous_step[0:2],
             )
             thrust = float(previous_step[1])
 
@@ -773,23 +819,44 @@ class _compute_descent(DynamicEquilibrium):
         # Define specific time step ~POINTS_NB_CLIMB points for calculation (with ground conditions)
         time_step = abs((altitude_t / descent_rate)) / float(POINTS_NB_DESCENT)
 
-        while altitude_t > 0.0:
-
-            # Calculate dynamic pressure
-            atm = _Atmosphere(altitude_t, altitude_in_feet=False)
+        def flight_conditions(altitude):
+            """Atmosphere, speeds, path angle, dynamic pressure and acceleration at altitude."""
+            atm = _Atmosphere(altitude, altitude_in_feet=False)
             atm.calibrated_airspeed = v_cas
             v_tas = atm.true_airspeed
             mach = v_tas / atm.speed_of_sound
             gamma = math.asin(descent_rate / v_tas)
-            atm_1 = _Atmosphere(altitude_t + 1.0, altitude_in_feet=False)
+            atm_1 = _Atmosphere(altitude + 1.0, altitude_in_feet=False)
             atm_1.calibrated_airspeed = v_cas
             dv_tas_dh = atm_1.true_airspeed - v_tas
             dvx_dt = dv_tas_dh * v_tas * math.sin(gamma)
             q = 0.5 * atm.density * v_tas ** 2
 
+            return atm, v_tas, mach, gamma, q, dvx_dt
+
+        # Equilibrium table if tabulated equilibrium is enabled, with the nominal descent rate
+        equilibrium_table = self.equilibrium_table(
+            inputs,
+            lambda altitude: flight_conditions(altitude)[3:],
+            np.linspace(0.0, float(cruise_altitude), TABLE_ALTITUDE_POINTS_NB),
+            mass_t,
+        )
+
+        while altitude_t > 0.0:
+
+            # Calculate dynamic pressure
+            atm, v_tas, mach, gamma, q, dvx_dt = flight_conditions(altitude_t)
+
             # Find equilibrium, decrease gamma if obtained thrust is negative
-            previous_step = self.dynamic_equilibrium(
-                inputs, gamma, q, dvx_dt, 0.0, mass_t, "none", previous_step[0:2]
+            previous_step = self.tabulated_dynamic_equilibrium(
+                inputs,
+                equilibrium_table,
+                altitude_t,
+                gamma,
+                q,
+                dvx_dt,
+                mass_t,
+                previous_step[0:2],
             )
             thrust = previous_step[1]
             while thrust < 0.0:
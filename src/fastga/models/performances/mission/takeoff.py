@@ -21,8 +21,6 @@ import logging
 from scipy.constants import g
 from typing import Union, List, Optional, Tuple
 
-from stdatm import Atmosphere
-
 from fastoad.model_base import FlightPoint
 
 # noinspection PyProtectedMember
@@ -30,6 +28,7 @@ from fastoad.module_management._bundle_loader import BundleLoader
 from fastoad.constants import EngineSetting
 
 from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
+from fastga.utils.atmosphere import TabulatedAtmosphere
 
 ALPHA_LIMIT = 13.5 * math.pi / 180.0  # Limit angle to touch tail on ground in rad
 ALPHA_RATE = 3.0 * math.pi / 180.0  # Angular rotation speed in rad/s
@@ -178,7 +177,7 @@ class _v2(om.ExplicitComponent):
         mtow = inputs["data:weight:aircraft:MTOW"]
 
         # Define atmospheric condition for safety height
-        atm = Atmosphere(SAFETY_HEIGHT, altitude_in_feet=False)
+        atm = TabulatedAtmosphere(SAFETY_HEIGHT, altitude_in_feet=False)
 
         iteration_number = 0
         factor = 1.2  # Minimum safety factor between stall speed and V2 according to CS 23.65 for the climb with all
@@ -294,7 +293,7 @@ class _v_lift_off_from_v2(om.ExplicitComponent):
         alpha = np.linspace(0.0, min(ALPHA_LIMIT, alpha_v2), num=10)
         v_lift_off = np.zeros(np.size(alpha))
         v2 = np.zeros(np.size(alpha))
-        atm_0 = Atmosphere(0.0)
+        atm_0 = TabulatedAtmosphere(0.0)
 
         # Step 1.0 computes the lift-off speed for different value of angle of attack ranging from 0° to the angle of
         # attack corresponding to the V2 computation from previously
@@ -338,7 +337,7 @@ class _v_lift_off_from_v2(om.ExplicitComponent):
             distance_t = 0.0
             while altitude_t < SAFETY_HEIGHT:
                 # Estimation of thrust
-                atm = Atmosphere(altitude_t, altitude_in_feet=False)
+                atm = TabulatedAtmosphere(altitude_t, altitude_in_feet=False)
                 flight_point = FlightPoint(
                     mach=v_t / atm.speed_of_sound,
                     altitude=altitude_t,
@@ -464,7 +463,7 @@ class _vr_from_v2(om.ExplicitComponent):
             33.0 * (lg_height / wing_span) ** 1.5 / (1.0 + 33.0 * (lg_height / wing_span) ** 1.5)
         )
         # Start reverted calculation of flight from lift-off to 0° alpha angle
-        atm = Atmosphere(0.0)
+        atm = TabulatedAtmosphere(0.0)
         # We find the value that corresponds to the speed at which, if we engage in a constant speed rotation we will
         # get the AOA computed for v_lift_off at v_lift_off
         while (alpha_t != 0.0) and (v_t != 0.0):
@@ -573,7 +572,9 @@ class _simulate_takeoff(om.ExplicitComponent):
             )
 
         # Determine rotation speed from regulation CS23.51
-        vs1 = math.sqrt((mtow * g) / (0.5 * Atmosphere(0).density * wing_area * cl_max_clean))
+        vs1 = math.sqrt(
+            (mtow * g) / (0.5 * TabulatedAtmosphere(0).density * wing_area * cl_max_clean)
+        )
         if inputs["data:geometry:propulsion:engine:count"] == 1.0:
             k = 1.0
         else:
@@ -593,7 +594,7 @@ class _simulate_takeoff(om.ExplicitComponent):
         climb = False
         while altitude_t < SAFETY_HEIGHT:
             # Estimation of thrust
-            atm = Atmosphere(altitude_t, altitude_in_feet=False)
+            atm = TabulatedAtmosphere(altitude_t, altitude_in_feet=False)
             flight_point = FlightPoint(
                 mach=max(v_t, vr) / atm.speed_of_sound,
                 altitude=altitude_t,
@@ -17,7 +17,6 @@
 
 import numpy as np
 import openmdao.api as om
-from fastga.command import api as api_cs23
 from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
 from fastoad.module_management.constants import ModelDomain
 import logging
@@ -40,6 +39,8 @@ class ComputePayloadRange(om.ExplicitComponent):
         self.options.declare("propulsion_id", default="", types=str)
 
     def setup(self):
+        from fastga.command import api as api_cs23
+
         variables = api_cs23.list_variables(Mission(propulsion_id=self.options["propulsion_id"]))
 
         inputs_mission = [var for var in variables if var.is_input]
@@ -166,6 +167,8 @@ class ComputePayloadRange(om.ExplicitComponent):
     @staticmethod
     def fuel_function(range_parameter, fuel_target, mass, inputs, prop_id):
 
+        from fastga.command import api as api_cs23
+
         variables = api_cs23.list_variables(Mission(propulsion_id=prop_id))
         inputs_mission = [var for var in variables if var.is_input]
         for i in range(len(inputs_mission)):
@@ -204,6 +207,8 @@ class TestComponent(om.ExplicitComponent):
         self.options.declare("propulsion_id", default="", types=str)
 
     def setup(self):
+        from fastga.command import api as api_cs23
+
         variables = api_cs23.list_variables(Mission(propulsion_id=self.options["propulsion_id"]))
 
         inputs_mission = [var for var in variables if var.is_input]
@@ -220,6 +225,8 @@ class TestComponent(om.ExplicitComponent):
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
+        from fastga.command import api as api_cs23
+
         variables = api_cs23.list_variables(Mission(propulsion_id=self.options["propulsion_id"]))
         inputs_mission = [var for var in variables if var.is_input]
         for i in range(len(inputs_mission)):
@@ -259,6 +259,33 @@ def test_compute_descent():
     assert duration == pytest.approx(27, abs=1)
 
 
+def test_tabulated_equilibrium():
+    """Tests that phases with tabulated equilibrium give the results of the exact equilibrium"""
+
+    for phase_name, phase_class in [
+        ("climb", _compute_climb),
+        ("cruise", _compute_cruise),
+        ("descent", _compute_descent),
+    ]:
+        fuel_masses = []
+        for tabulated_equilibrium in [False, True]:
+            group = Group()
+            group.add_subsystem("in_flight_cg_variation", InFlightCGVariation(), promotes=["*"])
+            group.add_subsystem(
+                phase_name,
+                phase_class(
+                    propulsion_id=ENGINE_WRAPPER, tabulated_equilibrium=tabulated_equilibrium
+                ),
+                promotes=["*"],
+            )
+            ivc = get_indep_var_comp(list_inputs(group), __file__, XML_FILE)
+            problem = run_system(group, ivc)
+            fuel_masses.append(
+                problem.get_val("data:mission:sizing:main_route:%s:fuel" % phase_name, units="kg")
+            )
+        assert fuel_masses[1] == pytest.approx(fuel_masses[0], rel=2e-3)
+
+
 def test_loop_cruise_distance():
     """Tests a distance computation loop matching the descent value/TLAR total range."""
 
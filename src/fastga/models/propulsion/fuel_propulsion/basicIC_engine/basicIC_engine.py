@@ -15,6 +15,7 @@
 
 import logging
 import math
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 from typing import Union, Sequence, Tuple, Optional
@@ -32,6 +33,7 @@ from . import resources
 
 from fastga.models.propulsion.fuel_propulsion.base import AbstractFuelPropulsion
 from fastga.models.propulsion.dict import DynamicAttributeDict, AddKeyAttributes
+from fastga.utils.atmosphere import TabulatedAtmosphere
 
 # Logger for this module
 _LOGGER = logging.getLogger(__name__)
@@ -159,7 +161,15 @@ class BasicICEngine(AbstractFuelPropulsion):
             raise FastUnknownEngineSettingError("Unknown flight phases: %s", str(unknown_keys))
 
     @staticmethod
+    @lru_cache()
     def read_map(map_file_path):
+        """
+        Reads the engine map once per session (or per worker process in batch runs). Returned
+        arrays are shared and read-only.
+
+        :param map_file_path: path of the engine map .csv file
+        :return: rpm, pme and pme limit vectors and sfc matrix
+        """
 
         data = pd.read_csv(map_file_path)
         values = data.to_numpy()[:, 1:].tolist()
@@ -184,6 +194,8 @@ class BasicICEngine(AbstractFuelPropulsion):
         )
         for idx in range(len(sfc_lines)):
             sfc_matrix[:, idx] = np.array([i for i in sfc_lines[idx].split(" ") if i != ""])
+        for array in (rpm_vect, pme_vect, pme_limit_vect, sfc_matrix):
+            array.flags.writeable = False
 
         return rpm_vect, pme_vect, pme_limit_vect, sfc_matrix
 
@@ -271,7 +283,7 @@ class BasicICEngine(AbstractFuelPropulsion):
         thrust = np.asarray(thrust)
 
         # Get maximum thrust @ given altitude & mach
-        atmosphere = Atmosphere(np.asarray(altitude), altitude_in_feet=False)
+        atmosphere = TabulatedAtmosphere(np.asarray(altitude), altitude_in_feet=False)
         mach = np.asarray(mach) + (np.asarray(mach) == 0) * 1e-12
         atmosphere.mach = mach
         max_thrust = self.max_thrust(np.asarray(engine_setting), atmosphere)
@@ -450,8 +462,8 @@ class BasicICEngine(AbstractFuelPropulsion):
         :param flight_points: current flight point(s)
         :return: maximum power in kW
         """
-        atmosphere = Atmosphere(np.asarray(flight_points.altitude), altitude_in_feet=False)
-        sigma = atmosphere.density / Atmosphere(0.0).density
+        atmosphere = TabulatedAtmosphere(np.asarray(flight_points.altitude), altitude_in_feet=False)
+        sigma = atmosphere.density / TabulatedAtmosphere(0.0).density
         max_power = (self.max_power / 1e3) * (sigma - (1 - sigma) / 7.55)  # max power in kW
 
         return max_power
@@ -499,7 +511,7 @@ class BasicICEngine(AbstractFuelPropulsion):
             sfc = ICE_sfc(torque, rpm_values) * mixture_values
         else:
             for idx in range(np.size(thrust)):
-                local_atmosphere = Atmosphere(
+                local_atmosphere = TabulatedAtmosphere(
                     atmosphere.get_altitude()[idx], altitude_in_feet=False
                 )
                 local_atmosphere.mach = atmosphere.mach[idx]
@@ -555,7 +567,7 @@ class BasicICEngine(AbstractFuelPropulsion):
                 [self.rpm_values[engine_setting[idx]] for idx in range(np.size(engine_setting))]
             )
             max_power_SL = np.interp(list(rpm_values), rpm_vect, power_max_vect)
-        sigma = atmosphere.density / Atmosphere(0.0).density
+        sigma = atmosphere.density / TabulatedAtmosphere(0.0).density
         max_power = max_power_SL * (sigma - (1 - sigma) / 7.55)
 
         # Found thrust relative to ICE maximum power @ given altitude and speed:
@@ -568,7 +580,7 @@ class BasicICEngine(AbstractFuelPropulsion):
         ).transpose()
         if np.size(altitude) == 1:  # Calculate for float
             thrust_max_global = 0.0
-            local_atmosphere = Atmosphere(
+            local_atmosphere = TabulatedAtmosphere(
                 altitude * np.ones(np.size(thrust_interp)), altitude_in_feet=False
             )
             local_atmosphere.mach = atmosphere.mach * np.ones(np.size(thrust_interp))
@@ -592,7 +604,7 @@ class BasicICEngine(AbstractFuelPropulsion):
         else:  # Calculate for array
             thrust_max_global = np.zeros(np.size(altitude))
             for idx in range(np.size(altitude)):
-                local_atmosphere = Atmosphere(
+                local_atmosphere = TabulatedAtmosphere(
                     altitude[idx] * np.ones(np.size(thrust_interp[idx])), altitude_in_feet=False
                 )
                 local_atmosphere.mach = atmosphere.mach[idx] * np.ones(np.size(thrust_interp[idx]))
@@ -606,7 +618,7 @@ class BasicICEngine(AbstractFuelPropulsion):
                     np.min(mechanical_power) > max_power[idx]
                 ):  # take the lower bound efficiency for calculation
                     efficiency_relative_error = 1
-                    local_atmosphere = Atmosphere(altitude[idx], altitude_in_feet=False)
+                    local_atmosphere = TabulatedAtmosphere(altitude[idx], altitude_in_feet=False)
                     local_atmosphere.mach = atmosphere.mach[idx]
                     propeller_efficiency = propeller_efficiency[0]
                     while efficiency_relative_error > 1e-2:
@@ -690,7 +702,7 @@ class BasicICEngine(AbstractFuelPropulsion):
         reynolds = unit_reynolds * self.nacelle.length
         # Roskam method for wing-nacelle interaction factor (vol 6 page 3.62)
         cf_nac = 0.455 / (
-            (1 + 0.144 * mach ** 2) ** 0.65 * (math.log10(reynolds)) ** 2.58
+            (1 + 0.144 * mach ** 2) ** 0.65 * (np.log10(reynolds)) ** 2.58
         )  # 100% turbulent
         f = self.nacelle.length / math.sqrt(4 * self.nacelle.height * self.nacelle.width / math.pi)
         ff_nac = 1 + 0.35 / f  # Raymer (seen in Gudmunsson)
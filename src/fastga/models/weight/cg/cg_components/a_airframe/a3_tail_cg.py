@@ -109,6 +109,7 @@ class ComputeVTcg(om.ExplicitComponent):
         self.add_input("data:geometry:has_T_tail", val=np.nan)
 
         self.add_output("data:weight:airframe:vertical_tail:CG:x", units="m")
+        self.add_output("data:weight:airframe:vertical_tail:CG:y", units="m")
         self.add_output("data:weight:airframe:vertical_tail:CG:z", units="m")
 
         self.declare_partials("*", "*", method="fd")
@@ -0,0 +1,173 @@
+"""
+International Standard Atmosphere evaluated from precomputed tables.
+"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.constants import foot
+from stdatm import Atmosphere
+from stdatm.atmosphere import TROPOPAUSE
+
+# Altitude range and step of the tables in m. With linear interpolation on a 1 m step, the
+# relative error on the properties is below 1e-8.
+TABLE_MIN_ALTITUDE = -1000.0
+TABLE_MAX_ALTITUDE = 20000.0
+TABLE_ALTITUDE_STEP = 1.0
+
+TABULATED_PROPERTIES = [
+    "temperature",
+    "pressure",
+    "density",
+    "speed_of_sound",
+    "kinematic_viscosity",
+]
+
+
+@lru_cache()
+def get_atmosphere_tables() -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Tables of the properties of the standard atmosphere (no temperature increment), computed on
+    first call.
+
+    :return: the altitudes of the tables in m, and a dictionary of the tables of the properties
+    in TABULATED_PROPERTIES.
+    """
+    points_nb = int(round((TABLE_MAX_ALTITUDE - TABLE_MIN_ALTITUDE) / TABLE_ALTITUDE_STEP)) + 1
+    altitudes = np.linspace(TABLE_MIN_ALTITUDE, TABLE_MAX_ALTITUDE, points_nb)
+    # The ISA pressure is slightly discontinuous at the tropopause, so a point is added just below
+    # it to keep the interpolation from spreading the jump over a whole step
+    altitudes = np.sort(np.append(altitudes, np.nextafter(TROPOPAUSE, -np.inf)))
+    atm = Atmosphere(altitudes, altitude_in_feet=False)
+    tables = {name: getattr(atm, name) for name in TABULATED_PROPERTIES}
+    for table in tables.values():
+        table.flags.writeable = False
+
+    return altitudes, tables
+
+
+@lru_cache(maxsize=4096)
+def _altitude_properties(altitude: float) -> Optional[Tuple[float, ...]]:
+    """
+    Properties at a single altitude in m, memoized as the same altitudes are often reused. None
+    is returned out of the tables.
+    """
+    if not TABLE_MIN_ALTITUDE <= altitude <= TABLE_MAX_ALTITUDE:
+        return None
+
+    altitudes, tables = get_atmosphere_tables()
+
+    return tuple(
+        float(np.interp(altitude, altitudes, tables[name])) for name in TABULATED_PROPERTIES
+    )
+
+
+class TabulatedAtmosphere(Atmosphere):
+    """
+    Same as :class:`stdatm.Atmosphere`, but temperature, pressure, density, speed of sound and
+    kinematic viscosity are interpolated in tables of the standard atmosphere instead of being
+    computed with the ISA formulas. Altitudes can be given as floats or arrays of any shape, and
+    the properties at a single altitude are memoized, so that instantiating the atmosphere
+    several times at the same altitude is cheap.
+
+    The ISA formulas are still used with a temperature increment, with complex altitudes
+    (complex step) and for altitudes out of the tables. Whether the tables are used is decided
+    on first access to a property, and again after a change of delta_t.
+    """
+
+    @property
+    def delta_t(self) -> Union[float, Sequence[float]]:
+        """Temperature increment applied to whole temperature profile."""
+        return Atmosphere.delta_t.fget(self)
+
+    @delta_t.setter
+    def delta_t(self, value: Union[float, Sequence[float]]):
+        Atmosphere.delta_t.fset(self, value)
+        # Altitudes in m at which the tables are interpolated (None if not known yet, False if
+        # the tables can not be used), and interpolated values by property name
+        self._table_altitude = None
+        self._table_values = {}
+
+    @property
+    def temperature(self) -> Union[float, Sequence[float]]:
+        """Temperature in K."""
+        value = self._table_value("temperature")
+        return super().temperature if value is None else value
+
+    @property
+    def pressure(self) -> Union[float, Sequence[float]]:
+        """Pressure in Pa."""
+        value = self._table_value("pressure")
+        return super().pressure if value is None else value
+
+    @property
+    def density(self) -> Union[float, Sequence[float]]:
+        """Density in kg/m3."""
+        value = self._table_value("density")
+        return super().density if value is None else value
+
+    @property
+    def speed_of_sound(self) -> Union[float, Sequence[float]]:
+        """Speed of sound in m/s."""
+        value = self._table_value("speed_of_sound")
+        return super().speed_of_sound if value is None else value
+
+    @property
+    def kinematic_viscosity(self) -> Union[float, Sequence[float]]:
+        """Kinematic viscosity in m2/s."""
+        value = self._table_value("kinematic_viscosity")
+        return super().kinematic_viscosity if value is None else value
+
+    def _table_value(self, name: str) -> Optional[Union[float, np.ndarray]]:
+        """Property interpolated in its table, None if the tables can not be used."""
+        if self._table_altitude is None:
+            self._table_altitude = self._get_table_altitude()
+        if self._table_altitude is False:
+            return None
+
+        value = self._table_values.get(name)
+        if value is None:
+            altitudes, tables = get_atmosphere_tables()
+            value = np.interp(self._table_altitude, altitudes, tables[name])
+            self._table_values[name] = value
+
+        return value
+
+    def _get_table_altitude(self) -> Union[bool, float, np.ndarray]:
+        """
+        Altitudes in m, or False if the tables can not be used. At a single altitude, all the
+        properties are taken from the memo at once.
+        """
+        if self.delta_t.any():
+            return False
+
+        altitude = self.get_altitude(altitude_in_feet=False)
+        if isinstance(altitude, float):
+            values = _altitude_properties(altitude)
+            if values is None:
+                return False
+            self._table_values = dict(zip(TABULATED_PROPERTIES, values))
+            return altitude
+
+        if (
+            altitude.size == 0
+            or altitude.dtype.kind == "c"
+            or altitude.min() < TABLE_MIN_ALTITUDE
+            or altitude.max() > TABLE_MAX_ALTITUDE
+        ):
+            return False
+
+        return altitude
@@ -0,0 +1,250 @@
+"""
+Batch execution of a problem over a table of design points in a pool of worker processes.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import multiprocessing
+import os
+import os.path as pth
+import time
+from copy import deepcopy
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from fastoad.io.configuration.configuration import FASTOADProblemConfigurator
+
+from fastga.models.handling_qualities.check_modes.mode_check import ModeCheck
+from fastga.utils.mda_warm_start import WarmStartNonlinearBlockGS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Name of the subsystem holding the problem inputs read from the input file
+INPUTS_SYSTEM_NAME = "fastoad_inputs"
+
+# Columns added to the design points in the result table
+CASE_STATUS_COLUMNS = ["success", "error", "case_time", "process_id"]
+
+# Case runner of the current process, built once per worker (or inherited from the parent
+# process when workers are forked)
+_BATCH_RUNNER = None
+
+
+class BatchCaseRunner:
+    """
+    Problem of a configuration file set up once, on which design points are evaluated one after
+    the other. Before each case, all the problem variables (discrete ones included) are reset to
+    their values after setup, and the state kept by the model from one evaluation to the next
+    (converged points of the MDA warm start, recorded mode checks) is cleared, so that results do
+    not depend on the cases run before in the same process. Process-level
+    caches (digitized figures, airfoil profiles, XFOIL/VLM/OpenVSP results, engine maps) are kept
+    warm from one case to the next.
+    """
+
+    def __init__(self, configuration_file_path: str, units: Dict[str, str] = None):
+        """
+        :param configuration_file_path: problem definition, with an existing input file
+        :param units: units of the design point and output values, by variable name, default to
+        the units of the problem
+        """
+        self.configuration_file_path = pth.abspath(configuration_file_path)
+        self.units = dict(units) if units else {}
+
+        configurator = FASTOADProblemConfigurator(self.configuration_file_path)
+        self.problem = configurator.get_problem(read_inputs=True)
+        self.problem.setup()
+        self.problem.final_setup()
+        self._initial_outputs = self.problem.model._outputs.asarray(copy=True)
+        self._initial_discrete_outputs = {
+            name: deepcopy(self.problem.get_val(name))
+            for name in self.problem.model._var_allprocs_discrete["output"]
+        }
+
+        self.input_names = []
+        self.output_names = []
+        for abs_name, meta in self.problem.model.get_io_metadata(
+            iotypes="output", return_rel_names=False
+        ).items():
+            if abs_name.startswith(INPUTS_SYSTEM_NAME + "."):
+                names = self.input_names
+            else:
+                names = self.output_names
+            if meta["prom_name"] not in names:
+                names.append(meta["prom_name"])
+
+    def check_names(self, input_names: List[str], output_names: List[str]):
+        """
+        Raises ValueError if a design point variable is not an input of the problem or if an
+        output variable is unknown.
+        """
+        unknown_inputs = [name for name in input_names if name not in self.input_names]
+        if unknown_inputs:
+            raise ValueError(
+                "Design point variables %s are not inputs of the problem defined in %s!"
+                % (unknown_inputs, self.configuration_file_path)
+            )
+        unknown_outputs = [
+            name
+            for name in output_names
+            if name not in self.output_names and name not in self.input_names
+        ]
+        if unknown_outputs:
+            raise ValueError(
+                "Variables %s are not in the problem defined in %s!"
+                % (unknown_outputs, self.configuration_file_path)
+            )
+
+    def reset(self):
+        """Sets the problem back to its state after setup."""
+        model = self.problem.model
+        model._outputs.set_val(self._initial_outputs)
+        for name, value in self._initial_discrete_outputs.items():
+            self.problem.set_val(name, deepcopy(value))
+
+        for system in model.system_iter(include_self=True, recurse=True):
+            if isinstance(system.nonlinear_solver, WarmStartNonlinearBlockGS):
+                system.nonlinear_solver.cache.clear()
+            if isinstance(system, ModeCheck):
+                system.clear_records()
+
+    def run_case(
+        self, design_point: Dict[str, float], output_names: List[str]
+    ) -> Tuple[Dict[str, float], bool, str]:
+        """
+        Runs the problem at a design point.
+
+        :param design_point: values of the problem inputs to modify, by variable name
+        :param output_names: names of the variables whose values are returned
+        :return: the values of the output variables (first element of vector variables), NaN if
+        the run failed, whether the run succeeded and the error message
+        """
+        self.reset()
+        for name, value in design_point.items():
+            self.problem.set_val(name, value, units=self.units.get(name))
+
+        try:
+            self.problem.run_model()
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.warning("Design point %s failed: %s", design_point, error)
+            return {name: np.nan for name in output_names}, False, str(error)
+
+        outputs = {
+            name: np.asarray(self.problem.get_val(name, units=self.units.get(name))).ravel()[0]
+            for name in output_names
+        }
+
+        return outputs, True, ""
+
+
+def _initialize_worker(configuration_file_path: str, units: Dict[str, str]):
+    """Builds the case runner of a worker process, unless inherited from the parent process."""
+    global _BATCH_RUNNER
+
+    if (
+        _BATCH_RUNNER is None
+        or _BATCH_RUNNER.configuration_file_path != pth.abspath(configuration_file_path)
+        or _BATCH_RUNNER.units != (units or {})
+    ):
+        _BATCH_RUNNER = BatchCaseRunner(configuration_file_path, units)
+
+
+def _run_case(case: Tuple[int, Dict[str, float], List[str]]) -> Tuple[int, dict]:
+    """Runs a design point in the current process and returns its index and result row."""
+    index, design_point, output_names = case
+    start_time = time.perf_counter()
+    outputs, success, error = _BATCH_RUNNER.run_case(design_point, output_names)
+    row = dict(design_point)
+    row.update(outputs)
+    row.update(
+        {
+            "success": success,
+            "error": error,
+            "case_time": time.perf_counter() - start_time,
+            "process_id": os.getpid(),
+        }
+    )
+
+    return index, row
+
+
+def run_batch(
+    configuration_file_path: str,
+    design_points: pd.DataFrame,
+    result_file_path: str = None,
+    output_names: List[str] = None,
+    units: Dict[str, str] = None,
+    max_workers: int = None,
+) -> pd.DataFrame:
+    """
+    Runs the problem of a configuration file at each design point of a table, in a pool of
+    worker processes that each set the problem up once.
+
+    :param configuration_file_path: problem definition, with an existing input file
+    :param design_points: one row per case, one column per problem input to modify (scalar
+    values), the other inputs keeping the values of the input file
+    :param result_file_path: if provided, the result table is written there as .csv
+    :param output_names: variables to store for each case, default to all the problem outputs
+    :param units: units of the design point and output values, by variable name, default to the
+    units of the problem
+    :param max_workers: maximum number of worker processes, default to the number of CPUs. With
+    1, cases are run in the current process
+    :return: the result table, with the design points, the output values and the status of each
+    case (success, error message, run time in s and process id)
+    """
+    _initialize_worker(configuration_file_path, units)
+    if output_names is None:
+        output_names = list(_BATCH_RUNNER.output_names)
+    input_names = [str(name) for name in design_points.columns]
+    _BATCH_RUNNER.check_names(input_names, output_names)
+    output_names = [name for name in output_names if name not in input_names]
+
+    cases = [
+        (index, dict(zip(input_names, row)), output_names)
+        for index, row in enumerate(design_points.itertuples(index=False, name=None))
+    ]
+
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count()
+    max_workers = min(max_workers, len(cases))
+    if max_workers <= 1:
+        results = [_run_case(case) for case in cases]
+    else:
+        # Forked workers inherit the problem set up in this process, spawned ones rebuild it
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing.get_context()
+        with context.Pool(
+            max_workers,
+            initializer=_initialize_worker,
+            initargs=(configuration_file_path, units),
+        ) as pool:
+            results = list(pool.imap_unordered(_run_case, cases, chunksize=1))
+
+    rows = [row for _, row in sorted(results, key=lambda result: result[0])]
+    result_table = pd.DataFrame(
+        rows, index=design_points.index, columns=input_names + output_names + CASE_STATUS_COLUMNS
+    )
+
+    failed_cases_nb = len(result_table) - int(result_table["success"].sum())
+    if failed_cases_nb:
+        _LOGGER.warning("%d of the %d design points failed", failed_cases_nb, len(result_table))
+
+    if result_file_path:
+        if pth.dirname(result_file_path) and not pth.exists(pth.dirname(result_file_path)):
+            os.makedirs(pth.dirname(result_file_path))
+        result_table.to_csv(result_file_path)
+
+    return result_table
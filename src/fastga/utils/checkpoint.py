@@ -0,0 +1,240 @@
+"""
+Checkpoint and restart of the MDA of a problem.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import os.path as pth
+import pickle
+import tempfile
+from functools import wraps
+
+import numpy as np
+import openmdao
+import openmdao.api as om
+from openmdao.solvers.solver import NonlinearSolver
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version of the checkpoint content, checked at restart
+CHECKPOINT_FORMAT_VERSION = 1
+
+# Range of OpenMDAO versions (major, minor) whose internals used to write and restore the state
+# (output vector views, iteration count and reference norm of solvers) have been checked
+MIN_OPENMDAO_VERSION = (3, 10)
+MAX_OPENMDAO_VERSION = (3, 16)
+
+
+class MDACheckpointer:
+    """
+    Writes the state of a problem, every given number of iterations of the nonlinear solver of
+    its MDA group, so that an interrupted run (killed job, external code timeout...) can be
+    restarted from the last iterate instead of from the input file.
+
+    The checkpoint holds the values of all the outputs of the model, the iteration count and
+    reference residual norm of the solver and, for a
+    :class:`~fastga.utils.mda_warm_start.WarmStartNonlinearBlockGS`, its cache of converged
+    points. External code results (XFOIL polars, VLM/OpenVSP coefficients) are already saved in
+    their result files. The file is written in a temporary file that then replaces the previous
+    checkpoint, so that an interruption during the writing never leaves a corrupted checkpoint.
+
+    The driver state is not checkpointed: a checkpoint written during an optimization holds the
+    design variables of the interrupted iteration, which differ from the input file ones, so it
+    is not restored. Checkpoints are meant for single MDA evaluations (run_model).
+    """
+
+    def __init__(
+        self, checkpoint_file_path: str, group_name: str = "aircraft_sizing", period: int = 1
+    ):
+        """
+        :param checkpoint_file_path: path of the checkpoint file
+        :param group_name: path of the group whose nonlinear solver iterations are checkpointed
+        :param period: number of solver iterations between two checkpoints
+        """
+        self.checkpoint_file_path = checkpoint_file_path
+        self.group_name = group_name
+        self.period = period
+        self._problem = None
+        self._solver = None
+        # (object, attribute name) of instrumented methods
+        self._wrapped = []
+        # Iteration count and reference norm to resume the solver from, after restore
+        self._restored_solver_state = None
+
+    def attach(self, problem: om.Problem):
+        """
+        Makes the iterations of the nonlinear solver of the group checkpointed. Should be called
+        after problem setup.
+        """
+        if self._problem is not None:
+            self.detach()
+
+        _check_openmdao_version()
+        group = problem.model._get_subsystem(self.group_name)
+        if group is None:
+            raise ValueError("Group %s not found in problem model!" % self.group_name)
+        solver = group.nonlinear_solver
+        if not isinstance(solver, NonlinearSolver) or isinstance(solver, om.NonlinearRunOnce):
+            raise TypeError(
+                "Checkpoints are only available for groups solved iteratively, %s uses %s!"
+                % (self.group_name, type(solver).__name__)
+            )
+
+        self._problem = problem
+        self._solver = solver
+        self._wrap(solver, "_iter_initialize", self._wrap_iter_initialize(solver._iter_initialize))
+        self._wrap(
+            solver, "_single_iteration", self._wrap_single_iteration(solver._single_iteration)
+        )
+
+    def detach(self):
+        """Removes all instrumentation."""
+        for obj, method_name in reversed(self._wrapped):
+            delattr(obj, method_name)
+        self._wrapped = []
+        self._problem = None
+        self._solver = None
+        self._restored_solver_state = None
+
+    def write(self):
+        """Writes the current state of the problem in the checkpoint file."""
+        solver = self._solver
+        outputs = self._problem.model._outputs
+        state = {
+            "version": CHECKPOINT_FORMAT_VERSION,
+            "group_name": self.group_name,
+            "outputs": {name: np.array(value) for name, value in outputs._abs_item_iter()},
+            "iteration_count": solver._iter_count + 1,
+            "reference_norm": getattr(solver, "_norm0", 0.0),
+            "warm_start_cache": getattr(solver, "cache", None),
+        }
+
+        folder_path = pth.dirname(pth.abspath(self.checkpoint_file_path))
+        os.makedirs(folder_path, exist_ok=True)
+        file_descriptor, tmp_file_path = tempfile.mkstemp(dir=folder_path, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as tmp_file:
+                pickle.dump(state, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file_path, self.checkpoint_file_path)
+        except BaseException:
+            os.remove(tmp_file_path)
+            raise
+
+    def restore(self) -> bool:
+        """
+        Sets the attached problem back to the state of the checkpoint file, if it exists. Should
+        be called after problem final setup and before the run. Outputs are not restored if the
+        checkpoint has been written with other inputs (IndepVarComp outputs, design variables
+        included) or for another model.
+
+        :return: True if the problem state has been restored
+        """
+        if not pth.exists(self.checkpoint_file_path):
+            return False
+
+        with open(self.checkpoint_file_path, "rb") as checkpoint_file:
+            state = pickle.load(checkpoint_file)
+
+        outputs = self._problem.model._outputs
+        stored_outputs = state["outputs"]
+        if (
+            state["version"] != CHECKPOINT_FORMAT_VERSION
+            or state["group_name"] != self.group_name
+            or {name: np.size(value) for name, value in stored_outputs.items()}
+            != {name: np.size(value) for name, value in outputs._abs_item_iter()}
+        ):
+            _LOGGER.warning(
+                "Checkpoint %s does not match the problem and is ignored.",
+                self.checkpoint_file_path,
+            )
+            return False
+
+        for component in self._problem.model.system_iter(recurse=True, typ=om.IndepVarComp):
+            for name, value in component._outputs._abs_item_iter():
+                if not np.array_equal(value, stored_outputs[name], equal_nan=True):
+                    _LOGGER.warning(
+                        "Checkpoint %s has been written with another value of %s and is ignored.",
+                        self.checkpoint_file_path,
+                        name,
+                    )
+                    return False
+
+        for name, value in stored_outputs.items():
+            outputs._views_flat[name][:] = value
+        if state["warm_start_cache"] is not None and hasattr(self._solver, "cache"):
+            self._solver.cache = state["warm_start_cache"]
+        self._restored_solver_state = (state["iteration_count"], state["reference_norm"])
+        _LOGGER.info(
+            "Problem restored from checkpoint %s at iteration %d of %s.",
+            self.checkpoint_file_path,
+            state["iteration_count"],
+            self.group_name,
+        )
+
+        return True
+
+    def remove(self):
+        """Deletes the checkpoint file, e.g. once the run is complete."""
+        if pth.exists(self.checkpoint_file_path):
+            os.remove(self.checkpoint_file_path)
+
+    def _wrap(self, obj, method_name: str, wrapper):
+        setattr(obj, method_name, wrapper)
+        self._wrapped.append((obj, method_name))
+
+    def _wrap_iter_initialize(self, iter_initialize):
+        @wraps(iter_initialize)
+        def restarted_iter_initialize(*args, **kwargs):
+            norm0, norm = iter_initialize(*args, **kwargs)
+            if self._restored_solver_state is not None:
+                # The relative tolerance applies to the residual norm of the first run, and the
+                # iteration limit to the iterations done before the interruption too
+                iteration_count, reference_norm = self._restored_solver_state
+                self._restored_solver_state = None
+                self._solver._iter_count = iteration_count
+                norm0 = max(norm0, reference_norm)
+            return norm0, norm
+
+        return restarted_iter_initialize
+
+    def _wrap_single_iteration(self, single_iteration):
+        @wraps(single_iteration)
+        def checkpointed_iteration(*args, **kwargs):
+            single_iteration(*args, **kwargs)
+            if (
+                not self._solver._system().under_complex_step
+                and (self._solver._iter_count + 1) % self.period == 0
+            ):
+                self.write()
+
+        return checkpointed_iteration
+
+
+def _check_openmdao_version():
+    """
+    Raises RuntimeError if the installed OpenMDAO is out of the range of versions whose internals
+    are known to be used correctly.
+    """
+    version = tuple(int(number) for number in openmdao.__version__.split(".")[:2])
+    if not MIN_OPENMDAO_VERSION <= version <= MAX_OPENMDAO_VERSION:
+        raise RuntimeError(
+            "MDA checkpoints rely on OpenMDAO internals checked for versions %s to %s, "
+            "OpenMDAO %s is installed."
+            % (
+                ".".join(map(str, MIN_OPENMDAO_VERSION)),
+                ".".join(map(str, MAX_OPENMDAO_VERSION)),
+                openmdao.__version__,
+            )
+        )
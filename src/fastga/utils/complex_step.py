@@ -0,0 +1,142 @@
+"""
+Helpers to keep computations compatible with OpenMDAO complex-step derivatives.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Callable, Sequence, Union
+
+import numpy as np
+from stdatm import Atmosphere
+from stdatm.atmosphere import SEA_LEVEL_PRESSURE, SEA_LEVEL_TEMPERATURE
+
+# Step used for the real jacobian in the complex Newton correction (same order of magnitude as
+# the default OpenMDAO finite difference step)
+JACOBIAN_STEP = 1.0e-6
+
+
+def to_scalar(value):
+    """
+    Converts a size-1 array (as given by OpenMDAO inputs) to a scalar. Contrary to float(), the
+    imaginary part is kept so that complex-step perturbations are propagated.
+
+    :param value: float, complex or size-1 array.
+    :return: numpy scalar (real or complex).
+    """
+    return np.asarray(value).reshape(-1)[0]
+
+
+def interp(x, x_p, f_p):
+    """
+    Equivalent of np.interp (constant extrapolation) that propagates the imaginary part of x, x_p
+    and f_p. The real part of x_p should be increasing.
+
+    :param x: scalar or array of abscissas at which the interpolation is done.
+    :param x_p: abscissas of the data points.
+    :param f_p: ordinates of the data points.
+    :return: interpolated values, with the shape of x.
+    """
+    x = np.asarray(x)
+    x_p = np.asarray(x_p)
+    f_p = np.asarray(f_p)
+    if not (np.iscomplexobj(x) or np.iscomplexobj(x_p) or np.iscomplexobj(f_p)):
+        return np.interp(x, x_p, f_p)
+
+    x_p_real = np.real(x_p)
+    idx = np.clip(np.searchsorted(x_p_real, np.real(x), side="right") - 1, 0, len(x_p) - 2)
+    slope = (f_p[idx + 1] - f_p[idx]) / (x_p[idx + 1] - x_p[idx])
+    result = f_p[idx] + slope * (x - x_p[idx])
+    result = np.where(np.real(x) <= x_p_real[0], f_p[0], result)
+    result = np.where(np.real(x) >= x_p_real[-1], f_p[-1], result)
+
+    return result
+
+
+def complex_newton_correction(
+    function: Callable, x_real: np.ndarray, args: tuple = (), step: float = JACOBIAN_STEP
+) -> np.ndarray:
+    """
+    Propagates the complex-step perturbation of the inputs through an implicit resolution
+    (fsolve) done on the real part of the problem. Applying the implicit function theorem, one
+    Newton step done in complex arithmetic around the real solution gives the exact derivative of
+    the solution in its imaginary part. The real part of the returned solution is kept equal to
+    x_real so that primal values are not modified.
+
+    :param function: residual function f(x, *args), may return complex values.
+    :param x_real: solution of Re(f(x, *args)) = 0.
+    :param args: additional arguments of the residual function.
+    :param step: step used for the central difference real jacobian of f with regard to x.
+    :return: solution with the imaginary part carrying the derivative.
+    """
+    x_real = np.real(np.asarray(x_real, dtype=complex))
+    residual = np.asarray(function(x_real, *args)).reshape(-1)
+    jacobian = np.zeros((len(x_real), len(x_real)))
+    for idx in range(len(x_real)):
+        delta = np.zeros(len(x_real))
+        delta[idx] = step
+        jacobian[:, idx] = (
+            np.real(np.asarray(function(x_real + delta, *args)).reshape(-1))
+            - np.real(np.asarray(function(x_real - delta, *args)).reshape(-1))
+        ) / (2.0 * step)
+
+    return x_real - 1j * np.linalg.solve(jacobian, np.imag(residual))
+
+
+class ComplexStepAtmosphere(Atmosphere):
+    """
+    Same as :class:`stdatm.Atmosphere` but allocates its internal arrays with the type of the
+    provided altitude, so that the imaginary part of a complex altitude (or temperature
+    increment) is not discarded.
+    """
+
+    def __init__(
+        self,
+        altitude: Union[float, Sequence[float]],
+        delta_t: float = 0.0,
+        altitude_in_feet: bool = True,
+    ):
+        super().__init__(altitude, delta_t, altitude_in_feet)
+        self._idx_tropo = np.real(self._altitude) < 11000.0
+        self._idx_strato = np.logical_not(self._idx_tropo)
+
+    @property
+    def temperature(self) -> Union[float, Sequence[float]]:
+        """Temperature in K."""
+        if self._temperature is None:
+            self._temperature = np.where(
+                self._idx_tropo,
+                SEA_LEVEL_TEMPERATURE - 0.0065 * self._altitude + self._delta_t,
+                216.65 + self._delta_t + 0.0 * self._altitude,
+            )
+        return self._return_value(self._temperature)
+
+    @property
+    def pressure(self) -> Union[float, Sequence[float]]:
+        """Pressure in Pa."""
+        if self._pressure is None:
+            self._pressure = np.where(
+                self._idx_tropo,
+                SEA_LEVEL_PRESSURE * (1 - (self._altitude / 44330.78)) ** 5.25587611,
+                22632 * 2.718281 ** (1.7345725 - 0.0001576883 * self._altitude),
+            )
+        return self._return_value(self._pressure)
+
+    def _return_value(self, value):
+        """
+        :returns: a float or a complex when needed. Otherwise, returns the value itself.
+        """
+        if self._float_expected and value is not None:
+            value = np.asarray(value)
+            if value.size == 1:
+                return to_scalar(value)
+        return value
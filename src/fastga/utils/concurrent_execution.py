@@ -0,0 +1,154 @@
+"""
+Concurrent execution of independent subsystems of a group on a single machine.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import multiprocessing
+import weakref
+
+import openmdao.api as om
+from openmdao.recorders.recording_iteration_stack import Recording
+
+_LOGGER = logging.getLogger(__name__)
+
+# Group solved concurrently, set just before the worker processes are forked so that they
+# inherit it
+_CONCURRENT_SYSTEM = None
+
+
+def _solve_subsystem(task):
+    """
+    Runs a subsystem of the group (in a worker process) from the given inputs and outputs values,
+    and returns its outputs and residuals values.
+    """
+    name, inputs, outputs = task
+    subsystem = _CONCURRENT_SYSTEM._get_subsystem(name)
+    subsystem._inputs.set_val(inputs)
+    subsystem._outputs.set_val(outputs)
+    subsystem._solve_nonlinear()
+
+    return subsystem._outputs.asarray(copy=True), subsystem._residuals.asarray(copy=True)
+
+
+class ConcurrentRunOnce(om.NonlinearRunOnce):
+    """
+    Solver that runs the subsystems of the containing group once, concurrently in a pool of
+    forked processes (no MPI needed), in the way a ParallelGroup would: all inputs are
+    transferred first, so subsystems should not depend on each other. Outputs are then copied
+    back in the subsystems order, whatever the order the processes finish in.
+
+    The pool is created at the first run and reused by the next ones (e.g. at each iteration of
+    an MDA), the current inputs and outputs of the subsystems being sent to the processes. Only
+    the continuous outputs and residuals come back from the processes: any other state of the
+    components (results caches, recorded check results, surrogate training points...) is only
+    updated in the worker processes. Subsystems with discrete variables are not accepted.
+
+    Falls back to a serial execution when processes cannot be forked (e.g. on Windows) or under
+    complex step.
+    """
+
+    SOLVER = "NL: CONCURRENT"
+
+    def _declare_options(self):
+        super()._declare_options()
+        self.options.declare(
+            "max_workers",
+            default=None,
+            types=int,
+            allow_none=True,
+            desc="Maximum number of worker processes, default to the number of subsystems "
+            "limited to the number of CPUs.",
+        )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._pool = None
+        self._pool_finalizer = None
+
+    def close(self):
+        """Stops the worker processes, which are started again at the next run if needed."""
+        if self._pool_finalizer is not None:
+            self._pool_finalizer()
+        self._pool = None
+        self._pool_finalizer = None
+
+    def _setup_solvers(self, system, depth):
+        super()._setup_solvers(system, depth)
+
+        # Processes forked before a new setup would hold the former system
+        self.close()
+
+        if system._var_allprocs_discrete["input"] or system._var_allprocs_discrete["output"]:
+            raise RuntimeError(
+                "Subsystems of %s can not be run concurrently since they have discrete variables!"
+                % system.pathname
+            )
+
+        prefix = system.pathname + "." if system.pathname else ""
+        for abs_in, abs_out in system._conn_abs_in2out.items():
+            subsystem_in = abs_in[len(prefix) :].split(".")[0]
+            subsystem_out = abs_out[len(prefix) :].split(".")[0]
+            if abs_out.startswith(prefix) and subsystem_in != subsystem_out:
+                raise RuntimeError(
+                    "Subsystems of %s can not be run concurrently since %s is connected to %s!"
+                    % (system.pathname, abs_in, abs_out)
+                )
+
+    def solve(self):
+        """
+        Run the solver.
+        """
+        global _CONCURRENT_SYSTEM
+
+        system = self._system()
+        subsystems = [subsys for subsys in system._subsystems_myproc if subsys._is_local]
+        if (
+            len(subsystems) < 2
+            or system.under_complex_step
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            super().solve()
+            return
+
+        with Recording("ConcurrentRunOnce", 0, self) as rec:
+            system._transfer("nonlinear", "fwd")
+
+            if self._pool is None:
+                max_workers = self.options["max_workers"]
+                if max_workers is None:
+                    max_workers = min(len(subsystems), multiprocessing.cpu_count())
+                _CONCURRENT_SYSTEM = system
+                try:
+                    self._pool = multiprocessing.get_context("fork").Pool(max_workers)
+                finally:
+                    _CONCURRENT_SYSTEM = None
+                self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+
+            tasks = [
+                (
+                    subsys.name,
+                    subsys._inputs.asarray(copy=True),
+                    subsys._outputs.asarray(copy=True),
+                )
+                for subsys in subsystems
+            ]
+            results = self._pool.map(_solve_subsystem, tasks, chunksize=1)
+
+            for subsys, (outputs, residuals) in zip(subsystems, results):
+                subsys._outputs.set_val(outputs)
+                subsys._residuals.set_val(residuals)
+
+            rec.abs = 0.0
+            rec.rel = 0.0
@@ -0,0 +1,200 @@
+"""
+Warm-start of MDA loops from previously converged points.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import openmdao.api as om
+
+_LOGGER = logging.getLogger(__name__)
+
+# Variables of the FAST-GA sizing loops (fastga.loop.mtow, fastga.loop.wing_area,
+# fastga.loop.wing_position and the sizing mission fuel) used to seed a new MDA
+DEFAULT_WARM_START_VARIABLES = [
+    "data:weight:aircraft:MTOW",
+    "data:geometry:wing:area",
+    "data:geometry:wing:MAC:at25percent:x",
+    "data:mission:sizing:fuel",
+]
+
+
+class ConvergedStateCache:
+    """
+    Stores the values of the loop variables at converged MDA points, keyed on the values of the
+    inputs of the MDA, along with the reference residual norm of their resolution. The oldest
+    points are dropped once max_size is reached.
+    """
+
+    def __init__(self, max_size: int = 50):
+        self.max_size = max_size
+        self._keys = []
+        self._states = []
+        self._reference_norms = []
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self):
+        """Forgets all the converged points."""
+        self._keys = []
+        self._states = []
+        self._reference_norms = []
+
+    def add(self, key: np.ndarray, state: Dict[str, np.ndarray], reference_norm: float):
+        """
+        Adds a converged point to the cache.
+
+        :param key: flat array of the MDA inputs values.
+        :param state: dict of the loop variables values at convergence.
+        :param reference_norm: residual norm the relative tolerance was applied to.
+        """
+        self._keys.append(np.array(key, dtype=float))
+        self._states.append({name: np.array(value) for name, value in state.items()})
+        self._reference_norms.append(reference_norm)
+        if len(self._keys) > self.max_size:
+            del self._keys[0]
+            del self._states[0]
+            del self._reference_norms[0]
+
+    def nearest(self, key: np.ndarray) -> Tuple[Optional[Dict[str, np.ndarray]], float, float]:
+        """
+        Returns the converged state whose inputs are the closest to key, distance being computed
+        on relative differences. Most recent point is returned in case of equality.
+
+        :param key: flat array of the MDA inputs values.
+        :return: dict of the loop variables values (None if no compatible point is stored), the
+        associated reference residual norm and the distance to key (inf if no point is stored).
+        """
+        key = np.array(key, dtype=float)
+        best_index = None
+        best_distance = np.inf
+        for index in reversed(range(len(self._keys))):
+            stored_key = self._keys[index]
+            if stored_key.shape != key.shape:
+                continue
+            scale = np.maximum(np.abs(stored_key), 1e-10)
+            distance = np.linalg.norm((key - stored_key) / scale)
+            if distance < best_distance:
+                best_distance = distance
+                best_index = index
+
+        if best_index is None:
+            return None, 0.0, np.inf
+        return self._states[best_index], self._reference_norms[best_index], best_distance
+
+
+class WarmStartNonlinearBlockGS(om.NonlinearBlockGS):
+    """
+    NonlinearBlockGS solver that seeds each new resolution with the loop variables of the closest
+    previously converged point (in terms of the inputs of the solved group that are computed
+    outside of it) and stores the converged points. Since Gauss-Seidel converges linearly, when
+    the seed is close enough to the new point, the relative tolerance is applied to the residual
+    norm of the cold start the seed originates from, otherwise a warm start would not save sweeps.
+    Farther from the seed, the relative tolerance applies to the actual initial residual norm.
+    Aitken acceleration of the sweeps is available through the inherited use_aitken option.
+    """
+
+    SOLVER = "NL: NLBGS_WS"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = ConvergedStateCache(self.options["warm_start_cache_size"])
+        self._key_input_names = None
+
+    def _declare_options(self):
+        super()._declare_options()
+        self.options.declare(
+            "warm_start_cache_size",
+            default=50,
+            types=int,
+            desc="Maximum number of converged points kept for the warm start.",
+        )
+        self.options.declare(
+            "warm_start_variables",
+            default=list(DEFAULT_WARM_START_VARIABLES),
+            types=list,
+            desc="Promoted names of the outputs seeded from the closest converged point. Names "
+            "that are not outputs of the solved group are ignored.",
+        )
+        self.options.declare(
+            "warm_start_reference_distance",
+            default=0.05,
+            lower=0.0,
+            desc="Relative distance between the inputs of the new point and of the seed below "
+            "which the relative tolerance applies to the residual norm of the cold start of the "
+            "seed.",
+        )
+
+    def _setup_solvers(self, system, depth):
+        super()._setup_solvers(system, depth)
+        # Inputs of the key, found on first resolution as the model may not be fully set up yet
+        self._key_input_names = None
+
+    def _inputs_key(self) -> np.ndarray:
+        """
+        Flat array of the values of the inputs of the solved group that are computed outside of
+        it, i.e. of everything the converged point depends on (one input per source).
+        """
+        system = self._system()
+        if self._key_input_names is None:
+            prefix = system.pathname + "." if system.pathname else ""
+            inputs_by_source = {}
+            for name in system.get_io_metadata(iotypes="input", return_rel_names=False):
+                source = system.get_source(name)
+                if not source.startswith(prefix):
+                    inputs_by_source.setdefault(source, name)
+            self._key_input_names = [
+                inputs_by_source[source] for source in sorted(inputs_by_source)
+            ]
+
+        values = [np.asarray(system.get_val(name)) for name in self._key_input_names]
+        values = [np.real(value).ravel() for value in values if value.dtype.kind in "fciub"]
+        if values:
+            return np.concatenate(values)
+        return np.zeros(0)
+
+    def _warm_start_variables(self) -> list:
+        """Names of the warm start variables that are outputs of the solved group."""
+        outputs = self._system()._outputs
+        return [name for name in self.options["warm_start_variables"] if name in outputs]
+
+    def _iter_initialize(self):
+        system = self._system()
+        state, reference_norm = None, 0.0
+        if not system.under_complex_step:
+            state, reference_norm, distance = self.cache.nearest(self._inputs_key())
+            if distance > self.options["warm_start_reference_distance"]:
+                reference_norm = 0.0
+            if state is not None:
+                _LOGGER.debug("Warm start of %s from a converged point", system.pathname)
+                for name, value in state.items():
+                    system._outputs[name] = value
+
+        norm0, norm = super()._iter_initialize()
+
+        return max(norm0, reference_norm), norm
+
+    def _solve(self):
+        super()._solve()
+
+        system = self._system()
+        if system.under_complex_step or self._iter_count >= self.options["maxiter"]:
+            return
+        self.cache.max_size = self.options["warm_start_cache_size"]
+        state = {name: system._outputs[name].copy() for name in self._warm_start_variables()}
+        if all(np.all(np.isfinite(value)) for value in state.values()):
+            self.cache.add(self._inputs_key(), state, self._norm0)
@@ -26,10 +26,10 @@ from typing import Dict
 from random import SystemRandom
 from openmdao.utils.units import convert_units
 
-from fastoad.io import VariableIO
 from fastoad.openmdao.variables import VariableList
 
 from fastga.models.aerodynamics.components.compute_equilibrated_polar import FIRST_INVALID_COEFF
+from fastga.utils.postprocessing.session import read_variables
 
 COLS = plotly.colors.DEFAULT_PLOTLY_COLORS
 
@@ -50,7 +50,7 @@ def aircraft_geometry_plot(
     default format will be assumed.
     :return: wing plot figure.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     # Wing parameters
     wing_kink_leading_edge_x = variables["data:geometry:wing:kink:leading_edge:x:local"].value[0]
@@ -278,7 +278,7 @@ def evolution_diagram(
     default format will be assumed.
     :return: V-N plot figure.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     velocity_array = list(variables["data:mission:sizing:cs23:flight_domain:mtow:velocity"].value)
     load_factor_array = list(
@@ -410,8 +410,8 @@ def cl_wing_diagram(
     :return: Cl distribution figure along the span.
     """
 
-    variables_ref = VariableIO(aircraft_ref_file_path, file_formatter).read()
-    variables_mod = VariableIO(aircraft_mod_file_path, file_formatter).read()
+    variables_ref = read_variables(aircraft_ref_file_path, file_formatter)
+    variables_mod = read_variables(aircraft_mod_file_path, file_formatter)
 
     if prop_on:
         cl_array_ref = list(
@@ -535,7 +535,7 @@ def cg_lateral_diagram(
     default format will be assumed.
     :return: wing plot figure.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     # Fuselage parameters
     fuselage_max_height = variables["data:geometry:fuselage:maximum_height"].value[0]
@@ -802,7 +802,7 @@ def mass_breakdown_bar_plot(
                            default format will be assumed.
     :return: bar plot figure.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     var_names_and_new_units = {
         "data:weight:aircraft:MTOW": "kg",
@@ -859,7 +859,7 @@ def mass_breakdown_sun_plot(aircraft_file_path: str, file_formatter=None):
                            default format will be assumed.
     :return: sunburst plot figure.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     var_names_and_new_units = {
         "data:weight:aircraft:MTOW": "kg",
@@ -969,7 +969,7 @@ def drag_breakdown_diagram(
     file_formatter=None,
 ) -> go.FigureWidget:
     """Return a plot of the drag breakdown of the wing in cruise conditions."""
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     parasite_drag_cruise = variables["data:aerodynamics:aircraft:cruise:CD0"].value[0]
     induced_drag_cruise = variables["data:aerodynamics:wing:cruise:induced_drag_coefficient"].value[
@@ -1115,7 +1115,7 @@ def payload_range(
     default format will be assumed.
     :return: payload range figure.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     payload_array = list(variables["data:payload_range:payload_array"].value)
     range_array = list(variables["data:payload_range:range_array"].value)
@@ -1197,7 +1197,7 @@ def aircraft_polar(
     :param equilibrated: boolean stating if the polar plotted is the equilibrated one or not
     :return: plane polar figure.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     if equilibrated:
         cl_array_cruise = list(variables["data:aerodynamics:aircraft:cruise:equilibrated:CL"].value)
@@ -24,7 +24,7 @@ from fastga.models.load_analysis.wing.aerostructural_loads import (
     NB_POINTS_POINT_MASS,
 )
 
-from fastoad.io import VariableIO
+from fastga.utils.postprocessing.session import read_variables
 
 COLS = plotly.colors.DEFAULT_PLOTLY_COLORS
 
@@ -44,7 +44,7 @@ def force_repartition_diagram(
                            be assumed.
     :return: force repartition diagram.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     y_vector = list(variables["data:loads:y_vector"].value)
     wing_weight = list(variables["data:loads:structure:ultimate:force_distribution:wing"].value)
@@ -126,7 +126,7 @@ def shear_diagram(
                            be assumed.
     :return: force repartition diagram.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     y_vector = list(variables["data:loads:y_vector"].value)
     wing_shear = list(variables["data:loads:structure:ultimate:shear:wing"].value)
@@ -199,7 +199,7 @@ def rbm_diagram(
                            be assumed.
     :return: force repartition diagram.
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = read_variables(aircraft_file_path, file_formatter)
 
     y_vector = list(variables["data:loads:y_vector"].value)
     wing_rbm = list(variables["data:loads:structure:ultimate:root_bending:wing"].value)
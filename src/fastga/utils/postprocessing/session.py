@@ -0,0 +1,86 @@
+"""
+Variables of the aircraft data files shared by the post-processing plots.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import os.path as pth
+import threading
+
+from fastoad.io import VariableIO
+from fastoad.io.formatter import IVariableIOFormatter
+from fastoad.openmdao.variables import VariableList
+
+
+class PostProcessingSession:
+    """
+    Variables read from aircraft data files, each file being parsed once and parsed again only
+    if it was modified (modification time or size changed). Files read with formatters of
+    different classes are stored separately.
+
+    The returned variable lists are shared between the plots and should not be modified.
+    """
+
+    def __init__(self):
+        # {(file path, formatter class): ((modification time, size), variables)}
+        self._variables = {}
+        self._lock = threading.Lock()
+        # Number of times a file has been parsed
+        self.read_count = 0
+
+    def read(self, aircraft_file_path: str, file_formatter: IVariableIOFormatter = None):
+        """
+        :param aircraft_file_path: path of data file
+        :param file_formatter: the formatter that defines the format of data file. If not
+        provided, default format will be assumed.
+        :return: the variables of the data file.
+        """
+        file_path = pth.abspath(aircraft_file_path)
+        file_stat = os.stat(file_path)
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        key = (file_path, None if file_formatter is None else type(file_formatter))
+
+        with self._lock:
+            if key not in self._variables or self._variables[key][0] != signature:
+                variables = VariableIO(file_path, file_formatter).read()
+                self._variables[key] = (signature, variables)
+                self.read_count += 1
+
+            return self._variables[key][1]
+
+    def clear(self):
+        """Forgets all the variables read."""
+        with self._lock:
+            self._variables.clear()
+
+
+_SESSION = PostProcessingSession()
+
+
+def get_session() -> PostProcessingSession:
+    """Returns the session used by the post-processing plots."""
+    return _SESSION
+
+
+def read_variables(aircraft_file_path: str, file_formatter=None) -> VariableList:
+    """
+    Returns the variables of the data file, read through the session of the post-processing
+    plots.
+
+    :param aircraft_file_path: path of data file
+    :param file_formatter: the formatter that defines the format of data file. If not provided,
+    default format will be assumed.
+    :return: the variables of the data file.
+    """
+    return _SESSION.read(aircraft_file_path, file_formatter)
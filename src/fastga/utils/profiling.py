@@ -0,0 +1,332 @@
+"""
+Opt-in instrumentation of OpenMDAO problems recording the time spent in each component.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import os.path as pth
+import threading
+import time
+from functools import wraps
+from typing import List, Tuple
+
+import openmdao.api as om
+from openmdao.components.external_code_comp import ExternalCodeComp
+from openmdao.solvers.solver import NonlinearSolver
+
+_LOGGER = logging.getLogger(__name__)
+
+# Kinds of timed calls
+COMPUTE = "compute"
+EXTERNAL_CODE = "external_code"
+SOLVER_ITERATION = "solver_iteration"
+
+REPORT_FIELDS = [
+    "total_time",
+    "calls",
+    "mean_time",
+    "max_time",
+    "cache_hits",
+    "cache_misses",
+]
+JSON_REPORT_FILE_NAME = "profiling.json"
+TEXT_REPORT_FILE_NAME = "profiling.txt"
+
+# Profiler recording the run in progress, if any, and components being computed (innermost last)
+_ACTIVE_PROFILER = None
+_COMPONENT_STACK = []
+# Guards the records, which are also updated from the threads running external codes
+_RECORDS_LOCK = threading.Lock()
+
+
+def record_cache_access(hit: bool):
+    """
+    Notifies the profiler of a lookup in a results cache (external code results, airfoil
+    profiles...), which is counted for the component being computed. Does nothing if no profiled
+    run is in progress.
+
+    :param hit: True if the cached value was used, False if it had to be computed.
+    """
+    if _ACTIVE_PROFILER is not None and _COMPONENT_STACK:
+        with _RECORDS_LOCK:
+            record = _ACTIVE_PROFILER._records[_COMPONENT_STACK[-1]]
+            if hit:
+                record["cache_hits"] += 1
+            else:
+                record["cache_misses"] += 1
+
+
+def record_external_code_run(duration: float):
+    """
+    Notifies the profiler of an external code run that is not done by the ExternalCodeDelegate of
+    the component being computed (e.g. concurrent runs of the component), so that it is timed with
+    the other runs of the component. Does nothing if no profiled run is in progress.
+
+    :param duration: wall time of the run in seconds.
+    """
+    if _ACTIVE_PROFILER is not None and _COMPONENT_STACK:
+        name, _ = _COMPONENT_STACK[-1]
+        with _RECORDS_LOCK:
+            class_name = _ACTIVE_PROFILER._records[_COMPONENT_STACK[-1]]["class"]
+            record = _ACTIVE_PROFILER._record((name, EXTERNAL_CODE), class_name)
+            record["total_time"] += duration
+            record["calls"] += 1
+            record["max_time"] = max(record["max_time"], duration)
+
+
+class ProfilingReport:
+    """
+    Timings of a profiled run, one record per (system path, kind of call). Times of a record
+    include the ones of the calls nested in it, e.g. the external code run by a component or the
+    components computed in a solver iteration.
+    """
+
+    def __init__(self, records: List[dict], total_time: float):
+        self.records = records
+        self.total_time = total_time
+
+    def sorted(self, sort_by: str = "total_time", kind: str = None) -> List[dict]:
+        """
+        :param sort_by: one of REPORT_FIELDS (descending order) or "name" (ascending order).
+        :param kind: if provided, only records of this kind (compute, external_code or
+        solver_iteration) are returned.
+        :return: the sorted records.
+        """
+        if sort_by not in REPORT_FIELDS and sort_by != "name":
+            raise ValueError("Can not sort on %s, use one of %s" % (sort_by, REPORT_FIELDS))
+        records = [record for record in self.records if kind is None or record["kind"] == kind]
+
+        return sorted(records, key=lambda record: record[sort_by], reverse=sort_by != "name")
+
+    def to_dict(self) -> dict:
+        """:return: the report as a JSON serializable dict."""
+        return {"total_time": self.total_time, "records": self.sorted()}
+
+    def write_json(self, file_path: str):
+        """Writes the report in JSON format."""
+        with open(file_path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def summary(self, sort_by: str = "total_time", kind: str = None, max_lines: int = 30) -> str:
+        """
+        :param sort_by: see :meth:`sorted`.
+        :param kind: see :meth:`sorted`.
+        :param max_lines: maximum number of records displayed, all if None.
+        :return: a text table of the records.
+        """
+        records = self.sorted(sort_by, kind)
+        if max_lines is not None:
+            records = records[:max_lines]
+
+        name_width = max([len(record["name"]) for record in records] + [4])
+        lines = [
+            "Profiled run: %.3f s" % self.total_time,
+            "%-*s  %-16s %10s %8s %10s %10s %6s %6s"
+            % (
+                name_width,
+                "name",
+                "kind",
+                "total [s]",
+                "calls",
+                "mean [s]",
+                "max [s]",
+                "hits",
+                "misses",
+            ),
+        ]
+        for record in records:
+            lines.append(
+                "%-*s  %-16s %10.3f %8d %10.4f %10.4f %6d %6d"
+                % (
+                    name_width,
+                    record["name"],
+                    record["kind"],
+                    record["total_time"],
+                    record["calls"],
+                    record["mean_time"],
+                    record["max_time"],
+                    record["cache_hits"],
+                    record["cache_misses"],
+                )
+            )
+
+        return "\n".join(lines)
+
+    def write_summary(self, file_path: str, sort_by: str = "total_time"):
+        """Writes the complete text table of the records."""
+        with open(file_path, "w") as file:
+            file.write(self.summary(sort_by, max_lines=None) + "\n")
+
+    def __str__(self):
+        return self.summary()
+
+
+class ComponentProfiler:
+    """
+    Records wall time and call count of the compute methods of all the components of a problem,
+    of the subprocesses of ExternalCodeComp components and of the iterations of the nonlinear
+    solvers, along with the lookups of the results caches done during compute.
+
+    Once attached, the instrumentation is done at each run_model/run_driver call, after which the
+    report is logged and, if a folder is provided, written as profiling.json and profiling.txt.
+    Timings accumulate over runs until :meth:`reset` is called. Calls done in forked processes
+    (see :class:`~fastga.utils.concurrent_execution.ConcurrentRunOnce`) are not recorded.
+    """
+
+    def __init__(self, report_folder_path: str = None):
+        self.report_folder_path = report_folder_path
+        self._problem = None
+        self._records = {}
+        self._total_time = 0.0
+        # (object, attribute name) of instrumented methods
+        self._wrapped = []
+
+    def attach(self, problem: om.Problem):
+        """Makes run_model and run_driver of the problem profiled."""
+        if self._problem is not None:
+            self.detach()
+        self._problem = problem
+        for method_name in ["run_model", "run_driver"]:
+            self._wrap(problem, method_name, self._wrap_run(getattr(problem, method_name)))
+
+    def detach(self):
+        """Removes all instrumentation."""
+        for obj, method_name in reversed(self._wrapped):
+            delattr(obj, method_name)
+        self._wrapped = []
+        self._problem = None
+
+    def reset(self):
+        """Clears the recorded timings."""
+        for record in self._records.values():
+            record.update(total_time=0.0, calls=0, max_time=0.0, cache_hits=0, cache_misses=0)
+        self._total_time = 0.0
+
+    @property
+    def report(self) -> ProfilingReport:
+        """Report of the timings recorded so far."""
+        records = []
+        for (name, kind), record in self._records.items():
+            if record["calls"] == 0:
+                continue
+            record = dict(record, name=name, kind=kind)
+            record["mean_time"] = record["total_time"] / record["calls"]
+            records.append(record)
+
+        return ProfilingReport(records, self._total_time)
+
+    def _wrap(self, obj, method_name: str, wrapper):
+        setattr(obj, method_name, wrapper)
+        self._wrapped.append((obj, method_name))
+
+    def _record(self, key: Tuple[str, str], class_name: str) -> dict:
+        if key not in self._records:
+            self._records[key] = {
+                "class": class_name,
+                "total_time": 0.0,
+                "calls": 0,
+                "max_time": 0.0,
+                "cache_hits": 0,
+                "cache_misses": 0,
+            }
+        return self._records[key]
+
+    def _timed(self, method, key: Tuple[str, str], class_name: str, component: bool = False):
+        record = self._record(key, class_name)
+
+        @wraps(method)
+        def timed_method(*args, **kwargs):
+            if component:
+                _COMPONENT_STACK.append(key)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                if component:
+                    _COMPONENT_STACK.pop()
+                with _RECORDS_LOCK:
+                    record["total_time"] += duration
+                    record["calls"] += 1
+                    record["max_time"] = max(record["max_time"], duration)
+
+        return timed_method
+
+    def _instrument(self):
+        """Wraps the methods of the systems and solvers of the problem model."""
+        instrumented = {id(obj) for obj, _ in self._wrapped}
+        for system in self._problem.model.system_iter(include_self=True, recurse=True):
+            if id(system) in instrumented:
+                continue
+            name = system.pathname or "model"
+            class_name = type(system).__name__
+
+            if isinstance(system, om.ExplicitComponent):
+                method_names = ["compute"]
+            elif isinstance(system, om.ImplicitComponent):
+                method_names = ["solve_nonlinear", "apply_nonlinear"]
+            else:
+                method_names = []
+            for method_name in method_names:
+                key = (name, COMPUTE if method_name == "compute" else method_name)
+                method = self._timed(getattr(system, method_name), key, class_name, True)
+                self._wrap(system, method_name, method)
+
+            if isinstance(system, ExternalCodeComp):
+                runner = system._external_code_runner
+                method = self._timed(runner._execute_local, (name, EXTERNAL_CODE), class_name)
+                self._wrap(runner, "_execute_local", method)
+
+            solver = system.nonlinear_solver if isinstance(system, om.Group) else None
+            if isinstance(solver, NonlinearSolver) and id(solver) not in instrumented:
+                # Solvers that run once have no iteration loop
+                method_name = (
+                    "solve" if isinstance(solver, om.NonlinearRunOnce) else "_single_iteration"
+                )
+                method = self._timed(
+                    getattr(solver, method_name), (name, SOLVER_ITERATION), type(solver).__name__
+                )
+                self._wrap(solver, method_name, method)
+
+    def _wrap_run(self, run_method):
+        @wraps(run_method)
+        def profiled_run(*args, **kwargs):
+            global _ACTIVE_PROFILER
+
+            if _ACTIVE_PROFILER is self:
+                # e.g. run_model called by a driver
+                return run_method(*args, **kwargs)
+
+            self._instrument()
+            _ACTIVE_PROFILER = self
+            start = time.perf_counter()
+            try:
+                return run_method(*args, **kwargs)
+            finally:
+                self._total_time += time.perf_counter() - start
+                _ACTIVE_PROFILER = None
+                _COMPONENT_STACK.clear()
+                self._write_report()
+
+        return profiled_run
+
+    def _write_report(self):
+        report = self.report
+        _LOGGER.info("Profiling of %s:\n%s", self._problem.model.pathname or "model", report)
+        if self.report_folder_path:
+            os.makedirs(self.report_folder_path, exist_ok=True)
+            report.write_json(pth.join(self.report_folder_path, JSON_REPORT_FILE_NAME))
+            report.write_summary(pth.join(self.report_folder_path, TEXT_REPORT_FILE_NAME))
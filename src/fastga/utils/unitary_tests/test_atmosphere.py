@@ -0,0 +1,101 @@
+"""
+Test module for the tabulated standard atmosphere.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from stdatm import Atmosphere
+
+from ..atmosphere import TABULATED_PROPERTIES, TabulatedAtmosphere
+
+# Maximum relative difference with the ISA formulas (reached at the tropopause for pressure)
+RTOL = 4e-9
+
+
+def test_array_altitudes():
+    """Tabulated properties match the ISA formulas over the whole table, tropopause included."""
+    altitudes = np.linspace(-1000.0, 20000.0, 30001)
+    altitudes = np.append(altitudes, [10999.9, 11000.0, 11000.1])
+    reference = Atmosphere(altitudes, altitude_in_feet=False)
+    atm = TabulatedAtmosphere(altitudes, altitude_in_feet=False)
+    for name in TABULATED_PROPERTIES:
+        assert isinstance(getattr(atm, name), np.ndarray)
+        assert_allclose(getattr(atm, name), getattr(reference, name), rtol=RTOL, atol=0.0)
+
+    # Any shape, in feet
+    altitudes = np.linspace(0.0, 30000.0, 12).reshape((3, 4))
+    reference = Atmosphere(altitudes)
+    atm = TabulatedAtmosphere(altitudes)
+    for name in TABULATED_PROPERTIES:
+        assert getattr(atm, name).shape == (3, 4)
+        assert_allclose(getattr(atm, name), getattr(reference, name), rtol=RTOL, atol=0.0)
+
+
+@pytest.mark.parametrize("altitude", [-3000.0, 0.0, 2438.4, 8000.0, 36089.0, 60000.0, 80000.0])
+def test_scalar_altitude(altitude):
+    """Properties are floats, also out of the tables (-3000 ft and 80000 ft)."""
+    reference = Atmosphere(altitude)
+    atm = TabulatedAtmosphere(altitude)
+    for name in TABULATED_PROPERTIES:
+        assert isinstance(getattr(atm, name), float)
+        assert getattr(atm, name) == pytest.approx(getattr(reference, name), rel=RTOL)
+
+    # Speeds are computed from the tabulated properties
+    reference.mach = atm.mach = 0.3
+    assert atm.true_airspeed == pytest.approx(reference.true_airspeed, rel=RTOL)
+    assert atm.equivalent_airspeed == pytest.approx(reference.equivalent_airspeed, rel=RTOL)
+    assert atm.unitary_reynolds == pytest.approx(reference.unitary_reynolds, rel=RTOL)
+
+
+@pytest.mark.parametrize("delta_t", [-20.0, 15.0])
+def test_delta_t(delta_t):
+    """With a temperature increment, the ISA formulas are used."""
+    altitudes = np.array([0.0, 5000.0, 15000.0])
+    reference = Atmosphere(altitudes, delta_t=delta_t, altitude_in_feet=False)
+    atm = TabulatedAtmosphere(altitudes, delta_t=delta_t, altitude_in_feet=False)
+    for name in TABULATED_PROPERTIES:
+        assert_allclose(getattr(atm, name), getattr(reference, name), rtol=1e-15)
+
+    reference = Atmosphere(5000.0, delta_t=delta_t, altitude_in_feet=False)
+    atm = TabulatedAtmosphere(5000.0, delta_t=delta_t, altitude_in_feet=False)
+    for name in TABULATED_PROPERTIES:
+        assert getattr(atm, name) == pytest.approx(getattr(reference, name), rel=1e-15)
+
+
+def test_delta_t_change():
+    """Properties follow a change of temperature increment after their first access."""
+    atm = TabulatedAtmosphere(5000.0, altitude_in_feet=False)
+    assert atm.temperature == pytest.approx(255.65, rel=RTOL)
+
+    atm.delta_t = 10.0
+    reference = Atmosphere(5000.0, delta_t=10.0, altitude_in_feet=False)
+    for name in TABULATED_PROPERTIES:
+        assert getattr(atm, name) == pytest.approx(getattr(reference, name), rel=1e-15)
+
+
+def test_complex_altitudes():
+    """With complex altitudes (complex step), the ISA formulas are used."""
+    altitudes = np.array([1000.0, 12000.0]) + 1e-30j
+    reference = Atmosphere(altitudes, altitude_in_feet=False)
+    atm = TabulatedAtmosphere(altitudes, altitude_in_feet=False)
+    for name in TABULATED_PROPERTIES:
+        assert_allclose(getattr(atm, name), getattr(reference, name), rtol=1e-15)
+
+    # As with stdatm, a scalar altitude gives float values
+    reference = Atmosphere(1000.0 + 1e-30j, altitude_in_feet=False)
+    atm = TabulatedAtmosphere(1000.0 + 1e-30j, altitude_in_feet=False)
+    for name in TABULATED_PROPERTIES:
+        assert getattr(atm, name) == getattr(reference, name)
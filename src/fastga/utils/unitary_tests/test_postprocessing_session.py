@@ -0,0 +1,55 @@
+"""
+Test module for the variables shared by the post-processing plots.
+"""
+#  This file is part of FAST : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2020  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import os.path as pth
+
+import pytest
+from fastoad.io import VariableIO
+from fastoad.openmdao.variables import Variable, VariableList
+
+from ..postprocessing.session import PostProcessingSession
+
+
+def _write_aircraft_file(file_path: str, wing_area: float):
+    variables = VariableList([Variable("data:geometry:wing:area", val=wing_area, units="m**2")])
+    VariableIO(file_path).write(variables)
+
+
+def test_session(tmpdir):
+    file_path = pth.join(tmpdir, "aircraft.xml")
+    _write_aircraft_file(file_path, 16.0)
+    session = PostProcessingSession()
+
+    # The file is parsed once, and the same variables are returned afterwards
+    variables = session.read(file_path)
+    assert variables["data:geometry:wing:area"].value == pytest.approx([16.0])
+    assert session.read(file_path) is variables
+    assert session.read(pth.relpath(file_path)) is variables
+    assert session.read_count == 1
+
+    # A modified file is parsed again
+    _write_aircraft_file(file_path, 18.0)
+    file_stat = os.stat(file_path)
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000000000))
+    variables = session.read(file_path)
+    assert variables["data:geometry:wing:area"].value == pytest.approx([18.0])
+    assert session.read(file_path) is variables
+    assert session.read_count == 2
+
+    session.clear()
+    assert session.read(file_path)["data:geometry:wing:area"].value == pytest.approx([18.0])
+    assert session.read_count == 3